@@ -0,0 +1,200 @@
+"""
+Backend/scripts/benchmark_affinity.py
+Benchmark: TF-IDF reviewer <-> paper affinity at 5000 papers x 2000 reviewers
+
+Generates a synthetic conference from a topic model: every paper mixes two
+research topics (title, keywords, abstract drawn mostly from the topics'
+words, the rest from a Zipf background vocabulary); every reviewer has
+written a few earlier papers on their own topics. Measures:
+    - counting (tokenizing) and weighting throughput
+    - top-k reviewers for every paper and top-k papers for every reviewer
+      (sparse products through the transposed matrices)
+    - single-paper / single-reviewer query latency
+    - incremental update of a few late papers vs a full re-weighting
+    - cache size and reload time
+    - accuracy of the pruned lookup matrices: share of the exhaustive top-k
+      affinity kept, overlap of the top-10, and how often a reviewer sharing
+      a topic with the paper makes the top-10
+
+No database or Flask needed.
+
+Usage:
+    python scripts/benchmark_affinity.py
+    python scripts/benchmark_affinity.py --papers 5000 --reviewers 2000 --k 50
+"""
+
+import sys
+import os
+import argparse
+import heapq
+import itertools
+import random
+import tempfile
+import time
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, SRC_DIR)
+
+from infrastructure.search.base import FIELD_WEIGHTS  # noqa: E402
+from infrastructure.similarity.affinity import (  # noqa: E402
+    ConferenceAffinity, PAPER_INDEX_TERMS, REVIEWER_INDEX_TERMS
+)
+from infrastructure.similarity.tfidf import merge_counts, scores, transpose  # noqa: E402
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='UTH-ConfMS reviewer affinity benchmark')
+    parser.add_argument('--papers', type=int, default=5000)
+    parser.add_argument('--reviewers', type=int, default=2000)
+    parser.add_argument('--history', type=int, default=5, help='earlier papers per reviewer')
+    parser.add_argument('--topics', type=int, default=150)
+    parser.add_argument('--vocabulary', type=int, default=30_000)
+    parser.add_argument('--k', type=int, default=50, help='top-k computed for every paper / reviewer')
+    parser.add_argument('--queries', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=42)
+    return parser.parse_args()
+
+
+class Corpus:
+    def __init__(self, args, rng):
+        self.rng = rng
+        self.background = [f"term{i}" for i in range(args.vocabulary)]
+        self.cum_weights = list(itertools.accumulate(1.0 / (rank + 30) for rank in range(args.vocabulary)))
+        self.topic_words = [[f"topic{t}word{i}" for i in range(60)] for t in range(args.topics)]
+
+    def words(self, topics, length, topical_share=0.35):
+        out = []
+        for _ in range(length):
+            if self.rng.random() < topical_share:
+                out.append(self.rng.choice(self.topic_words[self.rng.choice(topics)]))
+            else:
+                out.append(self.rng.choices(self.background, cum_weights=self.cum_weights)[0])
+        return ' '.join(out)
+
+    def paper(self, topics):
+        return {
+            'title': self.words(topics, self.rng.randint(6, 12)),
+            'keywords': ', '.join(self.rng.choice(self.topic_words[t]) for t in topics for _ in range(2)),
+            'abstract': self.words(topics, self.rng.randint(120, 220)),
+        }
+
+
+def percentile(samples, pct):
+    return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+    corpus = Corpus(args, rng)
+
+    print("="*60)
+    print("🎯 REVIEWER AFFINITY BENCHMARK (TF-IDF, sparse products)")
+    print("="*60)
+    print(f"   Papers: {args.papers:,}   Reviewers: {args.reviewers:,} x {args.history} earlier papers   "
+          f"Topics: {args.topics}")
+
+    started = time.perf_counter()
+    paper_topics = [rng.sample(range(args.topics), 2) for _ in range(args.papers)]
+    reviewer_topics = [rng.sample(range(args.topics), 2) for _ in range(args.reviewers)]
+    paper_texts = [corpus.paper(topics) for topics in paper_topics]
+    reviewer_texts = [
+        [corpus.paper([rng.choice(topics), rng.choice(topics)]) for _ in range(args.history)]
+        for topics in reviewer_topics
+    ]
+    print(f"   Corpus generated in {time.perf_counter() - started:.1f}s")
+
+    with tempfile.TemporaryDirectory(prefix='uth_affinity_') as cache_dir:
+        affinity = ConferenceAffinity(1, path=cache_dir)
+        space = affinity.space
+
+        # ---------- Build ----------
+        def fields(text):
+            return {field: (text[field], weight) for field, weight in FIELD_WEIGHTS.items()}
+
+        started = time.perf_counter()
+        paper_counts = [space.count(fields(text)) for text in paper_texts]
+        reviewer_counts = [merge_counts(space.count(fields(text)) for text in history) for history in reviewer_texts]
+        count_seconds = time.perf_counter() - started
+        for paper_id, counts in enumerate(paper_counts):
+            affinity._replace(affinity.papers, paper_id, '', counts)
+        for reviewer_id, counts in enumerate(reviewer_counts):
+            affinity._replace(affinity.reviewers, reviewer_id, (), counts)
+        started = time.perf_counter()
+        affinity._reweigh_all()
+        weigh_seconds = time.perf_counter() - started
+        documents = args.papers + args.reviewers * args.history
+        print(f"\n   Tokenizing: {count_seconds * 1000 / documents:.2f} ms/document ({count_seconds:.1f}s)")
+        stats = affinity.stats()
+        print(f"   Weighting all rows: {weigh_seconds:.2f}s  ({stats['terms']:,} terms, "
+              f"{stats['paper_nonzeros']:,} + {stats['reviewer_nonzeros']:,} non-zeros, "
+              f"candidates from the top {PAPER_INDEX_TERMS} / {REVIEWER_INDEX_TERMS} terms)")
+
+        # ---------- Products ----------
+        started = time.perf_counter()
+        candidates = affinity.candidates(range(args.papers), args.k)
+        print(f"\n   Top-{args.k} reviewers for every paper: {time.perf_counter() - started:.2f}s "
+              f"(incl. transposing the reviewer matrix)")
+        started = time.perf_counter()
+        affinity.paper_candidates(range(args.reviewers), args.k)
+        print(f"   Top-{args.k} papers for every reviewer: {time.perf_counter() - started:.2f}s "
+              f"(incl. transposing the paper matrix)")
+
+        for label, query, population in (
+            ('paper -> reviewers', affinity.top_reviewers, args.papers),
+            ('reviewer -> papers', affinity.top_papers, args.reviewers),
+        ):
+            samples = []
+            for key in rng.sample(range(population), min(args.queries, population)):
+                started = time.perf_counter()
+                query(key, 10)
+                samples.append((time.perf_counter() - started) * 1000)
+            samples.sort()
+            print(f"   {label:<20} p50 {percentile(samples, 50):.2f} ms   p99 {percentile(samples, 99):.2f} ms "
+                  f"(top-10, rescored exactly)")
+
+        # ---------- Incremental ----------
+        late = [corpus.paper(rng.sample(range(args.topics), 2)) for _ in range(50)]
+        started = time.perf_counter()
+        for offset, text in enumerate(late):
+            paper_id = args.papers + offset
+            affinity._replace(affinity.papers, paper_id, '', space.count(fields(text)))
+            affinity.paper_rows[paper_id] = space.weigh(dict(zip(*affinity.papers[paper_id][1])))
+            affinity._paper_columns = None
+        affinity.top_reviewers(args.papers, 10)
+        incremental_ms = (time.perf_counter() - started) * 1000
+        print(f"\n   50 late papers added + queried: {incremental_ms:.0f} ms "
+              f"(full re-weighting: {weigh_seconds * 1000:.0f} ms)")
+
+        started = time.perf_counter()
+        affinity.save()
+        save_seconds = time.perf_counter() - started
+        size_mb = os.path.getsize(affinity._cache_path) / 2**20
+        started = time.perf_counter()
+        reloaded = ConferenceAffinity(1, path=cache_dir)
+        print(f"   Cache: {size_mb:.1f} MB, written in {save_seconds:.2f}s, "
+              f"reloaded in {time.perf_counter() - started:.2f}s ({len(reloaded.paper_rows):,} papers)")
+
+    # ---------- Accuracy ----------
+    exhaustive_columns = transpose(affinity.reviewer_rows)   # every term of every profile
+    overlap, captured, topical = 0.0, 0.0, 0
+    sample = rng.sample(range(args.papers), min(200, args.papers))
+    for paper_id in sample:
+        exact = scores(affinity.paper_rows[paper_id], exhaustive_columns)
+        best = heapq.nlargest(args.k, exact.values())
+        found = candidates[paper_id]
+        overlap += len(
+            {reviewer_id for reviewer_id, score in exact.items() if score >= best[9]}
+            & {reviewer_id for reviewer_id, _ in found[:10]}
+        ) / 10
+        captured += sum(exact[reviewer_id] for reviewer_id, _ in found) / sum(best)
+        topical += sum(
+            1 for reviewer_id, _ in found[:10]
+            if set(reviewer_topics[reviewer_id]) & set(paper_topics[paper_id])
+        )
+    print(f"\n   Bulk top-{args.k} vs exhaustive cosine: {captured / len(sample):.2%} of the affinity, "
+          f"top-10 {overlap / len(sample):.1%} the same reviewers")
+    print(f"   Top-10 reviewers sharing a topic with the paper: {topical / (10 * len(sample)):.1%}")
+
+if __name__ == '__main__':
+    main()
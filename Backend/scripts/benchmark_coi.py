@@ -0,0 +1,125 @@
+"""
+Backend/scripts/benchmark_coi.py
+Benchmark: conflict-of-interest detection from the co-authorship graph
+
+Generates a synthetic publication history: research groups of users who
+mostly write with each other (some papers across groups), each group with
+an affiliation, papers spread over the last 15 years. A conference of
+5000 papers meets a reviewer pool of 2000. Measures:
+    - graph build throughput (authorships / s)
+    - conflicts of a whole conference (conflicts_among), 1 and 2 hops
+    - single reviewer x paper checks (conflict) - p50 / p99
+    - incremental: a late paper's authors added, then its conflicts
+
+No database or Flask needed.
+
+Usage:
+    python scripts/benchmark_coi.py
+    python scripts/benchmark_coi.py --users 50000 --history 100000 --papers 5000 --reviewers 2000
+"""
+
+import sys
+import os
+import argparse
+import random
+import time
+from datetime import date
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, SRC_DIR)
+
+from infrastructure.similarity.coauthor_graph import CoauthorGraph, window_start  # noqa: E402
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='UTH-ConfMS conflict-of-interest benchmark')
+    parser.add_argument('--users', type=int, default=50_000)
+    parser.add_argument('--history', type=int, default=100_000, help='earlier papers')
+    parser.add_argument('--group-size', type=int, default=12)
+    parser.add_argument('--papers', type=int, default=5000, help='papers of the conference')
+    parser.add_argument('--reviewers', type=int, default=2000)
+    parser.add_argument('--window', type=float, default=5, help='years')
+    parser.add_argument('--queries', type=int, default=20_000)
+    parser.add_argument('--seed', type=int, default=42)
+    return parser.parse_args()
+
+
+def percentile(samples, pct):
+    return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+    today = date.today().toordinal()
+    groups = max(1, args.users // args.group_size)
+
+    def authors():
+        group = rng.randrange(groups)
+        members = [group * args.group_size + rng.randrange(args.group_size) for _ in range(rng.randint(1, 5))]
+        if rng.random() < 0.15:   # cross-group collaboration
+            members.append(rng.randrange(args.users))
+        return list(dict.fromkeys(members)), f"University {group % 3000}"
+
+    print("="*60)
+    print("🤝 CONFLICT-OF-INTEREST BENCHMARK (co-authorship graph)")
+    print("="*60)
+    print(f"   Users: {args.users:,}   Earlier papers: {args.history:,}   "
+          f"Conference: {args.papers:,} papers x {args.reviewers:,} reviewers   Window: {args.window:g} years")
+
+    graph = CoauthorGraph()
+    started = time.perf_counter()
+    authorships = 0
+    for paper_id in range(args.history):
+        members, affiliation = authors()
+        day = today - rng.randrange(15 * 365)
+        for user_id in members:
+            graph.add_authorship(paper_id, user_id, day, affiliation)
+            authorships += 1
+    conference = list(range(args.history, args.history + args.papers))
+    for paper_id in conference:
+        members, affiliation = authors()
+        for user_id in members:
+            graph.add_authorship(paper_id, user_id, today, affiliation)
+            authorships += 1
+    seconds = time.perf_counter() - started
+    graph.take_touched()
+    stats = graph.stats()
+    print(f"\n   Built: {authorships:,} authorships in {seconds:.2f}s ({authorships / seconds:,.0f}/s), "
+          f"{stats['edges']:,} edges, {stats['affiliations']:,} affiliations")
+
+    pool = rng.sample(range(args.users), args.reviewers)
+    since = window_start(args.window)
+    for hops in (1, 2):
+        started = time.perf_counter()
+        found = graph.conflicts_among(conference, pool, hops, since)
+        seconds = time.perf_counter() - started
+        kinds = {}
+        for kind, _, _ in found.values():
+            kinds[kind] = kinds.get(kind, 0) + 1
+        print(f"   Whole conference, {hops} hop(s): {seconds:.2f}s, {len(found):,} conflicts {kinds}")
+
+    samples = []
+    for _ in range(args.queries):
+        reviewer_id, paper_id = rng.choice(pool), rng.choice(conference)
+        started = time.perf_counter()
+        graph.conflict(reviewer_id, paper_id, 1, since)
+        samples.append((time.perf_counter() - started) * 1e6)
+    samples.sort()
+    print(f"\n   Single check (cached neighbourhoods): p50 {percentile(samples, 50):.1f} µs   "
+          f"p99 {percentile(samples, 99):.1f} µs")
+
+    started = time.perf_counter()
+    late = args.history + args.papers
+    members, affiliation = authors()
+    for user_id in members:
+        graph.add_authorship(late, user_id, today, affiliation)
+    touched = graph.take_touched()
+    affected = graph.affected_by(touched, 1, since)
+    found = graph.conflicts_among([late], pool, 1, since)
+    print(f"   Late paper ({len(members)} authors): {(time.perf_counter() - started) * 1000:.1f} ms, "
+          f"{len(affected)} users affected, {len(found)} conflicts")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+"""
+Backend/scripts/benchmark_dedup.py
+Benchmark: MinHash/LSH near-duplicate detection at 50k papers
+
+Generates a synthetic corpus (title + abstract + body text drawn from a
+Zipf-Mandelbrot vocabulary) and plants near-duplicates: copies of an earlier
+paper, usually in another conference, with a share of their words replaced
+or dropped (--edit-rates). Measures:
+    - signing throughput (shingling + one-permutation MinHash)
+    - index build, size in memory, reload time from the signature log
+    - per-paper lookup latency p50 / p95 / p99 / max and a whole-conference sweep
+    - recall / precision against exact Jaccard similarity of the shingle sets
+    - all-pairs exact comparison on a sample, extrapolated to the full corpus
+
+No database or Flask needed.
+
+Usage:
+    python scripts/benchmark_dedup.py --papers 50000
+    python scripts/benchmark_dedup.py --papers 50000 --body-words 2000 --threshold 0.6
+"""
+
+import sys
+import os
+import argparse
+import itertools
+import random
+import tempfile
+import time
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, SRC_DIR)
+
+from infrastructure.similarity.lsh_index import MinHashLSHIndex  # noqa: E402
+from infrastructure.similarity.minhash import MinHasher, optimal_bands, shingle_hashes  # noqa: E402
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='UTH-ConfMS near-duplicate detection benchmark')
+    parser.add_argument('--papers', type=int, default=50_000)
+    parser.add_argument('--conferences', type=int, default=20)
+    parser.add_argument('--vocabulary', type=int, default=30_000)
+    parser.add_argument('--body-words', type=int, default=300, help='extracted-text words per paper')
+    parser.add_argument('--duplicate-rate', type=float, default=0.02, help='share of papers that are planted copies')
+    parser.add_argument('--edit-rates', default='0.02,0.05,0.1,0.2,0.3',
+                        help='share of words replaced / dropped in a copy (one picked per copy)')
+    parser.add_argument('--threshold', type=float, default=0.5)
+    parser.add_argument('--num-perm', type=int, default=128)
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--brute-sample', type=int, default=1000, help='papers in the all-pairs comparison')
+    parser.add_argument('--seed', type=int, default=42)
+    return parser.parse_args()
+
+
+class Corpus:
+    def __init__(self, vocabulary, rng):
+        self.rng = rng
+        self.words = [f"term{i}" for i in range(vocabulary)]
+        self.cum_weights = list(itertools.accumulate(1.0 / (rank + 30) for rank in range(vocabulary)))
+
+    def words_for(self, length):
+        return self.rng.choices(self.words, cum_weights=self.cum_weights, k=length)
+
+    def paper(self, body_words):
+        return ' '.join(self.words_for(self.rng.randint(6, 14) + self.rng.randint(120, 220) + body_words))
+
+    def near_copy(self, text, edit_rate):
+        out = []
+        for word in text.split():
+            roll = self.rng.random()
+            if roll < edit_rate / 2:
+                continue                                  # dropped
+            out.append(self.words_for(1)[0] if roll < edit_rate else word)  # replaced / kept
+        return ' '.join(out)
+
+
+def percentile(samples, pct):
+    return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+
+def exact_jaccard(first: set, second: set) -> float:
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+    corpus = Corpus(args.vocabulary, rng)
+    edit_rates = [float(rate) for rate in args.edit_rates.split(',')]
+    bands, rows = optimal_bands(args.threshold, args.num_perm)
+
+    print("="*60)
+    print("🧬 NEAR-DUPLICATE DETECTION BENCHMARK (MinHash + LSH)")
+    print("="*60)
+    print(f"   Papers: {args.papers:,}   Conferences: {args.conferences}   "
+          f"Words/paper: ~{170 + args.body_words}")
+    print(f"   Signature: {args.num_perm} x uint32   LSH: {bands} bands x {rows} rows   "
+          f"threshold {args.threshold:g}")
+
+    started = time.perf_counter()
+    texts, conferences, planted = [], [], {}
+    for paper_id in range(args.papers):
+        if paper_id > 100 and rng.random() < args.duplicate_rate:
+            source = rng.randrange(paper_id)
+            edit_rate = rng.choice(edit_rates)
+            texts.append(corpus.near_copy(texts[source], edit_rate))
+            planted[paper_id] = (source, edit_rate)
+        else:
+            texts.append(corpus.paper(args.body_words))
+        conferences.append(rng.randint(1, args.conferences))
+    print(f"   Corpus generated in {time.perf_counter() - started:.1f}s "
+          f"({len(planted):,} planted near-duplicates)")
+
+    # ---------- Signing ----------
+    hasher = MinHasher(num_perm=args.num_perm)
+    shingle_sets = []
+    started = time.perf_counter()
+    for text in texts:
+        shingle_sets.append(shingle_hashes(text, hasher.shingle_size))
+    shingle_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    signatures = [hasher.signature_from_hashes(hashes) for hashes in shingle_sets]
+    minhash_seconds = time.perf_counter() - started
+    per_paper_ms = (shingle_seconds + minhash_seconds) * 1000 / args.papers
+    print(f"\n   Signing: {per_paper_ms:.2f} ms/paper "
+          f"(shingling {shingle_seconds:.1f}s + MinHash {minhash_seconds:.1f}s total)")
+
+    with tempfile.TemporaryDirectory(prefix='uth_minhash_') as index_dir:
+        index = MinHashLSHIndex(num_perm=args.num_perm, bands=bands, rows=rows, path=index_dir)
+        started = time.perf_counter()
+        index.add_many(
+            (paper_id, conferences[paper_id], signatures[paper_id], 0)
+            for paper_id in range(args.papers)
+        )
+        build_seconds = time.perf_counter() - started
+        stats = index.stats()
+        log_mb = stats['log_bytes'] / 2**20
+        print(f"   Index built + written: {build_seconds:.1f}s  "
+              f"(memory {stats['memory_bytes'] / 2**20:.0f} MB, log {log_mb:.0f} MB)")
+
+        started = time.perf_counter()
+        for paper_id in rng.sample(range(args.papers), 200):
+            index.add(paper_id, conferences[paper_id], signatures[paper_id], 0)
+        print(f"   Incremental update: {(time.perf_counter() - started) * 1000 / 200:.2f} ms/paper")
+        index.close()
+
+        started = time.perf_counter()
+        index = MinHashLSHIndex(num_perm=args.num_perm, bands=bands, rows=rows, path=index_dir)
+        print(f"   Reloaded from disk in {time.perf_counter() - started:.2f}s ({len(index):,} papers)")
+
+        # ---------- Lookups ----------
+        query_ids = rng.sample(range(args.papers), min(args.queries, args.papers))
+        samples = []
+        for paper_id in query_ids:
+            started = time.perf_counter()
+            index.similar_to(paper_id, args.threshold)
+            samples.append((time.perf_counter() - started) * 1000)
+        samples.sort()
+        print(f"\n   {'ms':<22}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}")
+        print(f"   {'paper lookup':<22}{percentile(samples, 50):>8.2f}{percentile(samples, 95):>8.2f}"
+              f"{percentile(samples, 99):>8.2f}{samples[-1]:>8.2f}")
+        stats = index.stats()
+        print(f"   Candidates checked per lookup: {stats['candidates_checked'] / max(1, stats['queries']):.2f}")
+
+        started = time.perf_counter()
+        sweep = index.duplicates_in(1, args.threshold)
+        print(f"   Conference sweep ({len(index.paper_ids(1)):,} papers): "
+              f"{time.perf_counter() - started:.2f}s, {len(sweep)} pairs")
+
+        # ---------- Quality ----------
+        found = set()
+        for paper_id in range(args.papers):
+            for other_id, _ in index.similar_to(paper_id, args.threshold):
+                found.add((min(paper_id, other_id), max(paper_id, other_id)))
+        index.close()
+
+    truth_by_edit = {}
+    relevant = set()
+    for copy_id, (source, edit_rate) in planted.items():
+        similarity = exact_jaccard(shingle_sets[copy_id], shingle_sets[source])
+        hit = (min(copy_id, source), max(copy_id, source)) in found
+        bucket = truth_by_edit.setdefault(edit_rate, [0, 0, 0.0])
+        bucket[0] += 1
+        bucket[1] += hit
+        bucket[2] += similarity
+        if similarity >= args.threshold:
+            relevant.add((min(copy_id, source), max(copy_id, source)))
+
+    true_positives = sum(
+        1 for first, second in found
+        if exact_jaccard(shingle_sets[first], shingle_sets[second]) >= args.threshold
+    )
+    print(f"\n   {'edit rate':<12}{'copies':>8}{'mean J':>9}{'found':>8}")
+    for edit_rate in sorted(truth_by_edit):
+        total, hits, similarity_sum = truth_by_edit[edit_rate]
+        print(f"   {edit_rate:<12g}{total:>8}{similarity_sum / total:>9.2f}{hits / total:>8.1%}")
+    recall = len(found & relevant) / max(1, len(relevant))
+    precision = true_positives / max(1, len(found))
+    print(f"   Pairs with exact J >= {args.threshold:g}: recall {recall:.1%}, precision {precision:.1%} "
+          f"({len(found):,} pairs reported)")
+
+    # ---------- All pairs, for comparison ----------
+    sample = rng.sample(range(args.papers), min(args.brute_sample, args.papers))
+    started = time.perf_counter()
+    for first, second in itertools.combinations(sample, 2):
+        exact_jaccard(shingle_sets[first], shingle_sets[second])
+    pair_seconds = (time.perf_counter() - started) / max(1, len(sample) * (len(sample) - 1) // 2)
+    all_pairs = args.papers * (args.papers - 1) // 2
+    print(f"\n   All-pairs exact Jaccard: {pair_seconds * 1e6:.1f} µs/pair -> "
+          f"{all_pairs * pair_seconds / 3600:.1f} h for {all_pairs:,} pairs "
+          f"(LSH: one lookup per paper)")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Backend/scripts/benchmark_paper_listing.py
+Benchmark: keyset vs OFFSET pagination of GET /conferences/<id>/papers
+
+Seeds one conference with --rows papers (default 100k) into a throwaway
+SQLite file, or into DATABASE_URL when it is set, then times one page
+(--page-size rows) at increasing depths with both strategies. With
+--no-index the composite indexes are dropped first to show their effect.
+
+Usage:
+    python scripts/benchmark_paper_listing.py --rows 100000
+    DATABASE_URL=postgresql://... python scripts/benchmark_paper_listing.py --no-index
+"""
+
+import sys
+import os
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+STATUSES = ['submitted', 'under_review', 'accepted', 'rejected']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='UTH-ConfMS paper listing benchmark')
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=20, help='timed runs per measurement')
+    parser.add_argument('--no-index', action='store_true', help='drop the composite indexes first')
+    parser.add_argument('--seed', type=int, default=42)
+    return parser.parse_args()
+
+
+def setup_database(tmp_dir):
+    os.environ.setdefault('APP_ENV', 'testing')
+    os.environ['DB_ECHO'] = 'False'
+    if 'DATABASE_URL' not in os.environ:
+        os.environ['DB_TYPE'] = 'sqlite'
+        os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tmp_dir, 'listing.db')}"
+    sys.path.insert(0, SRC_DIR)
+
+    from infrastructure.databases.base import Base, get_engine
+    import infrastructure.models  # noqa: F401 - register every table
+
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def seed(engine, rows, rng):
+    from sqlalchemy import insert
+    from infrastructure.models import User, Conference, Track, Paper
+
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        user_id = conn.execute(insert(User.__table__).values(
+            username=f'bench_chair_{rng.randint(0, 10**9)}',
+            password_hash='x',
+            full_name='Benchmark Chair',
+            email=f'chair{rng.randint(0, 10**9)}@bench.test',
+            role='Chair',
+            created_at=now,
+            is_deleted=False
+        )).inserted_primary_key[0]
+
+        conference_id = conn.execute(insert(Conference.__table__).values(
+            chair_id=user_id,
+            name='Benchmark Conference',
+            submission_deadline=now + timedelta(days=30),
+            review_deadline=now + timedelta(days=60),
+            is_blind_review=True,
+            created_at=now,
+            is_deleted=False
+        )).inserted_primary_key[0]
+
+        track_ids = [
+            conn.execute(insert(Track.__table__).values(
+                conference_id=conference_id, name=f'Track {i}', code=f'T{i}',
+                created_at=now, is_deleted=False
+            )).inserted_primary_key[0]
+            for i in range(4)
+        ]
+
+    start = now - timedelta(days=90)
+    batch = []
+    with engine.begin() as conn:
+        for i in range(rows):
+            batch.append({
+                'title': f'Paper {i}',
+                'abstract': 'lorem ipsum ' * 80,
+                'keywords': 'benchmark',
+                'pdf_path': f'blobs/00/00/{i:064x}',
+                'status': rng.choice(STATUSES).upper(),
+                'is_withdrawn': False,
+                'submitter_id': user_id,
+                'conference_id': conference_id,
+                'track_id': rng.choice(track_ids),
+                # many papers share a timestamp -> exercises the id tie-break
+                'created_at': start + timedelta(seconds=rng.randint(0, 90 * 86400 // 10) * 10),
+                'updated_at': now,
+            })
+            if len(batch) == 10_000:
+                conn.execute(insert(Paper.__table__), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(Paper.__table__), batch)
+
+    return user_id, conference_id
+
+
+def drop_indexes(engine):
+    from infrastructure.models import Paper
+    for index in Paper.__table__.indexes:
+        if index.name and index.name.startswith('ix_papers_conference'):
+            index.drop(bind=engine, checkfirst=True)
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000  # median ms
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory(prefix='uth_listing_') as tmp_dir:
+        engine = setup_database(tmp_dir)
+
+        from infrastructure.databases.unit_of_work import session_scope
+        from infrastructure.models import Paper
+        from sqlalchemy import or_
+        from domain.services.paper_service import PaperService, encode_cursor, decode_cursor, DEFAULT_FIELDS
+
+        print("="*60)
+        print("📄 PAPER LISTING BENCHMARK")
+        print("="*60)
+        print(f"   Rows: {args.rows:,}   Page size: {args.page_size}   Indexes: {'off' if args.no_index else 'on'}")
+
+        started = time.perf_counter()
+        user_id, conference_id = seed(engine, args.rows, rng)
+        print(f"   Seeded in {time.perf_counter() - started:.1f}s")
+
+        if args.no_index:
+            drop_indexes(engine)
+
+        chair = {'user_id': user_id, 'role': ['Chair']}
+        columns = [getattr(Paper, name) for name in DEFAULT_FIELDS]
+
+        def offset_page(depth):
+            with session_scope(read_only=True) as db:
+                return db.query(*columns).filter(
+                    Paper.conference_id == conference_id
+                ).order_by(
+                    Paper.created_at.desc(), Paper.id.desc()
+                ).offset(depth).limit(args.page_size + 1).all()
+
+        def keyset_query(cursor):
+            # Same SQL as the service, without access check / serialization,
+            # so it compares like for like with offset_page
+            with session_scope(read_only=True) as db:
+                query = db.query(*columns).filter(Paper.conference_id == conference_id)
+                if cursor:
+                    created_at, paper_id = decode_cursor(cursor)
+                    query = query.filter(
+                        Paper.created_at <= created_at,
+                        or_(Paper.created_at < created_at, Paper.id < paper_id)
+                    )
+                return query.order_by(
+                    Paper.created_at.desc(), Paper.id.desc()
+                ).limit(args.page_size + 1).all()
+
+        def cursor_at(depth):
+            if depth == 0:
+                return None
+            row = offset_page(depth - 1)[0]
+            return encode_cursor(row.created_at, row.id)
+
+        def keyset_page(cursor, status=None):
+            result, error = PaperService.list_conference_papers(
+                conference_id=conference_id,
+                current_user=chair,
+                status=status,
+                cursor=cursor,
+                limit=args.page_size
+            )
+            if error:
+                raise SystemExit(f"❌ {error}")
+            return result
+
+        depths = [d for d in (0, 1_000, 10_000, 50_000, args.rows - args.page_size) if 0 <= d < args.rows]
+        # OFFSET / keyset: the bare queries; API: the whole list_conference_papers call
+        print(f"\n   {'depth':>9}{'OFFSET ms':>12}{'keyset ms':>12}{'speed-up':>10}{'API ms':>10}")
+        for depth in sorted(set(depths)):
+            cursor = cursor_at(depth)
+            offset_ms = timed(lambda: offset_page(depth), args.repeat)
+            keyset_ms = timed(lambda: keyset_query(cursor), args.repeat)
+            api_ms = timed(lambda: keyset_page(cursor), args.repeat)
+            print(f"   {depth:>9,}{offset_ms:>12.2f}{keyset_ms:>12.2f}{offset_ms / keyset_ms:>9.1f}x{api_ms:>10.2f}")
+
+        # Filtered listing uses ix_papers_conference_status_created
+        filtered_ms = timed(lambda: keyset_page(None, status=['accepted']), args.repeat)
+        print(f"\n   status=accepted first page: {filtered_ms:.2f} ms")
+
+        # Full walk with the cursor - total cost grows linearly with the row count
+        walk_rows = min(args.rows, 10_000)
+        started = time.perf_counter()
+        cursor, seen = None, 0
+        while seen < walk_rows:
+            page = keyset_page(cursor)
+            seen += len(page['papers'])
+            cursor = page['next_cursor']
+            if not cursor:
+                break
+        elapsed = time.perf_counter() - started
+        print(f"   keyset walk of {seen:,} rows: {elapsed * 1000:.0f} ms "
+              f"({elapsed * 1000 / max(1, seen // args.page_size):.2f} ms/page)")
+
+        if engine.dialect.name == 'sqlite':
+            from sqlalchemy import text
+            with engine.connect() as conn:
+                plan = conn.execute(text(
+                    "EXPLAIN QUERY PLAN SELECT id FROM papers WHERE conference_id = :c "
+                    "AND created_at <= :t ORDER BY created_at DESC, id DESC LIMIT 51"
+                ), {'c': conference_id, 't': datetime.utcnow()}).fetchall()
+            print("\n   Query plan (keyset page):")
+            for row in plan:
+                print(f"     {row[-1]}")
+
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
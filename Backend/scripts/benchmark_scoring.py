@@ -0,0 +1,115 @@
+"""
+Backend/scripts/benchmark_scoring.py
+Benchmark: review score aggregation and reviewer calibration
+
+Generates a synthetic conference: every paper has a true quality, every
+reviewer a harshness (bias) and a spread, each paper gets `--per-paper`
+reviews from random reviewers. Measures:
+    - full recompute of a conference (score_conference) - reviews / s
+    - incremental: one new review, the reviewer's papers recomputed from
+      the reviews of everyone involved (what the commit hook does)
+    - ranking quality: rank correlation with the true quality of the raw
+      mean vs the calibrated score
+
+No database or Flask needed.
+
+Usage:
+    python scripts/benchmark_scoring.py
+    python scripts/benchmark_scoring.py --papers 5000 --reviewers 1500 --per-paper 3
+"""
+
+import sys
+import os
+import argparse
+import random
+import time
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, SRC_DIR)
+
+from domain.services.scoring_logic import (  # noqa: E402
+    aggregate_papers, calibrate_reviewers, columns, conference_prior, score_conference
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='UTH-ConfMS review scoring benchmark')
+    parser.add_argument('--papers', type=int, default=5000)
+    parser.add_argument('--reviewers', type=int, default=1500)
+    parser.add_argument('--per-paper', type=int, default=3)
+    parser.add_argument('--bias', type=float, default=1.5, help='std of reviewer harshness')
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    return parser.parse_args()
+
+
+def percentile(samples, pct):
+    return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+
+def rank_correlation(truth: dict, estimate: dict) -> float:
+    """Spearman correlation of two {paper_id: value} maps"""
+    def ranks(values):
+        order = sorted(values, key=values.get)
+        return {key: rank for rank, key in enumerate(order)}
+    a, b = ranks(truth), ranks({key: estimate[key] for key in truth})
+    n = len(a)
+    return 1 - 6 * sum((a[key] - b[key]) ** 2 for key in a) / (n * (n * n - 1))
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+    quality = {paper_id: rng.gauss(5.5, 1.5) for paper_id in range(args.papers)}
+    harshness = [rng.gauss(0, args.bias) for _ in range(args.reviewers)]
+    spread = [rng.uniform(0.5, 1.5) for _ in range(args.reviewers)]
+
+    rows = []
+    for paper_id in range(args.papers):
+        for reviewer_id in rng.sample(range(args.reviewers), args.per_paper):
+            score = quality[paper_id] + harshness[reviewer_id] + rng.gauss(0, spread[reviewer_id])
+            rows.append((paper_id, reviewer_id, round(min(10, max(1, score)))))
+
+    print("="*60)
+    print("📊 REVIEW SCORING BENCHMARK (aggregation + calibration)")
+    print("="*60)
+    print(f"   Papers: {args.papers:,}   Reviewers: {args.reviewers:,}   Reviews: {len(rows):,}   "
+          f"Harshness std: {args.bias:g}")
+
+    started = time.perf_counter()
+    prior, calibration, papers = score_conference(rows)
+    seconds = time.perf_counter() - started
+    print(f"\n   Full recompute: {seconds * 1000:.0f} ms ({len(rows) / seconds:,.0f} reviews/s), "
+          f"conference mean {prior.mean:.2f} ± {prior.std:.2f}")
+
+    mean = rank_correlation(quality, {paper_id: scores.mean for paper_id, scores in papers.items()})
+    calibrated = rank_correlation(quality, {paper_id: scores.calibrated for paper_id, scores in papers.items()})
+    print(f"   Rank correlation with true quality: mean {mean:.3f}   calibrated {calibrated:.3f}")
+
+    by_reviewer, by_paper = {}, {}
+    for row in rows:
+        by_reviewer.setdefault(row[1], []).append(row)
+        by_paper.setdefault(row[0], []).append(row)
+
+    samples = []
+    for _ in range(args.queries):
+        reviewer_id = rng.randrange(args.reviewers)
+        started = time.perf_counter()
+        affected = {row[0] for row in by_reviewer.get(reviewer_id, ())}
+        involved = {row[1] for paper_id in affected for row in by_paper[paper_id]}
+        subset = [row for involved_id in involved for row in by_reviewer[involved_id]]
+        paper_ids, reviewer_ids, scores = columns(subset)
+        reviewers = calibrate_reviewers(reviewer_ids, scores, prior)
+        aggregate_papers(paper_ids, reviewer_ids, scores, reviewers, prior, only=affected)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    print(f"\n   Incremental (one reviewer's papers, ~{len(rows) / args.reviewers:.0f}): "
+          f"p50 {percentile(samples, 50):.2f} ms   p99 {percentile(samples, 99):.2f} ms")
+
+    check = conference_prior(None, count=len(rows), total=sum(row[2] for row in rows),
+                             squares=sum(row[2] ** 2 for row in rows))
+    print(f"   SQL-aggregate prior matches: {abs(check.mean - prior.mean) < 1e-9 and abs(check.std - prior.std) < 1e-9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+"""
+Backend/scripts/benchmark_search.py
+Benchmark: in-memory BM25 paper search at 100k papers
+
+Generates a synthetic corpus (title / keywords / abstract drawn from a
+Zipf-Mandelbrot vocabulary - the shape of topical words once stop words are
+gone) and measures:
+    - index build + snapshot time, snapshot size, load time from disk
+    - query latency p50 / p95 / p99 / max against --target-ms
+    - latency again after --updates incremental edits (journal + delta path)
+    - how many queries hit max_postings (results marked truncated) and how
+      much of their top 20 the exact ranking (max_postings=0) shares
+    - a second worker on the same index directory catching up on the
+      journal the first one wrote, and its search latency meanwhile
+    - optionally (--like) the LIKE '%term%' scan it replaces, on SQLite
+
+Queries are 1-3 words drawn from the same distribution, so frequent words
+show up as often as they would in real searches. The "head" row queries
+only the most frequent words - the worst case for the threshold algorithm.
+
+No database or Flask needed.
+
+Usage:
+    python scripts/benchmark_search.py --papers 100000
+    python scripts/benchmark_search.py --papers 100000 --conferences 20 --like
+"""
+
+import sys
+import os
+import argparse
+import itertools
+import random
+import sqlite3
+import tempfile
+import time
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, SRC_DIR)
+
+from infrastructure.search.bm25_index import InMemoryBM25Backend  # noqa: E402
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='UTH-ConfMS paper search benchmark')
+    parser.add_argument('--papers', type=int, default=100_000)
+    parser.add_argument('--conferences', type=int, default=1, help='papers are spread over this many conferences')
+    parser.add_argument('--vocabulary', type=int, default=30_000)
+    parser.add_argument('--queries', type=int, default=1000)
+    parser.add_argument('--updates', type=int, default=2000, help='incremental edits before the second run')
+    parser.add_argument('--target-ms', type=float, default=20.0)
+    parser.add_argument('--like', action='store_true', help="also time LIKE '%%term%%' on SQLite")
+    parser.add_argument('--seed', type=int, default=42)
+    return parser.parse_args()
+
+
+class Corpus:
+    def __init__(self, vocabulary, rng):
+        self.rng = rng
+        self.words = [f"term{i}" for i in range(vocabulary)]
+        # cum_weights: choices() would otherwise re-accumulate on every call
+        self.cum_weights = list(itertools.accumulate(1.0 / (rank + 30) for rank in range(vocabulary)))
+
+    def text(self, length):
+        return ' '.join(self.rng.choices(self.words, cum_weights=self.cum_weights, k=length))
+
+    def paper(self):
+        return {
+            'title': self.text(self.rng.randint(6, 14)),
+            'keywords': self.text(self.rng.randint(3, 6)),
+            'abstract': self.text(self.rng.randint(120, 220)),
+        }
+
+    def query(self):
+        return self.text(self.rng.choice((1, 2, 2, 3)))
+
+
+def python_speed():
+    """Seconds for 10M interpreted additions - ~0.4s on a current server core"""
+    started = time.perf_counter()
+    total = 0
+    for i in range(10_000_000):
+        total += i
+    return time.perf_counter() - started
+
+
+def percentile(samples, pct):
+    return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+
+def run_queries(backend, queries, conference_ids, rng):
+    """(sorted latencies in ms, [(query, conference_id, hits)] of truncated results)"""
+    samples, truncated = [], []
+    for query in queries:
+        conference_id = rng.choice(conference_ids)
+        started = time.perf_counter()
+        hits = backend.search(query, conference_id=conference_id, limit=20)
+        samples.append((time.perf_counter() - started) * 1000)
+        if hits.truncated:
+            truncated.append((query, conference_id, hits))
+    samples.sort()
+    return samples, truncated
+
+
+def report(label, run, target_ms):
+    samples, truncated = run
+    p99 = percentile(samples, 99)
+    verdict = '✅' if p99 < target_ms else '❌'
+    print(f"   {label:<22}{percentile(samples, 50):>8.2f}{percentile(samples, 95):>8.2f}"
+          f"{p99:>8.2f}{samples[-1]:>8.2f}   {verdict}   {len(truncated):>5}")
+    return truncated
+
+
+def exact_overlap(backend, truncated):
+    """Mean share of a truncated top 20 that is also in the exact top 20"""
+    if not truncated:
+        return 1.0
+    budget, backend.max_postings = backend.max_postings, 0
+    try:
+        shares = []
+        for query, conference_id, hits in truncated:
+            exact = {hit.paper_id for hit in backend.search(query, conference_id=conference_id, limit=20)}
+            shares.append(len(exact & {hit.paper_id for hit in hits}) / max(1, len(exact)))
+    finally:
+        backend.max_postings = budget
+    return sum(shares) / len(shares)
+
+
+def like_baseline(rows, queries, rng):
+    db = sqlite3.connect(':memory:')
+    db.execute("CREATE TABLE papers (id INTEGER PRIMARY KEY, conference_id INTEGER, "
+               "title TEXT, keywords TEXT, abstract TEXT)")
+    db.executemany("INSERT INTO papers VALUES (?, ?, ?, ?, ?)", (
+        (paper_id, conference_id, fields['title'], fields['keywords'], fields['abstract'])
+        for paper_id, conference_id, fields in rows
+    ))
+    samples = []
+    for query in queries:
+        word = rng.choice(query.split())
+        pattern = f'%{word}%'
+        started = time.perf_counter()
+        db.execute(
+            "SELECT id FROM papers WHERE title LIKE ? OR keywords LIKE ? OR abstract LIKE ? LIMIT 20",
+            (pattern, pattern, pattern)
+        ).fetchall()
+        samples.append((time.perf_counter() - started) * 1000)
+    db.close()
+    samples.sort()
+    return samples
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+    corpus = Corpus(args.vocabulary, rng)
+    conference_ids = list(range(1, args.conferences + 1))
+
+    print("="*60)
+    print("🔎 PAPER SEARCH BENCHMARK (in-memory BM25)")
+    print("="*60)
+    print(f"   Papers: {args.papers:,}   Conferences: {args.conferences}   Vocabulary: {args.vocabulary:,}")
+    print(f"   Python speed: {python_speed():.2f}s per 10M additions (scale the latencies below by it)")
+
+    started = time.perf_counter()
+    rows = [(paper_id, rng.choice(conference_ids), corpus.paper()) for paper_id in range(1, args.papers + 1)]
+    print(f"   Corpus generated in {time.perf_counter() - started:.1f}s")
+
+    queries = [corpus.query() for _ in range(args.queries)]
+    head_queries = [' '.join(rng.sample(corpus.words[:10], 3)) for _ in range(max(20, args.queries // 20))]
+
+    with tempfile.TemporaryDirectory(prefix='uth_search_') as index_dir:
+        backend = InMemoryBM25Backend(path=index_dir, snapshot_every=10**9)
+
+        started = time.perf_counter()
+        backend.rebuild(rows)
+        build_seconds = time.perf_counter() - started
+        snapshot_mb = os.path.getsize(os.path.join(index_dir, 'snapshot.pickle')) / 2**20
+        stats = backend.stats()
+        print(f"   Index built + snapshot: {build_seconds:.1f}s  "
+              f"({stats['terms']:,} terms, snapshot {snapshot_mb:.0f} MB)")
+        backend.close()
+
+        started = time.perf_counter()
+        backend = InMemoryBM25Backend(path=index_dir, snapshot_every=10**9)
+        print(f"   Loaded from disk in {time.perf_counter() - started:.2f}s")
+
+        run_queries(backend, queries[:50], conference_ids, rng)  # warm-up
+        second_worker = InMemoryBM25Backend(path=index_dir, snapshot_every=10**9)
+
+        print(f"\n   {'ms':<22}{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8}   p99 < {args.target_ms:g} ms   truncated")
+        truncated = report('queries', run_queries(backend, queries, conference_ids, rng), args.target_ms)
+        head_truncated = report('head terms only', run_queries(backend, head_queries, conference_ids, rng),
+                                args.target_ms)
+
+        started = time.perf_counter()
+        for _ in range(args.updates):
+            paper_id = rng.randint(1, args.papers)
+            backend.index(paper_id, rng.choice(conference_ids), corpus.paper())
+        update_ms = (time.perf_counter() - started) * 1000 / max(1, args.updates)
+        report(f'after {args.updates:,} edits', run_queries(backend, queries, conference_ids, rng), args.target_ms)
+
+        stats = backend.stats()
+        print(f"\n   Incremental update: {update_ms:.2f} ms/paper "
+              f"({stats['journal_entries']:,} journal entries, {stats['renormalizations']} renormalizations)")
+        print(f"   Postings read per query: {stats['postings_scanned'] / max(1, stats['queries']):,.0f}  "
+              f"(max_postings {backend.max_postings:,})")
+        print(f"   Truncated results sharing the exact top 20: queries {exact_overlap(backend, truncated):.1%}   "
+              f"head terms {exact_overlap(backend, head_truncated):.1%}")
+
+        # The second worker was loaded before the edits - its tailer replays them
+        # in the background while it keeps answering searches
+        started = time.perf_counter()
+        during = []
+        while not second_worker.caught_up():
+            query = rng.choice(queries)
+            query_started = time.perf_counter()
+            second_worker.search(query, conference_id=rng.choice(conference_ids), limit=20)
+            during.append((time.perf_counter() - query_started) * 1000)
+        catch_up_ms = (time.perf_counter() - started) * 1000
+        query = queries[0]
+        same = [hit.paper_id for hit in second_worker.search(query, conference_id=conference_ids[0], limit=20)] == \
+            [hit.paper_id for hit in backend.search(query, conference_id=conference_ids[0], limit=20)]
+        print(f"   Second worker: replayed {second_worker.stats()['journal_entries']:,} journal entries "
+              f"in the background in {catch_up_ms:.0f} ms, same hits as the writer: {same}")
+        if during:
+            during.sort()
+            print(f"   Its {len(during):,} searches meanwhile: p50 {percentile(during, 50):.2f} ms  "
+                  f"p99 {percentile(during, 99):.2f} ms  max {during[-1]:.2f} ms")
+        second_worker.close()
+        backend.close()
+
+    if args.like:
+        like = like_baseline(rows, queries[:100], rng)
+        print(f"\n   LIKE '%term%' (SQLite, 100 queries): p50 {percentile(like, 50):.1f} ms  "
+              f"p99 {percentile(like, 99):.1f} ms")
+
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Backend/scripts/benchmark_startup.py
+Import-time / create_app() startup benchmark
+
+Each run happens in a fresh interpreter so nothing is cached between runs.
+Importing the app must not create the engine or open connections; the script
+fails if it does.
+
+The same probe is also run in "eager" mode, which builds the engine while
+importing like the module did before engine creation became lazy, so the
+difference is the startup cost every process (and prefork worker) saves.
+Children use DATABASE_URL when it is set, else a throwaway SQLite file (eager
+mode needs the driver of the configured database).
+
+Usage:
+    python scripts/benchmark_startup.py [runs] [--json results.json] [--importtime]
+"""
+
+import sys
+import os
+import json
+import statistics
+import subprocess
+import tempfile
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Runs inside the child interpreter; prints one JSON line
+PROBE = r'''
+import json, sys, time
+t0 = time.perf_counter()
+import app as app_module
+if EAGER:
+    import infrastructure.databases.base as base
+    base.get_engine()
+t1 = time.perf_counter()
+application = app_module.create_app('testing')
+t2 = time.perf_counter()
+import infrastructure.databases.base as base
+print(json.dumps({
+    'import_seconds': t1 - t0,
+    'create_app_seconds': t2 - t1,
+    'engine_created': base._engine is not None,
+    'modules_loaded': len(sys.modules),
+}))
+'''
+
+
+def run_once(importtime=False, eager=False):
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ['-X', 'importtime']
+    cmd += ['-c', f"EAGER = {eager}\n" + PROBE]
+    result = subprocess.run(cmd, cwd=SRC_DIR, capture_output=True, text=True, env=CHILD_ENV)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+
+    # The probe's JSON is the last stdout line (banners may precede it)
+    sample = json.loads(result.stdout.strip().splitlines()[-1])
+    if importtime:
+        sample['importtime'] = result.stderr
+    return sample
+
+
+CHILD_ENV = dict(os.environ)
+if 'DATABASE_URL' not in CHILD_ENV:
+    CHILD_ENV['DB_TYPE'] = 'sqlite'
+    CHILD_ENV['DATABASE_URL'] = f"sqlite:///{os.path.join(tempfile.gettempdir(), 'uth_startup_benchmark.db')}"
+
+
+def summarize(values):
+    return {
+        'min': min(values),
+        'median': statistics.median(values),
+        'max': max(values),
+    }
+
+
+def main():
+    args = sys.argv[1:]
+    runs = int(args[0]) if args and args[0].isdigit() else 10
+    json_path = args[args.index('--json') + 1] if '--json' in args else None
+    importtime = '--importtime' in args
+
+    print("="*60)
+    print("⏱️  STARTUP BENCHMARK (create_app('testing'))")
+    print("="*60)
+
+    # Interleaved so both modes see the same machine load
+    samples, eager_samples = [], []
+    for _ in range(runs):
+        samples.append(run_once())
+        eager_samples.append(run_once(eager=True))
+
+    def startup(sample):
+        return sample['import_seconds'] + sample['create_app_seconds']
+
+    engine_created = any(sample['engine_created'] for sample in samples)
+    report = {
+        'runs': runs,
+        'import_seconds': summarize([s['import_seconds'] for s in samples]),
+        'create_app_seconds': summarize([s['create_app_seconds'] for s in samples]),
+        'startup_seconds': summarize([startup(s) for s in samples]),
+        'eager_startup_seconds': summarize([startup(s) for s in eager_samples]),
+        'modules_loaded': samples[-1]['modules_loaded'],
+        'engine_created_at_startup': engine_created,
+    }
+
+    for key in ('import_seconds', 'create_app_seconds', 'startup_seconds', 'eager_startup_seconds'):
+        stats = report[key]
+        print(f"   {key:<22} min={stats['min'] * 1000:7.1f} ms  "
+              f"median={stats['median'] * 1000:7.1f} ms  max={stats['max'] * 1000:7.1f} ms")
+    saved = report['eager_startup_seconds']['median'] - report['startup_seconds']['median']
+    print(f"   lazy engine saves      {saved * 1000:7.1f} ms per process (median)")
+    print(f"   modules loaded         {report['modules_loaded']}")
+    print(f"   engine at startup      {'❌ YES' if engine_created else '✅ no'}")
+
+    if importtime:
+        # Slowest 15 imports (cumulative µs) from -X importtime
+        lines = [l for l in run_once(importtime=True)['importtime'].splitlines() if l.startswith('import time:')]
+        rows = []
+        for line in lines[1:]:
+            _, self_us, cumulative_us, name = [part.strip() for part in line.split('|')]
+            rows.append((int(cumulative_us), name))
+        print("\n   Slowest imports (cumulative):")
+        for cumulative_us, name in sorted(rows, reverse=True)[:15]:
+            print(f"   {cumulative_us / 1000:8.1f} ms  {name}")
+
+    if json_path:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n   Saved: {json_path}")
+
+    print("="*60)
+    if engine_created:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""
+Backend/scripts/load_test_auth.py
+Load test for /api/v1/auth/register, /login and /me
+
+Runs create_app('testing') in-process (Flask test client, one per worker
+thread) against a throwaway SQLite file, or against DATABASE_URL when it is
+set (e.g. a local Postgres). With --base-url it drives a running server over
+HTTP instead.
+
+Every performance feature can be toggled with --set so it is measured against
+the baseline, e.g.:
+    --set HASH_WORKERS=0               bcrypt inline on the request thread
+    --set TOKEN_CACHE_SIZE=0           no verified-token cache
+    --set PROFILE_CACHE_SIZE=0         no /me profile cache
+    --set DB_POOL_SIZE=2               smaller pool
+
+Usage:
+    python scripts/load_test_auth.py --users 200 --clients 16 --requests 2000 --json out.json
+    python scripts/load_test_auth.py --compare baseline.json --threshold 0.15
+"""
+
+import sys
+import os
+import argparse
+import json
+import math
+import platform
+import random
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+PASSWORD = 'LoadTest@123'
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='UTH-ConfMS auth load test')
+    parser.add_argument('--users', type=int, default=100, help='accounts created in the register phase')
+    parser.add_argument('--clients', type=int, default=8, help='concurrent client threads')
+    parser.add_argument('--requests', type=int, default=1000, help='requests per endpoint (login, me)')
+    parser.add_argument('--base-url', help='drive a running server instead of an in-process app')
+    parser.add_argument('--set', action='append', default=[], metavar='KEY=VALUE',
+                        help='config override applied before the app is imported')
+    parser.add_argument('--json', help='write results to this file')
+    parser.add_argument('--compare', help='baseline JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='allowed relative regression of p95 / throughput (default 0.10)')
+    parser.add_argument('--seed', type=int, default=42)
+    return parser.parse_args()
+
+
+# ---------- Clients ----------
+
+class InProcessClient:
+    """Flask test client - one per thread"""
+
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def request(self, method, path, body=None, token=None):
+        headers = {'Authorization': f'Bearer {token}'} if token else {}
+        response = self.client.open(path, method=method, json=body, headers=headers)
+        return response.status_code, response.get_json(silent=True)
+
+
+class HttpClient:
+    """Plain urllib client for --base-url"""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+
+    def request(self, method, path, body=None, token=None):
+        import urllib.request
+        import urllib.error
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        req = urllib.request.Request(self.base_url + path, data=data, method=method)
+        req.add_header('Content-Type', 'application/json')
+        if token:
+            req.add_header('Authorization', f'Bearer {token}')
+        try:
+            with urllib.request.urlopen(req, timeout=30) as response:
+                return response.status, json.loads(response.read() or b'null')
+        except urllib.error.HTTPError as e:
+            return e.code, None
+
+
+# ---------- Phases ----------
+
+def run_phase(name, make_client, jobs, clients):
+    """Run jobs (callables taking a client) on `clients` threads; returns latencies"""
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+    cursor = iter(jobs)
+
+    def worker():
+        nonlocal errors
+        client = make_client()
+        local_latencies = []
+        local_errors = 0
+        while True:
+            with lock:
+                job = next(cursor, None)
+            if job is None:
+                break
+            start = time.perf_counter()
+            ok = job(client)
+            local_latencies.append(time.perf_counter() - start)
+            if not ok:
+                local_errors += 1
+        with lock:
+            latencies.extend(local_latencies)
+            errors += local_errors
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker, name=f'{name}-{i}') for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return summarize(latencies, errors, elapsed)
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies, errors, elapsed):
+    values = sorted(latencies)
+    return {
+        'requests': len(values),
+        'errors': errors,
+        'elapsed_seconds': round(elapsed, 4),
+        'throughput_rps': round(len(values) / elapsed, 2) if elapsed else 0.0,
+        'p50_ms': round(percentile(values, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(values, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(values, 0.99) * 1000, 3),
+        'max_ms': round(values[-1] * 1000, 3) if values else 0.0,
+    }
+
+
+# ---------- Setup ----------
+
+def apply_overrides(overrides):
+    applied = {}
+    for item in overrides:
+        key, sep, value = item.partition('=')
+        if not sep:
+            raise SystemExit(f"--set expects KEY=VALUE, got '{item}'")
+        os.environ[key] = value
+        applied[key] = value
+    return applied
+
+
+def build_app(tmp_dir):
+    """create_app('testing') on a fresh database with all tables"""
+    os.environ.setdefault('APP_ENV', 'testing')
+    if 'DATABASE_URL' not in os.environ:
+        os.environ['DB_TYPE'] = 'sqlite'
+        os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tmp_dir, 'load_test.db')}"
+    os.environ.setdefault('AUDIT_SPILL_PATH', os.path.join(tmp_dir, 'audit_spill.jsonl'))
+
+    sys.path.insert(0, SRC_DIR)
+    from app import create_app
+    from infrastructure.databases.base import Base, get_engine
+    import infrastructure.models  # noqa: F401 - register every table
+
+    app = create_app('testing')
+    Base.metadata.create_all(bind=get_engine())
+    return app
+
+
+def snapshot_settings():
+    from config import get_config
+    current_config = get_config()
+    keys = [
+        'DB_TYPE', 'DB_POOL_SIZE', 'BCRYPT_ROUNDS', 'HASH_WORKERS', 'HASH_QUEUE_SIZE',
+        'TOKEN_CACHE_SIZE', 'TOKEN_CACHE_TTL', 'PROFILE_CACHE_SIZE', 'PROFILE_CACHE_TTL',
+        'LOGIN_THROTTLE_ENABLED', 'AUDIT_BATCH_SIZE',
+    ]
+    return {key: getattr(current_config, key, None) for key in keys}
+
+
+# ---------- Compare ----------
+
+def compare(current, baseline, threshold):
+    """Return a list of regression messages (empty = OK)"""
+    regressions = []
+    for endpoint, stats in current['endpoints'].items():
+        base = baseline.get('endpoints', {}).get(endpoint)
+        if not base:
+            continue
+        if base['p95_ms'] and stats['p95_ms'] > base['p95_ms'] * (1 + threshold):
+            regressions.append(
+                f"{endpoint}: p95 {stats['p95_ms']:.1f} ms vs baseline {base['p95_ms']:.1f} ms"
+            )
+        if base['throughput_rps'] and stats['throughput_rps'] < base['throughput_rps'] * (1 - threshold):
+            regressions.append(
+                f"{endpoint}: throughput {stats['throughput_rps']:.0f} rps vs baseline {base['throughput_rps']:.0f} rps"
+            )
+    return regressions
+
+
+def main():
+    args = parse_args()
+    rng = random.Random(args.seed)
+
+    # Hammering one account from one IP is the point here - throttle off unless asked
+    os.environ.setdefault('LOGIN_THROTTLE_ENABLED', 'False')
+    overrides = apply_overrides(args.set)
+
+    with tempfile.TemporaryDirectory(prefix='uth_load_') as tmp_dir:
+        if args.base_url:
+            make_client = lambda: HttpClient(args.base_url)
+            settings = {'base_url': args.base_url}
+        else:
+            app = build_app(tmp_dir)
+            make_client = lambda: InProcessClient(app)
+            settings = snapshot_settings()
+
+        run_id = f"{int(time.time())}{rng.randint(1000, 9999)}"
+        usernames = [f"load{run_id}_{i}" for i in range(args.users)]
+        tokens = {}
+        tokens_lock = threading.Lock()
+
+        print("="*60)
+        print("🏋️  AUTH LOAD TEST")
+        print("="*60)
+        print(f"   Users: {args.users}   Clients: {args.clients}   Requests/endpoint: {args.requests}")
+        if overrides:
+            print(f"   Overrides: {overrides}")
+
+        def register_job(username):
+            def job(client):
+                status, body = client.request('POST', '/api/v1/auth/register', {
+                    'username': username,
+                    'password': PASSWORD,
+                    'email': f'{username}@load.test',
+                    'full_name': 'Load Test',
+                })
+                if status == 201:
+                    with tokens_lock:
+                        tokens[username] = body['data']['token']
+                return status == 201
+            return job
+
+        def login_job(username):
+            def job(client):
+                status, _ = client.request('POST', '/api/v1/auth/login', {
+                    'username': username,
+                    'password': PASSWORD,
+                })
+                return status == 200
+            return job
+
+        def me_job(token):
+            def job(client):
+                status, _ = client.request('GET', '/api/v1/auth/me', token=token)
+                return status == 200
+            return job
+
+        results = {}
+        results['register'] = run_phase(
+            'register', make_client, [register_job(u) for u in usernames], args.clients
+        )
+        if not tokens:
+            raise SystemExit("❌ No user could register - is the app healthy?")
+
+        registered = list(tokens)
+        results['login'] = run_phase(
+            'login', make_client,
+            [login_job(rng.choice(registered)) for _ in range(args.requests)],
+            args.clients
+        )
+        results['me'] = run_phase(
+            'me', make_client,
+            [me_job(tokens[rng.choice(registered)]) for _ in range(args.requests)],
+            args.clients
+        )
+
+    report = {
+        'timestamp': datetime.utcnow().isoformat() + 'Z',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {
+            'users': args.users,
+            'clients': args.clients,
+            'requests': args.requests,
+            'seed': args.seed,
+            'overrides': overrides,
+        },
+        'settings': settings,
+        'endpoints': results,
+    }
+
+    print(f"\n   {'endpoint':<10}{'req':>7}{'err':>6}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for endpoint, stats in results.items():
+        print(f"   {endpoint:<10}{stats['requests']:>7}{stats['errors']:>6}{stats['throughput_rps']:>10.1f}"
+              f"{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n   Saved: {args.json}")
+
+    exit_code = 0
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ Regressions (> {args.threshold:.0%}):")
+            for message in regressions:
+                print(f"   - {message}")
+            exit_code = 1
+        else:
+            print(f"\n✅ No regression vs {args.compare} (threshold {args.threshold:.0%})")
+
+    print("="*60)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
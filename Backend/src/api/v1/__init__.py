@@ -0,0 +1,22 @@
+# ============================================
+# File: Backend/src/api/v1/__init__.py
+# ============================================
+"""
+API v1 - every route is mounted under /api/v1
+"""
+
+from flask import Blueprint
+
+from api.v1.auth import auth_bp
+from api.v1.conferences import conferences_bp
+from api.v1.papers import papers_bp
+from api.v1.submissions import submissions_bp
+from api.v1.uploads import uploads_bp
+
+
+v1_bp = Blueprint('v1', __name__, url_prefix='/api/v1')
+v1_bp.register_blueprint(auth_bp)
+v1_bp.register_blueprint(conferences_bp)
+v1_bp.register_blueprint(papers_bp)
+v1_bp.register_blueprint(submissions_bp)
+v1_bp.register_blueprint(uploads_bp)
@@ -5,14 +5,17 @@
 Authentication API Routes
 """
 
+import math
 from flask import Blueprint, request, jsonify
-from domain.services.auth_service import AuthService
+from domain.services.auth_service import AuthService, USERNAME_TAKEN, EMAIL_TAKEN
 from domain.schemas.user_schema import (
     UserRegistrationSchema,
     UserLoginSchema,
     UserResponseSchema
 )
 from domain.utils.auth_utils import require_auth
+from infrastructure.services.hashing_service import HashingBusyError
+from infrastructure.services.rate_limiter import LoginThrottledError
 from marshmallow import ValidationError
 
 
@@ -57,14 +60,14 @@ def register():
             password=data['password'],
             email=data['email'],
             full_name=data['full_name'],
-            role=data.get('role', 'Author')
+            roles=[data['role']] if data.get('role') else None
         )
         
         if user is None:
             return jsonify({
                 'status': 'error',
                 'message': token_or_error
-            }), 400
+            }), 409 if token_or_error in (USERNAME_TAKEN, EMAIL_TAKEN) else 400
         
         return jsonify({
             'status': 'success',
@@ -81,6 +84,13 @@ def register():
             'message': 'Validation error',
             'errors': e.messages
         }), 400
+    except HashingBusyError as e:
+        response = jsonify({
+            'status': 'error',
+            'message': str(e)
+        })
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, 503
     except Exception as e:
         return jsonify({
             'status': 'error',
@@ -115,7 +125,8 @@ def login():
         # Login user
         user, token_or_error = AuthService.login_user(
             username=data['username'],
-            password=data['password']
+            password=data['password'],
+            client_ip=request.remote_addr
         )
         
         if user is None:
@@ -139,6 +150,20 @@ def login():
             'message': 'Validation error',
             'errors': e.messages
         }), 400
+    except LoginThrottledError as e:
+        response = jsonify({
+            'status': 'error',
+            'message': str(e)
+        })
+        response.headers['Retry-After'] = str(max(1, math.ceil(e.retry_after)))
+        return response, 429
+    except HashingBusyError as e:
+        response = jsonify({
+            'status': 'error',
+            'message': str(e)
+        })
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, 503
     except Exception as e:
         return jsonify({
             'status': 'error',
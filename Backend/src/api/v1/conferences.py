@@ -0,0 +1,894 @@
+# ============================================
+# File: Backend/src/api/v1/conferences.py
+# ============================================
+"""
+Conference API Routes
+"""
+
+from flask import Blueprint, Response, request, jsonify
+from domain.services.paper_service import (
+    PaperService, CONFERENCE_NOT_FOUND, DEFAULT_PAGE_SIZE, DEFAULT_SEARCH_LIMIT
+)
+from domain.services.duplicate_service import (
+    DuplicateService, ACCESS_DENIED, DEFAULT_PAIR_LIMIT
+)
+from domain.services.paper_export_service import (
+    PaperExportService,
+    CONFERENCE_NOT_FOUND as EXPORT_CONFERENCE_NOT_FOUND,
+    TRACK_NOT_FOUND,
+    ACCESS_DENIED as EXPORT_DENIED,
+    EXPORT_PDF
+)
+from domain.services.paper_status_service import (
+    PaperStatusService,
+    CONFERENCE_NOT_FOUND as STATUS_CONFERENCE_NOT_FOUND,
+    ACCESS_DENIED as STATUS_DENIED
+)
+from domain.services.assignment_service import (
+    AssignmentService,
+    CONFERENCE_NOT_FOUND as ASSIGNMENT_CONFERENCE_NOT_FOUND,
+    PAPER_NOT_FOUND as ASSIGNMENT_PAPER_NOT_FOUND,
+    REVIEWER_NOT_IN_POOL,
+    ASSIGNMENT_NOT_FOUND,
+    DECLINE_DENIED,
+    ACCESS_DENIED as ASSIGNMENT_DENIED
+)
+from domain.services.conflict_service import (
+    ConflictService,
+    CONFERENCE_NOT_FOUND as CONFLICT_CONFERENCE_NOT_FOUND,
+    PAPER_NOT_FOUND as CONFLICT_PAPER_NOT_FOUND,
+    ACCESS_DENIED as CONFLICT_DENIED
+)
+from domain.services.scoring_service import (
+    ScoringService,
+    CONFERENCE_NOT_FOUND as SCORING_CONFERENCE_NOT_FOUND,
+    ACCESS_DENIED as SCORING_DENIED
+)
+from domain.utils.auth_utils import require_auth
+
+
+conferences_bp = Blueprint('conferences', __name__, url_prefix='/conferences')
+
+
+def _csv_arg(name):
+    value = request.args.get(name)
+    if not value:
+        return None
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+@conferences_bp.route('/<int:conference_id>/papers', methods=['GET'])
+@require_auth
+def list_papers(conference_id):
+    """
+    List papers of a conference (keyset pagination)
+    ---
+    Headers:
+        Authorization: Bearer <token>
+
+    Query:
+        status=submitted,under_review   // optional, comma separated
+        track_id=3                      // optional
+        fields=id,title,status          // optional sparse fieldset (abstract only on request)
+        limit=50                        // 1..200
+        cursor=<next_cursor>            // from the previous page
+        order=desc                      // desc (newest first) | asc
+
+    Response:
+        {
+            "status": "success",
+            "data": {
+                "papers": [{...}],
+                "next_cursor": "WyIyMDI2LTA...",
+                "has_more": true
+            }
+        }
+    """
+    try:
+        try:
+            track_id = request.args.get('track_id', type=int)
+            limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+        except ValueError:
+            return jsonify({
+                'status': 'error',
+                'message': 'limit and track_id must be integers'
+            }), 400
+
+        result, error = PaperService.list_conference_papers(
+            conference_id=conference_id,
+            current_user=request.current_user,
+            status=_csv_arg('status'),
+            track_id=track_id,
+            fields=_csv_arg('fields'),
+            cursor=request.args.get('cursor'),
+            limit=limit,
+            order=request.args.get('order', 'desc')
+        )
+
+        if error:
+            return jsonify({
+                'status': 'error',
+                'message': error
+            }), 404 if error == CONFERENCE_NOT_FOUND else 400
+
+        return jsonify({
+            'status': 'success',
+            'data': result
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@conferences_bp.route('/<int:conference_id>/papers/search', methods=['GET'])
+@require_auth
+def search_papers(conference_id):
+    """
+    Full-text search over paper titles, keywords and abstracts
+    ---
+    Headers:
+        Authorization: Bearer <token>
+
+    Query:
+        q=graph neural network          // required, accents optional ("hoc may" finds "Học máy")
+        fields=id,title,status          // optional sparse fieldset
+        limit=20                        // 1..100
+
+    Response:
+        {
+            "status": "success",
+            "data": {
+                "papers": [{..., "score": 7.4213}],   // best match first
+                "total": 20,
+                "truncated": false                    // true: best found within the search budget, not the proven top 20
+            }
+        }
+    """
+    try:
+        try:
+            limit = int(request.args.get('limit', DEFAULT_SEARCH_LIMIT))
+        except ValueError:
+            return jsonify({
+                'status': 'error',
+                'message': 'limit must be an integer'
+            }), 400
+
+        result, error = PaperService.search_conference_papers(
+            conference_id=conference_id,
+            current_user=request.current_user,
+            q=request.args.get('q'),
+            fields=_csv_arg('fields'),
+            limit=limit
+        )
+
+        if error:
+            return jsonify({
+                'status': 'error',
+                'message': error
+            }), 404 if error == CONFERENCE_NOT_FOUND else 400
+
+        return jsonify({
+            'status': 'success',
+            'data': result
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@conferences_bp.route('/<int:conference_id>/duplicates', methods=['GET'])
+@require_auth
+def list_duplicates(conference_id):
+    """
+    Likely duplicate / dual submissions involving this conference (chair, admin)
+    ---
+    Headers:
+        Authorization: Bearer <token>
+
+    Query:
+        threshold=0.6                   // optional, 0..1 (default DEDUP_THRESHOLD)
+        limit=100                       // 1..1000 pairs
+
+    Response:
+        {
+            "status": "success",
+            "data": {
+                "conference_id": 3,
+                "pairs": [{
+                    "paper": {"id": 41, "title": "...", "status": "submitted",
+                              "conference_id": 3, "conference_name": "..."},
+                    "duplicate": {"id": 7, ..., "conference_id": 1},   // any conference
+                    "similarity": 0.874
+                }],
+                "total": 1,
+                "index": {"papers": 5120, "complete": true}   // false while signing a backlog
+            }
+        }
+    """
+    try:
+        try:
+            limit = int(request.args.get('limit', DEFAULT_PAIR_LIMIT))
+        except ValueError:
+            return jsonify({
+                'status': 'error',
+                'message': 'limit must be an integer'
+            }), 400
+
+        result, error = DuplicateService.find_for_conference(
+            conference_id=conference_id,
+            current_user=request.current_user,
+            threshold=request.args.get('threshold'),
+            limit=limit
+        )
+
+        if error:
+            return jsonify({
+                'status': 'error',
+                'message': error
+            }), 404 if error == CONFERENCE_NOT_FOUND else 403 if error == ACCESS_DENIED else 400
+
+        return jsonify({
+            'status': 'success',
+            'data': result
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@conferences_bp.route('/<int:conference_id>/export', methods=['GET'])
+@require_auth
+def export_papers(conference_id):
+    """
+    Download the conference's PDFs as a ZIP (chair / admin), streamed as it is built
+    ---
+    Headers:
+        Authorization: Bearer <token>
+
+    Query:
+        track_id=3                      // optional, one track only
+        status=accepted,camera_ready    // optional, comma separated
+        files=pdf                       // pdf | camera_ready | all
+        include_withdrawn=1             // optional
+
+    Response (200, application/zip, chunked):
+        <conference>/manifest.csv, <conference>/authors.csv,
+        <conference>/pdf/<id>-<title>.pdf, <conference>/camera-ready/...
+    """
+    try:
+        try:
+            track_id = request.args.get('track_id', type=int)
+        except ValueError:
+            track_id = None
+
+        plan, error = PaperExportService.prepare_conference_export(
+            conference_id=conference_id,
+            current_user=request.current_user,
+            track_id=track_id,
+            status=_csv_arg('status'),
+            include_withdrawn=request.args.get('include_withdrawn') == '1',
+            files=request.args.get('files', EXPORT_PDF)
+        )
+
+        if error:
+            if error == EXPORT_DENIED:
+                status_code = 403
+            elif error in (EXPORT_CONFERENCE_NOT_FOUND, TRACK_NOT_FOUND):
+                status_code = 404
+            else:
+                status_code = 400
+            return jsonify({
+                'status': 'error',
+                'message': error
+            }), status_code
+
+        response = Response(
+            PaperExportService.stream_archive(plan),
+            mimetype='application/zip',
+            direct_passthrough=True
+        )
+        response.headers['Content-Disposition'] = f'attachment; filename="{plan.download_name}"'
+        response.headers['X-Export-Papers'] = str(plan.paper_count)
+        response.headers['X-Accel-Buffering'] = 'no'  # nginx: pass chunks on as they come
+        response.cache_control.private = True
+        response.cache_control.no_store = True
+        return response
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@conferences_bp.route('/<int:conference_id>/papers/status', methods=['POST'])
+@require_auth
+def change_paper_statuses(conference_id):
+    """
+    Move many papers to one status (chair / admin)
+    ---
+    Request Body:
+        {
+            "paper_ids": [1, 2, 3],
+            "status": "accepted",           // under_review | accepted | rejected | camera_ready | withdrawn
+            "comment": "..."                // optional, stored on the decisions
+        }
+
+    Response:
+        {
+            "status": "success",
+            "data": {
+                "status": "accepted",
+                "counts": {"updated": 2, "invalid_transition": 1},
+                "results": [{"paper_id": 1, "result": "updated", "from": "under_review"}, ...]
+            }
+        }
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+
+        result, error = PaperStatusService.bulk_transition(
+            conference_id=conference_id,
+            paper_ids=data.get('paper_ids'),
+            status=data.get('status'),
+            current_user=request.current_user,
+            comment=data.get('comment')
+        )
+
+        if error:
+            if error == STATUS_DENIED:
+                status_code = 403
+            elif error == STATUS_CONFERENCE_NOT_FOUND:
+                status_code = 404
+            else:
+                status_code = 400
+            return jsonify({
+                'status': 'error',
+                'message': error
+            }), status_code
+
+        return jsonify({
+            'status': 'success',
+            'data': result
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@conferences_bp.route('/<int:conference_id>/assignments/auto', methods=['POST'])
+@require_auth
+def auto_assign_reviewers(conference_id):
+    """
+    Assign reviewers automatically (chair / admin)
+    ---
+    Request Body (all optional):
+        {
+            "reviewers_per_paper": 3,
+            "default_quota": 10,        // for reviewers without a ConferenceMentor quota
+            "track_id": 2,
+            "dry_run": true             // compute and list the pairs, write nothing
+        }
+
+    Response:
+        {
+            "status": "success",
+            "data": {
+                "stats": {"assigned": 14900, "unfilled_slots": 0, "quality": 0.998,
+                          "total_affinity": ..., "upper_bound": ..., "seconds": 1.2, ...},
+                "unfilled": [{"paper_id": 12, "missing": 1}],
+                "pairs": [...]          // dry runs only
+            }
+        }
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+
+        result, error = AssignmentService.auto_assign(
+            conference_id=conference_id,
+            current_user=request.current_user,
+            reviewers_per_paper=data.get('reviewers_per_paper'),
+            default_quota=data.get('default_quota'),
+            track_id=data.get('track_id'),
+            dry_run=bool(data.get('dry_run'))
+        )
+
+        if error:
+            if error == ASSIGNMENT_DENIED:
+                status_code = 403
+            elif error == ASSIGNMENT_CONFERENCE_NOT_FOUND:
+                status_code = 404
+            else:
+                status_code = 400
+            return jsonify({
+                'status': 'error',
+                'message': error
+            }), status_code
+
+        return jsonify({
+            'status': 'success',
+            'data': result
+        }), 200 if result['stats']['dry_run'] else 201
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@conferences_bp.route('/<int:conference_id>/assignments/repair', methods=['POST'])
+@require_auth
+def repair_assignments(conference_id):
+    """
+    Fill only the open slots - declined reviewers, late papers (chair / admin)
+    ---
+    Request Body (all optional):
+        {
+            "paper_ids": [41, 42],      // default: every paper short of reviewers
+            "reviewers_per_paper": 3,
+            "default_quota": 10,
+            "dry_run": true
+        }
+
+    Response: as /assignments/auto; current assignments never move and
+    stats.max_gap bounds what a full re-solve could still add:
+        {"status": "success", "data": {"stats": {"assigned": 2, "max_gap": 0.03,
+                                                 "covers_all_open": true, "seconds": 0.004, ...}, ...}}
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+
+        result, error = AssignmentService.repair_assignments(
+            conference_id=conference_id,
+            current_user=request.current_user,
+            paper_ids=data.get('paper_ids'),
+            reviewers_per_paper=data.get('reviewers_per_paper'),
+            default_quota=data.get('default_quota'),
+            dry_run=bool(data.get('dry_run'))
+        )
+
+        if error:
+            if error == ASSIGNMENT_DENIED:
+                status_code = 403
+            elif error == ASSIGNMENT_CONFERENCE_NOT_FOUND:
+                status_code = 404
+            else:
+                status_code = 400
+            return jsonify({
+                'status': 'error',
+                'message': error
+            }), status_code
+
+        return jsonify({
+            'status': 'success',
+            'data': result
+        }), 200 if result['stats']['dry_run'] else 201
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@conferences_bp.route('/<int:conference_id>/assignments/<int:assignment_id>/decline', methods=['POST'])
+@require_auth
+def decline_assignment(conference_id, assignment_id):
+    """
+    Decline an assignment (the assigned reviewer, the chair or an admin)
+    ---
+    Request Body (optional):
+        {"repair": true}                // find a replacement reviewer right away (default)
+
+    Response:
+        {
+            "status": "success",
+            "data": {
+                "assignment_id": 77, "paper_id": 41, "status": "Declined",
+                "repair": {"stats": {...}, "unfilled": [], "pairs": [{"paper_id": 41, "reviewer_id": 9, ...}]}
+            }
+        }
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+
+        result, error = AssignmentService.decline_assignment(
+            conference_id=conference_id,
+            assignment_id=assignment_id,
+            current_user=request.current_user,
+            repair=bool(data.get('repair', True))
+        )
+
+        if error:
+            if error == DECLINE_DENIED:
+                status_code = 403
+            elif error in (ASSIGNMENT_CONFERENCE_NOT_FOUND, ASSIGNMENT_NOT_FOUND):
+                status_code = 404
+            else:
+                status_code = 400
+            return jsonify({
+                'status': 'error',
+                'message': error
+            }), status_code
+
+        return jsonify({
+            'status': 'success',
+            'data': result
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+def _suggestion_response(result, error):
+    if error:
+        if error == ASSIGNMENT_DENIED:
+            status_code = 403
+        elif error in (ASSIGNMENT_CONFERENCE_NOT_FOUND, ASSIGNMENT_PAPER_NOT_FOUND, REVIEWER_NOT_IN_POOL):
+            status_code = 404
+        else:
+            status_code = 400
+        return jsonify({
+            'status': 'error',
+            'message': error
+        }), status_code
+
+    return jsonify({
+        'status': 'success',
+        'data': result
+    }), 200
+
+
+@conferences_bp.route('/<int:conference_id>/papers/<int:paper_id>/reviewer-suggestions', methods=['GET'])
+@require_auth
+def suggest_reviewers(conference_id, paper_id):
+    """
+    Reviewers of the pool whose own papers match this paper best (chair / admin)
+    ---
+    Query:
+        k=10                            // 1..100
+
+    Response:
+        {
+            "status": "success",
+            "data": {
+                "paper_id": 41,
+                "reviewers": [{"reviewer_id": 7, "full_name": "...", "affinity": 0.4213}]
+            }
+        }
+    Conflicted reviewers (COI, authors) are left out; affinity is a TF-IDF cosine.
+    """
+    try:
+        try:
+            k = int(request.args.get('k', 10))
+        except ValueError:
+            return jsonify({
+                'status': 'error',
+                'message': 'k must be an integer'
+            }), 400
+
+        result, error = AssignmentService.suggest_reviewers(
+            conference_id=conference_id,
+            paper_id=paper_id,
+            current_user=request.current_user,
+            k=k
+        )
+        return _suggestion_response(result, error)
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@conferences_bp.route('/<int:conference_id>/reviewers/<int:reviewer_id>/paper-suggestions', methods=['GET'])
+@require_auth
+def suggest_papers(conference_id, reviewer_id):
+    """
+    Papers of the conference that match a pool reviewer's own papers best (chair / admin)
+    ---
+    Query:
+        k=10                            // 1..100
+
+    Response:
+        {
+            "status": "success",
+            "data": {
+                "reviewer_id": 7,
+                "papers": [{"paper_id": 41, "title": "...", "affinity": 0.4213}]
+            }
+        }
+    """
+    try:
+        try:
+            k = int(request.args.get('k', 10))
+        except ValueError:
+            return jsonify({
+                'status': 'error',
+                'message': 'k must be an integer'
+            }), 400
+
+        result, error = AssignmentService.suggest_papers(
+            conference_id=conference_id,
+            reviewer_id=reviewer_id,
+            current_user=request.current_user,
+            k=k
+        )
+        return _suggestion_response(result, error)
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+def _conflict_response(result, error, success_code=200):
+    if error:
+        if error == CONFLICT_DENIED:
+            status_code = 403
+        elif error in (CONFLICT_CONFERENCE_NOT_FOUND, CONFLICT_PAPER_NOT_FOUND):
+            status_code = 404
+        else:
+            status_code = 400
+        return jsonify({
+            'status': 'error',
+            'message': error
+        }), status_code
+
+    return jsonify({
+        'status': 'success',
+        'data': result
+    }), success_code
+
+
+@conferences_bp.route('/<int:conference_id>/conflicts/generate', methods=['POST'])
+@require_auth
+def generate_conflicts(conference_id):
+    """
+    Record conflicts of interest found in the co-authorship graph (chair / admin)
+    ---
+    Request Body (all optional, defaults from COI_* settings):
+        {
+            "hops": 1,                  // 1 = direct co-authors, 2 = their co-authors too
+            "window_years": 5,          // only joint papers / affiliations this recent (0 = all)
+            "affiliation": true,        // a shared affiliation is a conflict
+            "dry_run": true             // list the conflicts, write nothing
+        }
+
+    Response:
+        {
+            "status": "success",
+            "data": {
+                "stats": {"papers": 5000, "reviewers": 2000, "found": 812, "already_recorded": 40,
+                          "created": 772, "by_reason": {"author": 3, "coauthor": 690, "affiliation": 79},
+                          "seconds": 0.4, ...},
+                "conflicts": [...]      // dry runs only
+            }
+        }
+    Existing rows are kept; generated ones say "auto: ..." and follow new authors.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+
+        result, error = ConflictService.generate_conflicts(
+            conference_id=conference_id,
+            current_user=request.current_user,
+            hops=data.get('hops'),
+            window_years=data.get('window_years'),
+            affiliation=data.get('affiliation'),
+            dry_run=bool(data.get('dry_run'))
+        )
+        if error:
+            return _conflict_response(result, error)
+        return _conflict_response(result, error, 200 if result['stats']['dry_run'] else 201)
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@conferences_bp.route('/<int:conference_id>/conflicts/check', methods=['GET'])
+@require_auth
+def check_conflict(conference_id):
+    """
+    Is a reviewer conflicted with a paper? (chair / admin)
+    ---
+    Query:
+        paper_id=41&reviewer_id=7       // required
+        hops=1&window_years=5&affiliation=true
+
+    Response:
+        {
+            "status": "success",
+            "data": {
+                "paper_id": 41, "reviewer_id": 7, "conflicted": true,
+                "recorded": false, "recorded_reason": null,
+                "reason": "coauthor", "author_id": 12, "detail": 1
+            }
+        }
+    detail: co-authorship steps for "coauthor", the affiliation for "affiliation".
+    """
+    try:
+        try:
+            paper_id = int(request.args['paper_id'])
+            reviewer_id = int(request.args['reviewer_id'])
+        except (KeyError, ValueError):
+            return jsonify({
+                'status': 'error',
+                'message': 'paper_id and reviewer_id are required integers'
+            }), 400
+        affiliation = request.args.get('affiliation')
+
+        result, error = ConflictService.check_conflict(
+            conference_id=conference_id,
+            paper_id=paper_id,
+            reviewer_id=reviewer_id,
+            current_user=request.current_user,
+            hops=request.args.get('hops'),
+            window_years=request.args.get('window_years'),
+            affiliation=None if affiliation is None else affiliation.lower() == 'true'
+        )
+        return _conflict_response(result, error)
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+# ---------- Review scores ----------
+
+def _scoring_response(result, error):
+    if error:
+        if error == SCORING_DENIED:
+            status_code = 403
+        elif error == SCORING_CONFERENCE_NOT_FOUND:
+            status_code = 404
+        else:
+            status_code = 400
+        return jsonify({
+            'status': 'error',
+            'message': error
+        }), status_code
+
+    return jsonify({
+        'status': 'success',
+        'data': result
+    }), 200
+
+
+@conferences_bp.route('/<int:conference_id>/scores', methods=['GET'])
+@require_auth
+def get_conference_scores(conference_id):
+    """
+    Aggregated review scores of the conference's papers (chair / admin)
+    ---
+    Query:
+        sort=calibrated|mean|weighted|median|variance|z   // default calibrated, best first
+        limit=100&offset=0
+
+    Response:
+        {
+            "status": "success",
+            "data": {
+                "papers": [
+                    {
+                        "paper_id": 41, "title": "...", "status": "UNDER_REVIEW", "review_count": 3,
+                        "mean": 6.0, "median": 6.0, "variance": 1.0, "min": 5, "max": 7,
+                        "weighted": 6.1, "calibrated": 6.8, "z": 0.42, "updated_at": "..."
+                    }
+                ],
+                "total": 120, "limit": 100, "offset": 0, "sort": "calibrated"
+            }
+        }
+    calibrated: mean with each reviewer's harshness removed; read from the
+    summary table kept current as reviews are committed.
+    """
+    try:
+        try:
+            limit = int(request.args.get('limit', 100))
+            offset = int(request.args.get('offset', 0))
+        except ValueError:
+            return jsonify({
+                'status': 'error',
+                'message': 'limit and offset must be integers'
+            }), 400
+
+        result, error = ScoringService.get_conference_scores(
+            conference_id=conference_id,
+            current_user=request.current_user,
+            sort=request.args.get('sort', 'calibrated'),
+            limit=limit,
+            offset=offset
+        )
+        return _scoring_response(result, error)
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@conferences_bp.route('/<int:conference_id>/scores/refresh', methods=['POST'])
+@require_auth
+def refresh_conference_scores(conference_id):
+    """
+    Recompute every score summary of the conference (chair / admin)
+    ---
+    Only needed after bulk imports; reviews committed through the API refresh
+    their papers on their own.
+
+    Response:
+        {
+            "status": "success",
+            "data": {"stats": {"papers": 120, "reviews": 360, "reviewers": 40,
+                               "mean": 5.9, "std": 1.8, "seconds": 0.04}}
+        }
+    """
+    try:
+        result, error = ScoringService.refresh_conference_scores(
+            conference_id=conference_id,
+            current_user=request.current_user
+        )
+        return _scoring_response(result, error)
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@conferences_bp.route('/<int:conference_id>/reviewer-calibration', methods=['GET'])
+@require_auth
+def get_reviewer_calibration(conference_id):
+    """
+    How harsh or lenient each reviewer scores (chair / admin)
+    ---
+    Response:
+        {
+            "status": "success",
+            "data": {
+                "conference": {"reviews": 360, "mean": 5.9, "std": 1.8},
+                "reviewers": [
+                    {"reviewer_id": 7, "full_name": "...", "reviews": 9, "mean": 4.1, "std": 1.2,
+                     "bias": -1.4, "weight": 1.6}
+                ]
+            }
+        }
+    bias: shrunk mean minus the conference mean (negative = harsh), harshest first.
+    """
+    try:
+        result, error = ScoringService.get_reviewer_calibration(
+            conference_id=conference_id,
+            current_user=request.current_user
+        )
+        return _scoring_response(result, error)
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
@@ -0,0 +1,161 @@
+# ============================================
+# File: Backend/src/api/v1/papers.py
+# ============================================
+"""
+Paper API Routes - PDF downloads, duplicate checks
+
+The file body never passes through Python: send_file hands the open blob to
+the server's wsgi.file_wrapper (sendfile(2) under gunicorn/uWSGI), or only
+sets an X-Sendfile header when USE_X_SENDFILE is on. Werkzeug answers Range
+requests (206) and If-None-Match / If-Modified-Since (304) from the strong
+ETag (the blob's SHA-256) and the blob mtime.
+"""
+
+from flask import Blueprint, request, jsonify, send_file
+from domain.services.paper_file_service import (
+    PaperFileService,
+    VARIANT_SUBMISSION,
+    VARIANT_CAMERA_READY,
+    ACCESS_DENIED
+)
+from domain.services.duplicate_service import (
+    DuplicateService,
+    PAPER_NOT_FOUND,
+    ACCESS_DENIED as DUPLICATES_DENIED,
+    DEFAULT_DUPLICATE_LIMIT
+)
+from domain.utils.auth_utils import require_auth
+
+
+papers_bp = Blueprint('papers', __name__, url_prefix='/papers')
+
+
+def _send_paper_file(paper_id: int, variant: str):
+    try:
+        target, error = PaperFileService.resolve_download(
+            paper_id=paper_id,
+            current_user=request.current_user,
+            variant=variant
+        )
+
+        if target is None:
+            return jsonify({
+                'status': 'error',
+                'message': error
+            }), 403 if error == ACCESS_DENIED else 404
+
+        response = send_file(
+            target.path,
+            mimetype='application/pdf',
+            as_attachment=request.args.get('download') == '1',
+            download_name=target.download_name,
+            conditional=True,
+            etag=target.etag,
+            max_age=0
+        )
+        # Access-controlled: browsers may keep it, shared caches may not;
+        # max_age=0 makes every re-open a cheap 304 revalidation
+        response.cache_control.private = True
+        response.cache_control.public = False
+        return response
+
+    except FileNotFoundError:
+        return jsonify({
+            'status': 'error',
+            'message': 'File not available'
+        }), 404
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
+
+
+@papers_bp.route('/<int:paper_id>/pdf', methods=['GET'])
+@require_auth
+def download_pdf(paper_id):
+    """
+    Download the submitted PDF
+    ---
+    Headers:
+        Authorization: Bearer <token>
+        Range: bytes=0-1023            // optional -> 206 Partial Content
+        If-None-Match: "<sha256>"      // optional -> 304 Not Modified
+
+    Query:
+        download=1                     // Content-Disposition: attachment
+
+    Response:
+        application/pdf (ETag: "<sha256>", Accept-Ranges: bytes)
+    """
+    return _send_paper_file(paper_id, VARIANT_SUBMISSION)
+
+
+@papers_bp.route('/<int:paper_id>/camera-ready', methods=['GET'])
+@require_auth
+def download_camera_ready(paper_id):
+    """
+    Download the camera-ready PDF (authors, chair, admin)
+    ---
+    Same headers and responses as /papers/<id>/pdf
+    """
+    return _send_paper_file(paper_id, VARIANT_CAMERA_READY)
+
+
+@papers_bp.route('/<int:paper_id>/duplicates', methods=['GET'])
+@require_auth
+def list_duplicates(paper_id):
+    """
+    Papers in any conference that look like near-duplicates of this one (chair, admin)
+    ---
+    Headers:
+        Authorization: Bearer <token>
+
+    Query:
+        threshold=0.6                  // optional, 0..1 (default DEDUP_THRESHOLD)
+        limit=20                       // 1..100
+
+    Response:
+        {
+            "status": "success",
+            "data": {
+                "paper_id": 41,
+                "duplicates": [{"id": 7, "title": "...", "status": "accepted",
+                                "conference_id": 1, "conference_name": "...",
+                                "similarity": 0.874}],
+                "index": {"papers": 5120, "complete": true}
+            }
+        }
+    """
+    try:
+        try:
+            limit = int(request.args.get('limit', DEFAULT_DUPLICATE_LIMIT))
+        except ValueError:
+            return jsonify({
+                'status': 'error',
+                'message': 'limit must be an integer'
+            }), 400
+
+        result, error = DuplicateService.find_for_paper(
+            paper_id=paper_id,
+            current_user=request.current_user,
+            threshold=request.args.get('threshold'),
+            limit=limit
+        )
+
+        if error:
+            return jsonify({
+                'status': 'error',
+                'message': error
+            }), 404 if error == PAPER_NOT_FOUND else 403 if error == DUPLICATES_DENIED else 400
+
+        return jsonify({
+            'status': 'success',
+            'data': result
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'status': 'error',
+            'message': str(e)
+        }), 500
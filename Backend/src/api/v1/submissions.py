@@ -0,0 +1,166 @@
+# ============================================
+# File: Backend/src/api/v1/submissions.py
+# ============================================
+"""
+One-request Submission API Routes
+
+    POST   /submissions                metadata + PDF in one multipart request
+
+Meant for the deadline hour: send an `Idempotency-Key` header (a UUID) and
+reuse it on every retry of the same submission. A retry gets the first
+attempt's outcome (201 + `Idempotent-Replayed: true`) instead of a second
+Paper, and the deadline is checked against when the FIRST attempt arrived.
+
+For large files on poor links, the resumable /uploads API remains available.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+from flask import Blueprint, request, jsonify, current_app
+from domain.services.submission_upload_service import SubmissionUploadService, SUBMISSION_FIELDS
+from domain.utils.auth_utils import require_auth
+from infrastructure.services.file_storage_service import FileTooLargeError, InvalidFileError
+from infrastructure.services.idempotency_store import (
+    IdempotencyInProgressError,
+    IdempotencyKeyReusedError,
+    validate_key
+)
+
+
+submissions_bp = Blueprint('submissions', __name__, url_prefix='/submissions')
+
+# X-Request-Start further back than this is a misconfigured proxy, not a slow upload
+MAX_REQUEST_START_AGE = timedelta(hours=1)
+
+
+def _error(message, status_code):
+    return jsonify({
+        'status': 'error',
+        'message': message
+    }), status_code
+
+
+def _received_at(now: datetime) -> datetime:
+    """
+    When the request arrived: the front proxy's X-Request-Start ("t=<seconds>",
+    also ms / µs) when TRUST_REQUEST_START_HEADER is on, else now - the view
+    runs before the multipart body is read
+    """
+    if not current_app.config.get('TRUST_REQUEST_START_HEADER', False):
+        return now
+    raw = request.headers.get('X-Request-Start', '')
+    try:
+        value = float(raw[2:] if raw.startswith('t=') else raw)
+    except ValueError:
+        return now
+    if value > 1e14:
+        value /= 1e6      # microseconds
+    elif value > 1e11:
+        value /= 1e3      # milliseconds
+    try:
+        started = datetime.utcfromtimestamp(value)
+    except (OverflowError, OSError, ValueError):
+        return now
+    if started > now or now - started > MAX_REQUEST_START_AGE:
+        return now
+    return started
+
+
+def _metadata_from_form(form) -> dict:
+    """Paper metadata from a `metadata` JSON field or individual form fields"""
+    raw = form.get('metadata')
+    if raw:
+        metadata = json.loads(raw)
+        if not isinstance(metadata, dict):
+            raise ValueError("metadata must be a JSON object")
+        return metadata
+
+    metadata = {key: form.get(key) for key in SUBMISSION_FIELDS if form.get(key) not in (None, '')}
+    for key in ('conference_id', 'track_id'):
+        if key in metadata:
+            metadata[key] = int(metadata[key])
+    if form.get('authors'):
+        metadata['authors'] = json.loads(form['authors'])
+    return metadata
+
+
+@submissions_bp.route('', methods=['POST'])
+@require_auth
+def submit_paper():
+    """
+    Submit a paper (metadata + PDF) in one request
+    ---
+    Headers:
+        Idempotency-Key: 6f1c...         // optional, strongly recommended; reuse on retry
+        Content-Type: multipart/form-data
+
+    Form fields:
+        file: <the PDF>
+        metadata: {                      // or the same keys as individual fields
+            "conference_id": 1,
+            "track_id": 2,               // optional
+            "title": "...",
+            "abstract": "...",
+            "keywords": "...",           // optional
+            "authors": [                 // optional; the submitter is always an author
+                {"user_id": 7, "affiliation": "UTH", "is_corresponding": true}
+            ]
+        }
+
+    Response (201):
+        {"status": "success", "data": {"paper": {...}, "replayed": false}}
+    Errors:
+        400 invalid metadata / file, deadline passed
+        409 the first request with this key is still running (Retry-After)
+        413 file too large
+        422 Idempotency-Key reused for a different submission
+    """
+    received_at = _received_at(datetime.utcnow())
+    try:
+        idempotency_key = request.headers.get('Idempotency-Key')
+        if idempotency_key is not None:
+            error = validate_key(idempotency_key)
+            if error:
+                return _error(error, 400)
+
+        try:
+            metadata = _metadata_from_form(request.form)
+        except (TypeError, ValueError) as e:
+            return _error(f"Invalid metadata: {e}", 400)
+
+        upload = request.files.get('file')
+        if upload is None:
+            return _error("file is required", 400)
+
+        result, error = SubmissionUploadService.submit(
+            user_id=request.current_user['user_id'],
+            metadata=metadata,
+            file_stream=upload.stream,
+            received_at=received_at,
+            idempotency_key=idempotency_key
+        )
+        if error:
+            return _error(error, 400)
+
+        response = jsonify({
+            'status': 'success',
+            'data': result
+        })
+        response.headers['Location'] = f"{request.path.rsplit('/submissions', 1)[0]}/papers/{result['paper']['id']}"
+        if result['replayed']:
+            response.headers['Idempotent-Replayed'] = 'true'
+        return response, 201
+
+    except IdempotencyInProgressError as e:
+        response, status_code = _error(str(e), 409)
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, status_code
+    except IdempotencyKeyReusedError as e:
+        return _error(str(e), 422)
+    except FileTooLargeError as e:
+        return _error(str(e), 413)
+    except InvalidFileError as e:
+        return _error(str(e), 400)
+    except Exception as e:
+        return _error(str(e), 500)
@@ -0,0 +1,226 @@
+# ============================================
+# File: Backend/src/api/v1/uploads.py
+# ============================================
+"""
+Resumable Upload API Routes
+
+    POST   /uploads                    start a session (paper metadata + total size)
+    PUT    /uploads/<id>               send a chunk; header Upload-Offset = where it starts
+    GET    /uploads/<id>               progress (resume from data.offset)
+    POST   /uploads/<id>/finalize      create the Paper / attach the camera-ready
+    DELETE /uploads/<id>               abandon the upload
+
+A client that loses its connection calls GET, then continues PUTting from the
+returned offset. A PUT at the wrong offset gets 409 with the server's offset
+in the Upload-Offset header.
+"""
+
+from flask import Blueprint, request, jsonify
+from domain.services.submission_upload_service import SubmissionUploadService
+from domain.utils.auth_utils import require_auth
+from infrastructure.services.file_storage_service import FileTooLargeError, InvalidFileError
+from infrastructure.services.upload_session_store import (
+    UploadSessionNotFoundError,
+    UploadOffsetMismatchError,
+    UploadIncompleteError
+)
+
+
+uploads_bp = Blueprint('uploads', __name__, url_prefix='/uploads')
+
+
+def _error(message, status_code):
+    return jsonify({
+        'status': 'error',
+        'message': message
+    }), status_code
+
+
+def _storage_error_response(e):
+    """Map upload/storage exceptions to HTTP responses (None if not ours)"""
+    if isinstance(e, UploadSessionNotFoundError):
+        return _error(str(e), 404)
+    if isinstance(e, UploadOffsetMismatchError):
+        response = jsonify({
+            'status': 'error',
+            'message': str(e),
+            'data': {'offset': e.expected}
+        })
+        response.headers['Upload-Offset'] = str(e.expected)
+        return response, 409
+    if isinstance(e, UploadIncompleteError):
+        return _error(str(e), 409)
+    if isinstance(e, FileTooLargeError):
+        return _error(str(e), 413)
+    if isinstance(e, InvalidFileError):
+        return _error(str(e), 400)
+    return None
+
+
+@uploads_bp.route('', methods=['POST'])
+@require_auth
+def start_upload():
+    """
+    Start a resumable upload
+    ---
+    Request Body (submission):
+        {
+            "purpose": "submission",
+            "total_size": 1048576,
+            "conference_id": 1,
+            "track_id": 2,            // optional
+            "title": "...",
+            "abstract": "...",
+            "keywords": "..."         // optional
+        }
+
+    Request Body (camera-ready):
+        {"purpose": "camera_ready", "total_size": 1048576, "paper_id": 10}
+
+    Response (201):
+        {"status": "success", "data": {"upload_id": "...", "offset": 0, "chunk_size": 1048576, ...}}
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        try:
+            total_size = int(data.get('total_size'))
+        except (TypeError, ValueError):
+            return _error("total_size must be an integer", 400)
+
+        purpose = data.get('purpose', 'submission')
+        metadata = {
+            key: data.get(key)
+            for key in ('conference_id', 'track_id', 'title', 'abstract', 'keywords', 'paper_id')
+            if data.get(key) is not None
+        }
+
+        session, error = SubmissionUploadService.start_upload(
+            user_id=request.current_user['user_id'],
+            purpose=purpose,
+            total_size=total_size,
+            metadata=metadata
+        )
+        if error:
+            return _error(error, 400)
+
+        response = jsonify({
+            'status': 'success',
+            'data': session
+        })
+        response.headers['Location'] = f"{request.path.rstrip('/')}/{session['upload_id']}"
+        return response, 201
+
+    except Exception as e:
+        return _storage_error_response(e) or _error(str(e), 500)
+
+
+@uploads_bp.route('/<upload_id>', methods=['PUT'])
+@require_auth
+def upload_chunk(upload_id):
+    """
+    Append a chunk
+    ---
+    Headers:
+        Upload-Offset: 1048576          // byte position of this chunk (or ?offset=)
+        Content-Type: application/octet-stream
+        Content-Length: <chunk size>
+
+    Response:
+        {"status": "success", "data": {"offset": 2097152, "total_size": ..., "complete": false}}
+    """
+    try:
+        raw_offset = request.headers.get('Upload-Offset', request.args.get('offset'))
+        try:
+            offset = int(raw_offset)
+        except (TypeError, ValueError):
+            return _error("Upload-Offset header is required", 400)
+
+        progress, error = SubmissionUploadService.append_chunk(
+            upload_id=upload_id,
+            user_id=request.current_user['user_id'],
+            offset=offset,
+            stream=request.stream,
+            length=request.content_length
+        )
+        if error:
+            return _error(error, 400)
+        response = jsonify({
+            'status': 'success',
+            'data': progress
+        })
+        response.headers['Upload-Offset'] = str(progress['offset'])
+        return response, 200
+
+    except Exception as e:
+        return _storage_error_response(e) or _error(str(e), 500)
+
+
+@uploads_bp.route('/<upload_id>', methods=['GET'])
+@require_auth
+def get_upload(upload_id):
+    """
+    Upload progress
+    ---
+    Response:
+        {"status": "success", "data": {"offset": 2097152, "total_size": ..., "complete": false}}
+    """
+    try:
+        progress, _ = SubmissionUploadService.get_progress(upload_id, request.current_user['user_id'])
+        response = jsonify({
+            'status': 'success',
+            'data': progress
+        })
+        response.headers['Upload-Offset'] = str(progress['offset'])
+        response.headers['Cache-Control'] = 'no-store'
+        return response, 200
+
+    except Exception as e:
+        return _storage_error_response(e) or _error(str(e), 500)
+
+
+@uploads_bp.route('/<upload_id>/finalize', methods=['POST'])
+@require_auth
+def finalize_upload(upload_id):
+    """
+    Finish the upload
+    ---
+    Request (optional):
+        {"sha256": "<hex digest of the whole file>"}     // 400 when the received bytes differ
+
+    Response (201):
+        {"status": "success", "data": {"paper": {...}}}
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        sha256 = data.get('sha256')
+        if sha256 is not None and not isinstance(sha256, str):
+            return _error("sha256 must be a hex string", 400)
+        paper, error = SubmissionUploadService.finalize(upload_id, request.current_user['user_id'], sha256=sha256)
+        if error:
+            return _error(error, 400)
+
+        return jsonify({
+            'status': 'success',
+            'message': 'Upload completed',
+            'data': {
+                'paper': paper
+            }
+        }), 201
+
+    except Exception as e:
+        return _storage_error_response(e) or _error(str(e), 500)
+
+
+@uploads_bp.route('/<upload_id>', methods=['DELETE'])
+@require_auth
+def cancel_upload(upload_id):
+    """Abandon an upload and free its disk space"""
+    try:
+        SubmissionUploadService.cancel(upload_id, request.current_user['user_id'])
+        return jsonify({
+            'status': 'success',
+            'message': 'Upload cancelled'
+        }), 200
+
+    except Exception as e:
+        return _storage_error_response(e) or _error(str(e), 500)
@@ -9,7 +9,7 @@ import os
 # Add src to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from flask import Flask, jsonify
+from flask import Flask, jsonify, Response
 from flask_cors import CORS
 from config import config
 
@@ -31,12 +31,40 @@ def create_app(config_name=None):
         r"/*": {
             "origins": ["http://localhost:5173", "http://localhost:3000"],
             "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-            "allow_headers": ["Content-Type", "Authorization"],
-            "expose_headers": ["Content-Type", "Authorization"],
+            "allow_headers": ["Content-Type", "Authorization", "Upload-Offset", "X-Primary-Until"],
+            "expose_headers": ["Content-Type", "Authorization", "Upload-Offset", "Location", "X-Primary-Until"],
             "supports_credentials": True
         }
     })
     
+    # One DB session + one commit per request
+    from infrastructure.databases import unit_of_work
+    unit_of_work.init_app(app)
+    
+    # Keep the paper search index in step with committed changes
+    from infrastructure.search.indexing import register_search_indexing
+    register_search_indexing(warm_up=not app.config.get('TESTING', False))
+    
+    # Extract the text of new PDFs in the background (similarity, matching)
+    if app.config.get('TEXT_EXTRACTION_ENABLED', True):
+        from infrastructure.services.pdf_extraction_service import register_text_extraction
+        register_text_extraction(backfill=not app.config.get('TESTING', False))
+
+    # MinHash signatures of every paper for near-duplicate checks
+    if app.config.get('DEDUP_ENABLED', True):
+        from infrastructure.similarity.duplicates import register_duplicate_detection
+        register_duplicate_detection(backfill=not app.config.get('TESTING', False))
+
+    # Generated conflicts of interest follow new authors (co-authorship graph)
+    if app.config.get('COI_TRACKING_ENABLED', True):
+        from domain.services.conflict_service import register_conflict_tracking
+        register_conflict_tracking()
+
+    # Paper score summaries follow submitted reviews (calibrated per reviewer)
+    if app.config.get('SCORE_TRACKING_ENABLED', True):
+        from domain.services.scoring_service import register_score_tracking
+        register_score_tracking()
+    
     # Register API routes
     from api.v1 import v1_bp
     app.register_blueprint(v1_bp)
@@ -55,12 +83,27 @@ def create_app(config_name=None):
             },
             "endpoints": {
                 "health": "/health",
+                "metrics": "/metrics",
                 "auth": {
                     "register": "POST /api/v1/auth/register",
                     "login": "POST /api/v1/auth/login",
                     "me": "GET /api/v1/auth/me",
                     "logout": "POST /api/v1/auth/logout"
                 },
+                "conferences": {
+                    "papers": "GET /api/v1/conferences/<id>/papers?status=&track_id=&fields=&cursor=",
+                    "search": "GET /api/v1/conferences/<id>/papers/search?q="
+                },
+                "papers": {
+                    "pdf": "GET /api/v1/papers/<id>/pdf",
+                    "camera_ready": "GET /api/v1/papers/<id>/camera-ready"
+                },
+                "uploads": {
+                    "start": "POST /api/v1/uploads",
+                    "chunk": "PUT /api/v1/uploads/<upload_id>",
+                    "progress": "GET /api/v1/uploads/<upload_id>",
+                    "finalize": "POST /api/v1/uploads/<upload_id>/finalize"
+                },
                 "docs": "/api/docs (coming soon)"
             }
         }), 200
@@ -69,6 +112,13 @@ def create_app(config_name=None):
     @app.route('/health')
     def health():
         from infrastructure.databases.base import check_connection, get_db_info
+        from infrastructure.services.hashing_service import get_password_hasher
+        from infrastructure.services.audit_sink import get_audit_sink
+        from infrastructure.cache.profile_cache import get_profile_cache
+        from infrastructure.services.pdf_extraction_service import get_extraction_pipeline
+        from infrastructure.similarity.duplicates import duplicate_detection_stats
+        from infrastructure.services.idempotency_store import get_idempotency_store
+        from domain.utils.auth_utils import get_token_cache
         
         db_connected, db_message = check_connection()
         db_info = get_db_info()
@@ -88,9 +138,31 @@ def create_app(config_name=None):
             "app": {
                 "debug": app.config.get('DEBUG', False),
                 "port": app.config.get('PORT', 5000)
+            },
+            "hashing": get_password_hasher().stats(),
+            "audit": get_audit_sink().stats(),
+            "pdf_extraction": get_extraction_pipeline().stats(),
+            "duplicates": duplicate_detection_stats(),
+            "idempotency": get_idempotency_store().stats(),
+            "caches": {
+                "tokens": get_token_cache().stats(),
+                "profiles": get_profile_cache().stats()
             }
         }), status_code
     
+    # Metrics endpoint (Prometheus text exposition format)
+    from infrastructure.monitoring.collectors import register_default_collectors
+    register_default_collectors()
+    
+    @app.route('/metrics')
+    def metrics():
+        from infrastructure.monitoring.metrics import registry
+        
+        return Response(
+            registry.render(),
+            content_type='text/plain; version=0.0.4; charset=utf-8'
+        )
+    
     # Error handlers
     @app.errorhandler(404)
     def not_found(error):
@@ -30,6 +30,12 @@ class Config:
     DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))
     DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 3600))
     DB_ECHO = os.getenv('DB_ECHO', 'True').lower() == 'true'
+    SLOW_QUERY_THRESHOLD_MS = float(os.getenv('SLOW_QUERY_THRESHOLD_MS', 200))
+
+    # Read replicas (optional): "postgresql://.../replica1,postgresql://.../replica2"
+    DB_REPLICA_URLS = os.getenv('DB_REPLICA_URLS', '')
+    # After a write, that user's reads stay on the primary for this long
+    REPLICA_STICKY_SECONDS = float(os.getenv('REPLICA_STICKY_SECONDS', 5))
     
     @classmethod
     def get_database_url(cls):
@@ -53,12 +59,109 @@ class Config:
     # Security
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-change-in-production')
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', 'dev-jwt-secret-change-in-production')
-    
+    JWT_KEY_ID = os.getenv('JWT_KEY_ID', 'primary')  # 'kid' header của token mới
+    # Keys cũ vẫn verify được khi rotate: "kid1:secret1,kid2:secret2"
+    JWT_PREVIOUS_KEYS = os.getenv('JWT_PREVIOUS_KEYS', '')
+
+    # Verified-token cache (require_auth)
+    TOKEN_CACHE_SIZE = int(os.getenv('TOKEN_CACHE_SIZE', 10000))
+    TOKEN_CACHE_TTL = int(os.getenv('TOKEN_CACHE_TTL', 300))
+
+    # Login throttle (token buckets, checked before DB lookup and bcrypt)
+    LOGIN_THROTTLE_ENABLED = os.getenv('LOGIN_THROTTLE_ENABLED', 'True').lower() == 'true'
+    LOGIN_THROTTLE_BACKEND = os.getenv('LOGIN_THROTTLE_BACKEND', 'memory')
+    LOGIN_THROTTLE_SHARDS = int(os.getenv('LOGIN_THROTTLE_SHARDS', 64))
+    LOGIN_USER_BURST = int(os.getenv('LOGIN_USER_BURST', 5))
+    LOGIN_USER_PER_MINUTE = float(os.getenv('LOGIN_USER_PER_MINUTE', 5))
+    LOGIN_IP_BURST = int(os.getenv('LOGIN_IP_BURST', 20))
+    LOGIN_IP_PER_MINUTE = float(os.getenv('LOGIN_IP_PER_MINUTE', 30))
+
+    # User profile cache (GET /auth/me)
+    PROFILE_CACHE_SIZE = int(os.getenv('PROFILE_CACHE_SIZE', 10000))
+    PROFILE_CACHE_TTL = int(os.getenv('PROFILE_CACHE_TTL', 60))
+
+    # Password Hashing (bcrypt chạy trên process pool, không chạy trên request thread)
+    BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', 12))
+    HASH_WORKERS = int(os.getenv('HASH_WORKERS', os.cpu_count() or 2))  # 0 = hash inline
+    HASH_QUEUE_SIZE = int(os.getenv('HASH_QUEUE_SIZE', 64))  # max jobs running + waiting
+    HASH_TIMEOUT = float(os.getenv('HASH_TIMEOUT', 10))
+
+    # Audit log sink (batched, off the request path)
+    AUDIT_BATCH_SIZE = int(os.getenv('AUDIT_BATCH_SIZE', 200))
+    AUDIT_FLUSH_INTERVAL = float(os.getenv('AUDIT_FLUSH_INTERVAL', 1.0))
+    AUDIT_QUEUE_SIZE = int(os.getenv('AUDIT_QUEUE_SIZE', 10000))
+    AUDIT_SPILL_PATH = os.getenv('AUDIT_SPILL_PATH', 'var/audit_spill.jsonl')
+
+    # File storage (content-addressed blobs for Paper PDFs)
+    UPLOAD_ROOT = os.getenv('UPLOAD_ROOT', 'var/uploads')
+    UPLOAD_CHUNK_SIZE = int(os.getenv('UPLOAD_CHUNK_SIZE', 1024 * 1024))
+    MAX_PDF_SIZE_MB = int(os.getenv('MAX_PDF_SIZE_MB', 50))
+    UPLOAD_SESSION_TTL_HOURS = int(os.getenv('UPLOAD_SESSION_TTL_HOURS', 24))  # resumable uploads
+    UPLOAD_DEADLINE_GRACE_MINUTES = int(os.getenv('UPLOAD_DEADLINE_GRACE_MINUTES', 15))  # chunks / finalize after the deadline
+    UPLOAD_GC_INTERVAL = int(os.getenv('UPLOAD_GC_INTERVAL', 600))  # seconds between GC sweeps
+
+    # One-request submissions (POST /submissions with an Idempotency-Key header)
+    IDEMPOTENCY_TTL_HOURS = int(os.getenv('IDEMPOTENCY_TTL_HOURS', 24))  # how long retries are answered from the stored result
+    IDEMPOTENCY_CLAIM_SECONDS = int(os.getenv('IDEMPOTENCY_CLAIM_SECONDS', 300))  # a retry may take over a claim this old
+    # Deadline check uses X-Request-Start (nginx: "t=${msec}") - only behind a proxy that sets it
+    TRUST_REQUEST_START_HEADER = os.getenv('TRUST_REQUEST_START_HEADER', 'False').lower() == 'true'
+
+    # ZIP export of a conference's PDFs (streamed, never built in memory)
+    EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', 256 * 1024))
+
+    # PDF downloads
+    USE_X_SENDFILE = os.getenv('USE_X_SENDFILE', 'False').lower() == 'true'  # let Apache/lighttpd send the blob
+    DOWNLOAD_ACCESS_CACHE_SIZE = int(os.getenv('DOWNLOAD_ACCESS_CACHE_SIZE', 10000))
+    DOWNLOAD_ACCESS_CACHE_TTL = int(os.getenv('DOWNLOAD_ACCESS_CACHE_TTL', 60))
+
+    # Paper full-text search
+    SEARCH_BACKEND = os.getenv('SEARCH_BACKEND', 'auto')  # auto | memory | postgres
+    SEARCH_INDEX_PATH = os.getenv('SEARCH_INDEX_PATH', 'var/search_index')  # memory backend only
+    SEARCH_SNAPSHOT_EVERY = int(os.getenv('SEARCH_SNAPSHOT_EVERY', 500))  # journal entries per snapshot
+
+    # PDF text extraction (process pool, off the request path)
+    TEXT_EXTRACTION_ENABLED = os.getenv('TEXT_EXTRACTION_ENABLED', 'True').lower() == 'true'
+    TEXT_ROOT = os.getenv('TEXT_ROOT', 'var/texts')  # gzip'd text keyed by PDF SHA-256
+    EXTRACT_WORKERS = int(os.getenv('EXTRACT_WORKERS', max(1, (os.cpu_count() or 2) // 2)))  # 0 = inline
+    EXTRACT_QUEUE_SIZE = int(os.getenv('EXTRACT_QUEUE_SIZE', 1000))
+    EXTRACT_TIMEOUT = float(os.getenv('EXTRACT_TIMEOUT', 60))  # seconds per file
+    EXTRACT_MEMORY_MB = int(os.getenv('EXTRACT_MEMORY_MB', 512))  # per worker, on top of its start-up size
+    EXTRACT_MAX_PAGES = int(os.getenv('EXTRACT_MAX_PAGES', 200))
+
+    # Near-duplicate submissions (MinHash signatures + LSH index)
+    DEDUP_ENABLED = os.getenv('DEDUP_ENABLED', 'True').lower() == 'true'
+    DEDUP_INDEX_PATH = os.getenv('DEDUP_INDEX_PATH', 'var/minhash')
+    DEDUP_THRESHOLD = float(os.getenv('DEDUP_THRESHOLD', 0.5))  # estimated Jaccard of word 3-grams
+    DEDUP_NUM_PERM = int(os.getenv('DEDUP_NUM_PERM', 128))  # signature width (uint32 positions)
+
+    # Automatic reviewer assignment
+    ASSIGNMENT_REVIEWERS_PER_PAPER = int(os.getenv('ASSIGNMENT_REVIEWERS_PER_PAPER', 3))
+    ASSIGNMENT_DEFAULT_QUOTA = int(os.getenv('ASSIGNMENT_DEFAULT_QUOTA', 10))  # papers per reviewer without a ConferenceMentor quota
+    ASSIGNMENT_CANDIDATES = int(os.getenv('ASSIGNMENT_CANDIDATES', 50))  # best-affinity reviewers considered per paper
+    AFFINITY_CACHE_PATH = os.getenv('AFFINITY_CACHE_PATH', 'var/affinity')  # per-conference TF-IDF matrices ('' = memory only)
+
+    # Conflicts of interest from the co-authorship graph
+    COI_TRACKING_ENABLED = os.getenv('COI_TRACKING_ENABLED', 'True').lower() == 'true'  # follow new authors
+    COI_HOPS = int(os.getenv('COI_HOPS', 1))  # 1 = direct co-authors, 2 = their co-authors too
+    COI_WINDOW_YEARS = float(os.getenv('COI_WINDOW_YEARS', 5))  # joint papers older than this don't count (0 = all)
+    COI_AFFILIATION = os.getenv('COI_AFFILIATION', 'True').lower() == 'true'  # shared affiliation is a conflict
+    COI_GRAPH_REBUILD_MINUTES = int(os.getenv('COI_GRAPH_REBUILD_MINUTES', 1440))  # full rebuild (drops deleted authors)
+
+    # Review score summaries and reviewer calibration
+    SCORE_TRACKING_ENABLED = os.getenv('SCORE_TRACKING_ENABLED', 'True').lower() == 'true'  # refresh summaries on review commits
+    SCORE_PRIOR_REVIEWS = float(os.getenv('SCORE_PRIOR_REVIEWS', 3))  # pseudo-reviews pulling a reviewer towards the conference mean
+    SCORE_PRIOR_DRIFT = float(os.getenv('SCORE_PRIOR_DRIFT', 0.05))  # conference mean / std change that re-bases every summary
+
     @property
     def DATABASE_URL(self):
         """Get database URL (allow override from env)"""
         return os.getenv('DATABASE_URL', self.get_database_url())
 
+    @property
+    def DB_REPLICA_URL_LIST(self):
+        """Replica URLs as a list (empty when replicas are not configured)"""
+        return [url.strip() for url in self.DB_REPLICA_URLS.split(',') if url.strip()]
+
 
 class DevelopmentConfig(Config):
     """Development configuration"""
@@ -82,7 +185,8 @@ class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
     DB_ECHO = False
-    
+    BCRYPT_ROUNDS = 4  # Minimum cost - tests không cần bcrypt chậm
+
     @classmethod
     def get_database_url(cls):
         """Use test database or in-memory"""
@@ -0,0 +1,2 @@
+# Module: __init__.py
+# Created automatically for UTH-ConfMS
@@ -0,0 +1,33 @@
+# ============================================
+# File: Backend/src/domain/schemas/user_schema.py
+# ============================================
+"""
+User Schemas - validation of auth requests, shape of user responses
+"""
+
+from marshmallow import Schema, fields, validate
+
+
+VALID_ROLES = ['Author', 'Reviewer', 'Chair', 'Admin']
+
+
+class UserRegistrationSchema(Schema):
+    username = fields.String(required=True, validate=validate.Length(min=3, max=50))
+    password = fields.String(required=True, load_only=True, validate=validate.Length(min=8, max=128))
+    email = fields.Email(required=True, validate=validate.Length(max=255))
+    full_name = fields.String(required=True, validate=validate.Length(min=1, max=100))
+    role = fields.String(load_default=None, validate=validate.OneOf(VALID_ROLES))
+
+
+class UserLoginSchema(Schema):
+    username = fields.String(required=True, validate=validate.Length(min=1, max=50))
+    password = fields.String(required=True, load_only=True, validate=validate.Length(min=1, max=128))
+
+
+class UserResponseSchema(Schema):
+    id = fields.Integer()
+    username = fields.String()
+    email = fields.String()
+    full_name = fields.String()
+    roles = fields.List(fields.String())
+    created_at = fields.String()
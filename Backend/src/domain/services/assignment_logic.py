@@ -1,2 +1,309 @@
-# Module: assignment_logic.py
-# Created automatically for UTH-ConfMS
+# ============================================
+# File: Backend/src/domain/services/assignment_logic.py
+# ============================================
+"""
+Assignment Logic - paper <-> reviewer matching (no database, no Flask)
+
+The problem is a b-matching on a sparse candidate graph:
+    maximize   sum of affinity(paper, reviewer) over chosen pairs
+    subject to every paper gets `reviewers_per_paper` distinct reviewers
+               every reviewer gets at most `quota` papers
+               conflicted pairs are never chosen (hard exclusion)
+
+Solved with an auction (Bertsekas), the price-based form of min-cost flow:
+    - papers with open slots bid for the reviewers worth the most to them
+      (affinity - price); a paper short of d slots bids for its best d at
+      once, each bid raising the price by the margin over the (d+1)-th best
+      plus eps
+    - a full reviewer keeps its `quota` highest bids; the lowest is pushed
+      out and that paper bids again
+    - a paper stops bidding for a slot once every candidate costs more than
+      `penalty` below its affinity; leftover slots are then filled from
+      reviewers with spare capacity (fill phase)
+
+The final prices give an LP dual bound, so every result reports how far it
+can be from the optimum on its candidate graph at most:
+    upper_bound = sum(quota * price) + sum over papers of their top-k
+                  max(0, affinity - price)
+Pre-existing assignments (`fixed`) count towards both limits and are never
+moved.
+
+Incremental repair (a reviewer declined, a late paper arrived): solve only
+the papers with open slots, their current reviewers as `fixed` and the
+quotas left over by every other assignment (residual_quotas). Papers without
+open slots are constant in a full re-solve that keeps the current
+assignments, so the repair's upper_bound - total_affinity also bounds what
+such a full re-solve could add.
+
+Usage:
+    problem = AssignmentProblem(
+        paper_ids=[1, 2], reviewer_ids=[7, 8, 9],
+        candidates={1: [(7, 0.8), (8, 0.3)], 2: [(9, 0.6)]},
+        quotas={7: 5, 8: 5, 9: 2}, reviewers_per_paper=2,
+        conflicts={(2, 8)}
+    )
+    result = solve_assignment(problem)
+    result.pairs            # [(paper_id, reviewer_id, affinity), ...]
+"""
+
+import heapq
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+
+DEFAULT_EPSILON = 0.02  # bid increment, relative to the highest affinity
+DEFAULT_PENALTY = 0.25  # an open slot is worth this much less than a 0-affinity reviewer
+WAR_BIDS = 3            # bids per open slot before increments start doubling
+
+
+@dataclass
+class AssignmentProblem:
+    paper_ids: list
+    reviewer_ids: list
+    candidates: dict                    # paper_id -> [(reviewer_id, affinity >= 0), ...]
+    quotas: dict                        # reviewer_id -> max papers (incl. fixed ones)
+    reviewers_per_paper: int = 3
+    demand: dict = None                 # paper_id -> reviewers wanted (overrides reviewers_per_paper)
+    conflicts: set = field(default_factory=set)   # {(paper_id, reviewer_id)}
+    fixed: dict = field(default_factory=dict)     # paper_id -> {reviewer_id} already assigned
+
+
+@dataclass
+class AssignmentResult:
+    pairs: list             # new (paper_id, reviewer_id, affinity), fixed ones excluded
+    total_affinity: float   # of new + fixed pairs
+    upper_bound: float      # no assignment on this candidate graph can score more
+    unfilled: dict          # paper_id -> slots still open
+    stats: dict
+
+    @property
+    def quality(self) -> float:
+        """total / upper bound (1.0 = provably optimal)"""
+        if self.upper_bound <= 0:
+            return 1.0
+        return min(1.0, self.total_affinity / self.upper_bound)
+
+
+def solve_assignment(problem: AssignmentProblem, epsilon: float = DEFAULT_EPSILON,
+                     penalty: float = DEFAULT_PENALTY) -> AssignmentResult:
+    started = time.perf_counter()
+
+    papers = list(dict.fromkeys(problem.paper_ids))
+    reviewers = list(dict.fromkeys(problem.reviewer_ids))
+    reviewer_index = {reviewer_id: j for j, reviewer_id in enumerate(reviewers)}
+    conflicts = problem.conflicts or set()
+
+    # ---------- Dense indexes, fixed pairs taken out of demand / capacity ----------
+    capacity = [max(0, int(problem.quotas.get(reviewer_id) or 0)) for reviewer_id in reviewers]
+    fixed = [set() for _ in papers]
+    fixed_affinity = 0.0
+    need = []
+    for i, paper_id in enumerate(papers):
+        wanted = problem.reviewers_per_paper
+        if problem.demand and paper_id in problem.demand:
+            wanted = problem.demand[paper_id]
+        already = (problem.fixed or {}).get(paper_id, ())
+        for reviewer_id in already:
+            j = reviewer_index.get(reviewer_id)
+            if j is not None:
+                fixed[i].add(j)
+                capacity[j] = max(0, capacity[j] - 1)
+        need.append(max(0, wanted - len(already)))  # reviewers outside the pool count too
+
+    candidates = []
+    top_affinity = 0.0
+    for i, paper_id in enumerate(papers):
+        best = {}
+        for reviewer_id, affinity in problem.candidates.get(paper_id, ()):
+            j = reviewer_index.get(reviewer_id)
+            if j is None or j in fixed[i] or (paper_id, reviewer_id) in conflicts:
+                continue
+            affinity = max(0.0, float(affinity))
+            if affinity >= best.get(j, -1.0):
+                best[j] = affinity
+        candidates.append(list(best.items()))
+        if best:
+            top_affinity = max(top_affinity, max(best.values()))
+        for j in fixed[i]:
+            fixed_affinity += _affinity_of(problem, paper_id, reviewers[j])
+
+    scale = top_affinity or 1.0
+    eps = epsilon * scale
+    floor = -penalty * scale
+
+    # ---------- Auction ----------
+    price = [0.0] * len(reviewers)
+    holders = [[] for _ in reviewers]   # min-heap of (bid, paper index)
+    held = [set() for _ in papers]
+    queue = deque(i for i in range(len(papers)) if need[i] > 0)
+    bids = 0
+    # Price wars over the last free slots (demand > capacity somewhere) would
+    # take slots/eps rounds: past WAR_BIDS bids per slot the increment doubles
+    # every `slots` bids. The reported bound stays valid either way.
+    slots = max(1, sum(need))
+    escalate_at = WAR_BIDS * slots
+
+    while queue:
+        i = queue.popleft()
+        open_slots = need[i]
+        if open_slots <= 0:
+            continue
+        mine = held[i]
+        values = []
+        for j, affinity in candidates[i]:
+            if j in mine or capacity[j] == 0:
+                continue
+            value = affinity - price[j]
+            if value > floor:
+                values.append((value, j))
+        if not values:
+            continue  # every candidate priced out: left to the fill phase
+
+        best = heapq.nlargest(open_slots + 1, values)
+        if len(best) > open_slots:
+            threshold = best[open_slots][0]
+            best = best[:open_slots]
+        else:
+            threshold = floor
+
+        if bids >= escalate_at:
+            eps *= 2
+            escalate_at += slots
+        for value, j in best:
+            bid = price[j] + (value - threshold) + eps
+            bids += 1
+            heap = holders[j]
+            heapq.heappush(heap, (bid, i))
+            mine.add(j)
+            need[i] -= 1
+            if len(heap) > capacity[j]:
+                _, outbid = heapq.heappop(heap)
+                held[outbid].discard(j)
+                need[outbid] += 1
+                queue.append(outbid)
+            price[j] = heap[0][0] if len(heap) >= capacity[j] else 0.0
+
+    upper_bound = _dual_bound(candidates, capacity, price, held, fixed, need, papers,
+                              problem, fixed_affinity)
+
+    # ---------- Fill phase: open slots from reviewers with spare capacity ----------
+    load = [len(heap) for heap in holders]
+    filled_without_candidates = _fill(papers, reviewers, candidates, capacity, load, held,
+                                      fixed, need, conflicts)
+
+    # ---------- Result ----------
+    affinity_of = [dict(candidates[i]) for i in range(len(papers))]
+    pairs = []
+    total = fixed_affinity
+    for i, paper_id in enumerate(papers):
+        for j in sorted(held[i]):
+            affinity = affinity_of[i].get(j, 0.0)
+            total += affinity
+            pairs.append((paper_id, reviewers[j], affinity))
+
+    unfilled = {papers[i]: need[i] for i in range(len(papers)) if need[i] > 0}
+    result = AssignmentResult(
+        pairs=pairs,
+        total_affinity=total,
+        upper_bound=max(upper_bound, total),
+        unfilled=unfilled,
+        stats={
+            'papers': len(papers),
+            'reviewers': len(reviewers),
+            'candidate_edges': sum(len(c) for c in candidates),
+            'assigned': len(pairs),
+            'fixed': sum(len(f) for f in fixed),
+            'filled_without_candidates': filled_without_candidates,
+            'unfilled_slots': sum(unfilled.values()),
+            'bids': bids,
+            'seconds': round(time.perf_counter() - started, 3),
+        }
+    )
+    result.stats['quality'] = round(result.quality, 4)
+    return result
+
+
+def residual_quotas(quotas: dict, loads: dict, fixed: dict) -> dict:
+    """
+    Quotas for a problem over some papers only: `loads` counts every active
+    assignment of a reviewer (in or out of the problem), `fixed` the ones of
+    the problem's papers - the solver counts those itself
+    """
+    in_problem = {}
+    for reviewers in fixed.values():
+        for reviewer_id in reviewers:
+            in_problem[reviewer_id] = in_problem.get(reviewer_id, 0) + 1
+    return {
+        reviewer_id: max(0, quota - loads.get(reviewer_id, 0) + in_problem.get(reviewer_id, 0))
+        for reviewer_id, quota in quotas.items()
+    }
+
+
+def _affinity_of(problem: AssignmentProblem, paper_id, reviewer_id) -> float:
+    for candidate_id, affinity in problem.candidates.get(paper_id, ()):
+        if candidate_id == reviewer_id:
+            return max(0.0, float(affinity))
+    return 0.0
+
+
+def _dual_bound(candidates, capacity, price, held, fixed, need, papers, problem, fixed_affinity) -> float:
+    """
+    LP upper bound from the auction prices, and the capacity-free bound
+    (every paper gets its best candidates); the smaller one is reported
+    """
+    dual = sum(cap * p for cap, p in zip(capacity, price))
+    relaxed = 0.0
+    for i in range(len(papers)):
+        slots = need[i] + len(held[i])
+        if slots <= 0:
+            continue
+        profits = [affinity - price[j] for j, affinity in candidates[i] if capacity[j] > 0]
+        dual += sum(value for value in heapq.nlargest(slots, profits) if value > 0)
+        relaxed += sum(heapq.nlargest(slots, (affinity for _, affinity in candidates[i])))
+    return fixed_affinity + min(dual, relaxed)
+
+
+def _fill(papers, reviewers, candidates, capacity, load, held, fixed, need, conflicts) -> int:
+    """Open slots: best spare candidate first, then the least-loaded spare reviewer"""
+    open_papers = [i for i in range(len(papers)) if need[i] > 0]
+    if not open_papers:
+        return 0
+
+    filled_blind = 0
+    spare = None
+    for i in open_papers:
+        paper_id = papers[i]
+        for j, _ in sorted(candidates[i], key=lambda item: -item[1]):
+            if need[i] == 0:
+                break
+            if load[j] < capacity[j] and j not in held[i]:
+                held[i].add(j)
+                load[j] += 1
+                need[i] -= 1
+        if need[i] == 0:
+            continue
+
+        if spare is None:
+            # Reviewers with room, most room first (built once, kept current)
+            spare = [(load[j] - capacity[j], j) for j in range(len(reviewers)) if load[j] < capacity[j]]
+            heapq.heapify(spare)
+        skipped = []
+        while need[i] > 0 and spare:
+            room, j = heapq.heappop(spare)
+            if load[j] - capacity[j] != room:
+                if load[j] < capacity[j]:
+                    heapq.heappush(spare, (load[j] - capacity[j], j))
+                continue
+            if j in held[i] or j in fixed[i] or (paper_id, reviewers[j]) in conflicts:
+                skipped.append((room, j))
+                continue
+            held[i].add(j)
+            load[j] += 1
+            need[i] -= 1
+            filled_blind += 1
+            if load[j] < capacity[j]:
+                heapq.heappush(spare, (load[j] - capacity[j], j))
+        for item in skipped:
+            heapq.heappush(spare, item)
+    return filled_blind
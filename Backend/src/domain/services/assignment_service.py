@@ -0,0 +1,584 @@
+# ============================================
+# File: Backend/src/domain/services/assignment_service.py
+# ============================================
+"""
+Assignment Service - automatic reviewer assignment for a conference
+
+    1. load, in the writing transaction (the conference row is locked so two
+       runs cannot double-assign):
+           papers under review, the reviewer pool and quotas, active
+           assignments, conflicts of interest and authorships
+    2. candidates: every paper's ASSIGNMENT_CANDIDATES best reviewers by
+       TF-IDF affinity (infrastructure.similarity.affinity: the paper against
+       the reviewer's own papers); a ConferenceMentor request for the paper
+       adds BID_BONUS
+    3. solve (assignment_logic.solve_assignment)
+    4. one bulk INSERT of the new Assignment rows (is_auto_assigned=True)
+
+Reviewer pool: users with a ConferenceMentor row that has no paper (the
+general pool) or a paper of this conference; their quota is the largest
+`quota` on those rows, ASSIGNMENT_DEFAULT_QUOTA when none is set. Quotas
+count the reviewer's active assignments in this conference.
+
+Hard exclusions: ConflictOfInterest rows, the paper's authors and submitter,
+reviewers who declined the paper or were taken off it. Active assignments
+are kept and count towards reviewers per paper.
+
+Incremental repair (repair_assignments, decline_assignment): only the papers
+with open slots are loaded - their active reviewers fixed, every other
+assignment reduced to a per-reviewer count against the quotas - and only
+their candidates are computed, so a decline or a late paper costs
+milliseconds instead of a whole-conference run and nothing else moves.
+
+The affinity matrices are brought up to date before the conference row is
+locked, so the locked transaction only reads what changed in between.
+"""
+
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, func, insert, or_
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.databases.routing import stick_to_primary
+from infrastructure.models import (
+    Paper, PaperStatus, PaperAuthor, Conference, ConferenceMentor,
+    ConflictOfInterest, Assignment, User, AuditLogAI
+)
+from infrastructure.similarity.affinity import get_conference_affinity
+from domain.services.assignment_logic import AssignmentProblem, residual_quotas, solve_assignment
+from domain.services.paper_file_service import INACTIVE_ASSIGNMENT_STATUSES, PaperFileService
+from domain.utils.auth_utils import get_role_names
+
+
+CONFERENCE_NOT_FOUND = "Conference not found"
+PAPER_NOT_FOUND = "Paper not found in this conference"
+REVIEWER_NOT_IN_POOL = "User is not in this conference's reviewer pool"
+ACCESS_DENIED = "Only the conference chair or an admin can assign reviewers"
+ASSIGNMENT_NOT_FOUND = "Assignment not found in this conference"
+ASSIGNMENT_INACTIVE = "Assignment is already declined or cancelled"
+DECLINE_DENIED = "Only the assigned reviewer, the conference chair or an admin can decline an assignment"
+
+DECLINED = 'Declined'
+
+ASSIGNABLE_STATUSES = (PaperStatus.SUBMITTED, PaperStatus.UNDER_REVIEW)
+MAX_REVIEWERS_PER_PAPER = 10
+BID_BONUS = 0.2
+ID_CHUNK_SIZE = 900
+MAX_SUGGESTIONS = 100
+
+
+def _chunks(ids):
+    ids = list(ids)
+    for start in range(0, len(ids), ID_CHUNK_SIZE):
+        yield ids[start:start + ID_CHUNK_SIZE]
+
+
+def _settings():
+    from config import get_config
+    current_config = get_config()
+    return (current_config.ASSIGNMENT_REVIEWERS_PER_PAPER,
+            current_config.ASSIGNMENT_DEFAULT_QUOTA,
+            current_config.ASSIGNMENT_CANDIDATES)
+
+
+def _active_assignment() -> tuple:
+    """Filter of the assignments that count: not deleted, not declined / cancelled"""
+    return (
+        or_(Assignment.is_deleted.is_(False), Assignment.is_deleted.is_(None)),
+        Assignment.status.notin_(INACTIVE_ASSIGNMENT_STATUSES),
+    )
+
+
+def _conflicts(db, paper_ids) -> set:
+    """
+    {(paper_id, user_id)} that must never be assigned: COI rows, authors,
+    submitters, reviewers who declined the paper or were taken off it
+    """
+    conflicts = set()
+    for chunk in _chunks(paper_ids):
+        conflicts.update(
+            (row.id, row.submitter_id) for row in db.query(Paper.id, Paper.submitter_id).filter(Paper.id.in_(chunk))
+        )
+        conflicts.update(
+            (row.paper_id, row.user_id) for row in db.query(PaperAuthor.paper_id, PaperAuthor.user_id).filter(
+                PaperAuthor.paper_id.in_(chunk)
+            )
+        )
+        conflicts.update(
+            (row.paper_id, row.reviewer_id) for row in db.query(
+                ConflictOfInterest.paper_id, ConflictOfInterest.reviewer_id
+            ).filter(ConflictOfInterest.paper_id.in_(chunk))
+        )
+        conflicts.update(
+            (row.paper_id, row.reviewer_id) for row in db.query(Assignment.paper_id, Assignment.reviewer_id).filter(
+                Assignment.paper_id.in_(chunk),
+                Assignment.status.in_(INACTIVE_ASSIGNMENT_STATUSES)
+            )
+        )
+    return conflicts
+
+
+def reviewer_pool(db, conference_id: int):
+    """({reviewer_id: quota or None}, {paper_id: {reviewer_id}} mentor requests)"""
+    conference_papers = db.query(Paper.id).filter(Paper.conference_id == conference_id)
+    quotas = {}
+    bids = {}
+    for row in db.query(
+        ConferenceMentor.reviewer_user_id, ConferenceMentor.paper_id, ConferenceMentor.quota
+    ).join(
+        User, User.id == ConferenceMentor.reviewer_user_id
+    ).filter(
+        User.is_deleted == False,
+        or_(ConferenceMentor.paper_id.is_(None), ConferenceMentor.paper_id.in_(conference_papers))
+    ):
+        if row.quota is not None:
+            quotas[row.reviewer_user_id] = max(quotas.get(row.reviewer_user_id) or 0, row.quota)
+        else:
+            quotas.setdefault(row.reviewer_user_id, None)
+        if row.paper_id is not None:
+            bids.setdefault(row.paper_id, set()).add(row.reviewer_user_id)
+    return quotas, bids
+
+
+def _validated(reviewers_per_paper=None, default_quota=None):
+    """((reviewers per paper, default quota, candidates per paper), None) or (None, error_message)"""
+    configured_per_paper, configured_quota, candidate_count = _settings()
+    try:
+        per_paper = int(reviewers_per_paper or configured_per_paper)
+        quota = int(default_quota or configured_quota)
+    except (TypeError, ValueError):
+        return None, "reviewers_per_paper and default_quota must be integers"
+    if not 1 <= per_paper <= MAX_REVIEWERS_PER_PAPER:
+        return None, f"reviewers_per_paper must be between 1 and {MAX_REVIEWERS_PER_PAPER}"
+    if quota < 1:
+        return None, "default_quota must be positive"
+    return (per_paper, quota, candidate_count), None
+
+
+def _insert_pairs(db, conference_id: int, pairs):
+    """One bulk INSERT of solver pairs as auto-assigned Assignment rows"""
+    now = datetime.utcnow()
+    db.execute(insert(Assignment), [
+        {
+            'conference_id': conference_id,
+            'paper_id': paper_id,
+            'reviewer_id': reviewer_id,
+            'is_auto_assigned': True,
+            'status': 'Assigned',
+            'assigned_at': now,
+            'created_at': now,
+            'updated_at': now,
+            'is_deleted': False,
+        }
+        for paper_id, reviewer_id, _ in pairs
+    ])
+
+
+def _response(result, dry_run: bool, list_pairs: bool = None) -> dict:
+    """API shape of a solver result; pairs are listed for dry runs unless list_pairs says otherwise"""
+    response = {
+        'stats': {
+            **result.stats,
+            'total_affinity': round(result.total_affinity, 4),
+            'upper_bound': round(result.upper_bound, 4),
+            'max_gap': round(result.upper_bound - result.total_affinity, 4),
+            'dry_run': dry_run,
+        },
+        'unfilled': [
+            {'paper_id': paper_id, 'missing': missing}
+            for paper_id, missing in sorted(result.unfilled.items())
+        ],
+    }
+    if dry_run if list_pairs is None else list_pairs:
+        response['pairs'] = [
+            {'paper_id': paper_id, 'reviewer_id': reviewer_id, 'affinity': round(affinity, 4)}
+            for paper_id, reviewer_id, affinity in result.pairs
+        ]
+    return response
+
+
+class AssignmentService:
+
+    @staticmethod
+    def auto_assign(conference_id: int, current_user: dict, reviewers_per_paper: int = None,
+                    default_quota: int = None, track_id: int = None, dry_run: bool = False):
+        """
+        Assign reviewers to every paper of the conference that still needs some
+
+        Returns: ({'stats', 'unfilled', 'pairs'?}, None) or (None, error_message);
+        `pairs` (paper_id, reviewer_id, affinity) is only listed for dry runs
+        """
+        settings, error = _validated(reviewers_per_paper, default_quota)
+        if error:
+            return None, error
+        per_paper, quota, candidate_count = settings
+
+        user_id = current_user.get('user_id')
+        with session_scope(read_only=True, read_key=user_id) as db:
+            error = AssignmentService._check_access(db, conference_id, current_user)
+            if error:
+                return None, error
+            AssignmentService._synced_affinity(db, conference_id)
+
+        with session_scope() as db:
+            error = AssignmentService._check_access(db, conference_id, current_user, lock=not dry_run)
+            if error:
+                return None, error
+
+            problem, bids = AssignmentService._load_problem(db, conference_id, per_paper, quota, track_id)
+            problem.candidates = AssignmentService._candidates(db, conference_id, problem, bids, candidate_count)
+            result = solve_assignment(problem)
+
+            if result.pairs and not dry_run:
+                _insert_pairs(db, conference_id, result.pairs)
+                AuditLogAI.enqueue(
+                    db_session=db,
+                    user_id=user_id,
+                    action_type='assignments_auto_created',
+                    table_name='assignments',
+                    record_id=conference_id,
+                    data=json.dumps({**result.stats, 'track_id': track_id})
+                )
+                stick_to_primary(user_id, session=db)
+
+        return _response(result, dry_run), None
+
+    @staticmethod
+    def repair_assignments(conference_id: int, current_user: dict, paper_ids=None,
+                           reviewers_per_paper: int = None, default_quota: int = None, dry_run: bool = False):
+        """
+        Fill only the open slots (declined reviewers, late papers) around the
+        current assignments, which are never moved
+
+        Only the papers with fewer than `reviewers_per_paper` active
+        assignments (of `paper_ids`, when given) are loaded and solved.
+        stats['max_gap'] bounds the affinity a full re-solve keeping the
+        current assignments could add (stats['covers_all_open']: every open
+        paper was part of the repair).
+
+        Returns: ({'stats', 'unfilled', 'pairs'?}, None) or (None, error_message)
+        """
+        settings, error = _validated(reviewers_per_paper, default_quota)
+        if error:
+            return None, error
+        per_paper, quota, candidate_count = settings
+        if paper_ids is not None:
+            try:
+                paper_ids = {int(paper_id) for paper_id in paper_ids}
+            except (TypeError, ValueError):
+                return None, "paper_ids must be a list of integers"
+
+        user_id = current_user.get('user_id')
+        with session_scope(read_only=True, read_key=user_id) as db:
+            error = AssignmentService._check_access(db, conference_id, current_user)
+            if error:
+                return None, error
+            AssignmentService._synced_affinity(db, conference_id)
+
+        with session_scope() as db:
+            error = AssignmentService._check_access(db, conference_id, current_user, lock=not dry_run)
+            if error:
+                return None, error
+
+            result = AssignmentService._repair(db, conference_id, per_paper, quota, candidate_count, paper_ids)
+            result.stats['covers_all_open'] = paper_ids is None
+            if result.pairs and not dry_run:
+                _insert_pairs(db, conference_id, result.pairs)
+                AuditLogAI.enqueue(
+                    db_session=db,
+                    user_id=user_id,
+                    action_type='assignments_repaired',
+                    table_name='assignments',
+                    record_id=conference_id,
+                    data=json.dumps(result.stats)
+                )
+                stick_to_primary(user_id, session=db)
+
+        return _response(result, dry_run), None
+
+    @staticmethod
+    def decline_assignment(conference_id: int, assignment_id: int, current_user: dict, repair: bool = True):
+        """
+        The assigned reviewer (or the chair / an admin) declines an assignment
+
+        With `repair` the paper gets a replacement reviewer in the same
+        transaction - the best one with room left, nobody else moves; a
+        reviewer who declined is never proposed for that paper again.
+
+        Returns: ({'assignment_id', 'paper_id', 'status', 'repair'}, None) or (None, error_message);
+        `repair` is None when no repair was asked for or the paper is no longer under review
+        """
+        settings, _ = _validated(None, None)
+        per_paper, quota, candidate_count = settings
+
+        user_id = current_user.get('user_id')
+        if repair:
+            with session_scope(read_only=True, read_key=user_id) as db:
+                _, error = AssignmentService._check_decline(db, conference_id, assignment_id, current_user)
+                if error:
+                    return None, error
+                AssignmentService._synced_affinity(db, conference_id)
+
+        with session_scope() as db:
+            assignment, error = AssignmentService._check_decline(
+                db, conference_id, assignment_id, current_user, lock=True
+            )
+            if error:
+                return None, error
+
+            # The replacement restores what the paper had, whatever the default
+            active = db.query(func.count(Assignment.id)).filter(
+                Assignment.conference_id == conference_id,
+                Assignment.paper_id == assignment.paper_id,
+                *_active_assignment()
+            ).scalar()
+            # Through the ORM row, not a bulk UPDATE: Assignment listeners
+            # (score summaries) must see the status change
+            declined = db.get(Assignment, assignment_id)
+            declined.status = DECLINED
+            declined.updated_at = datetime.utcnow()
+            db.flush()
+            AuditLogAI.enqueue(
+                db_session=db,
+                user_id=user_id,
+                action_type='assignment_declined',
+                table_name='assignments',
+                record_id=assignment_id,
+                data=json.dumps({'paper_id': assignment.paper_id, 'reviewer_id': assignment.reviewer_id})
+            )
+
+            result = None
+            if repair:
+                result = AssignmentService._repair(
+                    db, conference_id, per_paper, quota, candidate_count,
+                    paper_ids={assignment.paper_id}, demand={assignment.paper_id: active}
+                )
+                if result.pairs:
+                    _insert_pairs(db, conference_id, result.pairs)
+            stick_to_primary(user_id, session=db)
+
+        # Committed: the declined reviewer loses the PDF now, not when the
+        # cached download decision expires (repairs only add reviewers, and
+        # only allowed decisions are cached)
+        PaperFileService.forget_access(user_id=assignment.reviewer_id, paper_id=assignment.paper_id)
+
+        return {
+            'assignment_id': assignment_id,
+            'paper_id': assignment.paper_id,
+            'status': DECLINED,
+            'repair': _response(result, dry_run=False, list_pairs=True) if result is not None else None,
+        }, None
+
+    @staticmethod
+    def suggest_reviewers(conference_id: int, paper_id: int, current_user: dict, k: int = 10):
+        """
+        Best-matching reviewers of the pool for one paper (conflicted ones left out)
+
+        Returns: ({'paper_id', 'reviewers': [{'reviewer_id', 'full_name', 'affinity'}]}, None)
+                 or (None, error_message)
+        """
+        k = max(1, min(int(k or 10), MAX_SUGGESTIONS))
+        user_id = current_user.get('user_id')
+        with session_scope(read_only=True, read_key=user_id) as db:
+            error = AssignmentService._check_access(db, conference_id, current_user)
+            if error:
+                return None, error
+            in_conference = db.query(Paper.id).filter(
+                Paper.id == paper_id,
+                Paper.conference_id == conference_id
+            ).first()
+            if in_conference is None:
+                return None, PAPER_NOT_FOUND
+
+            affinity = AssignmentService._synced_affinity(db, conference_id)
+            excluded = [reviewer_id for _, reviewer_id in _conflicts(db, [paper_id])]
+            ranked = affinity.top_reviewers(paper_id, k, exclude=excluded)
+            names = dict(
+                db.query(User.id, User.full_name).filter(User.id.in_([reviewer_id for reviewer_id, _ in ranked]))
+            ) if ranked else {}
+
+        return {
+            'paper_id': paper_id,
+            'reviewers': [
+                {'reviewer_id': reviewer_id, 'full_name': names.get(reviewer_id), 'affinity': round(score, 4)}
+                for reviewer_id, score in ranked
+            ],
+        }, None
+
+    @staticmethod
+    def suggest_papers(conference_id: int, reviewer_id: int, current_user: dict, k: int = 10):
+        """
+        Best-matching papers of the conference for one reviewer of its pool
+
+        Returns: ({'reviewer_id', 'papers': [{'paper_id', 'title', 'affinity'}]}, None)
+                 or (None, error_message)
+        """
+        k = max(1, min(int(k or 10), MAX_SUGGESTIONS))
+        user_id = current_user.get('user_id')
+        with session_scope(read_only=True, read_key=user_id) as db:
+            error = AssignmentService._check_access(db, conference_id, current_user)
+            if error:
+                return None, error
+
+            affinity = AssignmentService._synced_affinity(db, conference_id)
+            if reviewer_id not in affinity.reviewer_rows:
+                return None, REVIEWER_NOT_IN_POOL
+            # Conflicts are few per reviewer: over-fetch and drop them
+            ranked = affinity.top_papers(reviewer_id, k + 50)
+            conflicted = {
+                paper_id for paper_id, other in _conflicts(db, [paper_id for paper_id, _ in ranked])
+                if other == reviewer_id
+            }
+            ranked = [(paper_id, score) for paper_id, score in ranked if paper_id not in conflicted][:k]
+            titles = dict(
+                db.query(Paper.id, Paper.title).filter(Paper.id.in_([paper_id for paper_id, _ in ranked]))
+            ) if ranked else {}
+
+        return {
+            'reviewer_id': reviewer_id,
+            'papers': [
+                {'paper_id': paper_id, 'title': titles.get(paper_id), 'affinity': round(score, 4)}
+                for paper_id, score in ranked
+            ],
+        }, None
+
+    # ---------- Loading ----------
+
+    @staticmethod
+    def _check_access(db, conference_id: int, current_user: dict, lock: bool = False):
+        """None when the user may assign reviewers in the conference, else the error"""
+        query = db.query(Conference.chair_id).filter(
+            Conference.id == conference_id,
+            Conference.is_deleted == False
+        )
+        if lock:
+            query = query.with_for_update()
+        conference = query.first()
+        if conference is None:
+            return CONFERENCE_NOT_FOUND
+        if 'Admin' not in get_role_names(current_user) and conference.chair_id != current_user.get('user_id'):
+            return ACCESS_DENIED
+        return None
+
+    @staticmethod
+    def _check_decline(db, conference_id: int, assignment_id: int, current_user: dict, lock: bool = False):
+        """(assignment row, None) when the user may decline it, else (None, error)"""
+        query = db.query(Conference.chair_id).filter(
+            Conference.id == conference_id,
+            Conference.is_deleted == False
+        )
+        if lock:
+            query = query.with_for_update()  # the repair inserts, like auto_assign
+        conference = query.first()
+        if conference is None:
+            return None, CONFERENCE_NOT_FOUND
+        assignment = db.query(Assignment.paper_id, Assignment.reviewer_id, Assignment.status).filter(
+            Assignment.id == assignment_id,
+            Assignment.conference_id == conference_id,
+            or_(Assignment.is_deleted.is_(False), Assignment.is_deleted.is_(None))
+        ).first()
+        if assignment is None:
+            return None, ASSIGNMENT_NOT_FOUND
+        user_id = current_user.get('user_id')
+        if (assignment.reviewer_id != user_id and conference.chair_id != user_id
+                and 'Admin' not in get_role_names(current_user)):
+            return None, DECLINE_DENIED
+        if assignment.status in INACTIVE_ASSIGNMENT_STATUSES:
+            return None, ASSIGNMENT_INACTIVE
+        return assignment, None
+
+    @staticmethod
+    def _repair(db, conference_id: int, per_paper: int, default_quota: int, candidate_count: int,
+                paper_ids=None, demand: dict = None):
+        """
+        Solve the open slots only: papers short of reviewers (or exactly
+        `paper_ids` with their `demand`), their current reviewers fixed
+        """
+        problem, bids = AssignmentService._load_problem(
+            db, conference_id, per_paper, default_quota, open_only=demand is None, paper_ids=paper_ids
+        )
+        problem.demand = demand
+        problem.candidates = AssignmentService._candidates(db, conference_id, problem, bids, candidate_count)
+        return solve_assignment(problem)
+
+    @staticmethod
+    def _synced_affinity(db, conference_id: int):
+        quotas, _ = reviewer_pool(db, conference_id)
+        affinity = get_conference_affinity(conference_id)
+        affinity.sync(db, quotas)
+        return affinity
+
+    @staticmethod
+    def _load_problem(db, conference_id: int, per_paper: int, default_quota: int, track_id: int = None,
+                      open_only: bool = False, paper_ids=None):
+        """
+        (AssignmentProblem without candidates, {paper_id: {reviewer_id}} mentor requests)
+
+        open_only: only papers with fewer than `per_paper` active assignments
+        (a repair); paper_ids: only these papers
+        """
+        if open_only:
+            papers = db.query(Paper.id).outerjoin(
+                Assignment, and_(Assignment.paper_id == Paper.id, *_active_assignment())
+            ).group_by(Paper.id).having(func.count(Assignment.id) < per_paper)
+        else:
+            papers = db.query(Paper.id)
+        papers = papers.filter(
+            Paper.conference_id == conference_id,
+            Paper.status.in_(ASSIGNABLE_STATUSES),
+            Paper.is_withdrawn.isnot(True)
+        )
+        if track_id is not None:
+            papers = papers.filter(Paper.track_id == track_id)
+        selected = [paper.id for paper in papers.order_by(Paper.id)]
+        if paper_ids is not None:
+            wanted = set(paper_ids)
+            selected = [paper_id for paper_id in selected if paper_id in wanted]
+
+        # Reviewer pool + quotas
+        quotas, bids = reviewer_pool(db, conference_id)
+        quotas = {reviewer_id: (value if value is not None else default_quota)
+                  for reviewer_id, value in quotas.items()}
+
+        # Active assignments: the problem's papers keep theirs (fixed), every
+        # one counts against its reviewer's quota
+        loads = dict(db.query(Assignment.reviewer_id, func.count(Assignment.id)).filter(
+            Assignment.conference_id == conference_id,
+            *_active_assignment()
+        ).group_by(Assignment.reviewer_id).all())
+        fixed = {}
+        for chunk in _chunks(selected):
+            for row in db.query(Assignment.paper_id, Assignment.reviewer_id).filter(
+                Assignment.conference_id == conference_id,
+                Assignment.paper_id.in_(chunk),
+                *_active_assignment()
+            ):
+                fixed.setdefault(row.paper_id, set()).add(row.reviewer_id)
+
+        return AssignmentProblem(
+            paper_ids=selected,
+            reviewer_ids=sorted(quotas),
+            candidates={},
+            quotas=residual_quotas(quotas, loads, fixed),
+            reviewers_per_paper=per_paper,
+            conflicts=_conflicts(db, selected),
+            fixed=fixed
+        ), bids
+
+    @staticmethod
+    def _candidates(db, conference_id: int, problem: AssignmentProblem, bids: dict, limit: int) -> dict:
+        """paper_id -> its `limit` best [(reviewer_id, affinity)], mentor requests boosted"""
+        affinity = get_conference_affinity(conference_id)
+        affinity.sync(db, problem.reviewer_ids)  # only what changed since the unlocked sync
+        candidates = affinity.candidates(problem.paper_ids, limit, exclude=problem.conflicts)
+        for paper_id, requested in bids.items():
+            ranked = candidates.get(paper_id)
+            if ranked is None:
+                continue
+            scores = dict(ranked)
+            for reviewer_id in requested:
+                if reviewer_id in problem.quotas and (paper_id, reviewer_id) not in problem.conflicts:
+                    scores[reviewer_id] = scores.get(reviewer_id, affinity.affinity(paper_id, reviewer_id)) + BID_BONUS
+            candidates[paper_id] = sorted(scores.items(), key=lambda item: -item[1])[:limit]
+        return candidates
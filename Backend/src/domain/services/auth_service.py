@@ -4,11 +4,32 @@
 """
 Authentication Service - UPDATED for Multi-Role Support
 """
-from infrastructure.databases.base import SessionLocal
+from sqlalchemy.exc import IntegrityError
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.databases.routing import stick_to_primary
 from infrastructure.models import User, Role, UserRole, AuditLogAI
-from domain.utils.auth_utils import hash_password, verify_password, generate_token
+from infrastructure.services.hashing_service import get_password_hasher, HashingBusyError
+from infrastructure.services.rate_limiter import get_login_throttle, LoginThrottledError
+from infrastructure.cache.profile_cache import get_profile_cache, invalidate_user_profile
+from config import get_config
+from domain.utils.auth_utils import generate_token
 import json
 
+USERNAME_TAKEN = "Username already exists"
+EMAIL_TAKEN = "Email already exists"
+
+
+def _taken(db, username: str, email: str):
+    """USERNAME_TAKEN / EMAIL_TAKEN when an account already uses them, else None"""
+    existing_user = db.query(User).filter(
+        (User.username == username) | (User.email == email)
+    ).first()
+    if existing_user is None:
+        return None
+    return USERNAME_TAKEN if existing_user.username == username else EMAIL_TAKEN
+
+
 class AuthService:
     
     @staticmethod
@@ -23,174 +44,195 @@ class AuthService:
             full_name: str
             roles: list of str - ['Author', 'Reviewer'] (default: ['Author'])
         
-        Returns: (user_dict, token) or (None, error_message)
+        Returns: (user_dict, token) or (None, error_message); USERNAME_TAKEN /
+        EMAIL_TAKEN also when a concurrent registration wins the unique index.
+        Every row is flushed before the token is issued.
         """
-        db = SessionLocal()
-        
-        try:
-            # Check existing user
-            existing_user = db.query(User).filter(
-                (User.username == username) | (User.email == email)
-            ).first()
-            
-            if existing_user:
-                if existing_user.username == username:
-                    return None, "Username already exists"
-                return None, "Email already exists"
-            
-            # Default role
-            if roles is None:
-                roles = ['Author']
-            
-            # Validate roles
-            valid_role_names = ['Author', 'Reviewer', 'Chair', 'Admin']
-            for role_name in roles:
-                if role_name not in valid_role_names:
-                    return None, f"Invalid role: {role_name}"
-            
-            # Create user
-            hashed_pw = hash_password(password)
-            new_user = User(
-                username=username,
-                password_hash=hashed_pw,
-                email=email,
-                full_name=full_name
-            )
-            
-            db.add(new_user)
-            db.flush()  # Get user.id before commit
-            
-            # ✅ Assign roles to user
-            for role_name in roles:
-                role = db.query(Role).filter(Role.name == role_name).first()
-                if not role:
-                    # Create role if not exists (shouldn't happen if DB seeded properly)
-                    role = Role(name=role_name, description=f"{role_name} role")
-                    db.add(role)
-                    db.flush()
+        with session_scope() as db:
+            try:
+                # Check existing user
+                taken = _taken(db, username, email)
+                if taken:
+                    return None, taken
+            
+                # Default role
+                if roles is None:
+                    roles = ['Author']
+            
+                # Validate roles
+                valid_role_names = ['Author', 'Reviewer', 'Chair', 'Admin']
+                for role_name in roles:
+                    if role_name not in valid_role_names:
+                        return None, f"Invalid role: {role_name}"
+            
+                # Create user (bcrypt runs on the hashing pool)
+                hashed_pw = get_password_hasher().hash(password)
+                new_user = User(
+                    username=username,
+                    password_hash=hashed_pw,
+                    email=email,
+                    full_name=full_name,
+                    role=roles[0]
+                )
+            
+                db.add(new_user)
+                db.flush()  # Get user.id
+                stick_to_primary(new_user.id, session=db)
+            
+                # ✅ Assign roles to user
+                for role_name in roles:
+                    role = db.query(Role).filter(Role.name == role_name).first()
+                    if not role:
+                        # Create role if not exists (shouldn't happen if DB seeded properly)
+                        role = Role(name=role_name, description=f"{role_name} role")
+                        db.add(role)
+                        db.flush()
                 
-                # Create UserRole (global role, not conference-specific)
-                user_role = UserRole(
+                    # Create UserRole (global role, not conference-specific)
+                    user_role = UserRole(
+                        role=role,
+                        conference_id=None,  # Global role
+                        is_active=True,
+                        assigned_by=None  # Self-assigned during registration
+                    )
+                    new_user.user_roles.append(user_role)
+            
+                # Audit log
+                AuditLogAI.enqueue(
+                    db_session=db,
                     user_id=new_user.id,
-                    role_id=role.id,
-                    conference_id=None,  # Global role
-                    is_active=True,
-                    assigned_by=None  # Self-assigned during registration
+                    action_type='user_registered',
+                    table_name='users',
+                    record_id=new_user.id,
+                    data=json.dumps({"username": username, "roles": roles})
                 )
-                db.add(user_role)
-            
-            db.commit()
-            db.refresh(new_user)
-            
-            # Audit log
-            AuditLogAI.log(
-                db_session=db,
-                user_id=new_user.id,
-                action_type='user_registered',
-                table_name='users',
-                record_id=new_user.id,
-                data=json.dumps({"username": username, "roles": roles})
-            )
-            
-            # ✅ Generate token with roles array
-            token = generate_token(new_user.id, new_user.roles)
-            
-            user_dict = {
-                'id': new_user.id,
-                'username': new_user.username,
-                'email': new_user.email,
-                'full_name': new_user.full_name,
-                'roles': new_user.roles  # ✅ Array of roles
-            }
-            
-            return user_dict, token
-            
-        except Exception as e:
-            db.rollback()
-            return None, f"Registration failed: {str(e)}"
-        finally:
-            db.close()
+                # Any unique-key clash surfaces here, not at the commit after the token is out
+                db.flush()
+            
+                # ✅ Generate token with roles array
+                token = generate_token(new_user.id, new_user.roles)
+            
+                user_dict = {
+                    'id': new_user.id,
+                    'username': new_user.username,
+                    'email': new_user.email,
+                    'full_name': new_user.full_name,
+                    'roles': new_user.roles  # ✅ Array of roles
+                }
+            
+                return user_dict, token
+            
+            except HashingBusyError:
+                db.rollback()
+                raise
+            except IntegrityError:
+                # Another registration took the username / email since the check
+                db.rollback()
+                return None, _taken(db, username, email) or USERNAME_TAKEN
+            except Exception as e:
+                db.rollback()
+                return None, f"Registration failed: {str(e)}"
     
     
     @staticmethod
-    def login_user(username: str, password: str):
+    def login_user(username: str, password: str, client_ip: str = None):
         """
         Login user and return token with all roles
+        
+        Raises LoginThrottledError (before any DB / bcrypt work) when the
+        username or client IP is over its attempt limit. Only failed
+        attempts count: a successful login gives its token back.
         """
-        db = SessionLocal()
+        throttled = get_config().LOGIN_THROTTLE_ENABLED
+        if throttled:
+            get_login_throttle().check(username, client_ip)
         
-        try:
-            user = db.query(User).filter(User.username == username).first()
-            
-            if not user:
-                return None, "Invalid credentials"
-            
-            if not verify_password(password, user.password_hash):
-                return None, "Invalid credentials"
-            
-            if user.is_deleted:
-                return None, "Account has been deleted"
-            
-            # ✅ Generate token with roles array
-            token = generate_token(user.id, user.roles)
-            
-            # Audit log
-            AuditLogAI.log(
-                db_session=db,
-                user_id=user.id,
-                action_type='user_login',
-                table_name='users',
-                record_id=user.id,
-                data=json.dumps({"username": username, "roles": user.roles})
-            )
-            
-            user_dict = {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'full_name': user.full_name,
-                'roles': user.roles  # ✅ Array of roles
-            }
-            
-            return user_dict, token
-            
-        except Exception as e:
-            return None, f"Login failed: {str(e)}"
-        finally:
-            db.close()
+        with session_scope() as db:
+            try:
+                user = db.query(User).filter(User.username == username).first()
+            
+                if not user:
+                    return None, "Invalid credentials"
+            
+                hasher = get_password_hasher()
+                if not hasher.verify(password, user.password_hash):
+                    return None, "Invalid credentials"
+            
+                if user.is_deleted:
+                    return None, "Account has been deleted"
+            
+                # Transparent upgrade when BCRYPT_ROUNDS changed since the hash was stored
+                if hasher.needs_rehash(user.password_hash):
+                    user.password_hash = hasher.rehash(password)
+                    db.flush()
+            
+                # ✅ Generate token with roles array
+                token = generate_token(user.id, user.roles)
+            
+                # Audit log
+                AuditLogAI.enqueue(
+                    db_session=db,
+                    user_id=user.id,
+                    action_type='user_login',
+                    table_name='users',
+                    record_id=user.id,
+                    data=json.dumps({"username": username, "roles": user.roles})
+                )
+            
+                user_dict = {
+                    'id': user.id,
+                    'username': user.username,
+                    'email': user.email,
+                    'full_name': user.full_name,
+                    'roles': user.roles  # ✅ Array of roles
+                }
+            
+                if throttled:
+                    get_login_throttle().succeeded(username, client_ip)
+            
+                return user_dict, token
+            
+            except HashingBusyError:
+                raise
+            except Exception as e:
+                db.rollback()
+                return None, f"Login failed: {str(e)}"
     
     
     @staticmethod
     def get_user_by_id(user_id: int):
         """
-        Get user info by ID
+        Get user info by ID (read-through profile cache)
         """
-        db = SessionLocal()
+        profile_cache = get_profile_cache()
+        cached = profile_cache.get(user_id)
+        if cached is not None:
+            return dict(cached), None
         
-        try:
-            user = db.query(User).filter(
-                User.id == user_id, 
-                User.is_deleted == False
-            ).first()
-            
-            if not user:
-                return None, "User not found"
-            
-            user_dict = {
-                'id': user.id,
-                'username': user.username,
-                'email': user.email,
-                'full_name': user.full_name,
-                'roles': user.roles,  # ✅ Array of roles
-                'created_at': user.created_at.isoformat()
-            }
-            
-            return user_dict, None
-            
-        except Exception as e:
-            return None, str(e)
-        finally:
-            db.close()
+        with session_scope(read_only=True, read_key=user_id) as db:
+            try:
+                user = db.query(User).filter(
+                    User.id == user_id, 
+                    User.is_deleted == False
+                ).first()
+            
+                if not user:
+                    return None, "User not found"
+            
+                user_dict = {
+                    'id': user.id,
+                    'username': user.username,
+                    'email': user.email,
+                    'full_name': user.full_name,
+                    'roles': list(user.roles),  # ✅ Array of roles
+                    'created_at': user.created_at.isoformat()
+                }
+                profile_cache.set(user_id, user_dict)
+            
+                return dict(user_dict), None
+            
+            except Exception as e:
+                return None, str(e)
     
     
     # ✅ NEW: Assign role to user
@@ -207,68 +249,69 @@ class AuthService:
         
         Returns: (success: bool, message: str)
         """
-        db = SessionLocal()
-        
-        try:
-            # Check user exists
-            user = db.query(User).filter(User.id == user_id).first()
-            if not user:
-                return False, "User not found"
-            
-            # Check role exists
-            role = db.query(Role).filter(Role.name == role_name).first()
-            if not role:
-                return False, f"Role '{role_name}' not found"
-            
-            # Check if already has this role
-            existing = db.query(UserRole).filter(
-                UserRole.user_id == user_id,
-                UserRole.role_id == role.id,
-                UserRole.conference_id == conference_id
-            ).first()
-            
-            if existing:
-                if existing.is_active:
-                    return False, f"User already has role '{role_name}'"
-                else:
-                    # Reactivate
-                    existing.is_active = True
-                    existing.assigned_by = assigned_by
-                    db.commit()
-                    return True, f"Role '{role_name}' reactivated"
-            
-            # Create new UserRole
-            user_role = UserRole(
-                user_id=user_id,
-                role_id=role.id,
-                conference_id=conference_id,
-                is_active=True,
-                assigned_by=assigned_by
-            )
-            db.add(user_role)
-            db.commit()
-            
-            # Audit log
-            AuditLogAI.log(
-                db_session=db,
-                user_id=assigned_by or user_id,
-                action_type='role_assigned',
-                table_name='user_roles',
-                record_id=user_id,
-                data=json.dumps({
-                    "user_id": user_id,
-                    "role": role_name,
-                    "conference_id": conference_id
-                })
-            )
-            
-            return True, f"Role '{role_name}' assigned successfully"
-            
-        except Exception as e:
-            db.rollback()
-            return False, f"Failed to assign role: {str(e)}"
-        finally:
-            db.close()
+        with session_scope() as db:
+            try:
+                # Check user exists
+                user = db.query(User).filter(User.id == user_id).first()
+                if not user:
+                    return False, "User not found"
+            
+                # Check role exists
+                role = db.query(Role).filter(Role.name == role_name).first()
+                if not role:
+                    return False, f"Role '{role_name}' not found"
+            
+                # Check if already has this role
+                existing = db.query(UserRole).filter(
+                    UserRole.user_id == user_id,
+                    UserRole.role_id == role.id,
+                    UserRole.conference_id == conference_id
+                ).first()
+            
+                if existing:
+                    if existing.is_active:
+                        return False, f"User already has role '{role_name}'"
+                    else:
+                        # Reactivate
+                        existing.is_active = True
+                        existing.assigned_by = assigned_by
+                        db.flush()
+                        invalidate_user_profile(user_id, session=db)
+                        stick_to_primary(user_id, session=db)
+                        return True, f"Role '{role_name}' reactivated"
+            
+                # Create new UserRole
+                user_role = UserRole(
+                    user_id=user_id,
+                    role_id=role.id,
+                    conference_id=conference_id,
+                    is_active=True,
+                    assigned_by=assigned_by
+                )
+                db.add(user_role)
+                db.flush()
+                invalidate_user_profile(user_id, session=db)
+                stick_to_primary(user_id, session=db)
+            
+                # Audit log
+                AuditLogAI.enqueue(
+                    db_session=db,
+                    user_id=assigned_by or user_id,
+                    action_type='role_assigned',
+                    table_name='user_roles',
+                    record_id=user_id,
+                    data=json.dumps({
+                        "user_id": user_id,
+                        "role": role_name,
+                        "conference_id": conference_id
+                    })
+                )
+            
+                return True, f"Role '{role_name}' assigned successfully"
+            
+            except Exception as e:
+                db.rollback()
+                return False, f"Failed to assign role: {str(e)}"
     
     
     # ✅ NEW: Revoke role from user
@@ -277,30 +320,87 @@ class AuthService:
         """
         Revoke a role from user (Admin only)
         """
-        db = SessionLocal()
+        with session_scope() as db:
+            try:
+                role = db.query(Role).filter(Role.name == role_name).first()
+                if not role:
+                    return False, f"Role '{role_name}' not found"
+            
+                user_role = db.query(UserRole).filter(
+                    UserRole.user_id == user_id,
+                    UserRole.role_id == role.id,
+                    UserRole.conference_id == conference_id
+                ).first()
+            
+                if not user_role:
+                    return False, "User does not have this role"
+            
+                # Soft delete
+                user_role.is_active = False
+                db.flush()
+                invalidate_user_profile(user_id, session=db)
+                stick_to_primary(user_id, session=db)
+            
+                return True, f"Role '{role_name}' revoked successfully"
+            
+            except Exception as e:
+                db.rollback()
+                return False, f"Failed to revoke role: {str(e)}"
+    
+    
+    @staticmethod
+    def update_profile(user_id: int, full_name: str = None, email: str = None):
+        """
+        Update editable profile fields
         
-        try:
-            role = db.query(Role).filter(Role.name == role_name).first()
-            if not role:
-                return False, f"Role '{role_name}' not found"
-            
-            user_role = db.query(UserRole).filter(
-                UserRole.user_id == user_id,
-                UserRole.role_id == role.id,
-                UserRole.conference_id == conference_id
-            ).first()
-            
-            if not user_role:
-                return False, "User does not have this role"
-            
-            # Soft delete
-            user_role.is_active = False
-            db.commit()
-            
-            return True, f"Role '{role_name}' revoked successfully"
-            
-        except Exception as e:
-            db.rollback()
-            return False, f"Failed to revoke role: {str(e)}"
-        finally:
-            db.close()
\ No newline at end of file
+        Returns: (user_dict, None) or (None, error_message)
+        """
+        with session_scope() as db:
+            try:
+                user = db.query(User).filter(
+                    User.id == user_id,
+                    User.is_deleted == False
+                ).first()
+                if not user:
+                    return None, "User not found"
+            
+                if email and email != user.email:
+                    taken = db.query(User.id).filter(
+                        User.email == email,
+                        User.id != user_id
+                    ).first()
+                    if taken:
+                        return None, "Email already exists"
+                    user.email = email
+            
+                if full_name:
+                    user.full_name = full_name
+            
+                db.flush()
+                invalidate_user_profile(user_id, session=db)
+                stick_to_primary(user_id, session=db)
+            
+                # Audit log
+                AuditLogAI.enqueue(
+                    db_session=db,
+                    user_id=user_id,
+                    action_type='profile_updated',
+                    table_name='users',
+                    record_id=user_id,
+                    data=json.dumps({"full_name": full_name, "email": email})
+                )
+            
+                user_dict = {
+                    'id': user.id,
+                    'username': user.username,
+                    'email': user.email,
+                    'full_name': user.full_name,
+                    'roles': list(user.roles),
+                    'created_at': user.created_at.isoformat()
+                }
+            
+                return user_dict, None
+            
+            except Exception as e:
+                db.rollback()
+                return None, f"Failed to update profile: {str(e)}"
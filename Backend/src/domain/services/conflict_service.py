@@ -0,0 +1,301 @@
+# ============================================
+# File: Backend/src/domain/services/conflict_service.py
+# ============================================
+"""
+Conflict Service - conflicts of interest generated from the co-authorship graph
+
+A reviewer of the conference's pool (assignment_service.reviewer_pool) is
+conflicted with a paper when they wrote it, when one of its authors is
+within COI_HOPS co-authorship steps (joint papers of the last
+COI_WINDOW_YEARS) or, with COI_AFFILIATION, when they and an author used the
+same affiliation in that window (infrastructure.similarity.coauthor_graph).
+
+generate_conflicts() walks every author's neighbourhood once and writes the
+pairs not recorded yet with one bulk INSERT of ConflictOfInterest rows; their
+reason starts with AUTO_REASON_PREFIX. Manual rows are never touched.
+
+Once a conference has generated rows, new authorships keep it up to date:
+after a commit inserting papers / authors the graph catches up on its
+tracking thread and only the papers and reviewers near the users that
+changed are checked again (register_conflict_tracking). That refresh uses
+the configured hops / window / affiliation settings.
+"""
+
+import json
+import time
+from datetime import datetime
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.databases.upsert import insert_ignore
+from infrastructure.databases.routing import stick_to_primary
+from infrastructure.models import Paper, Conference, ConflictOfInterest, User, AuditLogAI
+from infrastructure.similarity.coauthor_graph import (
+    REASON_AUTHOR, REASON_COAUTHOR, REASON_AFFILIATION,
+    add_coauthor_listener, register_coauthor_tracking, synced_coauthor_graph, window_start
+)
+from domain.services.assignment_service import reviewer_pool
+from domain.utils.auth_utils import get_role_names
+
+
+CONFERENCE_NOT_FOUND = "Conference not found"
+PAPER_NOT_FOUND = "Paper not found in this conference"
+ACCESS_DENIED = "Only the conference chair or an admin can manage conflicts of interest"
+
+AUTO_REASON_PREFIX = 'auto: '
+MAX_HOPS = 3
+MAX_WINDOW_YEARS = 50
+ID_CHUNK_SIZE = 900
+
+
+def _settings(hops=None, window_years=None, affiliation=None):
+    """(hops, window_years, affiliation) with the configured defaults; raises ValueError"""
+    from config import get_config
+    current_config = get_config()
+    hops = int(current_config.COI_HOPS if hops is None else hops)
+    window_years = float(current_config.COI_WINDOW_YEARS if window_years is None else window_years)
+    if affiliation is None:
+        affiliation = current_config.COI_AFFILIATION
+    if not 0 <= hops <= MAX_HOPS:
+        raise ValueError(f"hops must be between 0 and {MAX_HOPS}")
+    if not 0 <= window_years <= MAX_WINDOW_YEARS:
+        raise ValueError(f"window_years must be between 0 and {MAX_WINDOW_YEARS}")
+    return hops, window_years, bool(affiliation)
+
+
+def _conference_papers(db, conference_id: int) -> list:
+    return [row.id for row in db.query(Paper.id).filter(
+        Paper.conference_id == conference_id,
+        Paper.is_withdrawn.isnot(True)
+    ).order_by(Paper.id)]
+
+
+def _recorded(db, conference_id: int) -> set:
+    """{(paper_id, reviewer_id)} with a ConflictOfInterest row, manual or generated"""
+    return {
+        (row.paper_id, row.reviewer_id) for row in db.query(
+            ConflictOfInterest.paper_id, ConflictOfInterest.reviewer_id
+        ).join(
+            Paper, Paper.id == ConflictOfInterest.paper_id
+        ).filter(Paper.conference_id == conference_id)
+    }
+
+
+def _reason(conflict, reviewer_id: int, names: dict, graph) -> str:
+    kind, author_id, detail = conflict
+    name = names.get(author_id) or f"user {author_id}"
+    if kind == REASON_AUTHOR:
+        return f"{AUTO_REASON_PREFIX}author of the paper"
+    if kind == REASON_AFFILIATION:
+        return f"{AUTO_REASON_PREFIX}same affiliation as {name} ({detail})"
+    if detail == 1:
+        joint = graph.joint_paper_day(reviewer_id, author_id)
+        return f"{AUTO_REASON_PREFIX}co-author of {name} (latest joint paper {joint})"
+    return f"{AUTO_REASON_PREFIX}{detail} co-authorship steps from {name}"
+
+
+def _insert_conflicts(db, conference_id: int, pending: dict, graph):
+    """
+    One bulk INSERT of generated rows for {(paper_id, reviewer_id): conflict};
+    a pair another writer recorded since _recorded() is skipped by the unique index
+    """
+    author_ids = list({conflict[1] for conflict in pending.values()})
+    names = {}
+    for start in range(0, len(author_ids), ID_CHUNK_SIZE):
+        names.update(db.query(User.id, User.full_name).filter(User.id.in_(author_ids[start:start + ID_CHUNK_SIZE])))
+    now = datetime.utcnow()
+    db.execute(insert_ignore(ConflictOfInterest, ['paper_id', 'reviewer_id']), [
+        {
+            'conference_id': conference_id,
+            'paper_id': paper_id,
+            'reviewer_id': reviewer_id,
+            'reason': _reason(conflict, reviewer_id, names, graph),
+            'created_at': now,
+        }
+        for (paper_id, reviewer_id), conflict in sorted(pending.items())
+    ])
+
+
+def _by_reason(conflicts) -> dict:
+    counts = {REASON_AUTHOR: 0, REASON_COAUTHOR: 0, REASON_AFFILIATION: 0}
+    for kind, _, _ in conflicts:
+        counts[kind] += 1
+    return counts
+
+
+class ConflictService:
+
+    @staticmethod
+    def generate_conflicts(conference_id: int, current_user: dict, hops: int = None, window_years: float = None,
+                           affiliation: bool = None, dry_run: bool = False):
+        """
+        Record every graph conflict between the conference's papers and its reviewer pool
+
+        Returns: ({'stats', 'conflicts'?}, None) or (None, error_message);
+        `conflicts` (paper_id, reviewer_id, reason, author_id, detail) is only
+        listed for dry runs
+        """
+        try:
+            hops, window_years, affiliation = _settings(hops, window_years, affiliation)
+        except (TypeError, ValueError) as e:
+            return None, str(e) if isinstance(e, ValueError) else "hops and window_years must be numbers"
+
+        started = time.perf_counter()
+        user_id = current_user.get('user_id')
+        with session_scope() as db:
+            error = ConflictService._check_access(db, conference_id, current_user)
+            if error:
+                return None, error
+
+            graph = synced_coauthor_graph(db)
+            paper_ids = _conference_papers(db, conference_id)
+            pool, _ = reviewer_pool(db, conference_id)
+            found = graph.conflicts_among(paper_ids, pool, hops, window_start(window_years), affiliation)
+            recorded = _recorded(db, conference_id)
+            pending = {pair: conflict for pair, conflict in found.items() if pair not in recorded}
+
+            stats = {
+                'papers': len(paper_ids),
+                'reviewers': len(pool),
+                'found': len(found),
+                'already_recorded': len(found) - len(pending),
+                'created': 0 if dry_run else len(pending),
+                'by_reason': _by_reason(pending.values()),
+                'hops': hops,
+                'window_years': window_years,
+                'affiliation': affiliation,
+                'dry_run': dry_run,
+            }
+            if pending and not dry_run:
+                _insert_conflicts(db, conference_id, pending, graph)
+                AuditLogAI.enqueue(
+                    db_session=db,
+                    user_id=user_id,
+                    action_type='conflicts_auto_created',
+                    table_name='conflict_of_interest',
+                    record_id=conference_id,
+                    data=json.dumps(stats)
+                )
+                stick_to_primary(user_id, session=db)
+        stats['seconds'] = round(time.perf_counter() - started, 3)
+
+        response = {'stats': stats}
+        if dry_run:
+            response['conflicts'] = [
+                {'paper_id': paper_id, 'reviewer_id': reviewer_id, 'reason': kind, 'author_id': author_id,
+                 'detail': detail}
+                for (paper_id, reviewer_id), (kind, author_id, detail) in sorted(pending.items())
+            ]
+        return response, None
+
+    @staticmethod
+    def check_conflict(conference_id: int, paper_id: int, reviewer_id: int, current_user: dict,
+                       hops: int = None, window_years: float = None, affiliation: bool = None):
+        """
+        Whether one reviewer is conflicted with one paper (graph lookup + recorded rows)
+
+        Returns: ({'paper_id', 'reviewer_id', 'conflicted', 'recorded', 'reason',
+                   'author_id', 'detail'}, None) or (None, error_message)
+        """
+        try:
+            hops, window_years, affiliation = _settings(hops, window_years, affiliation)
+        except (TypeError, ValueError) as e:
+            return None, str(e) if isinstance(e, ValueError) else "hops and window_years must be numbers"
+
+        user_id = current_user.get('user_id')
+        with session_scope(read_only=True, read_key=user_id) as db:
+            error = ConflictService._check_access(db, conference_id, current_user)
+            if error:
+                return None, error
+            in_conference = db.query(Paper.id).filter(
+                Paper.id == paper_id,
+                Paper.conference_id == conference_id
+            ).first()
+            if in_conference is None:
+                return None, PAPER_NOT_FOUND
+
+            recorded = db.query(ConflictOfInterest.reason).filter(
+                ConflictOfInterest.paper_id == paper_id,
+                ConflictOfInterest.reviewer_id == reviewer_id
+            ).first()
+            graph = synced_coauthor_graph(db)
+            conflict = graph.conflict(reviewer_id, paper_id, hops, window_start(window_years), affiliation)
+
+        kind, author_id, detail = conflict or (None, None, None)
+        return {
+            'paper_id': paper_id,
+            'reviewer_id': reviewer_id,
+            'conflicted': conflict is not None or recorded is not None,
+            'recorded': recorded is not None,
+            'recorded_reason': recorded.reason if recorded is not None else None,
+            'reason': kind,
+            'author_id': author_id,
+            'detail': detail,
+        }, None
+
+    @staticmethod
+    def _check_access(db, conference_id: int, current_user: dict):
+        """None when the user may manage the conference's conflicts, else the error"""
+        conference = db.query(Conference.chair_id).filter(
+            Conference.id == conference_id,
+            Conference.is_deleted == False
+        ).first()
+        if conference is None:
+            return CONFERENCE_NOT_FOUND
+        if 'Admin' not in get_role_names(current_user) and conference.chair_id != current_user.get('user_id'):
+            return ACCESS_DENIED
+        return None
+
+
+# ---------- Following new authors ----------
+
+def refresh_generated_conflicts(graph, touched) -> int:
+    """
+    Add the conflicts new authorships created, in every conference that has
+    generated rows; `touched` None re-checks those conferences in full.
+    Returns the rows inserted.
+    """
+    hops, window_years, affiliation = _settings()
+    since = window_start(window_years)
+    inserted = 0
+    with session_scope() as db:
+        conference_ids = [row.conference_id for row in db.query(ConflictOfInterest.conference_id).filter(
+            ConflictOfInterest.conference_id.isnot(None),
+            ConflictOfInterest.reason.like(f"{AUTO_REASON_PREFIX}%")
+        ).distinct()]
+        affected = graph.affected_by(touched, hops, since) if touched is not None else None
+
+        for conference_id in conference_ids:
+            paper_ids = _conference_papers(db, conference_id)
+            pool, _ = reviewer_pool(db, conference_id)
+            if affected is None:
+                found = graph.conflicts_among(paper_ids, pool, hops, since, affiliation)
+            else:
+                # A changed pair has a changed user within `hops` of each side:
+                # papers with such an author against the whole pool, such
+                # reviewers against every paper
+                near = [paper_id for paper_id in paper_ids
+                        if any(author in affected for author in graph.authors_of(paper_id))]
+                found = graph.conflicts_among(near, pool, hops, since, affiliation)
+                found.update(graph.conflicts_among(
+                    paper_ids, [reviewer_id for reviewer_id in pool if reviewer_id in affected],
+                    hops, since, affiliation
+                ))
+            if not found:
+                continue
+            recorded = _recorded(db, conference_id)
+            pending = {pair: conflict for pair, conflict in found.items() if pair not in recorded}
+            if pending:
+                _insert_conflicts(db, conference_id, pending, graph)
+                inserted += len(pending)
+                print(f"🤝 {len(pending)} new conflicts of interest in conference {conference_id}")
+    return inserted
+
+
+def _on_coauthors_changed(graph, touched):
+    refresh_generated_conflicts(graph, touched)
+
+
+def register_conflict_tracking():
+    """Keep generated conflicts in step with new authorships (idempotent)"""
+    add_coauthor_listener(_on_coauthors_changed)
+    register_coauthor_tracking()
@@ -0,0 +1,165 @@
+# ============================================
+# File: Backend/src/domain/services/duplicate_service.py
+# ============================================
+"""
+Duplicate Service - likely duplicate / dual submissions
+
+Candidates come from the MinHash LSH index (infrastructure.similarity):
+papers whose title + abstract (+ extracted PDF text) share at least
+`threshold` of their word 3-grams, in any conference - a dual submission
+usually sits in another one.
+
+Only admins and the chair of the conference may ask. Matches in other
+conferences are reported with id, title, status and conference only.
+"""
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.models import Paper, PaperStatus, Conference
+from infrastructure.similarity.duplicates import (
+    find_similar_papers,
+    find_conference_duplicates,
+    duplicate_detection_stats,
+)
+from domain.utils.auth_utils import get_role_names
+
+
+PAPER_NOT_FOUND = "Paper not found"
+CONFERENCE_NOT_FOUND = "Conference not found"
+ACCESS_DENIED = "Only the conference chair or an admin can check for duplicates"
+
+DEFAULT_DUPLICATE_LIMIT = 20
+MAX_DUPLICATE_LIMIT = 100
+DEFAULT_PAIR_LIMIT = 100
+MAX_PAIR_LIMIT = 1000
+
+
+def _parse_threshold(threshold):
+    """(threshold or None for the configured one, error)"""
+    if threshold is None:
+        return None, None
+    try:
+        threshold = float(threshold)
+    except (TypeError, ValueError):
+        return None, "threshold must be a number"
+    if not 0.0 < threshold <= 1.0:
+        return None, "threshold must be between 0 and 1"
+    return threshold, None
+
+
+def _can_check(conference_chair_id: int, current_user: dict) -> bool:
+    return 'Admin' in get_role_names(current_user) or conference_chair_id == current_user.get('user_id')
+
+
+def _summaries(db, paper_ids) -> dict:
+    if not paper_ids:
+        return {}
+    rows = db.query(
+        Paper.id, Paper.title, Paper.status, Paper.conference_id, Conference.name.label('conference_name')
+    ).join(
+        Conference, Conference.id == Paper.conference_id
+    ).filter(Paper.id.in_(paper_ids)).all()
+    return {
+        row.id: {
+            'id': row.id,
+            'title': row.title,
+            'status': row.status.value if isinstance(row.status, PaperStatus) else row.status,
+            'conference_id': row.conference_id,
+            'conference_name': row.conference_name,
+        }
+        for row in rows
+    }
+
+
+def _index_status() -> dict:
+    stats = duplicate_detection_stats()
+    return {'papers': stats['papers'], 'complete': stats['complete']}
+
+
+class DuplicateService:
+
+    @staticmethod
+    def find_for_paper(paper_id: int, current_user: dict, threshold=None,
+                       limit: int = DEFAULT_DUPLICATE_LIMIT):
+        """
+        Papers (any conference) that look like near-duplicates of one paper
+
+        Returns: ({'paper_id', 'duplicates', 'index'}, None) or (None, error_message);
+        each duplicate carries its estimated `similarity` (0..1), best first
+        """
+        threshold, error = _parse_threshold(threshold)
+        if error:
+            return None, error
+        limit = max(1, min(int(limit or DEFAULT_DUPLICATE_LIMIT), MAX_DUPLICATE_LIMIT))
+        user_id = current_user.get('user_id')
+
+        with session_scope(read_only=True, read_key=user_id) as db:
+            row = db.query(Conference.chair_id).join(
+                Paper, Paper.conference_id == Conference.id
+            ).filter(Paper.id == paper_id).first()
+            if row is None:
+                return None, PAPER_NOT_FOUND
+            if not _can_check(row.chair_id, current_user):
+                return None, ACCESS_DENIED
+
+            matches = find_similar_papers(paper_id, threshold=threshold, limit=limit)
+            summaries = _summaries(db, [other_id for other_id, _ in matches])
+
+        duplicates = []
+        for other_id, similarity in matches:
+            summary = summaries.get(other_id)
+            if summary is None:
+                continue  # deleted since it was indexed
+            duplicates.append({**summary, 'similarity': round(similarity, 3)})
+
+        return {
+            'paper_id': paper_id,
+            'duplicates': duplicates,
+            'index': _index_status()
+        }, None
+
+    @staticmethod
+    def find_for_conference(conference_id: int, current_user: dict, threshold=None,
+                            limit: int = DEFAULT_PAIR_LIMIT):
+        """
+        Likely duplicate pairs involving a conference's papers
+
+        Returns: ({'conference_id', 'pairs', 'total', 'index'}, None) or
+        (None, error_message); `paper` is in this conference, `duplicate` may
+        be in any conference, most similar pairs first
+        """
+        threshold, error = _parse_threshold(threshold)
+        if error:
+            return None, error
+        limit = max(1, min(int(limit or DEFAULT_PAIR_LIMIT), MAX_PAIR_LIMIT))
+        user_id = current_user.get('user_id')
+
+        with session_scope(read_only=True, read_key=user_id) as db:
+            conference = db.query(Conference.chair_id).filter(
+                Conference.id == conference_id,
+                Conference.is_deleted == False
+            ).first()
+            if conference is None:
+                return None, CONFERENCE_NOT_FOUND
+            if not _can_check(conference.chair_id, current_user):
+                return None, ACCESS_DENIED
+
+            found = find_conference_duplicates(conference_id, threshold=threshold)
+            shown = found[:limit]
+            summaries = _summaries(db, {paper for pair in shown for paper in pair[:2]})
+
+        pairs = []
+        for paper_id, other_id, similarity in shown:
+            if paper_id not in summaries or other_id not in summaries:
+                continue
+            pairs.append({
+                'paper': summaries[paper_id],
+                'duplicate': summaries[other_id],
+                'similarity': round(similarity, 3)
+            })
+
+        return {
+            'conference_id': conference_id,
+            'pairs': pairs,
+            'total': len(found),
+            'index': _index_status()
+        }, None
@@ -0,0 +1,292 @@
+# ============================================
+# File: Backend/src/domain/services/paper_export_service.py
+# ============================================
+"""
+Paper Export Service - every PDF of a conference / track as one ZIP
+
+The archive is streamed while it is built (infrastructure.services.zip_stream):
+the first bytes leave before any PDF is read and memory does not grow with
+the number or size of the papers.
+
+Layout:
+    <conference>/manifest.csv        one row per paper: metadata, archive file
+                                     names, SHA-256 and size of each PDF
+    <conference>/authors.csv         one row per PaperAuthor
+    <conference>/pdf/<id>-<title>.pdf
+    <conference>/camera-ready/<id>-<title>.pdf
+
+Papers are read by id in batches of EXPORT_BATCH_SIZE, each batch in its
+own short transaction, so no DB connection is held while file bytes are
+sent. The set of papers is fixed when the export is prepared (ids up to the
+highest one matching then), so the CSVs and the PDFs describe the same papers.
+
+Only admins and the chair of the conference may export.
+"""
+
+import csv
+import io
+import os
+from dataclasses import dataclass
+
+from sqlalchemy import func
+
+from infrastructure.databases.unit_of_work import session_scope, separate_transaction
+from infrastructure.models import Paper, PaperStatus, PaperAuthor, Conference, Track, User
+from infrastructure.services.file_storage_service import get_file_storage, StorageError
+from infrastructure.services.zip_stream import ZipEntry, stream_zip
+from domain.services.paper_file_service import _slugify
+from domain.utils.auth_utils import get_role_names
+
+
+CONFERENCE_NOT_FOUND = "Conference not found"
+TRACK_NOT_FOUND = "Track not found in this conference"
+ACCESS_DENIED = "Only the conference chair or an admin can export papers"
+
+EXPORT_PDF = 'pdf'
+EXPORT_CAMERA_READY = 'camera_ready'
+EXPORT_ALL = 'all'
+EXPORT_FILES = (EXPORT_PDF, EXPORT_CAMERA_READY, EXPORT_ALL)
+
+EXPORT_BATCH_SIZE = 500
+
+MANIFEST_COLUMNS = (
+    'paper_id', 'title', 'keywords', 'status', 'is_withdrawn', 'track_id', 'track',
+    'submitter_id', 'authors', 'created_at',
+    'pdf_file', 'pdf_sha256', 'pdf_size',
+    'camera_ready_file', 'camera_ready_sha256', 'camera_ready_size',
+)
+MANIFEST_SOURCE = (
+    Paper.id, Paper.title, Paper.keywords, Paper.status, Paper.is_withdrawn, Paper.track_id,
+    Track.name.label('track_name'), Paper.submitter_id, Paper.created_at,
+    Paper.pdf_path, Paper.camera_ready_path,
+)
+AUTHOR_COLUMNS = (
+    'paper_id', 'author_order', 'user_id', 'full_name', 'email', 'affiliation', 'is_corresponding',
+)
+
+
+@dataclass(frozen=True)
+class ExportPlan:
+    conference_id: int
+    track_id: int
+    statuses: tuple
+    include_withdrawn: bool
+    files: str
+    max_paper_id: int   # snapshot: papers created after prepare() are left out
+    paper_count: int
+    folder: str         # top-level folder inside the archive
+
+    @property
+    def download_name(self) -> str:
+        return f"{self.folder}.zip"
+
+
+def _cell(value):
+    """CSV-safe cell: no formula injection when a chair opens it in a spreadsheet"""
+    if value is None:
+        return ''
+    if isinstance(value, PaperStatus):
+        return value.value
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    if isinstance(value, str) and value[:1] in ('=', '+', '-', '@', '\t', '\r'):
+        return "'" + value
+    return value
+
+
+def _csv_bytes(rows) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\r\n')
+    for row in rows:
+        writer.writerow([_cell(value) for value in row])
+    return buffer.getvalue().encode('utf-8')
+
+
+def _blob(key):
+    """(absolute path, sha256, size) of a stored PDF, or None when it is not available"""
+    if not key:
+        return None
+    storage = get_file_storage()
+    try:
+        path = storage.path_for(key)
+        size = os.path.getsize(path)
+    except (StorageError, OSError):
+        return None  # legacy path / blob gone
+    return path, storage.hash_from_key(key), size
+
+
+class PaperExportService:
+
+    @staticmethod
+    def prepare_conference_export(conference_id: int, current_user: dict, track_id: int = None,
+                                  status: list = None, include_withdrawn: bool = False,
+                                  files: str = EXPORT_PDF):
+        """
+        Check access and fix the set of papers to export
+
+        Args:
+            track_id: only this track
+            status: list of PaperStatus values
+            files: 'pdf' (submissions), 'camera_ready' or 'all'
+
+        Returns: (ExportPlan, None) or (None, error_message)
+        """
+        if files not in EXPORT_FILES:
+            return None, f"files must be one of: {', '.join(EXPORT_FILES)}"
+        try:
+            statuses = tuple(PaperStatus(value) for value in status) if status else ()
+        except ValueError:
+            return None, f"Invalid status, use: {', '.join(s.value for s in PaperStatus)}"
+
+        user_id = current_user.get('user_id')
+        with session_scope(read_only=True, read_key=user_id) as db:
+            conference = db.query(Conference.chair_id, Conference.name).filter(
+                Conference.id == conference_id,
+                Conference.is_deleted == False
+            ).first()
+            if conference is None:
+                return None, CONFERENCE_NOT_FOUND
+            if 'Admin' not in get_role_names(current_user) and conference.chair_id != user_id:
+                return None, ACCESS_DENIED
+
+            folder = f"{conference_id}-{_slugify(conference.name)}"
+            if track_id is not None:
+                track = db.query(Track.code).filter(
+                    Track.id == track_id,
+                    Track.conference_id == conference_id,
+                    Track.is_deleted == False
+                ).first()
+                if track is None:
+                    return None, TRACK_NOT_FOUND
+                folder += f"-{_slugify(track.code)}"
+
+            plan = ExportPlan(conference_id, track_id, statuses, include_withdrawn, files, 0, 0, folder)
+            max_paper_id, paper_count = PaperExportService._papers_query(
+                db, plan, func.max(Paper.id), func.count(Paper.id)
+            ).one()
+
+        return ExportPlan(
+            conference_id, track_id, statuses, include_withdrawn, files,
+            max_paper_id or 0, paper_count, folder
+        ), None
+
+    @staticmethod
+    def stream_archive(plan: ExportPlan, chunk_size: int = None):
+        """The ZIP as an iterator of byte chunks (for a streaming Response)"""
+        if chunk_size is None:
+            from config import get_config
+            chunk_size = get_config().EXPORT_CHUNK_SIZE
+        return stream_zip(PaperExportService._entries(plan), chunk_size=chunk_size)
+
+    # ---------- Archive content ----------
+
+    @staticmethod
+    def _entries(plan: ExportPlan):
+        yield ZipEntry(f"{plan.folder}/manifest.csv", chunks=PaperExportService._manifest(plan), compress=True)
+        yield ZipEntry(f"{plan.folder}/authors.csv", chunks=PaperExportService._authors(plan), compress=True)
+
+        for paper in PaperExportService._batches(plan, Paper.id, Paper.title, Paper.pdf_path, Paper.camera_ready_path):
+            for folder, key in PaperExportService._files_of(plan, paper):
+                blob = _blob(key)
+                if blob is not None:
+                    yield ZipEntry(PaperExportService._archive_name(plan, folder, paper), path=blob[0])
+
+    @staticmethod
+    def _manifest(plan: ExportPlan):
+        yield b'\xef\xbb\xbf' + _csv_bytes([MANIFEST_COLUMNS])  # BOM: spreadsheets detect UTF-8
+
+        for batch in PaperExportService._batches(plan, *MANIFEST_SOURCE, batched=True, join_track=True):
+            paper_ids = [paper.id for paper in batch]
+            with separate_transaction(), session_scope(read_only=True) as db:
+                names = {}
+                for author in db.query(PaperAuthor.paper_id, User.full_name).join(
+                    User, User.id == PaperAuthor.user_id
+                ).filter(PaperAuthor.paper_id.in_(paper_ids)).order_by(
+                    PaperAuthor.paper_id, PaperAuthor.author_order
+                ):
+                    names.setdefault(author.paper_id, []).append(author.full_name)
+
+            rows = []
+            for paper in batch:
+                files = {}
+                for folder, key in PaperExportService._files_of(plan, paper):
+                    blob = _blob(key)
+                    if blob is not None:
+                        files[folder] = (PaperExportService._archive_name(plan, folder, paper), blob[1], blob[2])
+                pdf = files.get('pdf', ('', '', ''))
+                camera_ready = files.get('camera-ready', ('', '', ''))
+                rows.append((
+                    paper.id, paper.title, paper.keywords, paper.status, bool(paper.is_withdrawn),
+                    paper.track_id, paper.track_name, paper.submitter_id,
+                    '; '.join(names.get(paper.id, [])), paper.created_at,
+                    *pdf, *camera_ready
+                ))
+            yield _csv_bytes(rows)
+
+    @staticmethod
+    def _authors(plan: ExportPlan):
+        yield b'\xef\xbb\xbf' + _csv_bytes([AUTHOR_COLUMNS])
+
+        for batch in PaperExportService._batches(plan, Paper.id, batched=True):
+            paper_ids = [row.id for row in batch]
+            with separate_transaction(), session_scope(read_only=True) as db:
+                rows = db.query(
+                    PaperAuthor.paper_id, PaperAuthor.author_order, PaperAuthor.user_id,
+                    User.full_name, User.email, PaperAuthor.affiliation, PaperAuthor.is_corresponding
+                ).join(
+                    User, User.id == PaperAuthor.user_id
+                ).filter(PaperAuthor.paper_id.in_(paper_ids)).order_by(
+                    PaperAuthor.paper_id, PaperAuthor.author_order
+                ).all()
+            yield _csv_bytes(tuple(row) for row in rows)
+
+    # ---------- Helpers ----------
+
+    @staticmethod
+    def _papers_query(db, plan: ExportPlan, *columns):
+        query = db.query(*columns).filter(Paper.conference_id == plan.conference_id)
+        if plan.track_id is not None:
+            query = query.filter(Paper.track_id == plan.track_id)
+        if plan.statuses:
+            query = query.filter(Paper.status.in_(plan.statuses))
+        if not plan.include_withdrawn:
+            query = query.filter(Paper.is_withdrawn.isnot(True))
+        if plan.max_paper_id:
+            query = query.filter(Paper.id <= plan.max_paper_id)
+        return query
+
+    @staticmethod
+    def _batches(plan: ExportPlan, *columns, batched: bool = False, join_track: bool = False):
+        """
+        Rows of the exported papers in id order (Paper.id must be selected),
+        EXPORT_BATCH_SIZE per short transaction
+        """
+        if not plan.paper_count:
+            return
+        last_id = 0
+        while True:
+            with separate_transaction(), session_scope(read_only=True) as db:
+                query = PaperExportService._papers_query(db, plan, *columns)
+                if join_track:
+                    query = query.outerjoin(Track, Track.id == Paper.track_id)
+                batch = query.filter(Paper.id > last_id).order_by(Paper.id).limit(EXPORT_BATCH_SIZE).all()
+            if not batch:
+                return
+            if batched:
+                yield batch
+            else:
+                yield from batch
+            last_id = batch[-1].id
+            if len(batch) < EXPORT_BATCH_SIZE:
+                return
+
+    @staticmethod
+    def _files_of(plan: ExportPlan, paper):
+        if plan.files in (EXPORT_PDF, EXPORT_ALL):
+            yield 'pdf', paper.pdf_path
+        if plan.files in (EXPORT_CAMERA_READY, EXPORT_ALL):
+            yield 'camera-ready', paper.camera_ready_path
+
+    @staticmethod
+    def _archive_name(plan: ExportPlan, folder: str, paper) -> str:
+        return f"{plan.folder}/{folder}/{paper.id}-{_slugify(paper.title)}.pdf"
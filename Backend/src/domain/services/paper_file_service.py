@@ -0,0 +1,191 @@
+# ============================================
+# File: Backend/src/domain/services/paper_file_service.py
+# ============================================
+"""
+Paper File Service - who may download which PDF of a paper
+
+Rules:
+    - Admin and the conference chair: every file
+    - Submitter and co-authors: submission PDF and camera-ready
+    - Assigned reviewer (active assignment, no conflict of interest):
+      submission PDF only, never for a withdrawn paper
+    - In a blind-review conference reviewers get a neutral file name
+      (paper-<id>.pdf) so the download does not reveal the title/authors
+
+Allowed decisions are cached per (user, paper, variant) for
+DOWNLOAD_ACCESS_CACHE_TTL seconds, so a reviewer re-opening the same PDF does
+not hit the database again. A declined assignment or a withdrawn paper drops
+them at once (forget_access); other revocations take effect within that
+window.
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+
+from sqlalchemy import or_
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.models import Paper, PaperAuthor, Assignment, Conference, ConflictOfInterest
+from infrastructure.cache.memory_cache import TTLCache
+from infrastructure.services.file_storage_service import get_file_storage, StorageError
+from domain.utils.auth_utils import get_role_names
+
+
+VARIANT_SUBMISSION = 'pdf'
+VARIANT_CAMERA_READY = 'camera_ready'
+VARIANTS = (VARIANT_SUBMISSION, VARIANT_CAMERA_READY)
+
+PAPER_NOT_FOUND = "Paper not found"
+FILE_NOT_FOUND = "File not available"
+ACCESS_DENIED = "You do not have access to this file"
+
+INACTIVE_ASSIGNMENT_STATUSES = ('Declined', 'Cancelled')
+
+
+@dataclass(frozen=True)
+class DownloadTarget:
+    path: str           # absolute blob path
+    etag: str           # content SHA-256 (strong ETag)
+    download_name: str
+
+
+_access_cache = None
+_access_cache_lock = threading.Lock()
+
+
+def get_download_access_cache() -> TTLCache:
+    global _access_cache
+    if _access_cache is None:
+        with _access_cache_lock:
+            if _access_cache is None:
+                from config import get_config
+                current_config = get_config()
+                _access_cache = TTLCache(
+                    max_size=current_config.DOWNLOAD_ACCESS_CACHE_SIZE,
+                    ttl=current_config.DOWNLOAD_ACCESS_CACHE_TTL,
+                    name='download_access'
+                )
+    return _access_cache
+
+
+def _slugify(title: str) -> str:
+    slug = re.sub(r'[^A-Za-z0-9]+', '-', title or '').strip('-').lower()
+    return slug[:80] or 'paper'
+
+
+class PaperFileService:
+
+    @staticmethod
+    def resolve_download(paper_id: int, current_user: dict, variant: str = VARIANT_SUBMISSION):
+        """
+        Check access and locate the blob of a paper file
+
+        Args:
+            paper_id: int
+            current_user: decoded JWT payload (request.current_user)
+            variant: 'pdf' or 'camera_ready'
+
+        Returns: (DownloadTarget, None) or (None, error_message)
+        """
+        if variant not in VARIANTS:
+            return None, FILE_NOT_FOUND
+
+        user_id = current_user.get('user_id')
+        cache = get_download_access_cache()
+        cache_key = (user_id, paper_id, variant)
+        target = cache.get(cache_key)
+        if target is not None:
+            return target, None
+
+        with session_scope(read_only=True, read_key=user_id) as db:
+            row = db.query(
+                Paper.title,
+                Paper.pdf_path,
+                Paper.camera_ready_path,
+                Paper.submitter_id,
+                Paper.is_withdrawn,
+                Conference.chair_id,
+                Conference.is_blind_review
+            ).join(
+                Conference, Conference.id == Paper.conference_id
+            ).filter(Paper.id == paper_id).first()
+
+            if row is None:
+                return None, PAPER_NOT_FOUND
+
+            roles = get_role_names(current_user)
+            anonymous_name = False
+
+            if 'Admin' in roles or row.chair_id == user_id or row.submitter_id == user_id:
+                allowed = True
+            elif db.query(PaperAuthor.id).filter(
+                PaperAuthor.paper_id == paper_id,
+                PaperAuthor.user_id == user_id
+            ).first() is not None:
+                allowed = True
+            else:
+                allowed = (
+                    variant == VARIANT_SUBMISSION
+                    and not row.is_withdrawn
+                    and PaperFileService._is_active_reviewer(db, paper_id, user_id)
+                )
+                anonymous_name = bool(row.is_blind_review)
+
+            if not allowed:
+                return None, ACCESS_DENIED
+
+        key = row.pdf_path if variant == VARIANT_SUBMISSION else row.camera_ready_path
+        if not key:
+            return None, FILE_NOT_FOUND
+
+        storage = get_file_storage()
+        try:
+            path = storage.path_for(key)
+        except StorageError:
+            # Legacy path that is not a content-addressed blob
+            return None, FILE_NOT_FOUND
+
+        suffix = '-camera-ready' if variant == VARIANT_CAMERA_READY else ''
+        if anonymous_name:
+            download_name = f"paper-{paper_id}{suffix}.pdf"
+        else:
+            download_name = f"{paper_id}-{_slugify(row.title)}{suffix}.pdf"
+
+        target = DownloadTarget(
+            path=path,
+            etag=storage.hash_from_key(key),
+            download_name=download_name
+        )
+        cache.set(cache_key, target)
+        return target, None
+
+    @staticmethod
+    def _is_active_reviewer(db, paper_id: int, user_id: int) -> bool:
+        assigned = db.query(Assignment.id).filter(
+            Assignment.paper_id == paper_id,
+            Assignment.reviewer_id == user_id,
+            or_(Assignment.is_deleted.is_(False), Assignment.is_deleted.is_(None)),
+            Assignment.status.notin_(INACTIVE_ASSIGNMENT_STATUSES)
+        ).first() is not None
+        if not assigned:
+            return False
+
+        conflicted = db.query(ConflictOfInterest.id).filter(
+            ConflictOfInterest.paper_id == paper_id,
+            ConflictOfInterest.reviewer_id == user_id
+        ).first() is not None
+        return not conflicted
+
+    @staticmethod
+    def forget_access(user_id: int = None, paper_id: int = None):
+        """
+        Drop cached decisions after an assignment is revoked, a paper withdrawn, ...
+        Without both ids the whole cache is cleared.
+        """
+        cache = get_download_access_cache()
+        if user_id is None or paper_id is None:
+            cache.clear()
+            return
+        for variant in VARIANTS:
+            cache.delete((user_id, paper_id, variant))
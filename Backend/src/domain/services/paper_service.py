@@ -0,0 +1,265 @@
+# ============================================
+# File: Backend/src/domain/services/paper_service.py
+# ============================================
+"""
+Paper Service - listing and searching papers of a conference
+
+Listing uses keyset (seek) pagination on (created_at, id) instead of OFFSET:
+page N costs the same as page 1 because the database seeks straight to the
+cursor in ix_papers_conference[_status]_created instead of reading and
+discarding every earlier row.
+
+Only the requested columns are selected (sparse fieldsets), so list views do
+not pull `abstract` off disk.
+
+Search ranks title / keywords / abstract matches through the configured
+search backend (infrastructure.search.indexing) and then loads the hits'
+columns by primary key.
+
+The chair of the conference and admins see every paper; everyone else sees
+only the papers they submitted or co-author.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.models import Paper, PaperStatus, PaperAuthor, Conference
+from infrastructure.search.indexing import search_papers
+from domain.utils.auth_utils import get_role_names
+
+
+CONFERENCE_NOT_FOUND = "Conference not found"
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 100
+MAX_QUERY_LENGTH = 200
+
+LISTABLE_FIELDS = {
+    'id': Paper.id,
+    'title': Paper.title,
+    'abstract': Paper.abstract,
+    'keywords': Paper.keywords,
+    'status': Paper.status,
+    'is_withdrawn': Paper.is_withdrawn,
+    'submitter_id': Paper.submitter_id,
+    'track_id': Paper.track_id,
+    'created_at': Paper.created_at,
+    'updated_at': Paper.updated_at,
+}
+DEFAULT_FIELDS = ('id', 'title', 'keywords', 'status', 'track_id', 'created_at')
+
+
+def encode_cursor(created_at: datetime, paper_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), paper_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str):
+    """(created_at, id) from an opaque cursor; raises ValueError when malformed"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, paper_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(paper_id)
+    except (binascii.Error, TypeError, ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def _serialize(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, PaperStatus):
+        return value.value
+    return value
+
+
+def _sees_every_paper(conference, current_user: dict) -> bool:
+    return 'Admin' in get_role_names(current_user) or conference.chair_id == current_user.get('user_id')
+
+
+def _restrict_to_visible(db, query, conference, current_user: dict):
+    """Chair / admin: every paper; others: papers they submitted or co-author"""
+    if _sees_every_paper(conference, current_user):
+        return query
+    user_id = current_user.get('user_id')
+    coauthored = db.query(PaperAuthor.paper_id).filter(PaperAuthor.user_id == user_id)
+    return query.filter(or_(
+        Paper.submitter_id == user_id,
+        Paper.id.in_(coauthored)
+    ))
+
+
+class PaperService:
+
+    @staticmethod
+    def list_conference_papers(conference_id: int, current_user: dict, status: list = None,
+                               track_id: int = None, fields: list = None, cursor: str = None,
+                               limit: int = DEFAULT_PAGE_SIZE, order: str = 'desc'):
+        """
+        One page of a conference's papers
+
+        Args:
+            status: list of PaperStatus values ('submitted', 'accepted', ...)
+            fields: columns to return (default: everything except abstract/audit columns)
+            cursor: next_cursor of the previous page
+            order: 'desc' (newest first) or 'asc'
+
+        Returns: ({'papers', 'next_cursor', 'has_more'}, None) or (None, error_message)
+        """
+        fields = list(fields or DEFAULT_FIELDS)
+        unknown = [name for name in fields if name not in LISTABLE_FIELDS]
+        if unknown:
+            return None, f"Unknown fields: {', '.join(unknown)}"
+        if order not in ('asc', 'desc'):
+            return None, "order must be 'asc' or 'desc'"
+
+        try:
+            statuses = [PaperStatus(value) for value in status] if status else None
+        except ValueError:
+            return None, f"Invalid status, use: {', '.join(s.value for s in PaperStatus)}"
+
+        try:
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError as e:
+            return None, str(e)
+
+        limit = max(1, min(int(limit or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE))
+        user_id = current_user.get('user_id')
+
+        with session_scope(read_only=True, read_key=user_id) as db:
+            conference = db.query(Conference.chair_id).filter(
+                Conference.id == conference_id,
+                Conference.is_deleted == False
+            ).first()
+            if conference is None:
+                return None, CONFERENCE_NOT_FOUND
+
+            # created_at / id are always selected - they build the cursor
+            selected = list(dict.fromkeys(fields + ['created_at', 'id']))
+            query = db.query(*[LISTABLE_FIELDS[name].label(name) for name in selected]).filter(
+                Paper.conference_id == conference_id
+            )
+
+            if statuses:
+                query = query.filter(
+                    Paper.status == statuses[0] if len(statuses) == 1 else Paper.status.in_(statuses)
+                )
+            if track_id is not None:
+                query = query.filter(Paper.track_id == track_id)
+
+            query = _restrict_to_visible(db, query, conference, current_user)
+
+            if after is not None:
+                created_at, paper_id = after
+                # Range on created_at (index seek) + tie-break on id
+                if order == 'desc':
+                    query = query.filter(and_(
+                        Paper.created_at <= created_at,
+                        or_(Paper.created_at < created_at, Paper.id < paper_id)
+                    ))
+                else:
+                    query = query.filter(and_(
+                        Paper.created_at >= created_at,
+                        or_(Paper.created_at > created_at, Paper.id > paper_id)
+                    ))
+
+            if order == 'desc':
+                query = query.order_by(Paper.created_at.desc(), Paper.id.desc())
+            else:
+                query = query.order_by(Paper.created_at.asc(), Paper.id.asc())
+
+            rows = query.limit(limit + 1).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = None
+        if has_more and rows[-1].created_at is not None:
+            next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+        papers = [
+            {name: _serialize(getattr(row, name)) for name in fields}
+            for row in rows
+        ]
+        return {
+            'papers': papers,
+            'next_cursor': next_cursor,
+            'has_more': has_more
+        }, None
+
+
+    @staticmethod
+    def search_conference_papers(conference_id: int, current_user: dict, q: str,
+                                 fields: list = None, limit: int = DEFAULT_SEARCH_LIMIT):
+        """
+        Full-text search over title, keywords and abstract, best match first
+
+        Returns: ({'papers', 'total', 'truncated'}, None) or (None, error_message);
+        each paper carries its relevance `score`. `truncated` is True when the
+        search backend hit its work budget and the hits are the best it found
+        rather than the proven top `limit`.
+        """
+        q = (q or '').strip()
+        if not q:
+            return None, "Query q is required"
+        if len(q) > MAX_QUERY_LENGTH:
+            return None, f"Query is too long (max {MAX_QUERY_LENGTH} characters)"
+
+        fields = list(fields or DEFAULT_FIELDS)
+        unknown = [name for name in fields if name not in LISTABLE_FIELDS]
+        if unknown:
+            return None, f"Unknown fields: {', '.join(unknown)}"
+
+        limit = max(1, min(int(limit or DEFAULT_SEARCH_LIMIT), MAX_SEARCH_LIMIT))
+        user_id = current_user.get('user_id')
+
+        with session_scope(read_only=True, read_key=user_id) as db:
+            conference = db.query(Conference.chair_id).filter(
+                Conference.id == conference_id,
+                Conference.is_deleted == False
+            ).first()
+            if conference is None:
+                return None, CONFERENCE_NOT_FOUND
+
+            # Rank only what this user may see - filtering after the global
+            # top `limit` would leave authors with few or no hits
+            visible_ids = None
+            if not _sees_every_paper(conference, current_user):
+                visible = _restrict_to_visible(
+                    db, db.query(Paper.id).filter(Paper.conference_id == conference_id),
+                    conference, current_user
+                )
+                visible_ids = {row.id for row in visible}
+                if not visible_ids:
+                    return {'papers': [], 'total': 0, 'truncated': False}, None
+
+            hits = search_papers(q, conference_id=conference_id, limit=limit, paper_ids=visible_ids)
+            if not hits:
+                return {'papers': [], 'total': 0, 'truncated': hits.truncated}, None
+
+            selected = list(dict.fromkeys(fields + ['id']))
+            query = db.query(*[LISTABLE_FIELDS[name].label(name) for name in selected]).filter(
+                Paper.id.in_([hit.paper_id for hit in hits]),
+                Paper.conference_id == conference_id
+            )
+            rows = {row.id: row for row in _restrict_to_visible(db, query, conference, current_user).all()}
+
+        papers = []
+        for hit in hits:
+            row = rows.get(hit.paper_id)
+            if row is None:
+                continue  # not visible to this user, or deleted since it was indexed
+            paper = {name: _serialize(getattr(row, name)) for name in fields}
+            paper['score'] = round(hit.score, 4)
+            papers.append(paper)
+
+        return {
+            'papers': papers,
+            'total': len(papers),
+            'truncated': hits.truncated
+        }, None
@@ -0,0 +1,230 @@
+# ============================================
+# File: Backend/src/domain/services/paper_status_service.py
+# ============================================
+"""
+Paper Status Service - the Paper.status state machine, applied in bulk
+
+    submitted ──> under_review ──> accepted ──> camera_ready
+        │              │             ↑  │
+        │              │             │  ↓
+        │              └─────────> rejected
+        └──────────────┴──> withdrawn
+
+accepted <-> rejected stays open until the camera-ready is in (a chair may
+revise a decision); camera_ready additionally needs an uploaded file.
+
+Bulk transitions never load Paper objects:
+    1. one SELECT (id, status, has file) for the requested ids
+    2. per source status one set-based
+           UPDATE papers SET status = :to WHERE id IN (...) AND status = :from
+       - the status guard makes a concurrent change lose cleanly ('conflict')
+    3. decisions (accepted / rejected): previous ones soft-deleted with one
+       UPDATE, the new ones inserted with one executemany INSERT
+    4. one audit row per changed paper, all parked on the session and bulk
+       inserted by the audit sink after commit
+
+Only admins and the chair of the conference may change statuses.
+"""
+
+import json
+from datetime import datetime
+
+from sqlalchemy import insert
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.databases.routing import stick_to_primary
+from infrastructure.models import Paper, PaperStatus, Conference, Decision
+from infrastructure.services.audit_sink import get_audit_sink
+from domain.utils.auth_utils import get_role_names
+
+
+CONFERENCE_NOT_FOUND = "Conference not found"
+ACCESS_DENIED = "Only the conference chair or an admin can change paper statuses"
+
+MAX_BULK_PAPERS = 10000
+ID_CHUNK_SIZE = 900  # stays under SQLite's bound-parameter limit
+
+ALLOWED_TRANSITIONS = {
+    PaperStatus.SUBMITTED: {PaperStatus.UNDER_REVIEW, PaperStatus.WITHDRAWN},
+    PaperStatus.UNDER_REVIEW: {PaperStatus.ACCEPTED, PaperStatus.REJECTED, PaperStatus.WITHDRAWN},
+    PaperStatus.ACCEPTED: {PaperStatus.CAMERA_READY, PaperStatus.REJECTED},
+    PaperStatus.REJECTED: {PaperStatus.ACCEPTED},
+    PaperStatus.CAMERA_READY: set(),
+    PaperStatus.WITHDRAWN: set(),
+}
+DECISION_STATUSES = (PaperStatus.ACCEPTED, PaperStatus.REJECTED)
+
+# Per-paper outcomes
+RESULT_UPDATED = 'updated'
+RESULT_UNCHANGED = 'unchanged'              # already in the target status
+RESULT_INVALID = 'invalid_transition'
+RESULT_MISSING_FILE = 'camera_ready_missing'
+RESULT_CONFLICT = 'conflict'                # changed by someone else meanwhile
+RESULT_NOT_FOUND = 'not_found'
+
+
+def can_transition(current: PaperStatus, target: PaperStatus) -> bool:
+    return target in ALLOWED_TRANSITIONS.get(current, ())
+
+
+def _chunks(ids):
+    ids = list(ids)
+    for start in range(0, len(ids), ID_CHUNK_SIZE):
+        yield ids[start:start + ID_CHUNK_SIZE]
+
+
+def _parse_ids(paper_ids):
+    """(ordered unique ids, error)"""
+    if not isinstance(paper_ids, list) or not paper_ids:
+        return None, "paper_ids must be a non-empty list"
+    try:
+        ids = list(dict.fromkeys(int(paper_id) for paper_id in paper_ids))
+    except (TypeError, ValueError):
+        return None, "paper_ids must be integers"
+    if len(ids) > MAX_BULK_PAPERS:
+        return None, f"At most {MAX_BULK_PAPERS} papers per request"
+    return ids, None
+
+
+class PaperStatusService:
+
+    @staticmethod
+    def bulk_transition(conference_id: int, paper_ids: list, status: str, current_user: dict,
+                        comment: str = None):
+        """
+        Move many papers of one conference to `status`
+
+        Returns: ({'status', 'counts', 'results'}, None) or (None, error_message);
+        results holds one {'paper_id', 'result', 'from'} per requested id, in
+        request order (see RESULT_* for the possible results)
+        """
+        try:
+            target = PaperStatus(status)
+        except ValueError:
+            return None, f"Invalid status, use: {', '.join(s.value for s in PaperStatus)}"
+        ids, error = _parse_ids(paper_ids)
+        if error:
+            return None, error
+
+        user_id = current_user.get('user_id')
+        now = datetime.utcnow()
+
+        with session_scope() as db:
+            conference = db.query(Conference.chair_id).filter(
+                Conference.id == conference_id,
+                Conference.is_deleted == False
+            ).first()
+            if conference is None:
+                return None, CONFERENCE_NOT_FOUND
+            if 'Admin' not in get_role_names(current_user) and conference.chair_id != user_id:
+                return None, ACCESS_DENIED
+
+            # 1. Current state, as plain tuples
+            current = {}
+            for chunk in _chunks(ids):
+                for row in db.query(
+                    Paper.id, Paper.status, Paper.camera_ready_path.isnot(None).label('has_camera_ready')
+                ).filter(
+                    Paper.id.in_(chunk),
+                    Paper.conference_id == conference_id
+                ):
+                    current[row.id] = (row.status, row.has_camera_ready)
+
+            outcome = {}
+            by_source = {}
+            for paper_id in ids:
+                if paper_id not in current:
+                    outcome[paper_id] = RESULT_NOT_FOUND
+                    continue
+                source, has_camera_ready = current[paper_id]
+                if source == target:
+                    outcome[paper_id] = RESULT_UNCHANGED
+                elif not can_transition(source, target):
+                    outcome[paper_id] = RESULT_INVALID
+                elif target == PaperStatus.CAMERA_READY and not has_camera_ready:
+                    outcome[paper_id] = RESULT_MISSING_FILE
+                else:
+                    by_source.setdefault(source, []).append(paper_id)
+
+            # 2. One guarded UPDATE per source status (and id chunk)
+            values = {Paper.status: target, Paper.updated_at: now}
+            if target == PaperStatus.WITHDRAWN:
+                values[Paper.is_withdrawn] = True
+
+            changed = []
+            for source, source_ids in by_source.items():
+                for chunk in _chunks(source_ids):
+                    updated = db.query(Paper).filter(
+                        Paper.id.in_(chunk),
+                        Paper.status == source
+                    ).update(values, synchronize_session=False)
+                    if updated == len(chunk):
+                        moved = chunk
+                    else:
+                        # Lost a race for some: the ones now in `target` are ours
+                        moved = [
+                            row.id for row in db.query(Paper.id).filter(
+                                Paper.id.in_(chunk),
+                                Paper.status == target
+                            )
+                        ]
+                    moved_set = set(moved)
+                    for paper_id in chunk:
+                        outcome[paper_id] = RESULT_UPDATED if paper_id in moved_set else RESULT_CONFLICT
+                    changed.extend(moved)
+
+            # 3. Decisions
+            if changed and target in DECISION_STATUSES:
+                for chunk in _chunks(changed):
+                    db.query(Decision).filter(
+                        Decision.paper_id.in_(chunk),
+                        Decision.is_deleted == False
+                    ).update({Decision.is_deleted: True, Decision.updated_at: now}, synchronize_session=False)
+                db.execute(insert(Decision), [
+                    {
+                        'paper_id': paper_id,
+                        'conference_id': conference_id,
+                        'chair_user_id': user_id,
+                        'result': target.value,
+                        'final_comment': comment,
+                        'created_at': now,
+                        'updated_at': now,
+                        'is_deleted': False,
+                    }
+                    for paper_id in changed
+                ])
+
+            # 4. Audit rows, bulk-inserted by the sink once this commits
+            if changed:
+                sink = get_audit_sink()
+                for paper_id in changed:
+                    sink.record(
+                        user_id=user_id,
+                        action_type='paper_status_changed',
+                        table_name='papers',
+                        record_id=paper_id,
+                        data=json.dumps({"from": current[paper_id][0].value, "to": target.value}),
+                        session=db
+                    )
+                stick_to_primary(user_id, session=db)
+
+        if changed and target == PaperStatus.WITHDRAWN:
+            # Reviewers lose access to withdrawn papers
+            from domain.services.paper_file_service import PaperFileService
+            PaperFileService.forget_access()
+
+        counts = {}
+        results = []
+        for paper_id in ids:
+            result = outcome[paper_id]
+            counts[result] = counts.get(result, 0) + 1
+            entry = {'paper_id': paper_id, 'result': result}
+            if paper_id in current:
+                entry['from'] = current[paper_id][0].value
+            results.append(entry)
+
+        return {
+            'status': target.value,
+            'counts': counts,
+            'results': results
+        }, None
@@ -1,2 +1,190 @@
-# Module: scoring_logic.py
-# Created automatically for UTH-ConfMS
+# ============================================
+# File: Backend/src/domain/services/scoring_logic.py
+# ============================================
+"""
+Scoring Logic - review score aggregation and reviewer calibration (no database, no Flask)
+
+Reviews come in as three parallel columns (paper ids, reviewer ids, scores);
+every statistic is one pass over the columns plus one per group, never a
+loop over papers x reviewers.
+
+Reviewer model (empirical Bayes): a score is the paper's quality plus the
+reviewer's bias plus noise of the reviewer's own spread,
+    score = quality(paper) + bias(reviewer) + noise,  noise ~ N(0, var(reviewer))
+The reviewer's mean and variance are shrunk towards the conference's with
+`strength` pseudo-reviews, so someone with two reviews is barely corrected
+and a consistently harsh reviewer with twenty is corrected almost fully:
+    mean~ = (n * mean + k * mu) / (n + k)        bias = mean~ - mu
+    var~  = (n * var + k * sigma^2) / (n + k)
+Per paper:
+    mean, median, variance, min, max          raw scores
+    weighted      precision-weighted mean (weight sigma^2 / var~: a
+                  reviewer whose scores scatter more counts less)
+    calibrated    precision-weighted mean of score - bias, kept in 1..10
+    z             mean of (score - mean~) / sqrt(var~)
+
+Usage:
+    prior = conference_prior(scores)
+    reviewers = calibrate_reviewers(reviewer_ids, scores, prior)
+    papers = aggregate_papers(paper_ids, reviewer_ids, scores, reviewers, prior)
+    papers[41].calibrated
+"""
+
+import math
+from array import array
+from dataclasses import dataclass
+
+
+SCORE_MIN = 1
+SCORE_MAX = 10
+PRIOR_REVIEWS = 3.0     # pseudo-reviews pulling a reviewer towards the conference
+MIN_STD = 0.5           # floor of any standard deviation (a reviewer always giving 7)
+
+
+@dataclass(frozen=True)
+class Prior:
+    count: int
+    mean: float
+    std: float
+
+
+@dataclass(frozen=True)
+class ReviewerCalibration:
+    count: int
+    mean: float             # raw
+    std: float              # raw
+    shrunk_mean: float
+    shrunk_std: float
+
+    def bias(self, prior: Prior) -> float:
+        return self.shrunk_mean - prior.mean
+
+    def weight(self, prior: Prior) -> float:
+        return (prior.std / self.shrunk_std) ** 2
+
+
+@dataclass(frozen=True)
+class PaperScores:
+    count: int
+    mean: float
+    median: float
+    variance: float
+    min: float
+    max: float
+    weighted: float
+    calibrated: float
+    z: float
+
+
+def columns(rows) -> tuple:
+    """(paper ids, reviewer ids, scores) arrays of (paper_id, reviewer_id, score) rows"""
+    paper_ids, reviewer_ids, scores = array('q'), array('q'), array('d')
+    for paper_id, reviewer_id, score in rows:
+        paper_ids.append(paper_id)
+        reviewer_ids.append(reviewer_id)
+        scores.append(min(SCORE_MAX, max(SCORE_MIN, float(score))))
+    return paper_ids, reviewer_ids, scores
+
+
+def conference_prior(scores, count: int = None, total: float = None, squares: float = None) -> Prior:
+    """
+    Mean and spread of every score of the conference - from the scores, or
+    from SQL aggregates (count, sum, sum of squares) when given
+    """
+    if count is None:
+        count = len(scores)
+        total = math.fsum(scores)
+        squares = math.fsum(score * score for score in scores)
+    if not count:
+        return Prior(0, (SCORE_MIN + SCORE_MAX) / 2, (SCORE_MAX - SCORE_MIN) / 4)
+    mean = total / count
+    variance = max(0.0, squares / count - mean * mean)
+    return Prior(count, mean, max(MIN_STD, math.sqrt(variance)))
+
+
+def _groups(keys) -> dict:
+    """key -> [positions] in one pass"""
+    groups = {}
+    for position, key in enumerate(keys):
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [position]
+        else:
+            group.append(position)
+    return groups
+
+
+def calibrate_reviewers(reviewer_ids, scores, prior: Prior, strength: float = PRIOR_REVIEWS) -> dict:
+    """{reviewer_id: ReviewerCalibration} from every score of each reviewer"""
+    calibration = {}
+    prior_variance = prior.std ** 2
+    for reviewer_id, positions in _groups(reviewer_ids).items():
+        values = [scores[position] for position in positions]
+        n = len(values)
+        mean = math.fsum(values) / n
+        variance = math.fsum((value - mean) ** 2 for value in values) / n
+        shrunk_mean = (n * mean + strength * prior.mean) / (n + strength)
+        shrunk_variance = (n * variance + strength * prior_variance) / (n + strength)
+        calibration[reviewer_id] = ReviewerCalibration(
+            count=n,
+            mean=mean,
+            std=math.sqrt(variance),
+            shrunk_mean=shrunk_mean,
+            shrunk_std=max(MIN_STD, math.sqrt(shrunk_variance))
+        )
+    return calibration
+
+
+def _median(values: list) -> float:
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2
+
+
+def aggregate_papers(paper_ids, reviewer_ids, scores, calibration: dict, prior: Prior,
+                     only=None) -> dict:
+    """
+    {paper_id: PaperScores}; `calibration` must cover every reviewer of the
+    papers, `only` restricts the output to some papers
+    """
+    # Per review: bias-free score, weight and z-score, one pass
+    weights, corrected, z_scores = array('d'), array('d'), array('d')
+    for reviewer_id, score in zip(reviewer_ids, scores):
+        reviewer = calibration[reviewer_id]
+        weight = reviewer.weight(prior)
+        weights.append(weight)
+        corrected.append(score - reviewer.bias(prior))
+        z_scores.append((score - reviewer.shrunk_mean) / reviewer.shrunk_std)
+
+    wanted = set(only) if only is not None else None
+    aggregates = {}
+    for paper_id, positions in _groups(paper_ids).items():
+        if wanted is not None and paper_id not in wanted:
+            continue
+        values = [scores[position] for position in positions]
+        n = len(values)
+        mean = math.fsum(values) / n
+        total_weight = math.fsum(weights[position] for position in positions)
+        calibrated = math.fsum(weights[position] * corrected[position] for position in positions) / total_weight
+        aggregates[paper_id] = PaperScores(
+            count=n,
+            mean=mean,
+            median=_median(values),
+            variance=math.fsum((value - mean) ** 2 for value in values) / (n - 1) if n > 1 else 0.0,
+            min=min(values),
+            max=max(values),
+            weighted=math.fsum(weights[position] * scores[position] for position in positions) / total_weight,
+            calibrated=min(SCORE_MAX, max(SCORE_MIN, calibrated)),
+            z=math.fsum(z_scores[position] for position in positions) / n
+        )
+    return aggregates
+
+
+def score_conference(rows, strength: float = PRIOR_REVIEWS):
+    """(prior, {reviewer_id: ReviewerCalibration}, {paper_id: PaperScores}) of (paper_id, reviewer_id, score) rows"""
+    paper_ids, reviewer_ids, scores = columns(rows)
+    prior = conference_prior(scores)
+    calibration = calibrate_reviewers(reviewer_ids, scores, prior, strength)
+    return prior, calibration, aggregate_papers(paper_ids, reviewer_ids, scores, calibration, prior)
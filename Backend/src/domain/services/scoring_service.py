@@ -0,0 +1,432 @@
+# ============================================
+# File: Backend/src/domain/services/scoring_service.py
+# ============================================
+"""
+Scoring Service - materialized review scores of a conference
+
+Per-paper aggregates and reviewer calibration (domain.services.scoring_logic)
+are stored in paper_score_summaries and read from there; requests never
+recompute them.
+
+A review's score is Review.score, or Assignment.score when the review has
+none; deleted reviews and reviews of deleted, declined or cancelled
+assignments do not count.
+
+Kept current by mapper events: an inserted / updated / deleted Review, or an
+Assignment whose score, status or deletion changed, queues its paper and
+reviewer on the session. After the commit, in a session of its own:
+    - the papers queued, plus every other paper of the same reviewers in
+      the conference (their calibration moved), are recomputed
+    - the calibration uses all conference reviews of every reviewer of
+      those papers, the conference mean / spread one SQL aggregate
+So a review costs the ~quota papers of its reviewer, not the conference.
+Each summary keeps the conference mean / spread its bias was measured
+against; once the current one has drifted more than SCORE_PRIOR_DRIFT from
+any stored row, the whole conference is recomputed instead, so rankings
+never mix baselines. Rows are upserted: two workers refreshing the same
+paper both succeed.
+Bulk query.update() / Core statements bypass mapper events - call
+refresh_paper_scores() or refresh the conference after those.
+"""
+
+import json
+import time
+from datetime import datetime
+
+from sqlalchemy import event, func, inspect as sa_inspect, or_
+from sqlalchemy.orm import object_session
+
+from infrastructure.databases.base import SessionLocal
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.databases.routing import stick_to_primary
+from infrastructure.databases.upsert import upsert
+from infrastructure.models import Paper, Conference, Assignment, Review, User, PaperScoreSummary, AuditLogAI
+from domain.services.paper_file_service import INACTIVE_ASSIGNMENT_STATUSES
+from domain.services.scoring_logic import (
+    aggregate_papers, calibrate_reviewers, columns, conference_prior, score_conference
+)
+from domain.utils.auth_utils import get_role_names
+
+
+CONFERENCE_NOT_FOUND = "Conference not found"
+ACCESS_DENIED = "Only the conference chair or an admin can see review scores"
+
+PENDING_KEY = 'pending_score_updates'
+SCORE_SORTS = {
+    'calibrated': PaperScoreSummary.calibrated_score,
+    'mean': PaperScoreSummary.mean_score,
+    'weighted': PaperScoreSummary.weighted_score,
+    'median': PaperScoreSummary.median_score,
+    'variance': PaperScoreSummary.score_variance,
+    'z': PaperScoreSummary.z_score,
+}
+TRACKED_ASSIGNMENT_COLUMNS = ('score', 'status', 'is_deleted')
+SUMMARY_COLUMNS = (
+    'conference_id', 'review_count', 'mean_score', 'median_score', 'score_variance', 'min_score', 'max_score',
+    'weighted_score', 'calibrated_score', 'z_score', 'prior_mean', 'prior_std', 'updated_at'
+)
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+ID_CHUNK_SIZE = 900
+
+_registered = False
+
+
+def _strength() -> float:
+    from config import get_config
+    return get_config().SCORE_PRIOR_REVIEWS
+
+
+def _drift() -> float:
+    from config import get_config
+    return get_config().SCORE_PRIOR_DRIFT
+
+
+def _chunks(ids):
+    ids = list(ids)
+    for start in range(0, len(ids), ID_CHUNK_SIZE):
+        yield ids[start:start + ID_CHUNK_SIZE]
+
+
+def _score_column():
+    return func.coalesce(Review.score, Assignment.score)
+
+
+def _scored_reviews(db, conference_id: int):
+    """Query of (paper_id, reviewer_id, score) for every counted review of the conference"""
+    score = _score_column()
+    return db.query(Assignment.paper_id, Assignment.reviewer_id, score).outerjoin(
+        Review, Review.assignment_id == Assignment.id
+    ).filter(
+        Assignment.conference_id == conference_id,
+        or_(Assignment.is_deleted.is_(False), Assignment.is_deleted.is_(None)),
+        or_(Assignment.status.is_(None), Assignment.status.notin_(INACTIVE_ASSIGNMENT_STATUSES)),
+        or_(Review.id.is_(None), Review.is_deleted.is_(False)),
+        score.isnot(None)
+    )
+
+
+def _prior(db, conference_id: int):
+    score = _score_column()
+    count, total, squares = _scored_reviews(db, conference_id).with_entities(
+        func.count(score), func.sum(score), func.sum(score * score)
+    ).one()
+    return conference_prior(None, count=count or 0, total=float(total or 0), squares=float(squares or 0))
+
+
+def _drifted(db, conference_id: int, prior) -> bool:
+    """True when a stored summary was calibrated against a different conference mean / spread"""
+    drift = _drift()
+    return db.query(PaperScoreSummary.paper_id).filter(
+        PaperScoreSummary.conference_id == conference_id,
+        or_(
+            PaperScoreSummary.prior_mean.is_(None),
+            PaperScoreSummary.prior_std.is_(None),
+            func.abs(PaperScoreSummary.prior_mean - prior.mean) > drift,
+            func.abs(PaperScoreSummary.prior_std - prior.std) > drift,
+        )
+    ).first() is not None
+
+
+def _store(db, conference_id: int, paper_ids, aggregates: dict, prior):
+    """Upsert the summaries of `paper_ids` (papers without scored reviews lose theirs)"""
+    for chunk in _chunks([paper_id for paper_id in paper_ids if paper_id not in aggregates]):
+        db.query(PaperScoreSummary).filter(PaperScoreSummary.paper_id.in_(chunk)).delete(synchronize_session=False)
+    if aggregates:
+        now = datetime.utcnow()
+        db.execute(upsert(PaperScoreSummary, ['paper_id'], SUMMARY_COLUMNS), [
+            {
+                'paper_id': paper_id,
+                'conference_id': conference_id,
+                'review_count': scores.count,
+                'mean_score': scores.mean,
+                'median_score': scores.median,
+                'score_variance': scores.variance,
+                'min_score': scores.min,
+                'max_score': scores.max,
+                'weighted_score': scores.weighted,
+                'calibrated_score': scores.calibrated,
+                'z_score': scores.z,
+                'prior_mean': prior.mean,
+                'prior_std': prior.std,
+                'updated_at': now,
+            }
+            for paper_id, scores in aggregates.items()
+        ])
+
+
+def _refresh_conference(db, conference_id: int) -> dict:
+    """Recompute every summary of the conference; returns stats"""
+    started = time.perf_counter()
+    prior, calibration, aggregates = score_conference(_scored_reviews(db, conference_id), _strength())
+    paper_ids = [row.id for row in db.query(Paper.id).filter(Paper.conference_id == conference_id)]
+    _store(db, conference_id, paper_ids, aggregates, prior)
+    return {
+        'papers': len(aggregates),
+        'reviews': prior.count,
+        'reviewers': len(calibration),
+        'mean': round(prior.mean, 4),
+        'std': round(prior.std, 4),
+        'seconds': round(time.perf_counter() - started, 3),
+    }
+
+
+def refresh_paper_scores(paper_ids=(), reviewer_ids=(), db=None) -> int:
+    """
+    Recompute the summaries touched by changed reviews of `paper_ids` /
+    `reviewer_ids`; returns the papers recomputed. Runs in a session of its
+    own unless `db` is given.
+    """
+    own_session = db is None
+    if own_session:
+        db = SessionLocal()
+    try:
+        paper_ids, reviewer_ids = set(paper_ids), set(reviewer_ids)
+        conferences = {}
+        for chunk in _chunks(paper_ids):
+            for row in db.query(Paper.id, Paper.conference_id).filter(Paper.id.in_(chunk)):
+                conferences.setdefault(row.conference_id, set()).add(row.id)
+
+        refreshed = 0
+        strength = _strength()
+        for conference_id, papers in conferences.items():
+            if conference_id is None:
+                continue
+            prior = _prior(db, conference_id)
+            if _drifted(db, conference_id, prior):
+                # The other summaries' bias was measured against another mean
+                stats = _refresh_conference(db, conference_id)
+                print(f"📊 Conference {conference_id} scores re-based on mean {stats['mean']}: "
+                      f"{stats['papers']} summaries recomputed")
+                refreshed += stats['papers']
+                continue
+
+            reviews = _scored_reviews(db, conference_id)
+            # Papers whose calibration moved: every paper of the changed
+            # reviewers (all reviewers of the papers when none were named)
+            changed = reviewer_ids
+            if not changed:
+                changed = set()
+                for chunk in _chunks(papers):
+                    changed.update(row.reviewer_id for row in db.query(Assignment.reviewer_id).filter(
+                        Assignment.conference_id == conference_id,
+                        Assignment.paper_id.in_(chunk)
+                    ))
+            affected = set(papers)
+            for chunk in _chunks(changed):
+                affected.update(row.paper_id for row in reviews.filter(Assignment.reviewer_id.in_(chunk)))
+            # Every reviewer of those papers needs calibrating, from all their reviews
+            involved = set()
+            for chunk in _chunks(affected):
+                involved.update(row.reviewer_id for row in reviews.filter(Assignment.paper_id.in_(chunk)))
+            rows = []
+            for chunk in _chunks(involved):
+                rows.extend(reviews.filter(Assignment.reviewer_id.in_(chunk)))
+
+            paper_column, reviewer_column, scores = columns(rows)
+            calibration = calibrate_reviewers(reviewer_column, scores, prior, strength)
+            aggregates = aggregate_papers(paper_column, reviewer_column, scores, calibration, prior, only=affected)
+            _store(db, conference_id, affected, aggregates, prior)
+            refreshed += len(affected)
+        if own_session:
+            db.commit()
+        return refreshed
+    except Exception:
+        if own_session:
+            db.rollback()
+        raise
+    finally:
+        if own_session:
+            db.close()
+
+
+class ScoringService:
+
+    @staticmethod
+    def get_conference_scores(conference_id: int, current_user: dict, sort: str = 'calibrated',
+                              limit: int = DEFAULT_LIMIT, offset: int = 0):
+        """
+        Stored score summaries of the conference's papers, best first
+
+        Returns: ({'papers': [...], 'total', 'limit', 'offset', 'sort'}, None) or (None, error_message)
+        """
+        if sort not in SCORE_SORTS:
+            return None, f"sort must be one of: {', '.join(SCORE_SORTS)}"
+        limit = max(1, min(int(limit or DEFAULT_LIMIT), MAX_LIMIT))
+        offset = max(0, int(offset or 0))
+
+        user_id = current_user.get('user_id')
+        with session_scope(read_only=True, read_key=user_id) as db:
+            error = ScoringService._check_access(db, conference_id, current_user)
+            if error:
+                return None, error
+
+            summaries = db.query(PaperScoreSummary, Paper.title, Paper.status).join(
+                Paper, Paper.id == PaperScoreSummary.paper_id
+            ).filter(PaperScoreSummary.conference_id == conference_id)
+            total = summaries.count()
+            column = SCORE_SORTS[sort]
+            order = column.asc() if sort == 'variance' else column.desc()
+            papers = [
+                {
+                    'paper_id': summary.paper_id,
+                    'title': title,
+                    'status': status.value if hasattr(status, 'value') else status,
+                    'review_count': summary.review_count,
+                    'mean': round(summary.mean_score, 4),
+                    'median': round(summary.median_score, 4),
+                    'variance': round(summary.score_variance, 4),
+                    'min': summary.min_score,
+                    'max': summary.max_score,
+                    'weighted': round(summary.weighted_score, 4),
+                    'calibrated': round(summary.calibrated_score, 4),
+                    'z': round(summary.z_score, 4),
+                    'updated_at': summary.updated_at.isoformat() if summary.updated_at else None,
+                }
+                for summary, title, status in summaries.order_by(
+                    order, PaperScoreSummary.paper_id
+                ).offset(offset).limit(limit)
+            ]
+
+        return {
+            'papers': papers,
+            'total': total,
+            'limit': limit,
+            'offset': offset,
+            'sort': sort,
+        }, None
+
+    @staticmethod
+    def refresh_conference_scores(conference_id: int, current_user: dict):
+        """
+        Recompute every summary of the conference (after bulk imports /
+        Core updates that bypassed the mapper events)
+
+        Returns: ({'stats'}, None) or (None, error_message)
+        """
+        user_id = current_user.get('user_id')
+        with session_scope() as db:
+            error = ScoringService._check_access(db, conference_id, current_user)
+            if error:
+                return None, error
+            stats = _refresh_conference(db, conference_id)
+            AuditLogAI.enqueue(
+                db_session=db,
+                user_id=user_id,
+                action_type='scores_refreshed',
+                table_name='paper_score_summaries',
+                record_id=conference_id,
+                data=json.dumps(stats)
+            )
+            stick_to_primary(user_id, session=db)
+        return {'stats': stats}, None
+
+    @staticmethod
+    def get_reviewer_calibration(conference_id: int, current_user: dict):
+        """
+        Harshness of every reviewer of the conference: raw and shrunk mean /
+        spread, bias against the conference mean (negative = harsh)
+
+        Returns: ({'conference': {...}, 'reviewers': [...]}, None) or (None, error_message)
+        """
+        user_id = current_user.get('user_id')
+        with session_scope(read_only=True, read_key=user_id) as db:
+            error = ScoringService._check_access(db, conference_id, current_user)
+            if error:
+                return None, error
+            paper_column, reviewer_column, scores = columns(_scored_reviews(db, conference_id))
+            prior = conference_prior(scores)
+            calibration = calibrate_reviewers(reviewer_column, scores, prior, _strength())
+            names = {}
+            for chunk in _chunks(calibration):
+                names.update(db.query(User.id, User.full_name).filter(User.id.in_(chunk)))
+
+        return {
+            'conference': {'reviews': prior.count, 'mean': round(prior.mean, 4), 'std': round(prior.std, 4)},
+            'reviewers': sorted((
+                {
+                    'reviewer_id': reviewer_id,
+                    'full_name': names.get(reviewer_id),
+                    'reviews': reviewer.count,
+                    'mean': round(reviewer.mean, 4),
+                    'std': round(reviewer.std, 4),
+                    'bias': round(reviewer.bias(prior), 4),
+                    'weight': round(reviewer.weight(prior), 4),
+                }
+                for reviewer_id, reviewer in calibration.items()
+            ), key=lambda item: item['bias']),
+        }, None
+
+    @staticmethod
+    def _check_access(db, conference_id: int, current_user: dict):
+        """None when the user may see the conference's scores, else the error"""
+        conference = db.query(Conference.chair_id).filter(
+            Conference.id == conference_id,
+            Conference.is_deleted == False
+        ).first()
+        if conference is None:
+            return CONFERENCE_NOT_FOUND
+        if 'Admin' not in get_role_names(current_user) and conference.chair_id != current_user.get('user_id'):
+            return ACCESS_DENIED
+        return None
+
+
+# ---------- Mapper / session events ----------
+
+def _queue(target, paper_id, assignment_id=None, reviewer_id=None):
+    session = object_session(target)
+    if session is not None:
+        pending = session.info.setdefault(PENDING_KEY, {'papers': set(), 'assignments': set(), 'reviewers': set()})
+        pending['papers'].add(paper_id)
+        if assignment_id is not None:
+            pending['assignments'].add(assignment_id)
+        if reviewer_id is not None:
+            pending['reviewers'].add(reviewer_id)
+
+
+def _review_changed(mapper, connection, review):
+    _queue(review, review.paper_id, assignment_id=review.assignment_id)
+
+
+def _assignment_updated(mapper, connection, assignment):
+    state = sa_inspect(assignment)
+    if any(state.attrs[column].history.has_changes() for column in TRACKED_ASSIGNMENT_COLUMNS):
+        _queue(assignment, assignment.paper_id, reviewer_id=assignment.reviewer_id)
+
+
+@event.listens_for(SessionLocal, 'after_commit')
+def _refresh_after_commit(session):
+    pending = session.info.pop(PENDING_KEY, None)
+    if not pending:
+        return
+    try:
+        reviewer_ids = set(pending['reviewers'])
+        if pending['assignments']:
+            db = SessionLocal()
+            try:
+                reviewer_ids.update(row.reviewer_id for row in db.query(Assignment.reviewer_id).filter(
+                    Assignment.id.in_(pending['assignments'])
+                ))
+            finally:
+                db.close()
+        refresh_paper_scores(pending['papers'], reviewer_ids)
+    except Exception as e:
+        # The review is committed - a stale summary must not fail the request
+        print(f"⚠️  Score summary refresh failed: {e}")
+
+
+@event.listens_for(SessionLocal, 'after_rollback')
+def _forget_pending_scores(session):
+    session.info.pop(PENDING_KEY, None)
+
+
+def register_score_tracking():
+    """Attach the Review / Assignment mapper events (idempotent)"""
+    global _registered
+    if _registered:
+        return
+    event.listen(Review, 'after_insert', _review_changed)
+    event.listen(Review, 'after_update', _review_changed)
+    event.listen(Review, 'after_delete', _review_changed)
+    event.listen(Assignment, 'after_update', _assignment_updated)
+    _registered = True
@@ -0,0 +1,450 @@
+# ============================================
+# File: Backend/src/domain/services/submission_upload_service.py
+# ============================================
+"""
+Submission Upload Service - resumable uploads that end in a Paper
+
+Flow:
+    1. start_upload()    validates the paper metadata (conference open, track
+                         belongs to it / caller may upload the camera-ready)
+                         before any byte is sent
+    2. append_chunk()    PUT bytes at the current offset (repeat, resume)
+    3. get_progress()    how many bytes the server has
+    4. finalize()        blob into the store + Paper row (submission) or
+                         Paper.camera_ready_path (camera-ready)
+
+The submission deadline is checked against the time the upload STARTED, so
+an upload begun before the deadline on a slow link is not lost to it - but
+every chunk and the finalize must still arrive within
+UPLOAD_DEADLINE_GRACE_MINUTES of the deadline, or a session opened just
+before it would accept new bytes for as long as it lives.
+
+One-request submissions (submit()) - the deadline-hour path:
+    1. claim the Idempotency-Key (own short transaction, committed at once)
+       and pre-check the metadata against the time the request was RECEIVED
+    2. stream the PDF into the blob store - no DB connection is held
+    3. one short transaction: Paper + PaperAuthor rows + the key's stored
+       outcome. A retry with the same key gets that outcome back instead of
+       a second Paper.
+
+Storage errors (UploadSessionNotFoundError, UploadOffsetMismatchError,
+UploadIncompleteError, FileTooLargeError, InvalidFileError) are raised to the
+API layer, which maps them to HTTP statuses.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+from infrastructure.databases.unit_of_work import session_scope, separate_transaction
+from infrastructure.databases.routing import stick_to_primary
+from infrastructure.models import Paper, PaperStatus, PaperAuthor, Conference, Track, AuditLogAI, User
+from infrastructure.services.file_storage_service import get_file_storage
+from infrastructure.services.idempotency_store import (
+    get_idempotency_store,
+    request_fingerprint,
+    IdempotencyClaimLostError,
+    IdempotencyInProgressError,
+)
+from infrastructure.services.upload_session_store import get_upload_session_store
+
+
+PURPOSE_SUBMISSION = 'submission'
+PURPOSE_CAMERA_READY = 'camera_ready'
+
+CAMERA_READY_STATUSES = (PaperStatus.ACCEPTED, PaperStatus.CAMERA_READY)
+
+IDEMPOTENCY_SCOPE_SUBMISSION = 'submission'
+SUBMISSION_FIELDS = ('conference_id', 'track_id', 'title', 'abstract', 'keywords')
+MAX_AUTHORS = 50
+
+DEADLINE_PASSED = "Submission deadline has passed"
+UPLOAD_WINDOW_CLOSED = "Submission deadline has passed - the upload was not finished in time"
+
+
+def _upload_grace() -> timedelta:
+    from config import get_config
+    return timedelta(minutes=get_config().UPLOAD_DEADLINE_GRACE_MINUTES)
+
+
+def _paper_dict(paper: Paper) -> dict:
+    return {
+        'id': paper.id,
+        'title': paper.title,
+        'status': paper.status.value if paper.status else None,
+        'conference_id': paper.conference_id,
+        'track_id': paper.track_id,
+        'has_camera_ready': bool(paper.camera_ready_path),
+        'created_at': paper.created_at.isoformat() if paper.created_at else None,
+    }
+
+
+def _normalize_authors(user_id: int, authors):
+    """
+    (author list, error) - every entry {user_id, affiliation, is_corresponding},
+    in order; the submitter is author 1 unless listed elsewhere, and the
+    corresponding author when nobody else is marked
+    """
+    if authors is None:
+        authors = []
+    if not isinstance(authors, list):
+        return None, "authors must be a list"
+    if len(authors) > MAX_AUTHORS:
+        return None, f"At most {MAX_AUTHORS} authors"
+
+    normalized, seen = [], set()
+    for entry in authors:
+        if not isinstance(entry, dict):
+            return None, "Each author must be an object with user_id"
+        try:
+            author_id = int(entry.get('user_id'))
+        except (TypeError, ValueError):
+            return None, "Each author needs an integer user_id"
+        if author_id in seen:
+            return None, f"Author {author_id} is listed twice"
+        seen.add(author_id)
+        normalized.append({
+            'user_id': author_id,
+            'affiliation': (entry.get('affiliation') or None),
+            'is_corresponding': bool(entry.get('is_corresponding')),
+        })
+
+    if user_id not in seen:
+        normalized.insert(0, {'user_id': user_id, 'affiliation': None, 'is_corresponding': False})
+    if not any(author['is_corresponding'] for author in normalized):
+        for author in normalized:
+            if author['user_id'] == user_id:
+                author['is_corresponding'] = True
+    return normalized, None
+
+
+def _add_paper(db, user_id: int, metadata: dict, pdf_key: str, authors: list = None) -> Paper:
+    """Paper + its PaperAuthor rows in db (flushed, not committed)"""
+    paper = Paper(
+        title=metadata['title'],
+        abstract=metadata['abstract'],
+        keywords=metadata.get('keywords'),
+        pdf_path=pdf_key,
+        status=PaperStatus.SUBMITTED,
+        submitter_id=user_id,
+        conference_id=metadata['conference_id'],
+        track_id=metadata.get('track_id')
+    )
+    db.add(paper)
+    db.flush()
+    if authors is None:
+        authors = [{'user_id': user_id, 'affiliation': None, 'is_corresponding': True}]
+    db.add_all([
+        PaperAuthor(
+            paper_id=paper.id,
+            user_id=author['user_id'],
+            author_order=order,
+            is_corresponding=author['is_corresponding'],
+            affiliation=author['affiliation']
+        )
+        for order, author in enumerate(authors, start=1)
+    ])
+    return paper
+
+
+class SubmissionUploadService:
+
+    @staticmethod
+    def start_upload(user_id: int, purpose: str, total_size: int, metadata: dict):
+        """
+        Open an upload session
+
+        Args:
+            purpose: 'submission' -> metadata: conference_id, track_id?, title, abstract, keywords?
+                     'camera_ready' -> metadata: paper_id
+
+        Returns: (session_dict, None) or (None, error_message)
+        """
+        if purpose == PURPOSE_SUBMISSION:
+            error = SubmissionUploadService._check_submission(metadata, datetime.utcnow())
+        elif purpose == PURPOSE_CAMERA_READY:
+            error = SubmissionUploadService._check_camera_ready(user_id, metadata.get('paper_id'))
+        else:
+            error = f"Invalid upload purpose: {purpose}"
+
+        if error:
+            return None, error
+
+        store = get_upload_session_store()
+        session = store.create(user_id, purpose, total_size, metadata)
+        result = session.to_dict()
+        result['chunk_size'] = store.storage.chunk_size
+        return result, None
+
+    @staticmethod
+    def append_chunk(upload_id: str, user_id: int, offset: int, stream, length: int = None):
+        """Returns: (progress_dict, None) or (None, error_message)"""
+        store = get_upload_session_store()
+        session = store.get(upload_id, user_id)
+        if session.purpose == PURPOSE_SUBMISSION:
+            error = SubmissionUploadService._check_upload_window(session.metadata, datetime.utcnow())
+            if error:
+                return None, error
+        session = store.append(upload_id, user_id, offset, stream, length)
+        return session.to_dict(), None
+
+    @staticmethod
+    def get_progress(upload_id: str, user_id: int):
+        """Returns: (progress_dict, None)"""
+        return get_upload_session_store().get(upload_id, user_id).to_dict(), None
+
+    @staticmethod
+    def cancel(upload_id: str, user_id: int):
+        """Returns: (True, None)"""
+        get_upload_session_store().discard(upload_id, user_id)
+        return True, None
+
+    @staticmethod
+    def finalize(upload_id: str, user_id: int, sha256: str = None):
+        """
+        Turn a complete upload into a Paper (or its camera-ready file)
+
+        Args:
+            sha256: hex digest of the whole file, if the client computed one
+
+        Returns: (paper_dict, None) or (None, error_message)
+        """
+        store = get_upload_session_store()
+        session = store.get(upload_id, user_id)
+        metadata = session.metadata
+
+        with session_scope() as db:
+            try:
+                if session.purpose == PURPOSE_SUBMISSION:
+                    started_at = datetime.utcfromtimestamp(session.created_at)
+                    error = SubmissionUploadService._check_submission(
+                        metadata, started_at, read_only=False, finished_at=datetime.utcnow()
+                    )
+                    if error:
+                        return None, error
+
+                    stored = store.finalize(upload_id, user_id, db_session=db, sha256=sha256)
+                    paper = _add_paper(db, user_id, metadata, stored.key)
+                    action_type = 'paper_submitted'
+                else:
+                    paper_id = metadata.get('paper_id')
+                    error = SubmissionUploadService._check_camera_ready(user_id, paper_id, read_only=False)
+                    if error:
+                        return None, error
+
+                    stored = store.finalize(upload_id, user_id, db_session=db, sha256=sha256)
+                    paper = db.query(Paper).filter(Paper.id == paper_id).first()
+                    paper.camera_ready_path = stored.key
+                    paper.status = PaperStatus.CAMERA_READY
+                    action_type = 'camera_ready_uploaded'
+
+                db.flush()
+                stick_to_primary(user_id, session=db)
+
+                AuditLogAI.enqueue(
+                    db_session=db,
+                    user_id=user_id,
+                    action_type=action_type,
+                    table_name='papers',
+                    record_id=paper.id,
+                    data=json.dumps({
+                        "sha256": stored.sha256,
+                        "size": stored.size,
+                        "deduplicated": stored.deduplicated
+                    })
+                )
+
+                if session.purpose == PURPOSE_CAMERA_READY:
+                    # Cached download targets still point at the previous blob
+                    from domain.services.paper_file_service import PaperFileService
+                    PaperFileService.forget_access()
+
+                return _paper_dict(paper), None
+
+            except Exception:
+                db.rollback()
+                raise
+
+    @staticmethod
+    def submit(user_id: int, metadata: dict, file_stream, received_at: datetime,
+               idempotency_key: str = None):
+        """
+        Create a Paper from metadata + PDF in one request
+
+        Args:
+            metadata: conference_id, track_id?, title, abstract, keywords?,
+                      authors? ([{user_id, affiliation?, is_corresponding?}])
+            file_stream: the PDF (anything with read(n))
+            received_at: when the request arrived - the deadline is checked against it
+            idempotency_key: Idempotency-Key header; a retry with the same key
+                             gets the first outcome instead of a new Paper, and
+                             keeps the first attempt's receipt time if that
+                             attempt had stored the same PDF
+
+        Returns: ({'paper': {...}, 'replayed': bool}, None) or (None, error_message)
+        Raises: IdempotencyInProgressError, IdempotencyKeyReusedError,
+                FileTooLargeError, InvalidFileError
+        """
+        fields = {key: metadata.get(key) for key in SUBMISSION_FIELDS if metadata.get(key) is not None}
+        authors, error = _normalize_authors(user_id, metadata.get('authors'))
+        if error:
+            return None, error  # malformed request: nothing recorded, nothing to replay
+
+        claim = None
+        request_received_at = received_at
+        if idempotency_key:
+            store = get_idempotency_store()
+            claim = store.claim(
+                user_id, IDEMPOTENCY_SCOPE_SUBMISSION, idempotency_key,
+                request_fingerprint({'fields': fields, 'authors': authors}),
+                received_at
+            )
+            if claim.replayed:
+                if claim.error:
+                    return None, claim.error
+                return {**claim.result, 'replayed': True}, None
+            received_at = claim.received_at
+
+        try:
+            # Cheap checks before any byte is stored (replica reads, own short transaction)
+            with separate_transaction():
+                error = (SubmissionUploadService._check_submission(fields, received_at)
+                         or SubmissionUploadService._check_authors(authors))
+            if error:
+                if claim:
+                    with separate_transaction() as db:
+                        store.complete(db, claim, error=error)
+                return None, error
+
+            stored = get_file_storage().save_stream(file_stream, require_pdf=True)
+            if claim:
+                if claim.blob_sha256 is not None and stored.sha256 != claim.blob_sha256:
+                    # Not the file the earlier attempt had in before the deadline
+                    received_at = request_received_at
+                store.record_blob(claim, stored.sha256, received_at)
+
+            with separate_transaction() as db:
+                # Re-checked in the writing transaction (the deadline may have been moved)
+                error = SubmissionUploadService._check_submission(fields, received_at, read_only=False)
+                if error:
+                    if claim:
+                        store.complete(db, claim, error=error)
+                    return None, error
+
+                paper = _add_paper(db, user_id, fields, stored.key, authors)
+                db.flush()
+                result = {'paper': _paper_dict(paper)}
+                if claim:
+                    store.complete(db, claim, result=result, paper_id=paper.id)
+                stick_to_primary(user_id, session=db)
+
+                AuditLogAI.enqueue(
+                    db_session=db,
+                    user_id=user_id,
+                    action_type='paper_submitted',
+                    table_name='papers',
+                    record_id=paper.id,
+                    data=json.dumps({
+                        "sha256": stored.sha256,
+                        "size": stored.size,
+                        "deduplicated": stored.deduplicated,
+                        "authors": len(authors),
+                        "received_at": received_at.isoformat()
+                    })
+                )
+            return {**result, 'replayed': False}, None
+
+        except IdempotencyClaimLostError:
+            # Our claim went stale and a retry took it over: that attempt owns the
+            # outcome, the client gets it by retrying once more
+            raise IdempotencyInProgressError()
+        except Exception:
+            if claim:
+                store.release(claim)
+            raise
+
+    # ---------- Checks ----------
+
+    @staticmethod
+    def _check_authors(authors: list):
+        """Error message, or None when every listed author is an active user"""
+        author_ids = [author['user_id'] for author in authors]
+        with session_scope(read_only=True) as db:
+            found = {
+                row.id for row in db.query(User.id).filter(
+                    User.id.in_(author_ids),
+                    User.is_deleted == False
+                ).all()
+            }
+        missing = [author_id for author_id in author_ids if author_id not in found]
+        if missing:
+            return f"Unknown author user_id: {missing[0]}"
+        return None
+
+    @staticmethod
+    def _check_submission(metadata: dict, at: datetime, read_only: bool = True, finished_at: datetime = None):
+        """
+        Error message, or None when a submission with this metadata is allowed
+        at `at`; an upload started then must also be `finished_at` by the
+        deadline + UPLOAD_DEADLINE_GRACE_MINUTES
+        """
+        for key in ('conference_id', 'title', 'abstract'):
+            if not metadata.get(key):
+                return f"Missing field: {key}"
+
+        with session_scope(read_only=read_only) as db:
+            conference = db.query(
+                Conference.submission_deadline, Conference.is_deleted
+            ).filter(Conference.id == metadata['conference_id']).first()
+
+            if conference is None or conference.is_deleted:
+                return "Conference not found"
+            if at > conference.submission_deadline:
+                return DEADLINE_PASSED
+            if finished_at is not None and finished_at > conference.submission_deadline + _upload_grace():
+                return UPLOAD_WINDOW_CLOSED
+
+            track_id = metadata.get('track_id')
+            if track_id is not None:
+                track = db.query(Track.id).filter(
+                    Track.id == track_id,
+                    Track.conference_id == metadata['conference_id'],
+                    Track.is_deleted == False
+                ).first()
+                if track is None:
+                    return "Track not found in this conference"
+        return None
+
+    @staticmethod
+    def _check_upload_window(metadata: dict, now: datetime):
+        """Error message, or None while a submission upload may still receive bytes"""
+        with session_scope(read_only=True) as db:
+            deadline = db.query(Conference.submission_deadline).filter(
+                Conference.id == metadata.get('conference_id')
+            ).scalar()
+        if deadline is not None and now > deadline + _upload_grace():
+            return UPLOAD_WINDOW_CLOSED
+        return None
+
+    @staticmethod
+    def _check_camera_ready(user_id: int, paper_id, read_only: bool = True):
+        """Error message, or None when user_id may upload the camera-ready of paper_id"""
+        if not paper_id:
+            return "Missing field: paper_id"
+
+        with session_scope(read_only=read_only) as db:
+            paper = db.query(
+                Paper.submitter_id, Paper.status, Paper.is_withdrawn
+            ).filter(Paper.id == paper_id).first()
+
+            if paper is None:
+                return "Paper not found"
+
+            is_author = paper.submitter_id == user_id or db.query(PaperAuthor.id).filter(
+                PaperAuthor.paper_id == paper_id,
+                PaperAuthor.user_id == user_id
+            ).first() is not None
+            if not is_author:
+                return "Only the paper's authors can upload the camera-ready version"
+            if paper.is_withdrawn or paper.status not in CAMERA_READY_STATUSES:
+                return "Camera-ready upload is only open for accepted papers"
+        return None
@@ -6,17 +6,51 @@ Authentication Utilities
 """
 
 import bcrypt
+import hashlib
 import jwt
 from datetime import datetime, timedelta
 from functools import wraps
 from flask import request, jsonify
 from config import get_config
+from domain.utils.key_ring import KeyRing
+from infrastructure.cache import TTLCache
 
-config = get_config()
+# Built on first use - importing this module reads no config
+_config = None
+_key_ring = None
+_token_cache = None
 
 
-def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+def get_auth_config():
+    global _config
+    if _config is None:
+        _config = get_config()
+    return _config
+
+
+def get_key_ring() -> KeyRing:
+    global _key_ring
+    if _key_ring is None:
+        _key_ring = KeyRing.from_config(get_auth_config())
+    return _key_ring
+
+
+def get_token_cache() -> TTLCache:
+    """Verified payloads keyed by sha256(token); entries never outlive the token's exp"""
+    global _token_cache
+    if _token_cache is None:
+        config = get_auth_config()
+        _token_cache = TTLCache(
+            max_size=config.TOKEN_CACHE_SIZE,
+            ttl=config.TOKEN_CACHE_TTL,
+            name='verified_tokens'
+        )
+    return _token_cache
+
+
+def hash_password(password: str, rounds: int = None) -> str:
+    rounds = rounds or get_auth_config().BCRYPT_ROUNDS
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
 
 
 def verify_password(password: str, hashed: str) -> bool:
@@ -30,17 +64,68 @@ def generate_token(user_id: int, role: str, expires_in_hours: int = 24) -> str:
         'exp': datetime.utcnow() + timedelta(hours=expires_in_hours),
         'iat': datetime.utcnow()
     }
-    return jwt.encode(payload, config.JWT_SECRET_KEY, algorithm='HS256')
+    key_ring = get_key_ring()
+    return jwt.encode(
+        payload,
+        key_ring.current_secret,
+        algorithm='HS256',
+        headers={'kid': key_ring.current_kid}
+    )
+
+
+def verify_token(token: str):
+    """
+    Full HMAC verification against the key ring (no cache)
+    Returns: (payload, kid)
+    """
+    key_ring = get_key_ring()
+    kid = jwt.get_unverified_header(token).get('kid')
+
+    if kid is not None:
+        secret = key_ring.get(kid)
+        if secret is None:
+            raise jwt.InvalidTokenError(f"Unknown signing key: {kid}")
+        return jwt.decode(token, secret, algorithms=['HS256']), kid
+
+    # Legacy tokens issued before 'kid' headers existed
+    for candidate_kid, secret in key_ring.candidates():
+        try:
+            return jwt.decode(token, secret, algorithms=['HS256']), candidate_kid
+        except jwt.InvalidSignatureError:
+            continue
+    raise jwt.InvalidSignatureError("Signature verification failed")
 
 
 def decode_token(token: str) -> dict:
+    token_cache = get_token_cache()
+    cache_key = hashlib.sha256(token.encode('utf-8')).digest()
+
+    cached = token_cache.get(cache_key)
+    if cached is not None:
+        payload, kid = cached
+        # Key removed from the ring -> do not trust the cached result anymore
+        if kid in get_key_ring():
+            return dict(payload)
+        token_cache.delete(cache_key)
+
     try:
-        return jwt.decode(token, config.JWT_SECRET_KEY, algorithms=['HS256'])
+        payload, kid = verify_token(token)
     except jwt.ExpiredSignatureError:
         raise ValueError("Token has expired")
     except jwt.InvalidTokenError:
         raise ValueError("Invalid token")
 
+    token_cache.set(cache_key, (payload, kid), expires_at=payload.get('exp'))
+    return dict(payload)
+
+
+def get_role_names(payload: dict) -> set:
+    """Role names in a token payload ('role' is a list of names, a single name, or role dicts)"""
+    roles = payload.get('role') or []
+    if isinstance(roles, str):
+        roles = [roles]
+    return {role.get('name') if isinstance(role, dict) else str(role) for role in roles}
+
 
 def require_auth(f):
     @wraps(f)
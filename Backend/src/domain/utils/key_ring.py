@@ -0,0 +1,52 @@
+# ============================================
+# File: Backend/src/domain/utils/key_ring.py
+# ============================================
+"""
+JWT Key Ring - rotate JWT_SECRET_KEY without logging everyone out
+"""
+
+
+class KeyRing:
+    """
+    Signing keys indexed by 'kid'
+
+    New tokens are always signed with the current key. Tokens signed with a
+    previous key stay valid until they expire or the key is removed from
+    JWT_PREVIOUS_KEYS.
+    """
+
+    def __init__(self, current_kid: str, current_secret: str, previous: dict = None):
+        self.current_kid = current_kid
+        self._keys = dict(previous or {})
+        self._keys[current_kid] = current_secret
+
+    @classmethod
+    def from_config(cls, config):
+        """Build from JWT_KEY_ID / JWT_SECRET_KEY / JWT_PREVIOUS_KEYS"""
+        previous = {}
+        for item in (config.JWT_PREVIOUS_KEYS or '').split(','):
+            item = item.strip()
+            if not item:
+                continue
+            kid, sep, secret = item.partition(':')
+            if not sep or not kid or not secret:
+                raise ValueError(f"Invalid JWT_PREVIOUS_KEYS entry: '{kid}' (expected kid:secret)")
+            previous[kid] = secret
+        return cls(config.JWT_KEY_ID, config.JWT_SECRET_KEY, previous)
+
+    @property
+    def current_secret(self) -> str:
+        return self._keys[self.current_kid]
+
+    def get(self, kid: str):
+        return self._keys.get(kid)
+
+    def __contains__(self, kid) -> bool:
+        return kid in self._keys
+
+    def candidates(self):
+        """(kid, secret) pairs to try for legacy tokens without a 'kid' header"""
+        yield self.current_kid, self.current_secret
+        for kid, secret in self._keys.items():
+            if kid != self.current_kid:
+                yield kid, secret
@@ -0,0 +1,10 @@
+# File: src/infrastructure/cache/__init__.py
+"""
+In-process cache exports
+"""
+
+from .memory_cache import TTLCache
+
+__all__ = [
+    'TTLCache',
+]
@@ -0,0 +1,60 @@
+# ============================================
+# File: Backend/src/infrastructure/cache/profile_cache.py
+# ============================================
+"""
+Read-through cache of serialized user profiles (GET /auth/me)
+
+Entries are dropped when a role is assigned / revoked or the profile is
+edited. When the change happens inside a session, the entry is dropped again
+after that session commits, so a concurrent reader cannot re-cache the
+pre-commit row.
+"""
+
+import threading
+
+from sqlalchemy import event
+
+from infrastructure.cache.memory_cache import TTLCache
+from infrastructure.databases.base import SessionLocal
+
+
+PENDING_KEY = 'invalidate_user_profiles'
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_profile_cache() -> TTLCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from config import get_config
+                current_config = get_config()
+                _cache = TTLCache(
+                    max_size=current_config.PROFILE_CACHE_SIZE,
+                    ttl=current_config.PROFILE_CACHE_TTL,
+                    name='user_profiles'
+                )
+    return _cache
+
+
+def invalidate_user_profile(user_id: int, session=None):
+    """Drop the cached profile now and, with a session, again after commit"""
+    get_profile_cache().delete(user_id)
+    if session is not None:
+        session.info.setdefault(PENDING_KEY, set()).add(user_id)
+
+
+@event.listens_for(SessionLocal, 'after_commit')
+def _invalidate_after_commit(session):
+    user_ids = session.info.pop(PENDING_KEY, None)
+    if user_ids:
+        cache = get_profile_cache()
+        for user_id in user_ids:
+            cache.delete(user_id)
+
+
+@event.listens_for(SessionLocal, 'after_rollback')
+def _forget_pending_invalidations(session):
+    session.info.pop(PENDING_KEY, None)
@@ -5,15 +5,31 @@
 Database package exports
 """
 
-from .base import Base, engine, SessionLocal, get_db, init_db, drop_db, check_connection
+from .base import Base, get_engine, SessionLocal, get_db, init_db, drop_db, check_connection, ensure_columns, ensure_indexes
+from .unit_of_work import get_session, session_scope, separate_transaction, transactional
+from .upsert import insert_ignore, upsert
 
 __all__ = [
     'Base',
-    'engine',
+    'get_engine',
     'SessionLocal',
     'get_db',
     'init_db',
     'drop_db',
-    'check_connection'
+    'check_connection',
+    'ensure_columns',
+    'ensure_indexes',
+    'get_session',
+    'session_scope',
+    'separate_transaction',
+    'transactional',
+    'insert_ignore',
+    'upsert'
 ]
 
+
+def __getattr__(name):
+    # `engine` is created lazily - see base.get_engine()
+    if name == 'engine':
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
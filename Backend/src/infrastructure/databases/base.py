@@ -1,6 +1,10 @@
 """
 Backend/src/infrastructure/databases/base.py
 Database Base và Engine - Multi-database support
+
+Importing this module does no DB / network work: the engine is created on
+first use by get_engine(), and disposed in forked children so a prefork
+WSGI server never shares the master's connections with its workers.
 """
 
 from sqlalchemy import create_engine, text, inspect
@@ -8,52 +12,125 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from config import get_config
 import os
+import threading
+
+_config = None
+_engine = None
+_replica_engines = None
+_engine_lock = threading.Lock()
+
+
+def _get_config():
+    """Current configuration, read on first use"""
+    global _config
+    if _config is None:
+        _config = get_config()
+    return _config
+
+
+def _db_type():
+    return _get_config().DB_TYPE.lower()
+
+
+def _safe_url(url=None):
+    """Database URL with the password masked for logs"""
+    current_config = _get_config()
+    url = url or current_config.DATABASE_URL
+    if getattr(current_config, 'DB_PASSWORD', None):
+        url = url.replace(current_config.DB_PASSWORD, '***')
+    return url
+
+
+def _create_engine(url=None, name='primary'):
+    from infrastructure.monitoring.db_instrumentation import InstrumentedQueuePool, instrument_engine
+
+    current_config = _get_config()
+    url = url or current_config.DATABASE_URL
+
+    print(f"🔗 Connecting to {name}: {_safe_url(url)}")
+
+    # Engine options
+    engine_options = {'echo': current_config.DB_ECHO}
+
+    if url.startswith('sqlite'):
+        print("📝 SQLite mode: single connection")
+        engine_options.update({'connect_args': {'check_same_thread': False}})
+    else:
+        print(f"🏊 Connection pool: size={current_config.DB_POOL_SIZE}")
+        engine_options.update({
+            'poolclass': InstrumentedQueuePool,  # records checkout wait time
+            'pool_pre_ping': True,
+            'pool_size': current_config.DB_POOL_SIZE,
+            'max_overflow': current_config.DB_POOL_SIZE * 2,
+            'pool_recycle': current_config.DB_POOL_RECYCLE,
+        })
+
+    try:
+        new_engine = create_engine(url, **engine_options)
+        instrument_engine(
+            new_engine,
+            slow_query_threshold_ms=current_config.SLOW_QUERY_THRESHOLD_MS,
+            name=name
+        )
+        print(f"✅ Database engine created ({name})")
+        return new_engine
+    except Exception as e:
+        print(f"❌ Failed to create engine: {e}")
+        raise
+
+
+def get_engine():
+    """Create the primary engine on first use (thread-safe)"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = _create_engine()
+    return _engine
+
+
+def get_replica_engines():
+    """Read-replica engines from DB_REPLICA_URLS (empty list = no replicas)"""
+    global _replica_engines
+    if _replica_engines is None:
+        with _engine_lock:
+            if _replica_engines is None:
+                _replica_engines = [
+                    _create_engine(url, name=f'replica{index}')
+                    for index, url in enumerate(_get_config().DB_REPLICA_URL_LIST, start=1)
+                ]
+    return _replica_engines
+
+
+def _dispose_after_fork():
+    """
+    Runs in every forked child: drop pooled connections inherited from the
+    parent without closing them (the parent still owns the sockets).
+    """
+    for inherited in [_engine] + list(_replica_engines or []):
+        if inherited is not None:
+            inherited.dispose(close=False)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_dispose_after_fork)
+
+
+def __getattr__(name):
+    # Backward compatible `from infrastructure.databases.base import engine`
+    if name == 'engine':
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Get current configuration
-current_config = get_config()
-DATABASE_URL = current_config.DATABASE_URL
-DB_TYPE = current_config.DB_TYPE.lower()
-
-# Mask password in logs
-safe_url = DATABASE_URL
-if hasattr(current_config, 'DB_PASSWORD') and current_config.DB_PASSWORD:
-    safe_url = DATABASE_URL.replace(current_config.DB_PASSWORD, '***')
-
-print(f"🔗 Connecting to {DB_TYPE.upper()}: {safe_url}")
-
-# Engine options
-engine_options = {'echo': current_config.DB_ECHO}
-
-if DB_TYPE == 'sqlite':
-    print("📝 SQLite mode: single connection")
-    engine_options.update({'connect_args': {'check_same_thread': False}})
-else:
-    print(f"🏊 Connection pool: size={current_config.DB_POOL_SIZE}")
-    engine_options.update({
-        'pool_pre_ping': True,
-        'pool_size': current_config.DB_POOL_SIZE,
-        'max_overflow': current_config.DB_POOL_SIZE * 2,
-        'pool_recycle': current_config.DB_POOL_RECYCLE,
-    })
-
-# Create engine
-try:
-    engine = create_engine(DATABASE_URL, **engine_options)
-    print("✅ Database engine created")
-except Exception as e:
-    print(f"❌ Failed to create engine: {e}")
-    raise
 
 # ✅ CRITICAL: Create Base ONCE and only once
-# Check if Base already exists to prevent recreation
-if 'Base' not in globals():
-    Base = declarative_base()
-    print("🔨 Created new Base instance")
-else:
-    print("♻️  Reusing existing Base instance")
+Base = declarative_base()
+
+
+# Session factory - reads may go to replicas, writes always hit the primary
+from infrastructure.databases.routing import RoutingSession
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False)
 
 
 def get_db():
@@ -67,11 +144,14 @@ def get_db():
 
 def init_db():
     """Initialize database - create all tables"""
+    DB_TYPE = _db_type()
+    engine = get_engine()
     try:
         print("📦 Importing all models...")
         
         # ✅ Import directly from each model file
         from infrastructure.models.user_model import User
+        from infrastructure.models.role_model import Role, UserRole
         from infrastructure.models.umcauthres_model import UMCAuthRES
         from infrastructure.models.conference_model import Conference
         from infrastructure.models.conference_mentor_model import ConferenceMentor
@@ -83,6 +163,7 @@ def init_db():
         from infrastructure.models.brow_history_model import BrowHistory
         from infrastructure.models.decision_model import Decision
         from infrastructure.models.conflict_of_interest_model import ConflictOfInterest
+        from infrastructure.models.paper_score_summary_model import PaperScoreSummary
         from infrastructure.models.audit_log_ai_model import AuditLogAI
         
         # ✅ Debug: Check Base identity
@@ -110,6 +191,10 @@ def init_db():
         print(f"\n📋 Creating {tables_count} tables in {DB_TYPE.upper()}...")
         Base.metadata.create_all(bind=engine)
         
+        # create_all skips tables that already exist - add columns / indexes declared later
+        ensure_columns(engine)
+        ensure_indexes(engine)
+        
         # Verify in database
         inspector = inspect(engine)
         db_tables = inspector.get_table_names()
@@ -129,6 +214,62 @@ def init_db():
         traceback.print_exc()
         return False
 
+def ensure_columns(engine=None):
+    """Add nullable columns declared in Base.metadata that an existing table lacks"""
+    engine = engine or get_engine()
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    added = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {column['name'] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+            column_type = column.type.compile(dialect=engine.dialect)
+            with engine.begin() as conn:
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+            added.append(f"{table.name}.{column.name}")
+    if added:
+        print(f"🧱 Added columns: {', '.join(added)}")
+    return added
+
+def ensure_indexes(engine=None):
+    """Create every index in Base.metadata that the database does not have yet"""
+    engine = engine or get_engine()
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    created = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                if index.unique:
+                    _drop_duplicates(engine, table, index)
+                index.create(bind=engine)
+                created.append(index.name)
+    if created:
+        print(f"🗂️  Created indexes: {', '.join(created)}")
+    return created
+
+def _drop_duplicates(engine, table, index):
+    """Keep the oldest row of each group a new unique index would reject (NULL keys never collide)"""
+    key, = table.primary_key.columns
+    columns = ', '.join(column.name for column in index.columns)
+    keyed = ' AND '.join(f'{column.name} IS NOT NULL' for column in index.columns)
+    # The derived table lets MySQL delete from the table it reads
+    with engine.begin() as conn:
+        result = conn.execute(text(
+            f'DELETE FROM {table.name} WHERE {keyed} AND {key.name} NOT IN '
+            f'(SELECT keep_id FROM (SELECT MIN({key.name}) AS keep_id FROM {table.name} '
+            f'WHERE {keyed} GROUP BY {columns}) AS keep)'
+        ))
+    if result.rowcount:
+        print(f"🧹 Removed {result.rowcount} duplicate rows from {table.name} before {index.name}")
+
 def drop_db():
     """Drop all tables - DANGER! Only for development"""
     
@@ -137,6 +278,8 @@ def drop_db():
         print(" Cannot drop tables in PRODUCTION environment!")
         return False
     
+    current_config = _get_config()
+    DB_TYPE = _db_type()
     try:
         print("\n  WARNING: This will DELETE ALL TABLES!")
         print(f"   Database: {DB_TYPE.upper()} - {current_config.DB_NAME}")
@@ -147,7 +290,7 @@ def drop_db():
             return False
         
         print("\n Dropping all tables...")
-        Base.metadata.drop_all(bind=engine)
+        Base.metadata.drop_all(bind=get_engine())
         print(" All tables dropped successfully!")
         return True
         
@@ -161,7 +304,10 @@ def check_connection():
     Check database connection and return status
     Returns: (success: bool, message: str)
     """
+    current_config = _get_config()
+    DB_TYPE = _db_type()
     try:
+        engine = get_engine()
         print(f" Testing {DB_TYPE.upper()} connection...")
         
         with engine.connect() as conn:
@@ -226,6 +372,8 @@ def check_connection():
 
 def get_db_info():
     """Get current database configuration information"""
+    current_config = _get_config()
+    DB_TYPE = _db_type()
     info = {
         'type': DB_TYPE,
         'database': current_config.DB_NAME,
@@ -233,8 +381,8 @@ def get_db_info():
         'port': getattr(current_config, 'DB_PORT', 'N/A') if DB_TYPE != 'sqlite' else 'N/A',
         'user': getattr(current_config, 'DB_USER', 'N/A') if DB_TYPE != 'sqlite' else 'N/A',
         'pool_size': getattr(current_config, 'DB_POOL_SIZE', 'N/A') if DB_TYPE != 'sqlite' else 'N/A',
-        'echo': engine.echo,
-        'url': safe_url,
+        'echo': current_config.DB_ECHO,
+        'url': _safe_url(),
     }
     return info
 
@@ -248,6 +396,8 @@ def reset_db():
         print(" Cannot reset database in PRODUCTION environment!")
         return False
     
+    current_config = _get_config()
+    DB_TYPE = _db_type()
     print("\n" + "="*60)
     print("  DATABASE RESET WARNING")
     print("="*60)
@@ -263,7 +413,7 @@ def reset_db():
     
     # Step 1: Drop tables
     print("\n  Step 1: Dropping all tables...")
-    Base.metadata.drop_all(bind=engine)
+    Base.metadata.drop_all(bind=get_engine())
     print(" Tables dropped")
     
     # Step 2: Create tables
@@ -0,0 +1,198 @@
+# ============================================
+# File: Backend/src/infrastructure/databases/routing.py
+# ============================================
+"""
+Read-replica routing
+
+RoutingSession sends:
+    - every flush / INSERT / UPDATE / DELETE          -> primary
+    - reads inside session_scope(read_only=True)       -> one replica (round-robin
+                                                          per session)
+    - everything else                                  -> primary
+
+Read-your-writes: after a session that wrote commits, the client that made
+the request stays on the primary for REPLICA_STICKY_SECONDS, so it never
+reads a replica that has not caught up with its own change yet. The pin
+travels with the client - the response carries the deadline in a cookie and
+an X-Primary-Until header (for clients without cookies, sent back as a
+request header) - so it holds whichever worker process serves the next
+request. A deadline further away than REPLICA_STICKY_SECONDS is ignored.
+
+The session's sticky keys (affected user ids, e.g. a user whose roles an
+admin changed) are also pinned in a per-process cache: best effort for
+reads by *other* clients, which only hits when the same worker serves them.
+
+Without DB_REPLICA_URLS everything goes to the primary.
+"""
+
+import itertools
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+
+USE_REPLICA_KEY = 'use_replica'
+REPLICA_ENGINE_KEY = 'replica_engine'
+WROTE_KEY = 'wrote'
+STICKY_KEYS = 'sticky_keys'
+READ_KEYS = 'read_keys'
+PRIMARY_COOKIE = 'uth_primary_until'
+PRIMARY_HEADER = 'X-Primary-Until'
+
+_round_robin = itertools.count()
+_sticky = None
+_sticky_lock = threading.Lock()
+
+
+def _sticky_seconds() -> float:
+    from config import get_config
+    return get_config().REPLICA_STICKY_SECONDS
+
+
+def _get_sticky_cache():
+    global _sticky
+    if _sticky is None:
+        with _sticky_lock:
+            if _sticky is None:
+                from infrastructure.cache.memory_cache import TTLCache
+                _sticky = TTLCache(
+                    max_size=100000,
+                    ttl=_sticky_seconds(),
+                    name='primary_sticky'
+                )
+    return _sticky
+
+
+def _client_pinned() -> bool:
+    """The current request's client wrote within REPLICA_STICKY_SECONDS (cookie / header)"""
+    try:
+        from flask import has_request_context, request
+    except ImportError:
+        return False
+    if not has_request_context():
+        return False
+    value = request.headers.get(PRIMARY_HEADER) or request.cookies.get(PRIMARY_COOKIE)
+    if not value:
+        return False
+    try:
+        until = float(value)
+    except ValueError:
+        return False
+    now = time.time()
+    return now < until <= now + _sticky_seconds() + 1
+
+
+def _remember_client_write():
+    """Mark the current request as a writer; pin_response() hands the pin to the client"""
+    try:
+        from flask import g, has_request_context
+    except ImportError:
+        return
+    if has_request_context():
+        g._primary_until = time.time() + _sticky_seconds()
+
+
+def pin_response(response):
+    """Attach the read-your-writes deadline of a request that wrote to its response"""
+    from flask import g
+    until = g.pop('_primary_until', None)
+    if until is not None:
+        value = f"{until:.3f}"
+        response.set_cookie(
+            PRIMARY_COOKIE, value,
+            max_age=max(1, int(_sticky_seconds() + 1)),
+            httponly=True,
+            samesite='Lax'
+        )
+        response.headers[PRIMARY_HEADER] = value
+    return response
+
+
+def _current_user_key():
+    """Authenticated user of the current request, if any"""
+    try:
+        from flask import has_request_context, request
+        if has_request_context():
+            current_user = getattr(request, 'current_user', None)
+            if current_user:
+                return current_user.get('user_id')
+    except ImportError:
+        pass
+    return None
+
+
+def stick_to_primary(key, session=None):
+    """
+    Pin reads for `key` (usually a user id) to the primary.
+    With a session, the pin starts when that session commits.
+    """
+    if key is None:
+        return
+    if session is not None:
+        session.info.setdefault(STICKY_KEYS, set()).add(key)
+    else:
+        _get_sticky_cache().set(key, True)
+
+
+def is_sticky(key) -> bool:
+    return key is not None and _get_sticky_cache().get(key) is not None
+
+
+class RoutingSession(Session):
+    """Session that picks primary or replica per statement"""
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        from infrastructure.databases.base import get_engine, get_replica_engines
+
+        if self.bind is not None:
+            return self.bind
+
+        primary = get_engine()
+
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info[WROTE_KEY] = True
+            return primary
+
+        if not self.info.get(USE_REPLICA_KEY) or self.info.get(WROTE_KEY):
+            return primary
+
+        replicas = get_replica_engines()
+        if not replicas:
+            return primary
+
+        if _client_pinned():
+            return primary
+        read_keys = set(self.info.get(READ_KEYS, ())) | {_current_user_key()}
+        if any(is_sticky(key) for key in read_keys):
+            return primary
+
+        # Stay on one replica for the whole session (consistent snapshot)
+        replica = self.info.get(REPLICA_ENGINE_KEY)
+        if replica is None:
+            replica = replicas[next(_round_robin) % len(replicas)]
+            self.info[REPLICA_ENGINE_KEY] = replica
+        return replica
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _pin_writers_to_primary(session):
+    if session.info.pop(WROTE_KEY, False):
+        _remember_client_write()
+        keys = set(session.info.pop(STICKY_KEYS, ())) | {_current_user_key()}
+        sticky = _get_sticky_cache()
+        for key in keys:
+            if key is not None:
+                sticky.set(key, True)
+    else:
+        session.info.pop(STICKY_KEYS, None)
+    session.info.pop(REPLICA_ENGINE_KEY, None)
+
+
+@event.listens_for(RoutingSession, 'after_rollback')
+def _reset_routing_state(session):
+    session.info.pop(WROTE_KEY, None)
+    session.info.pop(STICKY_KEYS, None)
+    session.info.pop(REPLICA_ENGINE_KEY, None)
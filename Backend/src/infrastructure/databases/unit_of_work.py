@@ -0,0 +1,166 @@
+# ============================================
+# File: Backend/src/infrastructure/databases/unit_of_work.py
+# ============================================
+"""
+Request-scoped Session / Unit of Work
+
+Inside a Flask request every service shares ONE session (one pool checkout)
+and the whole request is committed ONCE after the view returns:
+    - response status < 400  -> commit
+    - response status >= 400 -> rollback
+The session is closed in teardown_appcontext.
+
+Outside a request (scripts, workers) session_scope() / @transactional open
+their own session and commit when the outermost scope exits.
+separate_transaction() does that inside a request too.
+
+Usage:
+    with session_scope() as db:
+        db.add(obj)
+        db.flush()          # never commit inside a service
+
+    @transactional
+    def main():
+        db = get_session()
+        ...
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from flask import g, has_request_context
+
+from infrastructure.databases.base import SessionLocal
+from infrastructure.databases.routing import USE_REPLICA_KEY, READ_KEYS, pin_response
+
+
+# Session owned by an explicit session_scope() outside a request
+_scoped_session = ContextVar('uow_session', default=None)
+
+
+def _app_session(create: bool = True):
+    """Session stored on the app context of the current request"""
+    if not has_request_context():
+        return None
+    session = g.get('_db_session')
+    if session is None and create:
+        session = SessionLocal()
+        g._db_session = session
+    return session
+
+
+def get_session():
+    """Return the active session (explicit scope first, then the request one)"""
+    session = _scoped_session.get()
+    if session is not None:
+        return session
+
+    session = _app_session()
+    if session is not None:
+        return session
+
+    raise RuntimeError("No active unit of work - wrap the call in session_scope()")
+
+
+@contextmanager
+def _routing(session, read_only, read_key):
+    """Route the reads of this block to a replica (see databases.routing)"""
+    if not read_only:
+        yield session
+        return
+
+    previous = session.info.get(USE_REPLICA_KEY)
+    session.info[USE_REPLICA_KEY] = True
+    if read_key is not None:
+        session.info.setdefault(READ_KEYS, set()).add(read_key)
+    try:
+        yield session
+    finally:
+        if previous is None:
+            session.info.pop(USE_REPLICA_KEY, None)
+        else:
+            session.info[USE_REPLICA_KEY] = previous
+
+
+@contextmanager
+def session_scope(read_only: bool = False, read_key=None):
+    """
+    Yield the active session, or open a new one and commit it on exit
+    Nested scopes reuse the outer session; only the outermost one commits.
+
+    read_only=True lets reads go to a replica unless `read_key` (usually the
+    user id being read) or the current user wrote recently.
+    """
+    session = _scoped_session.get()
+    if session is not None:
+        with _routing(session, read_only, read_key):
+            yield session
+        return
+
+    if has_request_context():
+        # Committed / rolled back by the request hooks
+        with _routing(_app_session(), read_only, read_key) as session:
+            yield session
+        return
+
+    with separate_transaction() as session:
+        with _routing(session, read_only, read_key):
+            yield session
+
+
+@contextmanager
+def separate_transaction():
+    """
+    A session of its own, committed when the block exits - also inside a
+    request, where session_scope() would join the request session and hold
+    its connection until the view returns. Nested session_scope() calls join
+    this one.
+
+    For short writes that must be visible right away (idempotency claims) and
+    for keeping a connection checked out only around the statements that
+    need it (not while a request body streams in).
+    """
+    session = SessionLocal()
+    token = _scoped_session.set(session)
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        _scoped_session.reset(token)
+        session.close()
+
+
+def transactional(f):
+    """Decorator form of session_scope() - the function uses get_session()"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        with session_scope():
+            return f(*args, **kwargs)
+    return decorated_function
+
+
+def init_app(app):
+    """Register commit / teardown hooks on the Flask app"""
+
+    @app.after_request
+    def commit_session(response):
+        session = _app_session(create=False)
+        if session is not None:
+            if response.status_code < 400:
+                session.commit()
+            else:
+                session.rollback()
+        # Read-your-writes pin of a request that committed (any session)
+        return pin_response(response)
+
+    @app.teardown_appcontext
+    def remove_session(exception=None):
+        session = g.pop('_db_session', None)
+        if session is not None:
+            if exception is not None:
+                session.rollback()
+            session.close()
@@ -0,0 +1,59 @@
+# ============================================
+# File: Backend/src/infrastructure/databases/upsert.py
+# ============================================
+"""
+Dialect-aware INSERT statements that tolerate an existing row
+
+Concurrent writers (request + background thread, two worker processes) can
+both decide a row is missing; the unique key settles it in the database
+instead of an IntegrityError in one of them:
+    insert_ignore(model, keys)          -> ON CONFLICT DO NOTHING / INSERT IGNORE
+    upsert(model, keys, columns)        -> ON CONFLICT DO UPDATE / ON DUPLICATE KEY UPDATE
+
+`keys` are the columns of the primary key / unique index that may collide.
+
+Usage:
+    db.execute(insert_ignore(ConflictOfInterest, ['paper_id', 'reviewer_id']), rows)
+    db.execute(upsert(PaperScoreSummary, ['paper_id'], ['mean_score', ...]), rows)
+"""
+
+from sqlalchemy import insert
+
+from .base import get_engine
+
+
+def _dialect() -> str:
+    # Writes always go to the primary
+    return get_engine().dialect.name
+
+
+def insert_ignore(model, keys):
+    dialect = _dialect()
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == 'mysql':
+        return insert(model).prefix_with('IGNORE')
+    else:
+        return insert(model)
+    return dialect_insert(model).on_conflict_do_nothing(index_elements=list(keys))
+
+
+def upsert(model, keys, columns):
+    dialect = _dialect()
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == 'mysql':
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+        statement = mysql_insert(model)
+        return statement.on_duplicate_key_update({name: statement.inserted[name] for name in columns})
+    else:
+        return insert(model)
+    statement = dialect_insert(model)
+    return statement.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={name: statement.excluded[name] for name in columns}
+    )
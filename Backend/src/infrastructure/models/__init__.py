@@ -4,6 +4,7 @@ Export all models - COMPLETE UPDATE
 """
 
 from .user_model import User
+from .role_model import Role, UserRole
 from .umcauthres_model import UMCAuthRES
 from .conference_model import Conference
 from .conference_mentor_model import ConferenceMentor
@@ -16,9 +17,13 @@ from .brow_history_model import BrowHistory
 from .decision_model import Decision
 from .conflict_of_interest_model import ConflictOfInterest
 from .audit_log_ai_model import AuditLogAI
+from .idempotency_key_model import IdempotencyKey
+from .paper_score_summary_model import PaperScoreSummary
 
 __all__ = [
     'User',
+    'Role',
+    'UserRole',
     'UMCAuthRES',
     'Conference',
     'ConferenceMentor',
@@ -32,4 +37,6 @@ __all__ = [
     'Decision',
     'ConflictOfInterest',
     'AuditLogAI',
+    'IdempotencyKey',
+    'PaperScoreSummary',
 ]
\ No newline at end of file
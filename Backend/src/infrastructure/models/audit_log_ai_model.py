@@ -3,7 +3,7 @@ Backend/src/infrastructure/models/audit_log_ai_model.py
 Audit Log AI Model - Track system activities
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -17,7 +17,11 @@ class AuditLogAI(Base):
     """
     
     __tablename__ = 'audit_log_ai'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Spill replays insert-if-absent on it (NULL for rows never spilled)
+        Index('ux_audit_log_ai_spill_id', 'spill_id', unique=True),
+        {'extend_existing': True},
+    )
     
     # Primary Key
     id = Column(Integer, primary_key=True, index=True)
@@ -51,6 +55,9 @@ class AuditLogAI(Base):
         index=True
     )
     
+    # Set when the row went through the audit sink's spill file
+    spill_id = Column(String(32), nullable=True)
+    
     # Relationship
     user = relationship("User", backref="ai_audit_logs")
     
@@ -59,10 +66,13 @@ class AuditLogAI(Base):
     
     @classmethod
     def log(cls, db_session, user_id, action_type, table_name, 
-            record_id=None, data=None):
+            record_id=None, data=None, commit=False):
         """
         Helper method to create audit log entry
         
+        The row joins the caller's unit of work (committed together with the
+        request). Pass commit=True only from standalone scripts.
+        
         Usage:
             AuditLogAI.log(
                 db_session=db,
@@ -81,5 +91,33 @@ class AuditLogAI(Base):
             data=data
         )
         db_session.add(log_entry)
-        db_session.commit()
-        return log_entry
\ No newline at end of file
+        if commit:
+            db_session.commit()
+        return log_entry
+    
+    @classmethod
+    def enqueue(cls, user_id, action_type, table_name, 
+                record_id=None, data=None, db_session=None):
+        """
+        Buffered variant of log() - no database I/O on the caller's thread
+        
+        With db_session the row is written only if that session commits.
+        
+        Usage:
+            AuditLogAI.enqueue(
+                user_id=user.id,
+                action_type='user_login',
+                table_name='users',
+                record_id=user.id,
+                db_session=db
+            )
+        """
+        from infrastructure.services.audit_sink import get_audit_sink
+        get_audit_sink().record(
+            user_id=user_id,
+            action_type=action_type,
+            table_name=table_name,
+            record_id=record_id,
+            data=data,
+            session=db_session
+        )
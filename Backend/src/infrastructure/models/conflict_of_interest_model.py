@@ -5,7 +5,7 @@
 Conflict of Interest Model
 """
 
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -14,7 +14,11 @@ from infrastructure.databases.base import Base
 
 class ConflictOfInterest(Base):
     __tablename__ = 'conflict_of_interest'
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # One row per pair - generators insert with ON CONFLICT DO NOTHING
+        Index('ux_conflict_of_interest_paper_reviewer', 'paper_id', 'reviewer_id', unique=True),
+        {'extend_existing': True},
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -44,7 +48,7 @@ class ConflictOfInterest(Base):
     # Relationships
     conference = relationship("Conference", backref="conflicts")
     paper = relationship("Paper", backref="conflicts")
-    reviewer = relationship("User", backref="conflicts")
+    reviewer = relationship("User", back_populates="conflicts")
     
     def __repr__(self):
         return f"<ConflictOfInterest(id={self.id}, reviewer_id={self.reviewer_id}, paper_id={self.paper_id})>"
\ No newline at end of file
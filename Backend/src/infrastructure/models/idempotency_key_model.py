@@ -0,0 +1,48 @@
+"""
+Backend/src/infrastructure/models/idempotency_key_model.py
+Idempotency Key Model - outcome of a request a client may retry
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, UniqueConstraint
+
+from infrastructure.databases.base import Base
+
+
+class IdempotencyKey(Base):
+    """
+    One row per (user, scope, Idempotency-Key header)
+    status 'processing' while the first request runs (claim_token identifies
+    that attempt), 'completed' once its result / error is stored
+    """
+
+    __tablename__ = 'idempotency_keys'
+    __table_args__ = (
+        UniqueConstraint('user_id', 'scope', 'key', name='uq_idempotency_keys_user_scope_key'),
+        Index('ix_idempotency_keys_expires_at', 'expires_at'),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
+    scope = Column(String(50), nullable=False)        # e.g. 'submission'
+    key = Column(String(255), nullable=False)
+    fingerprint = Column(String(64), nullable=False)  # SHA-256 of the request payload
+
+    status = Column(String(20), nullable=False, default='processing')
+    claim_token = Column(String(32), nullable=False)
+    locked_until = Column(DateTime, nullable=False)   # a stale claim can be taken over after this
+
+    received_at = Column(DateTime, nullable=False)    # when the claiming request arrived
+    blob_sha256 = Column(String(64), nullable=True)   # PDF that attempt stored, once it got that far
+    result = Column(Text, nullable=True)              # JSON of the successful outcome
+    error = Column(Text, nullable=True)               # or the error message it ended with
+    paper_id = Column(Integer, ForeignKey('papers.id', ondelete='SET NULL'), nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    completed_at = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<IdempotencyKey(user_id={self.user_id}, scope='{self.scope}', status='{self.status}')>"
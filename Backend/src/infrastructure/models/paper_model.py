@@ -9,7 +9,8 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Enum,
-    Boolean
+    Boolean,
+    Index
 )
 from sqlalchemy.orm import relationship
 from infrastructure.databases.base import Base
@@ -26,6 +27,12 @@ class Paper(Base):
     """
 
     __tablename__ = "papers"
+    __table_args__ = (
+        # Keyset listing per conference: WHERE conference_id [AND status]
+        # ORDER BY created_at, id - the trailing id makes the order unique
+        Index("ix_papers_conference_status_created", "conference_id", "status", "created_at", "id"),
+        Index("ix_papers_conference_created", "conference_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
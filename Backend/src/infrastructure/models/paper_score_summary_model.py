@@ -0,0 +1,45 @@
+"""
+Backend/src/infrastructure/models/paper_score_summary_model.py
+Paper Score Summary Model - materialized review aggregates of a paper
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Index
+
+from infrastructure.databases.base import Base
+
+
+class PaperScoreSummary(Base):
+    """
+    One row per paper with at least one scored review, maintained by
+    domain.services.scoring_service (recomputed when its reviews - or the
+    calibration of its reviewers - change, never per request)
+    """
+
+    __tablename__ = 'paper_score_summaries'
+    __table_args__ = (
+        Index('ix_paper_score_summaries_conference_calibrated', 'conference_id', 'calibrated_score'),
+    )
+
+    paper_id = Column(Integer, ForeignKey('papers.id', ondelete='CASCADE'), primary_key=True)
+    conference_id = Column(Integer, ForeignKey('conferences.id', ondelete='CASCADE'), nullable=False)
+
+    review_count = Column(Integer, nullable=False)
+    mean_score = Column(Float, nullable=False)
+    median_score = Column(Float, nullable=False)
+    score_variance = Column(Float, nullable=False)    # sample variance, 0 with one review
+    min_score = Column(Float, nullable=False)
+    max_score = Column(Float, nullable=False)
+    weighted_score = Column(Float, nullable=False)    # reviewer-precision weighted mean
+    calibrated_score = Column(Float, nullable=False)  # harshness-corrected, 1..10
+    z_score = Column(Float, nullable=False)           # mean reviewer-standardized score
+
+    # Conference mean / spread the bias was measured against (None: before they were kept)
+    prior_mean = Column(Float, nullable=True)
+    prior_std = Column(Float, nullable=True)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<PaperScoreSummary(paper_id={self.paper_id}, calibrated_score={self.calibrated_score})>"
@@ -0,0 +1,50 @@
+# ============================================
+# File: Backend/src/infrastructure/models/role_model.py
+# ============================================
+"""
+Role Models - roles and their assignment to users (global or per conference)
+"""
+
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from datetime import datetime
+
+from infrastructure.databases.base import Base
+
+
+class Role(Base):
+    __tablename__ = 'roles'
+    __table_args__ = {'extend_existing': True}
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(50), unique=True, nullable=False)
+    description = Column(String(255), nullable=True)
+
+    def __repr__(self):
+        return f"<Role(id={self.id}, name='{self.name}')>"
+
+
+class UserRole(Base):
+    __tablename__ = 'user_roles'
+    __table_args__ = (
+        UniqueConstraint('user_id', 'role_id', 'conference_id', name='uq_user_roles_user_role_conference'),
+        {'extend_existing': True},
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Foreign Keys
+    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
+    role_id = Column(Integer, ForeignKey('roles.id', ondelete='CASCADE'), nullable=False)
+    conference_id = Column(Integer, ForeignKey('conferences.id', ondelete='CASCADE'), nullable=True)  # None = global
+    assigned_by = Column(Integer, ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
+
+    is_active = Column(Boolean, default=True, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    user = relationship("User", back_populates="user_roles", foreign_keys=[user_id])
+    role = relationship("Role", lazy="joined")
+
+    def __repr__(self):
+        return f"<UserRole(user_id={self.user_id}, role_id={self.role_id}, conference_id={self.conference_id})>"
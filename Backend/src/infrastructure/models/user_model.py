@@ -58,4 +58,20 @@ class User(Base):
     conflicts = relationship(
         "ConflictOfInterest",
         back_populates="reviewer"
-    )
\ No newline at end of file
+    )
+
+    user_roles = relationship(
+        "UserRole",
+        back_populates="user",
+        foreign_keys="UserRole.user_id",
+        cascade="all, delete-orphan"
+    )
+
+    @property
+    def roles(self) -> list:
+        """Names of the active roles (the legacy `role` column when none are assigned)"""
+        names = []
+        for user_role in self.user_roles:
+            if user_role.is_active and user_role.role.name not in names:
+                names.append(user_role.role.name)
+        return names or [self.role]
\ No newline at end of file
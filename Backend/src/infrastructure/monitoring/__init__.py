@@ -0,0 +1,14 @@
+# File: src/infrastructure/monitoring/__init__.py
+"""
+Metrics exports
+"""
+
+from .metrics import registry, Counter, Gauge, Histogram, MetricsRegistry
+
+__all__ = [
+    'registry',
+    'Counter',
+    'Gauge',
+    'Histogram',
+    'MetricsRegistry',
+]
@@ -0,0 +1,144 @@
+# ============================================
+# File: Backend/src/infrastructure/monitoring/collectors.py
+# ============================================
+"""
+Scrape-time collectors for services that keep their own counters
+"""
+
+from infrastructure.monitoring.metrics import registry
+
+
+_registered = False
+
+
+def collect_hashing():
+    from infrastructure.services.hashing_service import get_password_hasher
+    stats = get_password_hasher().stats()
+    samples = [
+        ('uth_password_hash_queue_depth', 'gauge', 'bcrypt jobs running or waiting', {}, stats['queue_depth']),
+        ('uth_password_hash_queue_size', 'gauge', 'Max bcrypt jobs running or waiting', {}, stats['queue_size']),
+        ('uth_password_hash_rejected_total', 'counter', 'bcrypt jobs rejected because the queue was full', {}, stats['rejected']),
+        ('uth_password_rehashed_total', 'counter', 'Hashes upgraded to the configured cost on login', {}, stats['rehashed']),
+    ]
+    # Latency percentiles: the uth_password_hash_seconds histogram (hashing_service)
+    for operation, latency in stats['latency'].items():
+        labels = {'operation': operation}
+        samples.append(('uth_password_hash_max_seconds', 'gauge', 'Slowest bcrypt job', labels, latency['max_seconds']))
+    return samples
+
+
+def collect_audit():
+    from infrastructure.services.audit_sink import get_audit_sink
+    stats = get_audit_sink().stats()
+    return [
+        ('uth_audit_queue_depth', 'gauge', 'Audit rows waiting to be flushed', {}, stats['queued']),
+        ('uth_audit_rows_total', 'counter', 'Audit rows by outcome', {'outcome': 'written'}, stats['written']),
+        ('uth_audit_rows_total', 'counter', 'Audit rows by outcome', {'outcome': 'spilled'}, stats['spilled']),
+        ('uth_audit_rows_total', 'counter', 'Audit rows by outcome', {'outcome': 'replayed'}, stats['replayed']),
+        ('uth_audit_rows_total', 'counter', 'Audit rows by outcome', {'outcome': 'rejected'}, stats['rejected']),
+    ]
+
+
+def collect_caches():
+    from domain.utils.auth_utils import get_token_cache
+    from infrastructure.cache.profile_cache import get_profile_cache
+    samples = []
+    for cache in (get_token_cache(), get_profile_cache()):
+        stats = cache.stats()
+        labels = {'cache': stats['name']}
+        samples.append(('uth_cache_hits_total', 'counter', 'Cache hits', labels, stats['hits']))
+        samples.append(('uth_cache_misses_total', 'counter', 'Cache misses', labels, stats['misses']))
+        samples.append(('uth_cache_evictions_total', 'counter', 'LRU evictions', labels, stats['evictions']))
+        samples.append(('uth_cache_entries', 'gauge', 'Entries currently cached', labels, stats['size']))
+    return samples
+
+
+def collect_login_throttle():
+    from infrastructure.services.rate_limiter import get_login_throttle
+    stats = get_login_throttle().stats()
+    return [
+        ('uth_login_attempts_total', 'counter', 'Login attempts by throttle outcome', {'outcome': 'allowed'}, stats['allowed']),
+        ('uth_login_attempts_total', 'counter', 'Login attempts by throttle outcome', {'outcome': 'throttled_ip'}, stats['throttled']['ip']),
+        ('uth_login_attempts_total', 'counter', 'Login attempts by throttle outcome', {'outcome': 'throttled_username'}, stats['throttled']['username']),
+        ('uth_login_refunds_total', 'counter', 'Successful logins whose throttle token was given back', {}, stats['refunded']),
+        ('uth_login_bcrypt_avoided_total', 'counter', 'bcrypt verifications skipped because the attempt was throttled', {}, stats['bcrypt_avoided']),
+    ]
+
+
+def collect_pdf_extraction():
+    from infrastructure.services.pdf_extraction_service import get_extraction_pipeline
+    stats = get_extraction_pipeline().stats()
+    samples = [
+        ('uth_pdf_extract_queue_depth', 'gauge', 'PDFs waiting for text extraction', {}, stats['queued']),
+        ('uth_pdf_extract_running', 'gauge', 'PDFs being extracted right now', {}, stats['running']),
+        ('uth_pdf_extract_jobs_total', 'counter', 'PDF extraction jobs by outcome', {'outcome': 'extracted'}, stats['extracted']),
+        ('uth_pdf_extract_jobs_total', 'counter', 'PDF extraction jobs by outcome', {'outcome': 'skipped'}, stats['skipped']),
+        ('uth_pdf_extract_jobs_total', 'counter', 'PDF extraction jobs by outcome', {'outcome': 'dropped'}, stats['dropped']),
+        ('uth_pdf_extract_pages_total', 'counter', 'Pages of text extracted', {}, stats['pages']),
+        ('uth_pdf_extract_worker_seconds_total', 'counter', 'Time spent in extraction workers', {}, stats['worker_seconds']),
+        ('uth_pdf_extract_pages_per_second', 'gauge', 'Extraction throughput over the last minute', {}, stats['pages_per_second']),
+    ]
+    for reason, count in stats['failed'].items():
+        samples.append(('uth_pdf_extract_failures_total', 'counter', 'Failed PDF extractions by reason', {'reason': reason}, count))
+    return samples
+
+
+def collect_search():
+    from infrastructure.search.indexing import loaded_search_backend
+    backend = loaded_search_backend()
+    if backend is None:
+        return []  # not loaded yet - don't build the index from a scrape
+    stats = backend.stats()
+    labels = {'backend': stats['backend']}
+    samples = []
+    for key, kind, help_text in (
+        ('papers', 'gauge', 'Papers in the search index'),
+        ('terms', 'gauge', 'Distinct terms in the search index'),
+        ('postings_scanned', 'counter', 'Postings read by search queries'),
+        ('updates', 'counter', 'Search index upserts and removals'),
+        ('journal_entries', 'gauge', 'Search index changes not yet in a snapshot'),
+    ):
+        if key in stats:
+            samples.append((f'uth_search_{key}' + ('_total' if kind == 'counter' else ''),
+                            kind, help_text, labels, stats[key]))
+    return samples
+
+
+def collect_duplicates():
+    from infrastructure.similarity.duplicates import duplicate_detection_stats
+    stats = duplicate_detection_stats()  # never loads the index from a scrape
+    samples = [
+        ('uth_dedup_papers', 'gauge', 'Papers with a MinHash signature', {}, stats['papers']),
+        ('uth_dedup_queue_depth', 'gauge', 'Papers waiting to be (re)signed', {}, stats['queued']),
+        ('uth_dedup_signed_total', 'counter', 'Paper signatures computed', {}, stats['signed']),
+        ('uth_dedup_failures_total', 'counter', 'Failed signature updates', {}, stats['failed']),
+    ]
+    if 'queries' in stats:
+        samples.append(('uth_dedup_lookups_total', 'counter', 'Duplicate lookups against the LSH index', {}, stats['queries']))
+        samples.append(('uth_dedup_candidates_checked_total', 'counter', 'LSH candidates compared by full signature', {}, stats['candidates_checked']))
+    return samples
+
+
+def collect_idempotency():
+    from infrastructure.services.idempotency_store import get_idempotency_store
+    stats = get_idempotency_store().stats()
+    return [
+        ('uth_idempotency_requests_total', 'counter', 'Requests with an Idempotency-Key by outcome', {'outcome': outcome}, stats[outcome])
+        for outcome in ('claimed', 'replayed', 'in_progress', 'taken_over')
+    ]
+
+
+def register_default_collectors():
+    """Idempotent - safe when create_app() runs more than once"""
+    global _registered
+    if _registered:
+        return
+    registry.register_collector(collect_hashing)
+    registry.register_collector(collect_audit)
+    registry.register_collector(collect_caches)
+    registry.register_collector(collect_login_throttle)
+    registry.register_collector(collect_search)
+    registry.register_collector(collect_pdf_extraction)
+    registry.register_collector(collect_duplicates)
+    registry.register_collector(collect_idempotency)
+    _registered = True
@@ -0,0 +1,114 @@
+# ============================================
+# File: Backend/src/infrastructure/monitoring/db_instrumentation.py
+# ============================================
+"""
+Connection pool and SQL statement instrumentation
+
+Records:
+    - pool checkout wait time and checkout timeouts (InstrumentedQueuePool)
+    - connections in use / overflow / pool size (read at scrape time)
+    - per-statement duration histogram by operation (SELECT, INSERT, ...)
+    - slow queries above SLOW_QUERY_THRESHOLD_MS, logged to 'uth.sql.slow'
+"""
+
+import logging
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from infrastructure.monitoring.metrics import registry
+
+
+slow_query_logger = logging.getLogger('uth.sql.slow')
+
+POOL_CHECKOUT_SECONDS = registry.histogram(
+    'uth_db_pool_checkout_seconds',
+    'Time spent waiting for a pooled connection',
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+)
+POOL_CHECKOUT_TIMEOUTS = registry.counter(
+    'uth_db_pool_checkout_timeouts_total',
+    'Checkouts that gave up after pool_timeout'
+)
+STATEMENT_SECONDS = registry.histogram(
+    'uth_db_statement_seconds',
+    'SQL statement execution time',
+    ['operation']
+)
+SLOW_QUERIES = registry.counter(
+    'uth_db_slow_queries_total',
+    'Statements slower than SLOW_QUERY_THRESHOLD_MS',
+    ['operation']
+)
+
+_QUERY_START_KEY = 'uth_query_start'
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that times how long callers wait for a connection"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - start)
+
+
+def _operation(statement: str) -> str:
+    words = statement.lstrip().split(None, 1)
+    return words[0].upper() if words else 'UNKNOWN'
+
+
+def instrument_engine(engine, slow_query_threshold_ms: float = 200, name: str = 'primary'):
+    """Attach statement timing hooks and pool gauges to an engine"""
+    threshold = slow_query_threshold_ms / 1000.0
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(_QUERY_START_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get(_QUERY_START_KEY)
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        operation = _operation(statement)
+        STATEMENT_SECONDS.observe(elapsed, operation=operation)
+
+        if elapsed >= threshold:
+            SLOW_QUERIES.inc(operation=operation)
+            slow_query_logger.warning(
+                "Slow query (%.1f ms, executemany=%s): %s",
+                elapsed * 1000, executemany, ' '.join(statement.split())[:1000]
+            )
+
+    @event.listens_for(engine, 'handle_error')
+    def _handle_error(exception_context):
+        # Keep the start-time stack balanced when a statement fails
+        conn = exception_context.connection
+        if conn is not None:
+            starts = conn.info.get(_QUERY_START_KEY)
+            if starts:
+                starts.pop()
+
+    def collect_pool_stats():
+        pool = engine.pool
+        if not isinstance(pool, QueuePool):
+            return []
+        labels = {'engine': name}
+        return [
+            ('uth_db_pool_size', 'gauge', 'Configured pool_size', labels, pool.size()),
+            ('uth_db_pool_connections_in_use', 'gauge', 'Connections checked out right now', labels, pool.checkedout()),
+            ('uth_db_pool_connections_idle', 'gauge', 'Connections idle in the pool', labels, pool.checkedin()),
+            ('uth_db_pool_overflow', 'gauge', 'Connections opened beyond pool_size (negative = unused capacity)', labels, pool.overflow()),
+        ]
+
+    registry.register_collector(collect_pool_stats)
+    return engine
@@ -0,0 +1,18 @@
+# File: src/infrastructure/search/__init__.py
+"""
+Paper full-text search exports
+(backend selection and index maintenance live in search.indexing)
+"""
+
+from .base import SearchBackend, SearchHit, SearchResults, FIELD_WEIGHTS
+from .bm25_index import InMemoryBM25Backend
+from .tokenizer import tokenize
+
+__all__ = [
+    'SearchBackend',
+    'SearchHit',
+    'SearchResults',
+    'FIELD_WEIGHTS',
+    'InMemoryBM25Backend',
+    'tokenize',
+]
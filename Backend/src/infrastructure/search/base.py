@@ -0,0 +1,72 @@
+# ============================================
+# File: Backend/src/infrastructure/search/base.py
+# ============================================
+"""
+Search backend interface for paper full-text search
+"""
+
+from dataclasses import dataclass
+
+
+# Field -> weight: a hit in the title counts three times a hit in the abstract
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'keywords': 2.0,
+    'abstract': 1.0,
+}
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    paper_id: int
+    score: float
+
+
+class SearchResults(list):
+    """
+    SearchHits, best first. `truncated` is True when the backend stopped at
+    its work budget before it could prove these are the exact top hits -
+    they are then the best of the papers it looked at.
+    """
+
+    def __init__(self, hits=(), truncated: bool = False):
+        super().__init__(hits)
+        self.truncated = truncated
+
+
+class SearchBackend:
+    """
+    Interface for paper search stores
+
+    index() / remove() are called after the transaction that changed the
+    paper commits. Backends whose index lives in the database itself (e.g.
+    Postgres tsvector) can implement them as no-ops.
+    """
+
+    name = 'base'
+
+    def index(self, paper_id: int, conference_id: int, fields: dict):
+        """Add or replace one paper; fields = {'title': ..., 'abstract': ..., 'keywords': ...}"""
+        raise NotImplementedError
+
+    def remove(self, paper_id: int):
+        raise NotImplementedError
+
+    def search(self, query: str, conference_id: int = None, limit: int = 20,
+               paper_ids=None) -> SearchResults:
+        """
+        Best matches first. paper_ids (a set) restricts the ranking to those
+        papers - e.g. the ones the caller may see - before the top `limit`
+        are taken.
+        """
+        raise NotImplementedError
+
+    def rebuild(self, rows):
+        """Replace the whole index from an iterable of (paper_id, conference_id, fields)"""
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        return {'backend': self.name}
+
+    def close(self):
+        """Flush anything pending (called at shutdown)"""
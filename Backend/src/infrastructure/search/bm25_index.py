@@ -0,0 +1,833 @@
+# ============================================
+# File: Backend/src/infrastructure/search/bm25_index.py
+# ============================================
+"""
+In-process inverted index with BM25 ranking
+
+One partition per conference - chairs search inside their own conference, so
+a query only touches that conference's postings. Per partition:
+    docs[paper_id]  -> (term ids (sorted), weighted tfs, length)    forward index
+    terms[term_id]  -> postings: paper ids + impacts sorted by impact DESC,
+                       plus a `delta` set of papers changed since the sort
+
+The impact stored in a posting is the length-normalised BM25 tf part,
+    tf * (k1 + 1) / (tf + k1 * (1 - b + b * dl / avgdl))
+and idf is applied per term at query time. When avgdl drifts more than
+`renormalize_drift` from the value the impacts were computed with, the
+partition is re-normalised in one pass.
+
+Queries:
+    - few postings in total  -> exhaustive term-at-a-time accumulation
+    - otherwise              -> threshold algorithm: walk the impact-sorted
+      lists in parallel, score each new paper exactly through the forward
+      index, stop once the k-th best score beats the best any unseen paper
+      could still reach. Frequent terms cost a few hundred postings, not
+      the whole list.
+    - the threshold algorithm has 1/16 of `max_postings`. Queries made only
+      of words that occur in most papers have flat score distributions and
+      would read nearly every list to the end (100k papers: ~160k postings,
+      far over 20 ms in Python). They switch to accumulating partial scores
+      over the rest of the budget and score the best CANDIDATES of those
+      exactly.
+Papers in `delta` are always scored exactly; the writer re-sorts a term's
+list once its delta grows past 1/128 of it, so that set stays small.
+
+Trade-off: a query that runs out of `max_postings` returns the best papers
+it scored, not necessarily the exact top k. It says so - search() returns
+SearchResults with truncated=True (counted in stats()['truncated_queries'])
+- and a result is only marked exact when no unscored paper can beat the
+k-th hit. On the 100k-paper benchmark 1 query in 10 is truncated; those
+share ~96% of their top 20 with the exact ranking (~89% for queries of only
+head terms), at p99 ~20 ms on one slow core. max_postings=0 gives exact results at unbounded
+cost.
+
+search(paper_ids=...) ranks only those papers (what the caller may see), so
+a filtered query still returns up to `limit` hits.
+
+After a bulk load the index objects are moved out of the cyclic garbage
+collector's reach (gc.freeze) - otherwise full collections walking millions
+of postings show up as random latency spikes.
+
+Persistence (when `path` is set):
+    <path>/snapshot.pickle          all partitions + the journal position it covers
+    <path>/journal.<gen>.jsonl      upserts / removals since (shared_log.SharedLog)
+Several worker processes can share the directory. A change is appended under
+the journal's flock, after the writer has applied everything other workers
+appended before it. Searches never replay: a tailer thread checks the
+journal every TAIL_INTERVAL (a stat call when nothing changed), reads new
+entries into a backlog and applies them in TAIL_SLICE slices, releasing the
+index lock (and the GIL, for TAIL_PAUSE) in between - a burst of edits
+elsewhere delays a search by at most one slice. Other workers' edits show
+up within TAIL_INTERVAL plus the replay time; the worker's own edits
+immediately. Writes, snapshots and close() apply the whole backlog first,
+so journal order is kept and every worker converges on the same index.
+After `snapshot_every` entries one worker (snapshot.lock) starts a new journal generation, pickles
+its index as covering everything before it and deletes the old generations. On start the snapshot is loaded
+and the journal replayed from its position (entries are idempotent).
+rebuild() publishes its snapshot and appends a reload marker, so the other
+workers load it instead of keeping their old index.
+"""
+
+import gc
+import heapq
+import json
+import math
+import operator
+import os
+import pickle
+import tempfile
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import deque
+from contextlib import nullcontext
+from itertools import compress
+
+from infrastructure.search.base import SearchBackend, SearchHit, SearchResults, FIELD_WEIGHTS
+from infrastructure.search.tokenizer import tokenize
+from infrastructure.services.shared_log import SharedLog, LogGapError, file_lock
+
+
+SNAPSHOT_FILE = 'snapshot.pickle'
+SNAPSHOT_LOCK = 'snapshot.lock'
+JOURNAL_NAME = 'journal'
+SNAPSHOT_VERSION = 3
+
+EXHAUSTIVE_POSTINGS = 4000    # below this many postings, just add everything up
+TA_BATCH = 64                 # postings read between threshold checks
+TA_SHARE = 16                 # 1/16 of max_postings goes to the threshold algorithm
+ACCUMULATE_BATCH = 256        # postings read per list switch once accumulating
+CANDIDATES = 256              # best partial scores re-scored exactly
+DELTA_MIN = 64                # a term's list is re-sorted once its delta exceeds
+DELTA_FRACTION = 128          # max(DELTA_MIN, len(list) // DELTA_FRACTION)
+TAIL_INTERVAL = 0.2           # seconds between checks for other workers' journal entries
+TAIL_SLICE = 0.005            # seconds of replay per index-lock hold - searches wait at most this (+ one entry)
+TAIL_PAUSE = 0.01             # seconds between slices, so searches get the GIL while a backlog is replayed
+
+
+def analyze(fields: dict) -> dict:
+    """{term: weighted tf} of a paper's searchable fields"""
+    terms = {}
+    for field, weight in FIELD_WEIGHTS.items():
+        for token in tokenize(fields.get(field) or ''):
+            terms[token] = terms.get(token, 0.0) + weight
+    return terms
+
+
+class _Postings:
+    __slots__ = ('ids', 'impacts', 'delta', 'df')
+
+    def __init__(self):
+        self.ids = array('i')
+        self.impacts = array('d')
+        self.delta = set()
+        self.df = 0
+
+
+class _Partition:
+    __slots__ = ('docs', 'terms', 'total_len', 'avgdl_used')
+
+    def __init__(self):
+        self.docs = {}
+        self.terms = {}
+        self.total_len = 0.0
+        self.avgdl_used = 0.0
+
+    @property
+    def avgdl(self) -> float:
+        return self.total_len / len(self.docs) if self.docs else 0.0
+
+
+class InMemoryBM25Backend(SearchBackend):
+    """
+    Usage:
+        backend = InMemoryBM25Backend(path='var/search_index')
+        backend.index(paper.id, paper.conference_id, {'title': ..., 'abstract': ...})
+        hits = backend.search('graph neural network', conference_id=3, limit=20)
+    """
+
+    name = 'memory'
+
+    def __init__(self, path: str = None, k1: float = 1.2, b: float = 0.75,
+                 snapshot_every: int = 500, renormalize_drift: float = 0.2,
+                 max_postings: int = 12288, tail_interval: float = TAIL_INTERVAL):
+        self.path = os.path.abspath(path) if path else None
+        self.k1 = k1
+        self.b = b
+        self.max_postings = max_postings  # per partition and query, 0 = unbounded (always exact)
+        self.snapshot_every = snapshot_every
+        self.renormalize_drift = renormalize_drift
+        self.tail_interval = tail_interval  # 0 = no tailer (single process)
+
+        self._vocab = {}           # term -> term id
+        self._terms = []           # term id -> term
+        self._partitions = {}      # conference_id -> _Partition
+        self._doc_partition = {}   # paper_id -> conference_id
+        self._lock = threading.RLock()
+
+        self._log = None
+        self._journal_entries = 0  # in the current journal generation
+        self._backlog = deque()    # journal records read, not applied yet (in journal order)
+        self._snapshot_thread = None
+        self._tailer_pid = None    # a forked child starts its own tailer
+        self._closed = threading.Event()
+
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.postings_scanned = 0
+        self.truncated_queries = 0
+        self.updates = 0
+        self.renormalizations = 0
+        self.snapshots = 0
+        self.loaded_from_disk = False
+
+        if self.path:
+            os.makedirs(self.path, exist_ok=True)
+            self._log = SharedLog(self.path, JOURNAL_NAME, 'jsonl')
+            self._load()
+
+    # ---------- Helpers ----------
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._vocab.get(term)
+        if term_id is None:
+            term_id = self._vocab[term] = len(self._terms)
+            self._terms.append(term)
+        return term_id
+
+    def _forward(self, terms: dict):
+        """(sorted term ids, tfs, length) of an analyzed paper"""
+        pairs = sorted((self._term_id(term), tf) for term, tf in terms.items())
+        return (
+            array('i', [term_id for term_id, _ in pairs]),
+            array('f', [tf for _, tf in pairs]),
+            float(sum(terms.values())),
+        )
+
+    def _impact_of(self, part: _Partition, paper_id: int, term_id: int) -> float:
+        doc = part.docs.get(paper_id)
+        if doc is None:
+            return 0.0
+        term_ids, tfs, dl = doc
+        i = bisect_left(term_ids, term_id)
+        if i == len(term_ids) or term_ids[i] != term_id:
+            return 0.0
+        tf = tfs[i]
+        norm = self.k1 * (1.0 - self.b + self.b * dl / part.avgdl_used)
+        return tf * (self.k1 + 1.0) / (tf + norm)
+
+    def _renormalize(self, part: _Partition):
+        """Recompute every impact with the current avgdl and re-sort all lists"""
+        avgdl = part.avgdl or 1.0
+        k1, b = self.k1, self.b
+        buckets = {}
+        for paper_id, (term_ids, tfs, dl) in part.docs.items():
+            norm = k1 * (1.0 - b + b * dl / avgdl)
+            for term_id, tf in zip(term_ids, tfs):
+                bucket = buckets.get(term_id)
+                if bucket is None:
+                    bucket = buckets[term_id] = []
+                bucket.append((tf * (k1 + 1.0) / (tf + norm), paper_id))
+
+        terms = {}
+        for term_id, bucket in buckets.items():
+            bucket.sort(reverse=True)
+            postings = terms[term_id] = _Postings()
+            postings.impacts = array('d', [impact for impact, _ in bucket])
+            postings.ids = array('i', [paper_id for _, paper_id in bucket])
+            postings.df = len(bucket)
+        part.terms = terms
+        part.avgdl_used = avgdl
+        self.renormalizations += 1
+
+    def _compact(self, part: _Partition, term_id: int, postings: _Postings):
+        """
+        Merge a term's delta back into its sorted list
+
+        The papers outside the delta are already in order: they are filtered
+        at C speed and the (few) delta papers spliced in by bisection, in the
+        same (impact, paper id) DESC order a full sort gives - a head term's
+        list costs a few ms, not a re-sort of every posting.
+        """
+        delta = postings.delta
+        ids, impacts = postings.ids, postings.impacts
+        kept = list(map(operator.not_, map(delta.__contains__, ids)))
+        ids = array('i', compress(ids, kept))
+        impacts = array('d', compress(impacts, kept))
+
+        added = []
+        for paper_id in delta:
+            impact = self._impact_of(part, paper_id, term_id)
+            if impact:
+                added.append((impact, paper_id))
+        added.sort(reverse=True)
+
+        def order(index):
+            return -impacts[index], -ids[index]
+
+        merged_ids, merged_impacts = array('i'), array('d')
+        start = 0
+        for impact, paper_id in added:
+            at = bisect_left(range(start, len(ids)), (-impact, -paper_id), key=order) + start
+            merged_ids.extend(ids[start:at])
+            merged_impacts.extend(impacts[start:at])
+            merged_ids.append(paper_id)
+            merged_impacts.append(impact)
+            start = at
+        merged_ids.extend(ids[start:])
+        merged_impacts.extend(impacts[start:])
+        postings.ids, postings.impacts = merged_ids, merged_impacts
+        postings.delta = set()
+
+    def _maybe_compact(self, part: _Partition, term_id: int, postings: _Postings):
+        # Writers pay for the re-sort so queries only ever score a small delta
+        if len(postings.delta) > max(DELTA_MIN, len(postings.ids) // DELTA_FRACTION):
+            self._compact(part, term_id, postings)
+
+    # ---------- Mutations (caller holds the lock) ----------
+
+    def _apply_upsert(self, paper_id: int, conference_id: int, terms: dict):
+        self._apply_remove(paper_id)
+
+        part = self._partitions.get(conference_id)
+        if part is None:
+            part = self._partitions[conference_id] = _Partition()
+
+        doc = self._forward(terms)
+        part.docs[paper_id] = doc
+        part.total_len += doc[2]
+        self._doc_partition[paper_id] = conference_id
+
+        if not part.avgdl_used or \
+                abs(part.avgdl - part.avgdl_used) > self.renormalize_drift * part.avgdl_used:
+            self._renormalize(part)
+            return
+
+        for term_id in doc[0]:
+            postings = part.terms.get(term_id)
+            if postings is None:
+                postings = part.terms[term_id] = _Postings()
+            postings.df += 1
+            postings.delta.add(paper_id)
+            self._maybe_compact(part, term_id, postings)
+
+    def _apply_remove(self, paper_id: int):
+        conference_id = self._doc_partition.pop(paper_id, None)
+        if conference_id is None:
+            return
+        part = self._partitions[conference_id]
+        term_ids, _, dl = part.docs.pop(paper_id)
+        part.total_len -= dl
+        if not part.docs:
+            del self._partitions[conference_id]
+            return
+        for term_id in term_ids:
+            postings = part.terms.get(term_id)
+            if postings is None:
+                continue
+            postings.df -= 1
+            if postings.df <= 0:
+                del part.terms[term_id]
+            else:
+                postings.delta.add(paper_id)
+                self._maybe_compact(part, term_id, postings)
+
+    # ---------- SearchBackend ----------
+
+    def index(self, paper_id, conference_id, fields):
+        self._write({'op': 'upsert', 'id': paper_id, 'c': conference_id, 't': analyze(fields)})
+
+    def remove(self, paper_id):
+        self._write({'op': 'remove', 'id': paper_id})
+
+    def _write(self, entry: dict):
+        # Under the journal lock: first what other workers wrote, then ours -
+        # the last entry for a paper wins in every process
+        self._ensure_tailer()
+        with self._lock, self._journal_locked():
+            self._catch_up()
+            self._apply(entry)
+            self._write_journal(entry)
+            self.updates += 1
+
+    def _apply(self, entry: dict):
+        if entry['op'] == 'upsert':
+            self._apply_upsert(entry['id'], entry['c'], entry['t'])
+        else:
+            self._apply_remove(entry['id'])
+
+    def search(self, query, conference_id=None, limit=20, paper_ids=None):
+        started = time.perf_counter()
+        words = list(dict.fromkeys(tokenize(query)))
+        allowed = None if paper_ids is None else set(paper_ids)
+        results = []
+        truncated = False
+
+        self._ensure_tailer()
+        with self._lock:
+            term_ids = [self._vocab[word] for word in words if word in self._vocab]
+            if conference_id is not None:
+                parts = [self._partitions[conference_id]] if conference_id in self._partitions else []
+            else:
+                parts = list(self._partitions.values())
+
+            for part in parts:
+                top, cut_short = self._search_partition(part, term_ids, limit, allowed)
+                results.extend(top)
+                truncated = truncated or cut_short
+
+            self.queries += 1
+            self.truncated_queries += truncated
+            self.query_seconds += time.perf_counter() - started
+
+        results = heapq.nlargest(limit, results)
+        return SearchResults(
+            (SearchHit(paper_id=paper_id, score=score) for score, paper_id in results),
+            truncated=truncated
+        )
+
+    def _search_partition(self, part: _Partition, term_ids: list, limit: int, allowed: set = None):
+        """([(score, paper_id)], truncated) - the partition's best `limit` papers"""
+        n_docs = len(part.docs)
+        query = []
+        for term_id in term_ids:
+            postings = part.terms.get(term_id)
+            if postings is not None:
+                idf = math.log(1.0 + (n_docs - postings.df + 0.5) / (postings.df + 0.5))
+                query.append((term_id, idf, postings))
+        if not query:
+            return [], False
+
+        docs_get = part.docs.get
+        k1, b, avgdl = self.k1, self.b, part.avgdl_used
+        k1_plus_1 = k1 + 1.0
+        weights = [(term_id, idf) for term_id, idf, _ in query]
+
+        def exact_score(paper_id):
+            doc = docs_get(paper_id)
+            if doc is None:
+                return 0.0
+            doc_term_ids, tfs, dl = doc
+            size = len(doc_term_ids)
+            norm = k1 * (1.0 - b + b * dl / avgdl)
+            score = 0.0
+            for term_id, idf in weights:
+                i = bisect_left(doc_term_ids, term_id)
+                if i < size and doc_term_ids[i] == term_id:
+                    tf = tfs[i]
+                    score += idf * tf * k1_plus_1 / (tf + norm)
+            return score
+
+        top = []          # min-heap of (score, paper_id)
+        seen = set()
+
+        def consider(paper_id):
+            if allowed is not None and paper_id not in allowed:
+                return
+            score = exact_score(paper_id)
+            if score <= 0:
+                return
+            if len(top) < limit:
+                heapq.heappush(top, (score, paper_id))
+            elif score > top[0][0]:
+                heapq.heapreplace(top, (score, paper_id))
+
+        if allowed is not None and len(allowed) <= EXHAUSTIVE_POSTINGS // len(query):
+            # A handful of visible papers: score them directly
+            for paper_id in allowed:
+                consider(paper_id)
+            return top, False
+
+        changed = set()
+        for _, _, postings in query:
+            changed.update(postings.delta)
+        for paper_id in changed:
+            consider(paper_id)
+        seen.update(changed)
+
+        if sum(len(postings.ids) for _, _, postings in query) <= EXHAUSTIVE_POSTINGS:
+            scores = {}
+            get = scores.get
+            for _, idf, postings in query:
+                for paper_id, impact in zip(postings.ids, postings.impacts):
+                    scores[paper_id] = get(paper_id, 0.0) + impact * idf
+                self.postings_scanned += len(postings.ids)
+            ranked = [
+                (score, paper_id) for paper_id, score in scores.items()
+                # changed papers have stale impacts - they were scored exactly above
+                if paper_id not in changed and (allowed is None or paper_id in allowed)
+            ]
+            return heapq.nlargest(limit, top + ranked), False
+
+        cursors = [0] * len(query)
+
+        def next_list():
+            """(list to read next, threshold) - the list with the highest bound, -1 when all are read"""
+            threshold = 0.0
+            best_list, best_bound = -1, 0.0
+            for j, (_, idf, postings) in enumerate(query):
+                if cursors[j] < len(postings.ids):
+                    bound = postings.impacts[cursors[j]] * idf
+                    threshold += bound
+                    if bound > best_bound or best_list < 0:
+                        best_list, best_bound = j, bound
+            return best_list, best_bound, threshold
+
+        # 1. Threshold algorithm over the impact-sorted lists - threshold is
+        #    the best score an unseen paper could still reach, the list with
+        #    the highest bound is read next (that lowers it fastest)
+        ta_budget = self.max_postings // TA_SHARE if self.max_postings else 0
+        scanned = 0
+        while True:
+            best_list, best_bound, threshold = next_list()
+            if best_list < 0 or (len(top) >= limit and top[0][0] >= threshold):
+                self.postings_scanned += scanned
+                return top, False
+            if ta_budget and scanned >= ta_budget:
+                break
+
+            _, idf, postings = query[best_list]
+            # A paper first met here is at most its impact in this list plus
+            # the other lists' bounds - when that cannot beat the k-th score
+            # it never will, so it is marked seen without the random access
+            others = threshold - best_bound
+            start = cursors[best_list]
+            end = min(start + TA_BATCH, len(postings.ids))
+            for paper_id, impact in zip(postings.ids[start:end], postings.impacts[start:end]):
+                if paper_id in seen:
+                    continue
+                seen.add(paper_id)
+                if len(top) < limit or impact * idf + others > top[0][0]:
+                    consider(paper_id)
+            cursors[best_list] = end
+            scanned += end - start
+
+        # 2. Flat score distributions (words in most papers) would make the
+        #    threshold algorithm read nearly every list to the end. Instead,
+        #    keep reading in the same order without random accesses, adding
+        #    up partial scores, until the budget is spent ...
+        partial = {}
+        get = partial.get
+        while scanned < self.max_postings:
+            best_list, _, _ = next_list()
+            if best_list < 0:
+                break
+            _, idf, postings = query[best_list]
+            start = cursors[best_list]
+            end = min(start + ACCUMULATE_BATCH, len(postings.ids))
+            for paper_id, impact in zip(postings.ids[start:end], postings.impacts[start:end]):
+                partial[paper_id] = get(paper_id, 0.0) + impact * idf
+            cursors[best_list] = end
+            scanned += end - start
+        self.postings_scanned += scanned
+        _, _, threshold = next_list()
+
+        # ... 3. and score the most promising of those exactly
+        for paper_id in seen:
+            partial.pop(paper_id, None)
+        if allowed is not None:
+            partial = {paper_id: score for paper_id, score in partial.items() if paper_id in allowed}
+        candidates = heapq.nlargest(CANDIDATES + 1, partial, key=partial.get)
+        for paper_id in candidates[:CANDIDATES]:
+            consider(paper_id)
+
+        # Any paper not scored exactly is at most its partial score plus the
+        # unread part of every list - if the k-th score clears that, the
+        # result is exact after all
+        unscored = partial[candidates[CANDIDATES]] if len(candidates) > CANDIDATES else 0.0
+        if threshold == 0.0 and len(candidates) <= CANDIDATES:
+            return top, False
+        return top, not (len(top) >= limit and top[0][0] >= unscored + threshold)
+
+    def rebuild(self, rows):
+        with self._lock:
+            self._partitions = {}
+            self._doc_partition = {}
+            for paper_id, conference_id, fields in rows:
+                old = self._doc_partition.get(paper_id)
+                if old is not None:
+                    old_part = self._partitions[old]
+                    old_part.total_len -= old_part.docs.pop(paper_id)[2]
+                part = self._partitions.get(conference_id)
+                if part is None:
+                    part = self._partitions[conference_id] = _Partition()
+                doc = self._forward(analyze(fields))
+                part.docs[paper_id] = doc
+                part.total_len += doc[2]
+                self._doc_partition[paper_id] = conference_id
+
+            for conference_id in [cid for cid, part in self._partitions.items() if not part.docs]:
+                del self._partitions[conference_id]
+            for part in self._partitions.values():
+                self._renormalize(part)
+            gc.collect()
+            gc.freeze()
+
+        if self.path:
+            self._publish_rebuild()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'backend': self.name,
+                'papers': len(self._doc_partition),
+                'partitions': len(self._partitions),
+                'terms': len(self._terms),
+                'queries': self.queries,
+                'avg_query_ms': round(self.query_seconds * 1000 / self.queries, 3) if self.queries else 0.0,
+                'postings_scanned': self.postings_scanned,
+                'truncated_queries': self.truncated_queries,
+                'updates': self.updates,
+                'renormalizations': self.renormalizations,
+                'journal_entries': self._journal_entries,
+                'journal_backlog': len(self._backlog),
+                'snapshots': self.snapshots,
+            }
+
+    def caught_up(self) -> bool:
+        """True when every journal entry other workers have written is applied here"""
+        with self._lock:
+            return not self._backlog and (self._log is None or not self._log.changed())
+
+    def close(self):
+        self._closed.set()
+        thread = self._snapshot_thread
+        if thread is not None:
+            thread.join()
+        if self._log is not None:
+            with self._lock:
+                self._catch_up()  # another worker's snapshot may already cover our entries
+            if self._journal_entries:
+                self.snapshot()
+            with self._lock:
+                self._log.close()
+                self._log = None
+
+    # ---------- Persistence ----------
+
+    @property
+    def _snapshot_path(self):
+        return os.path.join(self.path, SNAPSHOT_FILE)
+
+    def _journal_locked(self):
+        return self._log.locked() if self._log is not None else nullcontext()
+
+    def _write_journal(self, entry: dict):
+        """Append one change (caller holds the lock and the journal lock)"""
+        if self._log is None:
+            return
+        self._log.append((json.dumps(entry, separators=(',', ':')) + '\n').encode('utf-8'))
+        self._journal_entries += 1
+        if self._journal_entries >= self.snapshot_every and self._snapshot_thread is None:
+            self._snapshot_thread = threading.Thread(
+                target=self._background_snapshot, name='search-snapshot', daemon=True
+            )
+            self._snapshot_thread.start()
+
+    def _catch_up(self, deadline: float = None) -> bool:
+        """
+        Apply what other workers appended to the journal (caller holds the
+        lock); with a perf_counter `deadline`, stop once it passes and leave
+        the rest in the backlog. True when nothing is left.
+        """
+        log = self._log
+        if log is None:
+            return True
+        try:
+            while True:
+                if not self._backlog:
+                    if not log.changed():
+                        return True
+                    self._read_journal()
+                    if not self._backlog:
+                        return True
+                while self._backlog:
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        return False
+                    entry = json.loads(self._backlog.popleft())
+                    if entry['op'] == 'reload':
+                        raise LogGapError("index rebuilt by another worker")
+                    self._apply(entry)
+        except LogGapError:
+            # A rebuild holds the journal lock until its snapshot is in place
+            self._backlog.clear()
+            with self._journal_locked():
+                self._reload()
+            return True
+
+    def _read_journal(self):
+        """Move the complete records past the journal position into the backlog"""
+        log = self._log
+        while True:
+            records = log.read_records()
+            self._backlog.extend(records)
+            self._journal_entries += len(records)
+            following = log.newer_generations()
+            if not following:
+                return
+            # A snapshot started a new generation - finish this one first
+            self._backlog.extend(log.read_records())
+            if following[0] != (-1 if log.generation is None else log.generation) + 1:
+                raise LogGapError(f"journal generation {log.generation} + 1 is gone")
+            log.seek(following[0])
+            self._journal_entries = 0
+
+    # ---------- Tailer (background thread) ----------
+
+    def _ensure_tailer(self):
+        if self._log is None or not self.tail_interval or self._tailer_pid == os.getpid():
+            return
+        with self._lock:
+            if self._tailer_pid != os.getpid():
+                self._tailer_pid = os.getpid()
+                threading.Thread(target=self._tail, name='search-journal-tailer', daemon=True).start()
+
+    def _tail(self):
+        while not self._closed.wait(self.tail_interval):
+            try:
+                done = False
+                while not done:
+                    with self._lock:
+                        if self._log is None:
+                            return
+                        done = self._catch_up(time.perf_counter() + TAIL_SLICE)
+                    if not done and self._closed.wait(TAIL_PAUSE):
+                        return
+            except Exception as e:
+                print(f"⚠️  Search journal catch-up failed: {e}")
+
+    def _state(self, position) -> dict:
+        # Arrays and forward entries are replaced, never mutated in place -
+        # copying the containers (and the delta sets) is enough
+        return {
+            'version': SNAPSHOT_VERSION,
+            'k1': self.k1,
+            'b': self.b,
+            'journal': position,
+            'terms': list(self._terms),
+            'partitions': {
+                conference_id: {
+                    'docs': dict(part.docs),
+                    'terms': {
+                        term_id: (p.ids, p.impacts, set(p.delta), p.df)
+                        for term_id, p in part.terms.items()
+                    },
+                    'total_len': part.total_len,
+                    'avgdl_used': part.avgdl_used,
+                }
+                for conference_id, part in self._partitions.items()
+            },
+        }
+
+    def _write_snapshot(self, state: dict):
+        fd, tmp_path = tempfile.mkstemp(prefix='.snapshot-', dir=self.path)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._snapshot_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _background_snapshot(self):
+        try:
+            self.snapshot()
+        except Exception as e:
+            print(f"⚠️  Search index snapshot failed: {e}")
+        finally:
+            self._snapshot_thread = None
+
+    def snapshot(self):
+        """
+        Write every partition to disk and drop the journal generations it covers
+
+        One worker at a time (snapshot.lock); the others skip - the journal
+        is trimmed for all of them either way.
+        """
+        if not self.path:
+            return
+        with file_lock(os.path.join(self.path, SNAPSHOT_LOCK), blocking=False) as acquired:
+            if not acquired:
+                return
+            with self._lock, self._journal_locked():
+                self._catch_up()
+                # Entries from here on go to a new file; the snapshot covers
+                # everything before it. Pickling happens outside the locks.
+                generation = self._log.start_generation()
+                self._journal_entries = 0
+                state = self._state((generation, 0))
+            self._write_snapshot(state)
+            self._log.discard_before(generation)
+            self.snapshots += 1
+
+    def _publish_rebuild(self):
+        """Snapshot a rebuilt index and tell the other workers to load it"""
+        with file_lock(os.path.join(self.path, SNAPSHOT_LOCK)):
+            with self._lock, self._journal_locked():
+                self._catch_up()
+                if self._log.generation is None:
+                    self._log.start_generation()
+                generation = self._log.next_generation()
+                self._write_snapshot(self._state((generation, 0)))
+                # Readers of the current generation reload when they reach this
+                self._log.append(b'{"op":"reload"}\n')
+                self._log.start_generation()
+                self._journal_entries = 0
+            self._log.discard_before(generation)
+            self.snapshots += 1
+
+    def _reload(self):
+        """Start over from the snapshot on disk (caller holds the lock)"""
+        self._vocab = {}
+        self._terms = []
+        self._partitions = {}
+        self._doc_partition = {}
+        self._journal_entries = 0
+        self._backlog.clear()
+        gc.unfreeze()
+        self._load()
+
+    def _load(self):
+        state = None
+        try:
+            with open(self._snapshot_path, 'rb') as f:
+                state = pickle.load(f)
+        except FileNotFoundError:
+            pass
+
+        if state and state.get('version') == SNAPSHOT_VERSION and (state['k1'], state['b']) == (self.k1, self.b):
+            self._terms = state['terms']
+            self._vocab = {term: term_id for term_id, term in enumerate(self._terms)}
+            for conference_id, saved in state['partitions'].items():
+                part = _Partition()
+                part.docs = saved['docs']
+                part.total_len = saved['total_len']
+                part.avgdl_used = saved['avgdl_used']
+                for term_id, (ids, impacts, delta, df) in saved['terms'].items():
+                    postings = part.terms[term_id] = _Postings()
+                    postings.ids, postings.impacts, postings.delta, postings.df = ids, impacts, delta, df
+                self._partitions[conference_id] = part
+                for paper_id in part.docs:
+                    self._doc_partition[paper_id] = conference_id
+            self._log.seek(*state['journal'])
+            self.loaded_from_disk = True
+        else:
+            generations = self._log.generations()
+            if generations and generations[0] != 0:
+                # No usable snapshot and the start of the journal is gone -
+                # only a rebuild from the database can recover
+                self._log.seek(generations[-1], os.path.getsize(self._log.path(generations[-1])))
+                self.loaded_from_disk = False
+            else:
+                self._log.seek(None)
+
+        self._catch_up()
+        if self._journal_entries:
+            self.loaded_from_disk = True
+        if self.loaded_from_disk:
+            gc.collect()
+            gc.freeze()
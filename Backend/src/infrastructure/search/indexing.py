@@ -0,0 +1,201 @@
+# ============================================
+# File: Backend/src/infrastructure/search/indexing.py
+# ============================================
+"""
+Search backend selection and index maintenance
+
+    SEARCH_BACKEND=auto       postgres when DB_TYPE is postgresql, else memory
+    SEARCH_BACKEND=memory     InMemoryBM25Backend persisted under SEARCH_INDEX_PATH
+    SEARCH_BACKEND=postgres   PostgresFullTextBackend (tsvector + GIN)
+
+Papers written through the ORM are picked up by mapper events: inserts,
+updates touching a searchable column and deletes are collected on the
+session and applied to the backend after that session commits, so a
+rolled-back submission never shows up in search. Bulk query.update() /
+Core statements bypass mapper events - call reindex_papers() after those.
+"""
+
+import atexit
+import threading
+import time
+
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import object_session
+
+from infrastructure.databases.base import SessionLocal
+from infrastructure.monitoring.metrics import registry
+from infrastructure.search.base import FIELD_WEIGHTS
+
+
+PENDING_KEY = 'pending_search_updates'
+SEARCHABLE_COLUMNS = tuple(FIELD_WEIGHTS) + ('conference_id',)
+
+SEARCH_LATENCY = registry.histogram(
+    'uth_search_seconds', 'Paper search latency', ['backend'],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.02, 0.05, 0.1, 0.25, 1.0)
+)
+
+_backend = None
+_backend_lock = threading.Lock()
+_registered = False
+
+
+def _paper_fields(paper) -> dict:
+    return {field: getattr(paper, field) for field in FIELD_WEIGHTS}
+
+
+def _iter_papers(batch_size: int = 2000):
+    """(paper_id, conference_id, fields) of every paper, streamed"""
+    from infrastructure.models import Paper
+
+    # Own session - this may run from a commit hook of the request session
+    columns = [Paper.id, Paper.conference_id] + [getattr(Paper, field) for field in FIELD_WEIGHTS]
+    db = SessionLocal()
+    try:
+        for row in db.query(*columns).yield_per(batch_size):
+            yield row.id, row.conference_id, {field: getattr(row, field) for field in FIELD_WEIGHTS}
+    finally:
+        db.close()
+
+
+def _create_backend():
+    from config import get_config
+    current_config = get_config()
+
+    name = current_config.SEARCH_BACKEND.lower()
+    if name == 'auto':
+        name = 'postgres' if current_config.DB_TYPE.lower() == 'postgresql' else 'memory'
+
+    if name == 'postgres':
+        from infrastructure.search.postgres_fts import PostgresFullTextBackend
+        backend = PostgresFullTextBackend()
+        backend.ensure_schema()
+        print("🔎 Search backend: Postgres full-text (tsvector + GIN)")
+        return backend
+
+    if name != 'memory':
+        raise ValueError(f"Unsupported search backend: {name}. Use: auto, memory, or postgres")
+
+    from infrastructure.search.bm25_index import InMemoryBM25Backend
+    backend = InMemoryBM25Backend(
+        path=current_config.SEARCH_INDEX_PATH or None,
+        snapshot_every=current_config.SEARCH_SNAPSHOT_EVERY
+    )
+    if not backend.loaded_from_disk:
+        started = time.perf_counter()
+        backend.rebuild(_iter_papers())
+        print(f"🔎 Search index built: {backend.stats()['papers']} papers "
+              f"in {time.perf_counter() - started:.1f}s")
+    atexit.register(backend.close)
+    return backend
+
+
+def get_search_backend():
+    """Process-wide search backend (the memory index is loaded or built on first use)"""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _create_backend()
+    return _backend
+
+
+def loaded_search_backend():
+    """The backend if it has been created already, else None (never triggers a build)"""
+    return _backend
+
+
+def search_papers(query: str, conference_id: int = None, limit: int = 20, paper_ids=None):
+    """Ranked SearchResults (see SearchBackend.search), timed into uth_search_seconds"""
+    backend = get_search_backend()
+    started = time.perf_counter()
+    try:
+        return backend.search(query, conference_id=conference_id, limit=limit, paper_ids=paper_ids)
+    finally:
+        SEARCH_LATENCY.observe(time.perf_counter() - started, backend=backend.name)
+
+
+def reindex_papers(paper_ids=None):
+    """Re-read papers from the database into the index (all papers when ids is None)"""
+    backend = get_search_backend()
+    if paper_ids is None:
+        backend.rebuild(_iter_papers())
+        return
+    from infrastructure.models import Paper
+
+    paper_ids = set(paper_ids)
+    db = SessionLocal()
+    try:
+        papers = db.query(Paper).filter(Paper.id.in_(paper_ids)).all()
+        rows = [(paper.id, paper.conference_id, _paper_fields(paper)) for paper in papers]
+    finally:
+        db.close()
+    for paper_id, conference_id, fields in rows:
+        backend.index(paper_id, conference_id, fields)
+        paper_ids.discard(paper_id)
+    for paper_id in paper_ids:
+        backend.remove(paper_id)
+
+
+# ---------- Mapper / session events ----------
+
+def _queue(paper, change):
+    session = object_session(paper)
+    if session is not None:
+        session.info.setdefault(PENDING_KEY, {})[paper.id] = change
+
+
+def _after_insert(mapper, connection, paper):
+    _queue(paper, (paper.conference_id, _paper_fields(paper)))
+
+
+def _after_update(mapper, connection, paper):
+    state = sa_inspect(paper)
+    if any(state.attrs[column].history.has_changes() for column in SEARCHABLE_COLUMNS):
+        _queue(paper, (paper.conference_id, _paper_fields(paper)))
+
+
+def _after_delete(mapper, connection, paper):
+    _queue(paper, None)
+
+
+@event.listens_for(SessionLocal, 'after_commit')
+def _apply_after_commit(session):
+    changes = session.info.pop(PENDING_KEY, None)
+    if not changes:
+        return
+    try:
+        backend = get_search_backend()
+        for paper_id, change in changes.items():
+            if change is None:
+                backend.remove(paper_id)
+            else:
+                backend.index(paper_id, change[0], change[1])
+    except Exception as e:
+        # The commit already happened - a stale index must not fail the request
+        print(f"⚠️  Search index update failed: {e}")
+
+
+@event.listens_for(SessionLocal, 'after_rollback')
+def _forget_pending_updates(session):
+    session.info.pop(PENDING_KEY, None)
+
+
+def register_search_indexing(warm_up: bool = True):
+    """Attach the Paper mapper events (idempotent) and load the index in the background"""
+    global _registered
+    if not _registered:
+        from infrastructure.models import Paper
+        event.listen(Paper, 'after_insert', _after_insert)
+        event.listen(Paper, 'after_update', _after_update)
+        event.listen(Paper, 'after_delete', _after_delete)
+        _registered = True
+
+    if warm_up and _backend is None:
+        def _warm_up():
+            try:
+                get_search_backend()
+            except Exception as e:
+                print(f"⚠️  Search backend unavailable: {e}")
+
+        threading.Thread(target=_warm_up, name='search-warm-up', daemon=True).start()
@@ -0,0 +1,102 @@
+# ============================================
+# File: Backend/src/infrastructure/search/postgres_fts.py
+# ============================================
+"""
+Postgres full-text search backend (tsvector + GIN)
+
+The index lives in the papers table itself: a stored generated column
+    search_vector = title (A) || keywords (B) || abstract (C)
+kept current by Postgres on every INSERT / UPDATE, plus a GIN index on it.
+index() / remove() are therefore no-ops and several app workers can share
+it. The 'simple' configuration (no stemming, no stop words) keeps matching
+language-neutral - titles are a mix of English and Vietnamese. Unlike the
+in-memory backend, diacritics are not folded (unaccent() is not IMMUTABLE,
+so it cannot appear in a generated column).
+"""
+
+from sqlalchemy import bindparam, text
+
+from infrastructure.search.base import SearchBackend, SearchHit, SearchResults
+
+
+SEARCH_COLUMN = 'search_vector'
+SEARCH_INDEX = 'ix_papers_search_vector'
+
+_ADD_COLUMN = f"""
+ALTER TABLE papers ADD COLUMN IF NOT EXISTS {SEARCH_COLUMN} tsvector
+GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(keywords, '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce(abstract, '')), 'C')
+) STORED
+"""
+
+_CREATE_INDEX = f"CREATE INDEX IF NOT EXISTS {SEARCH_INDEX} ON papers USING GIN ({SEARCH_COLUMN})"
+
+
+class PostgresFullTextBackend(SearchBackend):
+    """
+    Usage:
+        backend = PostgresFullTextBackend()
+        backend.ensure_schema()        # once, at start-up
+        hits = backend.search('graph neural network', conference_id=3)
+    """
+
+    name = 'postgres'
+
+    def __init__(self, engine=None):
+        self._engine = engine
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from infrastructure.databases.base import get_engine
+            self._engine = get_engine()
+        return self._engine
+
+    def ensure_schema(self):
+        """Add the generated column and its GIN index (idempotent)"""
+        with self.engine.begin() as conn:
+            conn.execute(text(_ADD_COLUMN))
+            conn.execute(text(_CREATE_INDEX))
+
+    def index(self, paper_id, conference_id, fields):
+        pass  # the generated column follows the row
+
+    def remove(self, paper_id):
+        pass
+
+    def search(self, query, conference_id=None, limit=20, paper_ids=None):
+        if not query or not query.strip() or (paper_ids is not None and not paper_ids):
+            return SearchResults()
+
+        # {D, C, B, A} weights - same 1 : 2 : 3 ratio as FIELD_WEIGHTS
+        sql = (
+            f"SELECT id, ts_rank_cd('{{0.1, 0.33, 0.67, 1.0}}', {SEARCH_COLUMN}, query) AS score "
+            "FROM papers, websearch_to_tsquery('simple', :q) AS query "
+            f"WHERE {SEARCH_COLUMN} @@ query"
+        )
+        params = {'q': query, 'limit': limit}
+        if conference_id is not None:
+            sql += " AND conference_id = :conference_id"
+            params['conference_id'] = conference_id
+        if paper_ids is not None:
+            sql += " AND id IN :paper_ids"
+            params['paper_ids'] = list(paper_ids)
+        sql += " ORDER BY score DESC, id DESC LIMIT :limit"
+        statement = text(sql)
+        if paper_ids is not None:
+            statement = statement.bindparams(bindparam('paper_ids', expanding=True))
+
+        from infrastructure.databases.unit_of_work import session_scope
+        with session_scope(read_only=True) as db:
+            rows = db.execute(statement, params).fetchall()
+        # The planner ranks every match - results are always exact
+        return SearchResults(SearchHit(paper_id=row.id, score=float(row.score)) for row in rows)
+
+    def rebuild(self, rows):
+        # Nothing to rebuild - make sure the column and index exist instead
+        self.ensure_schema()
+
+    def stats(self):
+        return {'backend': self.name, 'column': SEARCH_COLUMN, 'index': SEARCH_INDEX}
@@ -0,0 +1,40 @@
+# ============================================
+# File: Backend/src/infrastructure/search/tokenizer.py
+# ============================================
+"""
+Tokenizer shared by indexing and querying
+
+Lower-cases, folds Vietnamese / Latin diacritics ("Học máy" matches
+"hoc may") and drops a small English stop-word list. No stemming - queries
+and documents go through the same function, so exact word forms match.
+"""
+
+import re
+import unicodedata
+
+
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+STOP_WORDS = frozenset("""
+a an and are as at be by for from has have in into is it its of on or that the
+their this to was were which with we our via using based than these those can
+""".split())
+
+
+def fold(text: str) -> str:
+    """Lower-case and strip diacritics (ASCII text takes the fast path)"""
+    text = text.lower()
+    if text.isascii():
+        return text
+    text = text.replace('đ', 'd')
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> list:
+    if not text:
+        return []
+    return [
+        token for token in _TOKEN_RE.findall(fold(text))
+        if len(token) > 1 and token not in STOP_WORDS
+    ]
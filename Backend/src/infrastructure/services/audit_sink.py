@@ -0,0 +1,329 @@
+# ============================================
+# File: Backend/src/infrastructure/services/audit_sink.py
+# ============================================
+"""
+Audit Sink - buffered, batched writer for audit_log_ai
+
+Audit rows never touch the database on the request path:
+    1. AuditLogAI.enqueue() parks the row on the caller's session
+    2. after the session commits, the row moves to a bounded in-memory queue
+       (a rollback drops it - we never audit work that did not happen)
+    3. a background thread bulk-inserts the queue every AUDIT_BATCH_SIZE rows
+       or AUDIT_FLUSH_INTERVAL seconds, whichever comes first
+
+If the database is unavailable (or the queue is full) rows are appended to a
+local JSON-lines spill file and replayed on the next successful flush.
+Replays are idempotent: every spilled row carries a spill_id (unique in
+audit_log_ai) and is inserted only if absent, so a crash between the insert
+and removing the file, or a row spilled twice, never duplicates it. A
+`.replay` file left by a crash is replayed first, and an flock keeps the
+workers sharing the spill file from replaying it at the same time.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from sqlalchemy import event
+from sqlalchemy.exc import DataError, IntegrityError
+
+from infrastructure.databases.base import SessionLocal
+from infrastructure.services.shared_log import file_lock
+
+
+PENDING_KEY = 'pending_audit_rows'
+
+
+class AuditSink:
+    """
+    Usage:
+        sink = get_audit_sink()
+        sink.record(user_id=1, action_type='user_login', table_name='users',
+                    record_id=1, session=db)
+    """
+
+    def __init__(self, batch_size: int = 200, flush_interval: float = 1.0,
+                 queue_size: int = 10000, spill_path: str = 'var/audit_spill.jsonl'):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spill_path = spill_path
+        self.replay_path = f"{spill_path}.replay"
+        self.rejected_path = f"{spill_path}.rejected"
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+        # Metrics
+        self.written = 0
+        self.spilled = 0
+        self.replayed = 0
+        self.rejected = 0
+        self.batches = 0
+
+    # ---------- Producer side (request thread) ----------
+
+    def record(self, user_id, action_type, table_name, record_id=None, data=None, session=None):
+        """
+        Queue one audit row. With a session, the row is held until that
+        session commits; without one it is queued immediately.
+        """
+        row = {
+            'action_user_id': user_id,
+            'action_type': action_type,
+            'table_name': table_name,
+            'record_id': record_id,
+            'data': data,
+            'timestamp': datetime.utcnow(),
+        }
+        if session is not None:
+            session.info.setdefault(PENDING_KEY, []).append(row)
+        else:
+            self.submit([row])
+
+    def submit(self, rows):
+        """Hand committed rows to the flusher; never blocks the caller"""
+        self._ensure_started()
+        overflow = []
+        for row in rows:
+            try:
+                self._queue.put_nowait(row)
+            except queue.Full:
+                overflow.append(row)
+        if overflow:
+            self._spill(overflow)
+
+    # ---------- Consumer side (background thread) ----------
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._stop_event.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name='audit-sink', daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.stop)
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            batch = self._collect()
+            if batch:
+                self._write(batch)
+            elif os.path.exists(self.spill_path) or os.path.exists(self.replay_path):
+                self._replay_spill()
+        # Drain whatever is left on shutdown
+        batch = self._drain()
+        if batch:
+            self._write(batch)
+
+    def _collect(self):
+        """Block until batch_size rows arrive or flush_interval elapses"""
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _drain(self):
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                return batch
+
+    def _insert(self, rows, replay: bool = False):
+        from infrastructure.databases.base import get_engine
+        from infrastructure.databases.upsert import insert_ignore
+        from infrastructure.models.audit_log_ai_model import AuditLogAI
+        # A replayed row may already be in the table (crash before the spill file went away)
+        statement = insert_ignore(AuditLogAI, ['spill_id']) if replay else AuditLogAI.__table__.insert()
+        with get_engine().begin() as conn:
+            # executemany - one round trip per batch
+            conn.execute(statement, rows)
+
+    def _write(self, rows):
+        if os.path.exists(self.spill_path) or os.path.exists(self.replay_path):
+            self._replay_spill()
+        try:
+            self._insert(rows)
+            self.written += len(rows)
+            self.batches += 1
+        except (IntegrityError, DataError):
+            # One bad row must not poison the whole batch
+            self._write_one_by_one(rows)
+        except Exception as e:
+            print(f"⚠️  Audit sink: database unavailable ({e.__class__.__name__}), spilling {len(rows)} rows")
+            self._spill(rows)
+
+    def _write_one_by_one(self, rows, replay: bool = False):
+        for row in rows:
+            try:
+                self._insert([row], replay)
+                self.written += 1
+            except (IntegrityError, DataError):
+                self.rejected += 1
+                self._append_lines(self.rejected_path, [row])
+            except Exception:
+                self._spill([row])
+
+    # ---------- Spill file ----------
+
+    def _append_lines(self, path, rows):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            for row in rows:
+                item = dict(row, timestamp=row['timestamp'].isoformat())
+                # Kept when a replayed row is spilled again
+                item.setdefault('spill_id', uuid.uuid4().hex)
+                f.write(json.dumps(item, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _spill(self, rows):
+        with self._spill_lock:
+            self._append_lines(self.spill_path, rows)
+            self.spilled += len(rows)
+
+    def _replay_spill(self):
+        """
+        Insert the spill file (after a `.replay` file a crash left behind),
+        putting back what could not be written
+        """
+        with file_lock(f"{self.spill_path}.lock", blocking=False) as acquired:
+            if not acquired:
+                return  # another worker is replaying
+            if os.path.exists(self.replay_path) and not self._replay_file():
+                return
+            with self._spill_lock:
+                if not os.path.exists(self.spill_path):
+                    return
+                os.replace(self.spill_path, self.replay_path)
+            self._replay_file()
+
+    def _replay_file(self) -> bool:
+        """Insert the rows of the `.replay` file; False when the database is still down"""
+        rows = []
+        with open(self.replay_path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                item = json.loads(line)
+                item['timestamp'] = datetime.fromisoformat(item['timestamp'])
+                # Spilled before rows had ids: the line itself identifies the row
+                item.setdefault('spill_id', hashlib.blake2b(line.encode('utf-8'), digest_size=16).hexdigest())
+                rows.append(item)
+
+        done = 0
+        try:
+            for start in range(0, len(rows), self.batch_size):
+                chunk = rows[start:start + self.batch_size]
+                try:
+                    self._insert(chunk, replay=True)
+                    self.written += len(chunk)
+                except (IntegrityError, DataError):
+                    self._write_one_by_one(chunk, replay=True)
+                self.replayed += len(chunk)
+                done = start + len(chunk)
+            return True
+        except Exception:
+            # Still down - keep the rows that were not written
+            with self._spill_lock:
+                self._append_lines(self.spill_path, rows[done:])
+            return False
+        finally:
+            os.remove(self.replay_path)
+
+    # ---------- Lifecycle ----------
+
+    def flush(self):
+        """Synchronously write everything queued so far (tests, shutdown)"""
+        batch = self._drain()
+        if batch:
+            self._write(batch)
+
+    def stop(self, timeout: float = 5):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> dict:
+        return {
+            'queued': self._queue.qsize(),
+            'written': self.written,
+            'batches': self.batches,
+            'spilled': self.spilled,
+            'replayed': self.replayed,
+            'rejected': self.rejected,
+        }
+
+
+_sink = None
+_sink_lock = threading.Lock()
+
+
+def _reset_after_fork():
+    # The flusher thread does not survive fork(); the child starts its own
+    # sink instead of re-writing rows the parent still holds.
+    global _sink, _sink_lock
+    _sink = None
+    _sink_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_audit_sink() -> AuditSink:
+    """Process-wide audit sink built from the current config"""
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                from config import get_config
+                current_config = get_config()
+                _sink = AuditSink(
+                    batch_size=current_config.AUDIT_BATCH_SIZE,
+                    flush_interval=current_config.AUDIT_FLUSH_INTERVAL,
+                    queue_size=current_config.AUDIT_QUEUE_SIZE,
+                    spill_path=current_config.AUDIT_SPILL_PATH,
+                )
+                if os.path.exists(_sink.spill_path) or os.path.exists(_sink.replay_path):
+                    # Rows left by a previous run (or a crash mid-replay) go in now
+                    _sink._ensure_started()
+    return _sink
+
+
+# Rows parked on a session follow that session's transaction outcome
+
+@event.listens_for(SessionLocal, 'after_commit')
+def _release_pending_audit(session):
+    rows = session.info.pop(PENDING_KEY, None)
+    if rows:
+        get_audit_sink().submit(rows)
+
+
+@event.listens_for(SessionLocal, 'after_rollback')
+def _discard_pending_audit(session):
+    session.info.pop(PENDING_KEY, None)
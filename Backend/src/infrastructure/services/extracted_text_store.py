@@ -0,0 +1,122 @@
+# ============================================
+# File: Backend/src/infrastructure/services/extracted_text_store.py
+# ============================================
+"""
+Extracted Text Store - gzip'd plain text of uploaded PDFs, keyed by SHA-256
+
+Text is stored under the same content hash as the PDF blob it came from, so
+a re-submitted identical PDF (same blob key) is never extracted twice.
+
+Layout under TEXT_ROOT:
+    <h[:2]>/<h[2:4]>/<h>.txt.gz         text, pages separated by '\\f'
+    <h[:2]>/<h[2:4]>/<h>.failed.json    why extraction gave up on that PDF
+
+Writes go to a temp file in the target directory and are renamed into place,
+so readers (and concurrent workers) never see a partial file.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+import threading
+import time
+
+
+PAGE_SEPARATOR = '\f'
+
+
+class ExtractedTextStore:
+    """
+    Usage:
+        store = get_text_store()
+        sha = FileStorageService.hash_from_key(paper.pdf_path)
+        text = store.read(sha)            # None until the pipeline has run
+        pages = store.read_pages(sha)
+    """
+
+    def __init__(self, root: str, compress_level: int = 6):
+        self.root = os.path.abspath(root)
+        self.compress_level = compress_level
+        os.makedirs(self.root, exist_ok=True)
+
+    def _base(self, sha256: str) -> str:
+        if len(sha256) < 4 or not sha256.isalnum():
+            raise ValueError(f"Invalid content hash: {sha256}")
+        return os.path.join(self.root, sha256[:2], sha256[2:4], sha256)
+
+    def text_path(self, sha256: str) -> str:
+        return self._base(sha256) + '.txt.gz'
+
+    def failure_path(self, sha256: str) -> str:
+        return self._base(sha256) + '.failed.json'
+
+    def has(self, sha256: str) -> bool:
+        return os.path.isfile(self.text_path(sha256))
+
+    def read(self, sha256: str):
+        """Full text (pages joined by '\\f') or None when not extracted"""
+        try:
+            with open(self.text_path(sha256), 'rb') as f:
+                return gzip.decompress(f.read()).decode('utf-8')
+        except FileNotFoundError:
+            return None
+
+    def read_pages(self, sha256: str):
+        text = self.read(sha256)
+        return None if text is None else text.split(PAGE_SEPARATOR)
+
+    def write(self, sha256: str, pages) -> int:
+        """Store the pages of one PDF; returns the compressed size"""
+        text = PAGE_SEPARATOR.join(pages)
+        data = gzip.compress(text.encode('utf-8'), compresslevel=self.compress_level, mtime=0)
+        self._write_atomic(self.text_path(sha256), data)
+        self.clear_failure(sha256)
+        return len(data)
+
+    def failure(self, sha256: str):
+        """{'reason', 'error', 'failed_at'} of the last failed attempt, or None"""
+        try:
+            with open(self.failure_path(sha256), encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def mark_failed(self, sha256: str, reason: str, error: str = None):
+        data = json.dumps({'reason': reason, 'error': error, 'failed_at': time.time()})
+        self._write_atomic(self.failure_path(sha256), data.encode('utf-8'))
+
+    def clear_failure(self, sha256: str):
+        try:
+            os.remove(self.failure_path(sha256))
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='.tmp-', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_text_store() -> ExtractedTextStore:
+    """Process-wide text store built from the current config"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                from config import get_config
+                _store = ExtractedTextStore(root=get_config().TEXT_ROOT)
+    return _store
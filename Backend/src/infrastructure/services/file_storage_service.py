@@ -1,2 +1,196 @@
-# Module: file_storage_service.py
-# Created automatically for UTH-ConfMS
+# ============================================
+# File: Backend/src/infrastructure/services/file_storage_service.py
+# ============================================
+"""
+File Storage Service - streaming, content-addressed blob store
+
+Uploads are copied from the incoming stream to disk in fixed-size chunks
+(never the whole file in memory) while the SHA-256 is computed on the fly.
+Blobs are stored under their hash, so a re-submitted identical PDF is
+deduplicated, and every write goes to a temp file first and is renamed into
+place atomically - readers never see a half-written blob.
+
+Layout under UPLOAD_ROOT:
+    tmp/                         in-progress writes
+    blobs/<h[:2]>/<h[2:4]>/<h>   finished blobs (h = sha256 hex)
+
+The storage key saved in Paper.pdf_path / camera_ready_path is the relative
+blob path, e.g. 'blobs/3f/a2/3fa2...e9'.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+
+
+PDF_MAGIC = b'%PDF-'
+
+
+class StorageError(Exception):
+    """Base class for storage failures"""
+
+
+class FileTooLargeError(StorageError):
+    """Upload exceeded the size limit (caller should answer 413)"""
+
+
+class InvalidFileError(StorageError):
+    """Upload is not the expected file type (caller should answer 400)"""
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    key: str            # relative path to store in the database
+    sha256: str
+    size: int
+    deduplicated: bool  # True if an identical blob already existed
+
+
+class FileStorageService:
+    """
+    Usage:
+        storage = get_file_storage()
+        stored = storage.save_stream(request.stream, require_pdf=True)
+        paper.pdf_path = stored.key
+    """
+
+    def __init__(self, root: str, chunk_size: int = 1024 * 1024, max_size: int = None):
+        self.root = os.path.abspath(root)
+        self.chunk_size = chunk_size
+        self.max_size = max_size
+        self.tmp_dir = os.path.join(self.root, 'tmp')
+        self.blob_dir = os.path.join(self.root, 'blobs')
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        os.makedirs(self.blob_dir, exist_ok=True)
+
+    # ---------- Keys ----------
+
+    @staticmethod
+    def key_for(sha256: str) -> str:
+        return '/'.join(['blobs', sha256[:2], sha256[2:4], sha256])
+
+    @staticmethod
+    def hash_from_key(key: str) -> str:
+        """SHA-256 hex of a blob key (also its strong ETag)"""
+        return key.rsplit('/', 1)[-1]
+
+    def path_for(self, key: str) -> str:
+        """Absolute path of a key; refuses keys that escape UPLOAD_ROOT"""
+        path = os.path.abspath(os.path.join(self.root, key))
+        if not path.startswith(self.blob_dir + os.sep):
+            raise StorageError(f"Invalid storage key: {key}")
+        return path
+
+    def exists(self, key: str) -> bool:
+        try:
+            return os.path.isfile(self.path_for(key))
+        except StorageError:
+            return False
+
+    def open(self, key: str):
+        return open(self.path_for(key), 'rb')
+
+    # ---------- Writes ----------
+
+    def new_temp_file(self, prefix: str = 'upload-'):
+        """(fd, path) of a fresh temp file inside UPLOAD_ROOT (same filesystem as blobs)"""
+        return tempfile.mkstemp(prefix=prefix, dir=self.tmp_dir)
+
+    def save_stream(self, stream, require_pdf: bool = False, max_size: int = None) -> StoredFile:
+        """
+        Copy a file-like object (anything with read(n)) into the store
+
+        Raises: FileTooLargeError, InvalidFileError
+        """
+        limit = max_size or self.max_size
+        fd, tmp_path = self.new_temp_file()
+        digest = hashlib.sha256()
+        size = 0
+
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                head = b''
+                while True:
+                    chunk = stream.read(self.chunk_size)
+                    if not chunk:
+                        break
+                    if require_pdf and len(head) < len(PDF_MAGIC):
+                        head += chunk[:len(PDF_MAGIC) - len(head)]
+                        if not PDF_MAGIC.startswith(head):
+                            raise InvalidFileError("File is not a PDF")
+                    size += len(chunk)
+                    if limit and size > limit:
+                        raise FileTooLargeError(f"File exceeds {limit // (1024 * 1024)} MB limit")
+                    digest.update(chunk)
+                    out.write(chunk)
+
+                if size == 0:
+                    raise InvalidFileError("Empty file")
+                if require_pdf and head != PDF_MAGIC:
+                    raise InvalidFileError("File is not a PDF")
+                out.flush()
+                os.fsync(out.fileno())
+
+            return self.commit_temp_file(tmp_path, digest.hexdigest(), size)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def commit_temp_file(self, tmp_path: str, sha256: str, size: int) -> StoredFile:
+        """Atomically move a fully written temp file to its content address"""
+        key = self.key_for(sha256)
+        final_path = self.path_for(key)
+
+        if os.path.exists(final_path):
+            os.remove(tmp_path)
+            return StoredFile(key=key, sha256=sha256, size=size, deduplicated=True)
+
+        os.makedirs(os.path.dirname(final_path), exist_ok=True)
+        os.replace(tmp_path, final_path)
+        self._fsync_dir(os.path.dirname(final_path))
+        return StoredFile(key=key, sha256=sha256, size=size, deduplicated=False)
+
+    @staticmethod
+    def _fsync_dir(path: str):
+        # Make the rename durable (no-op where directories cannot be opened)
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def delete(self, key: str) -> bool:
+        """Remove a blob (only when no Paper references it any more)"""
+        try:
+            os.remove(self.path_for(key))
+            return True
+        except FileNotFoundError:
+            return False
+
+
+_storage = None
+_storage_lock = threading.Lock()
+
+
+def get_file_storage() -> FileStorageService:
+    """Process-wide storage built from the current config"""
+    global _storage
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                from config import get_config
+                current_config = get_config()
+                _storage = FileStorageService(
+                    root=current_config.UPLOAD_ROOT,
+                    chunk_size=current_config.UPLOAD_CHUNK_SIZE,
+                    max_size=current_config.MAX_PDF_SIZE_MB * 1024 * 1024,
+                )
+    return _storage
@@ -0,0 +1,257 @@
+# ============================================
+# File: Backend/src/infrastructure/services/hashing_service.py
+# ============================================
+"""
+Password Hashing Service - bcrypt on a bounded process pool
+
+bcrypt is CPU-bound on purpose, so running it on the request thread lets a
+login storm at a submission deadline starve every other request. Jobs are sent
+to a process pool sized to the number of cores; when too many jobs are already
+running or waiting, new ones are rejected immediately instead of queueing.
+A job that times out keeps its slot until its worker is really free, and a
+pool broken by a dying worker is rebuilt (the job retried once).
+
+A full queue, a job that times out and a pool that keeps breaking all raise
+HashingBusyError - overload, never a wrong password: callers answer 503 with
+Retry-After. Job latency is the uth_password_hash_seconds histogram.
+"""
+
+import math
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+import bcrypt
+
+from infrastructure.monitoring.metrics import registry
+
+
+HASH_SECONDS = registry.histogram(
+    'uth_password_hash_seconds',
+    'bcrypt job latency (queue wait included)',
+    ['operation'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+)
+
+
+class HashingBusyError(Exception):
+    """The hashing pool cannot take or finish the job now - caller should answer 503 + Retry-After"""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class HashingQueueFullError(HashingBusyError):
+    """Raised when the hashing pool has no free slot"""
+
+
+class HashingTimeoutError(HashingBusyError):
+    """The job did not finish within the timeout (the pool is saturated or a worker is stuck)"""
+
+
+# Worker functions - module level so the process pool can pickle them
+
+def _bcrypt_hash(password: str, rounds: int) -> str:
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=rounds)).decode('utf-8')
+
+
+def _bcrypt_verify(password: str, hashed: str) -> bool:
+    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+
+
+def get_hash_rounds(hashed: str):
+    """
+    Read the cost factor stored in a bcrypt hash
+    Format: $2b$<cost>$<22 chars salt><31 chars hash>
+    Returns: int or None if the hash is not a bcrypt hash
+    """
+    try:
+        return int(hashed.split('$')[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+class PasswordHasher:
+    """
+    Bounded bcrypt executor with latency / queue depth metrics
+
+    Usage:
+        hasher = get_password_hasher()
+        hashed = hasher.hash('SecurePass123')
+        ok = hasher.verify('SecurePass123', hashed)
+    """
+
+    def __init__(self, workers: int, queue_size: int, rounds: int, timeout: float = 10):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.rounds = rounds
+        self.timeout = timeout
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(queue_size)
+
+        # Metrics
+        self._metrics_lock = threading.Lock()
+        self._in_flight = 0
+        self._rejected = 0
+        self._rehashed = 0
+        self._latency = {
+            'hash': {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0},
+            'verify': {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0},
+        }
+
+    def _get_executor(self):
+        """Create the process pool on first use (never at import time)"""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _run(self, operation: str, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            with self._metrics_lock:
+                self._rejected += 1
+            raise HashingQueueFullError("Password hashing queue is full, please retry")
+
+        with self._metrics_lock:
+            self._in_flight += 1
+
+        start = time.perf_counter()
+        future = None
+        try:
+            if self.workers <= 0:
+                return fn(*args)
+            executor, future = self._submit(fn, args)
+            try:
+                try:
+                    return future.result(timeout=self.timeout)
+                except BrokenProcessPool:
+                    # A worker died while running the job - rebuild the pool and retry once
+                    self._reset_executor(executor)
+                    executor, future = self._submit(fn, args)
+                    return future.result(timeout=self.timeout)
+            except FutureTimeoutError:
+                raise HashingTimeoutError(
+                    f"Password hashing took longer than {self.timeout:g}s, please retry",
+                    retry_after=max(1, math.ceil(self.timeout))
+                )
+            except BrokenProcessPool:
+                raise HashingBusyError("Password hashing pool is restarting, please retry")
+        finally:
+            elapsed = time.perf_counter() - start
+            HASH_SECONDS.observe(elapsed, operation=operation)
+            with self._metrics_lock:
+                stats = self._latency[operation]
+                stats['count'] += 1
+                stats['total_seconds'] += elapsed
+                stats['max_seconds'] = max(stats['max_seconds'], elapsed)
+            if future is None:
+                self._finish()
+            else:
+                # A timed-out job keeps its worker busy: the slot stays taken
+                # until it really ends (runs at once when already done)
+                future.add_done_callback(self._finish)
+
+    def _submit(self, fn, args):
+        """(executor, future); rebuilds the pool once when it is already broken"""
+        executor = self._get_executor()
+        try:
+            return executor, executor.submit(fn, *args)
+        except BrokenProcessPool:
+            self._reset_executor(executor)
+            executor = self._get_executor()
+            return executor, executor.submit(fn, *args)
+
+    def _finish(self, future=None):
+        self._slots.release()
+        with self._metrics_lock:
+            self._in_flight -= 1
+
+    def _reset_executor(self, broken=None):
+        """Drop the pool (only if it is still `broken`, when given - another thread may have rebuilt it)"""
+        with self._executor_lock:
+            if self._executor is not None and (broken is None or self._executor is broken):
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def hash(self, password: str, rounds: int = None) -> str:
+        return self._run('hash', _bcrypt_hash, password, rounds or self.rounds)
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return self._run('verify', _bcrypt_verify, password, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """True if the stored hash was made with a different cost factor"""
+        return get_hash_rounds(hashed) != self.rounds
+
+    def rehash(self, password: str) -> str:
+        """Hash again with the configured cost (used for rehash-on-login)"""
+        new_hash = self.hash(password)
+        with self._metrics_lock:
+            self._rehashed += 1
+        return new_hash
+
+    def stats(self) -> dict:
+        """Snapshot of queue depth and hash latency"""
+        with self._metrics_lock:
+            latency = {}
+            for operation, stats in self._latency.items():
+                count = stats['count']
+                latency[operation] = {
+                    'count': count,
+                    'total_seconds': round(stats['total_seconds'], 6),
+                    'avg_seconds': round(stats['total_seconds'] / count, 6) if count else 0.0,
+                    'max_seconds': round(stats['max_seconds'], 6),
+                }
+            return {
+                'workers': self.workers,
+                'rounds': self.rounds,
+                'queue_size': self.queue_size,
+                'queue_depth': self._in_flight,
+                'rejected': self._rejected,
+                'rehashed': self._rehashed,
+                'latency': latency,
+            }
+
+    def shutdown(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+
+_hasher = None
+_hasher_lock = threading.Lock()
+
+
+def _reset_after_fork():
+    # A process pool inherited from the parent is unusable in the child
+    global _hasher, _hasher_lock
+    _hasher = None
+    _hasher_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Process-wide hasher built from the current config"""
+    global _hasher
+    if _hasher is None:
+        with _hasher_lock:
+            if _hasher is None:
+                from config import get_config
+                current_config = get_config()
+                _hasher = PasswordHasher(
+                    workers=current_config.HASH_WORKERS,
+                    queue_size=current_config.HASH_QUEUE_SIZE,
+                    rounds=current_config.BCRYPT_ROUNDS,
+                    timeout=current_config.HASH_TIMEOUT,
+                )
+    return _hasher
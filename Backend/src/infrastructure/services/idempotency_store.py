@@ -0,0 +1,339 @@
+# ============================================
+# File: Backend/src/infrastructure/services/idempotency_store.py
+# ============================================
+"""
+Idempotency Store - a retried request gets the original request's outcome
+
+Clients send an `Idempotency-Key` header (any unique string, a UUID is
+fine) and reuse it when they retry. Keys are unique per (user, scope, key)
+in the idempotency_keys table:
+
+    claim()     INSERT status='processing' and commit at once, in its own
+                short transaction. For a key that already exists:
+                    completed                -> its stored outcome (replay)
+                    processing, claim fresh  -> IdempotencyInProgressError
+                    processing, claim stale  -> taken over (the first attempt died)
+                    different payload        -> IdempotencyKeyReusedError
+    record_blob()  note the SHA-256 of the file the attempt stored (own short
+                transaction). Only an attempt that got this far passes its
+                receipt time on to a retry - and only to a retry that sends
+                the same file.
+    complete()  UPDATE to 'completed' with the outcome, inside the CALLER's
+                transaction: the Paper row and the stored outcome commit
+                together. If another attempt took the claim over meanwhile,
+                IdempotencyClaimLostError rolls the caller back.
+    release()   expire our processing claim after an unexpected error so the
+                retry takes it over without waiting
+
+Completed keys are kept IDEMPOTENCY_TTL_HOURS and purged opportunistically.
+"""
+
+import hashlib
+import json
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy.exc import IntegrityError
+
+from infrastructure.databases.base import SessionLocal
+from infrastructure.models import IdempotencyKey
+
+
+STATUS_PROCESSING = 'processing'
+STATUS_COMPLETED = 'completed'
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyError(Exception):
+    pass
+
+
+class IdempotencyInProgressError(IdempotencyError):
+    """The first request with this key is still running"""
+
+    def __init__(self, retry_after: int = 1):
+        super().__init__("A request with this Idempotency-Key is still being processed")
+        self.retry_after = retry_after
+
+
+class IdempotencyKeyReusedError(IdempotencyError):
+    """Same key, different request payload"""
+
+    def __init__(self):
+        super().__init__("Idempotency-Key was already used for a different request")
+
+
+class IdempotencyClaimLostError(IdempotencyError):
+    """Our claim expired and another attempt took the key over"""
+
+
+@dataclass
+class IdempotencyClaim:
+    record_id: int
+    token: str
+    received_at: datetime      # of the request holding the claim
+    blob_sha256: str = None    # takeover: the file the earlier attempt stored (received_at is its)
+    result: dict = None        # replay: stored outcome of the original request
+    error: str = None
+
+    @property
+    def replayed(self) -> bool:
+        return self.result is not None or self.error is not None
+
+
+def request_fingerprint(payload) -> str:
+    """SHA-256 of a canonical JSON form of the request payload"""
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def validate_key(key: str):
+    """Error message, or None when the header value is usable"""
+    if not key or len(key) > MAX_KEY_LENGTH:
+        return f"Idempotency-Key must be 1-{MAX_KEY_LENGTH} characters"
+    if not key.isprintable():
+        return "Idempotency-Key must be printable"
+    return None
+
+
+class IdempotencyStore:
+    """
+    Usage:
+        store = get_idempotency_store()
+        claim = store.claim(user_id, 'submission', key, request_fingerprint(payload), received_at)
+        if claim.replayed:
+            return claim.result, claim.error
+        with separate_transaction() as db:
+            ...                                          # the actual work
+            store.complete(db, claim, result={...})
+    """
+
+    def __init__(self, ttl_seconds: int = 24 * 3600, claim_seconds: int = 300,
+                 purge_interval: int = 600):
+        self.ttl_seconds = ttl_seconds
+        self.claim_seconds = claim_seconds
+        self.purge_interval = purge_interval
+        self._last_purge = 0.0
+        self._purge_lock = threading.Lock()
+
+        # Metrics
+        self.claimed = 0
+        self.replayed = 0
+        self.in_progress = 0
+        self.taken_over = 0
+
+    def claim(self, user_id: int, scope: str, key: str, fingerprint: str,
+              received_at: datetime) -> IdempotencyClaim:
+        """
+        Claim the key for this request (committed before returning)
+
+        Raises: IdempotencyInProgressError, IdempotencyKeyReusedError
+        """
+        self.maybe_purge()
+        now = datetime.utcnow()
+        db = SessionLocal()
+        try:
+            row = self._find(db, user_id, scope, key)
+            if row is None:
+                row = IdempotencyKey(
+                    user_id=user_id,
+                    scope=scope,
+                    key=key,
+                    fingerprint=fingerprint,
+                    status=STATUS_PROCESSING,
+                    claim_token=secrets.token_hex(16),
+                    locked_until=now + timedelta(seconds=self.claim_seconds),
+                    received_at=received_at,
+                    expires_at=now + timedelta(seconds=self.ttl_seconds)
+                )
+                db.add(row)
+                try:
+                    db.commit()
+                    self.claimed += 1
+                    return IdempotencyClaim(row.id, row.claim_token, received_at)
+                except IntegrityError:
+                    # A concurrent retry inserted the same key first
+                    db.rollback()
+                    row = self._find(db, user_id, scope, key)
+                    if row is None:
+                        raise IdempotencyInProgressError()
+            return self._existing(db, row, fingerprint, received_at, now)
+        finally:
+            db.close()
+
+    def _existing(self, db, row, fingerprint, received_at, now) -> IdempotencyClaim:
+        expired = row.expires_at <= now
+        if not expired and row.fingerprint != fingerprint:
+            raise IdempotencyKeyReusedError()
+
+        if not expired and row.status == STATUS_COMPLETED:
+            self.replayed += 1
+            return IdempotencyClaim(
+                row.id, row.claim_token, row.received_at,
+                result=json.loads(row.result) if row.result else None,
+                error=row.error
+            )
+
+        if not expired and row.locked_until > now:
+            self.in_progress += 1
+            remaining = (row.locked_until - now).total_seconds()
+            raise IdempotencyInProgressError(retry_after=max(1, min(5, int(remaining))))
+
+        # The first attempt died (or the key expired): take the row over - only
+        # if nobody else did since we read it. A retry keeps the receipt time of
+        # the first attempt, so a deadline it made is still made - but only if
+        # that attempt had stored its file: one that failed before (garbage
+        # body, dropped connection) proves nothing about when the real file
+        # was sent. The caller compares the retry's file with blob_sha256.
+        blob_sha256 = None
+        if not expired and row.blob_sha256 and row.received_at < received_at:
+            received_at, blob_sha256 = row.received_at, row.blob_sha256
+        token = secrets.token_hex(16)
+        updated = db.query(IdempotencyKey).filter(
+            IdempotencyKey.id == row.id,
+            IdempotencyKey.claim_token == row.claim_token
+        ).update({
+            IdempotencyKey.status: STATUS_PROCESSING,
+            IdempotencyKey.fingerprint: fingerprint,
+            IdempotencyKey.claim_token: token,
+            IdempotencyKey.locked_until: now + timedelta(seconds=self.claim_seconds),
+            IdempotencyKey.received_at: received_at,
+            IdempotencyKey.blob_sha256: blob_sha256,
+            IdempotencyKey.result: None,
+            IdempotencyKey.error: None,
+            IdempotencyKey.paper_id: None,
+            IdempotencyKey.completed_at: None,
+            IdempotencyKey.expires_at: now + timedelta(seconds=self.ttl_seconds),
+        }, synchronize_session=False)
+        db.commit()
+        if not updated:
+            raise IdempotencyInProgressError()
+        self.taken_over += 1
+        return IdempotencyClaim(row.id, token, received_at, blob_sha256=blob_sha256)
+
+    @staticmethod
+    def _find(db, user_id, scope, key):
+        return db.query(IdempotencyKey).filter(
+            IdempotencyKey.user_id == user_id,
+            IdempotencyKey.scope == scope,
+            IdempotencyKey.key == key
+        ).first()
+
+    @staticmethod
+    def record_blob(claim: IdempotencyClaim, sha256: str, received_at: datetime):
+        """
+        Note the file this attempt stored and the receipt time it is held to
+        (own transaction, committed at once); raises IdempotencyClaimLostError
+        """
+        db = SessionLocal()
+        try:
+            updated = db.query(IdempotencyKey).filter(
+                IdempotencyKey.id == claim.record_id,
+                IdempotencyKey.claim_token == claim.token,
+                IdempotencyKey.status == STATUS_PROCESSING
+            ).update({
+                IdempotencyKey.blob_sha256: sha256,
+                IdempotencyKey.received_at: received_at,
+            }, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+        if not updated:
+            raise IdempotencyClaimLostError("Idempotency claim was taken over by a retry")
+        claim.blob_sha256 = sha256
+        claim.received_at = received_at
+
+    @staticmethod
+    def complete(db, claim: IdempotencyClaim, result: dict = None, error: str = None,
+                 paper_id: int = None):
+        """Store the outcome in the caller's transaction; raises IdempotencyClaimLostError"""
+        updated = db.query(IdempotencyKey).filter(
+            IdempotencyKey.id == claim.record_id,
+            IdempotencyKey.claim_token == claim.token,
+            IdempotencyKey.status == STATUS_PROCESSING
+        ).update({
+            IdempotencyKey.status: STATUS_COMPLETED,
+            IdempotencyKey.result: json.dumps(result, default=str) if result is not None else None,
+            IdempotencyKey.error: error,
+            IdempotencyKey.paper_id: paper_id,
+            IdempotencyKey.completed_at: datetime.utcnow(),
+        }, synchronize_session=False)
+        if not updated:
+            raise IdempotencyClaimLostError("Idempotency claim was taken over by a retry")
+
+    @staticmethod
+    def release(claim: IdempotencyClaim):
+        """Expire our processing claim (best effort) so a retry takes it over at once"""
+        db = SessionLocal()
+        try:
+            db.query(IdempotencyKey).filter(
+                IdempotencyKey.id == claim.record_id,
+                IdempotencyKey.claim_token == claim.token,
+                IdempotencyKey.status == STATUS_PROCESSING
+            ).update({
+                IdempotencyKey.locked_until: datetime.utcnow()
+            }, synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️  Could not release idempotency claim {claim.record_id}: {e}")
+        finally:
+            db.close()
+
+    def maybe_purge(self):
+        now = time.monotonic()
+        if now - self._last_purge < self.purge_interval:
+            return
+        if not self._purge_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_purge = now
+            self.purge_expired()
+        except Exception as e:
+            print(f"⚠️  Idempotency key purge failed: {e}")
+        finally:
+            self._purge_lock.release()
+
+    @staticmethod
+    def purge_expired() -> int:
+        db = SessionLocal()
+        try:
+            removed = db.query(IdempotencyKey).filter(
+                IdempotencyKey.expires_at < datetime.utcnow()
+            ).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+        if removed:
+            print(f"🧹 Purged {removed} expired idempotency key(s)")
+        return removed
+
+    def stats(self) -> dict:
+        return {
+            'claimed': self.claimed,
+            'replayed': self.replayed,
+            'in_progress': self.in_progress,
+            'taken_over': self.taken_over,
+        }
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """Process-wide store built from the current config"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                from config import get_config
+                current_config = get_config()
+                _store = IdempotencyStore(
+                    ttl_seconds=current_config.IDEMPOTENCY_TTL_HOURS * 3600,
+                    claim_seconds=current_config.IDEMPOTENCY_CLAIM_SECONDS,
+                )
+    return _store
@@ -0,0 +1,522 @@
+# ============================================
+# File: Backend/src/infrastructure/services/pdf_extraction_service.py
+# ============================================
+"""
+PDF Extraction Pipeline - text of uploaded PDFs, off the request path
+
+    1. A Paper is inserted, or its pdf_path / camera_ready_path changes ->
+       the blob key is parked on the session and queued after commit
+       (a rolled-back submission is never extracted)
+    2. a dispatcher thread hands queued blobs to a process pool; at most
+       `workers` extractions run at a time, the rest wait in the queue
+    3. the worker extracts the text with pypdf and writes it, gzip'd, to the
+       ExtractedTextStore under the blob's SHA-256 - blobs that already have
+       text (re-submissions, camera-ready = submission) are skipped
+
+Limits, enforced inside each worker process:
+    - EXTRACT_TIMEOUT seconds per file: a wall-clock alarm aborts the file;
+      a CPU-time rlimit kills the worker if it is stuck in C code
+    - EXTRACT_MEMORY_MB of address space on top of what the worker started
+      with (a decompression bomb fails with MemoryError, not an OOM kill)
+    - EXTRACT_MAX_PAGES pages per file
+A worker that dies takes the pool with it: the pool is rebuilt and the files
+that were running are retried once, then recorded as failed.
+
+Files that fail for a reason that will not go away (not a PDF, encrypted,
+timeout, memory) get a failure marker in the store and are not retried unless
+submitted with force=True. The queue lives in memory; backfill() (run at
+start-up) re-queues every paper whose text is missing - in one worker process
+only, the one holding TEXT_ROOT/.backfill.lock.
+
+Consumers of the text (near-duplicate signatures, ...) subscribe with
+add_extraction_listener(fn); fn(key, sha256) runs after each stored text.
+"""
+
+import atexit
+import os
+import queue
+import signal
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import object_session
+
+from infrastructure.databases.base import SessionLocal
+from infrastructure.services.extracted_text_store import ExtractedTextStore, get_text_store
+from infrastructure.services.file_storage_service import FileStorageService, StorageError, get_file_storage
+from infrastructure.services.shared_log import file_lock
+
+try:
+    import resource
+except ImportError:  # Windows - no rlimits (and no SIGALRM): limits are off
+    resource = None
+
+
+PENDING_KEY = 'pending_pdf_extractions'
+PDF_COLUMNS = ('pdf_path', 'camera_ready_path')
+
+# Failure reasons that a retry would not fix
+PERMANENT_FAILURES = frozenset({'invalid_pdf', 'encrypted', 'timeout', 'memory', 'worker_crash'})
+
+THROUGHPUT_WINDOW = 60.0   # seconds of completed jobs behind pages_per_second
+
+# In TEXT_ROOT; held by the one worker process running the start-up backfill
+BACKFILL_LOCK = '.backfill.lock'
+
+# Module-level, not on the pipeline: a forked child rebuilds its pipeline but
+# keeps what the app registered at import / create_app() time
+_listeners = []
+
+
+def add_extraction_listener(listener):
+    """listener(key, sha256) is called (on a pool callback thread) after each extracted text"""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+class ExtractionTimeout(Exception):
+    """Raised inside a worker when a file runs past its time budget"""
+
+
+# ---------- Worker side (runs in the pool processes) ----------
+
+def _on_alarm(signum, frame):
+    raise ExtractionTimeout()
+
+
+def _init_worker(memory_mb: int):
+    """Cap the worker's address space at its start-up size + memory_mb"""
+    if resource is None or not memory_mb:
+        return
+    try:
+        with open('/proc/self/statm') as f:
+            current = int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return  # no /proc - leave the cap off rather than guess
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = current + memory_mb * 1024 * 1024
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _arm_limits(timeout: float):
+    in_main_thread = threading.current_thread() is threading.main_thread()
+    if in_main_thread and hasattr(signal, 'setitimer'):
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    if resource is not None and in_main_thread:
+        # Backstop for code that never returns to the interpreter: SIGXCPU
+        # kills the worker once it has burnt twice the budget on this file
+        used = time.process_time()
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = int(used + 2 * timeout) + 1
+        if hard == resource.RLIM_INFINITY or soft < hard:
+            resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _disarm_limits():
+    in_main_thread = threading.current_thread() is threading.main_thread()
+    if in_main_thread and hasattr(signal, 'setitimer'):
+        signal.setitimer(signal.ITIMER_REAL, 0)
+    if resource is not None and in_main_thread:
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        resource.setrlimit(resource.RLIMIT_CPU, (hard, hard))
+
+
+def _extract_pdf(pdf_path: str, text_root: str, sha256: str, timeout: float, max_pages: int) -> dict:
+    """Extract one PDF into the text store; never raises for a bad file"""
+    started = time.perf_counter()
+    result = {'ok': False, 'pages': 0, 'total_pages': 0, 'reason': None, 'error': None}
+
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        result.update(reason='no_extractor', error='pypdf is not installed')
+        return result
+
+    _arm_limits(timeout)
+    try:
+        reader = PdfReader(pdf_path, strict=False)
+        if reader.is_encrypted and not reader.decrypt(''):
+            result.update(reason='encrypted', error='PDF needs a password')
+            return result
+
+        total = len(reader.pages)
+        pages = []
+        for index in range(min(total, max_pages) if max_pages else total):
+            pages.append(reader.pages[index].extract_text() or '')
+
+        _disarm_limits()
+        ExtractedTextStore(text_root).write(sha256, pages)
+        result.update(ok=True, pages=len(pages), total_pages=total)
+    except ExtractionTimeout:
+        result.update(reason='timeout', error=f'Extraction took longer than {timeout:g}s')
+    except MemoryError:
+        result.update(reason='memory', error='Extraction exceeded the memory limit')
+    except FileNotFoundError:
+        result.update(reason='missing_file', error='PDF blob not found')
+    except Exception as e:
+        result.update(reason='invalid_pdf', error=f'{type(e).__name__}: {e}'[:300])
+    finally:
+        _disarm_limits()
+        result['seconds'] = time.perf_counter() - started
+    return result
+
+
+# ---------- Pipeline (runs in the app process) ----------
+
+class PdfExtractionPipeline:
+    """
+    Usage:
+        pipeline = get_extraction_pipeline()
+        pipeline.submit(paper.pdf_path)     # blob key, usually via the commit hook
+        pipeline.drain(timeout=60)          # scripts / tests: wait for the queue
+    """
+
+    def __init__(self, storage: FileStorageService, store: ExtractedTextStore, workers: int = 2,
+                 queue_size: int = 1000, timeout: float = 60, memory_mb: int = 512,
+                 max_pages: int = 200):
+        self.storage = storage
+        self.store = store
+        self.workers = workers
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+        self.max_pages = max_pages
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._queued = set()          # sha256 waiting or running - submit() dedupes on it
+        self._attempts = {}           # sha256 -> pool crashes seen while it was running
+        self._running = {}            # future -> (sha256, key)
+        self._slots = threading.BoundedSemaphore(max(1, workers))
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+        # Metrics
+        self.extracted = 0
+        self.skipped = 0              # text already stored for that hash
+        self.dropped = 0              # queue full - picked up by the next backfill
+        self.failures = {}            # reason -> count
+        self.pages = 0
+        self.worker_seconds = 0.0
+        self._recent = deque()        # (finished_at, pages) inside THROUGHPUT_WINDOW
+
+    # ---------- Producer side ----------
+
+    def submit(self, key: str, force: bool = False) -> bool:
+        """Queue one blob key; False when it is skipped, already queued or dropped"""
+        if not key:
+            return False
+        try:
+            self.storage.path_for(key)
+            sha256 = FileStorageService.hash_from_key(key)
+            self.store.text_path(sha256)
+        except (StorageError, ValueError):
+            return False  # legacy path, not a content-addressed blob
+        if not force:
+            if self.store.has(sha256):
+                with self._lock:
+                    self.skipped += 1
+                return False
+            failure = self.store.failure(sha256)
+            if failure and failure.get('reason') in PERMANENT_FAILURES:
+                return False
+        else:
+            self.store.clear_failure(sha256)
+
+        self._ensure_started()
+        with self._lock:
+            if sha256 in self._queued:
+                return False
+            try:
+                self._queue.put_nowait((sha256, key))
+            except queue.Full:
+                self.dropped += 1
+                return False
+            self._queued.add(sha256)
+        return True
+
+    def backfill(self) -> int:
+        """Queue every paper file that has no text yet; returns the number queued"""
+        from infrastructure.models import Paper
+
+        db = SessionLocal()
+        try:
+            rows = db.query(Paper.pdf_path, Paper.camera_ready_path).all()
+        finally:
+            db.close()
+        queued = 0
+        for row in rows:
+            for key in row:
+                if key and self.submit(key):
+                    queued += 1
+        return queued
+
+    # ---------- Dispatcher (background thread) ----------
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._stop_event.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name='pdf-extraction', daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.stop)
+
+    def _get_executor(self):
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        initializer=_init_worker,
+                        initargs=(self.memory_mb,)
+                    )
+        return self._executor
+
+    def _reset_executor(self, broken):
+        with self._executor_lock:
+            if self._executor is broken and broken is not None:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                sha256, key = self._queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            self._slots.acquire()
+            try:
+                self._dispatch(sha256, key)
+            except Exception as e:
+                self._finish(sha256, key, {'ok': False, 'reason': 'error', 'error': str(e)[:300], 'seconds': 0.0})
+
+    def _dispatch(self, sha256: str, key: str):
+        args = (None, self.store.root, sha256, self.timeout, self.max_pages)
+        try:
+            args = (self.storage.path_for(key),) + args[1:]
+        except Exception as e:
+            self._finish(sha256, key, {'ok': False, 'reason': 'missing_file', 'error': str(e), 'seconds': 0.0})
+            return
+
+        if self.workers <= 0:
+            self._finish(sha256, key, _extract_pdf(*args))
+            return
+
+        executor = self._get_executor()
+        try:
+            future = executor.submit(_extract_pdf, *args)
+        except BrokenProcessPool:
+            self._reset_executor(executor)
+            future = self._get_executor().submit(_extract_pdf, *args)
+        with self._lock:
+            self._running[future] = (sha256, key)
+        future.add_done_callback(lambda f, executor=executor: self._on_done(f, executor))
+
+    def _on_done(self, future, executor):
+        with self._lock:
+            sha256, key = self._running.pop(future)
+        try:
+            result = future.result()
+        except BrokenProcessPool:
+            # A worker was killed (CPU backstop, OOM killer) - every file that
+            # was running fails with this; give each one more go
+            self._reset_executor(executor)
+            with self._lock:
+                attempts = self._attempts[sha256] = self._attempts.get(sha256, 0) + 1
+            if attempts <= 1 and self._requeue(sha256, key):
+                self._slots.release()
+                return
+            result = {'ok': False, 'reason': 'worker_crash', 'error': 'Extraction worker died', 'seconds': 0.0}
+        except Exception as e:
+            result = {'ok': False, 'reason': 'error', 'error': str(e)[:300], 'seconds': 0.0}
+        self._finish(sha256, key, result)
+
+    def _requeue(self, sha256: str, key: str) -> bool:
+        try:
+            self._queue.put_nowait((sha256, key))
+            return True
+        except queue.Full:
+            return False
+
+    def _finish(self, sha256: str, key: str, result: dict):
+        if not result['ok']:
+            reason = result['reason']
+            if reason in PERMANENT_FAILURES:
+                self.store.mark_failed(sha256, reason, result.get('error'))
+            print(f"⚠️  PDF extraction failed ({reason}) for {key}: {result.get('error')}")
+
+        now = time.monotonic()
+        with self._lock:
+            self._queued.discard(sha256)
+            self._attempts.pop(sha256, None)
+            self.worker_seconds += result.get('seconds', 0.0)
+            if result['ok']:
+                self.extracted += 1
+                self.pages += result['pages']
+                self._recent.append((now, result['pages']))
+            else:
+                self.failures[result['reason']] = self.failures.get(result['reason'], 0) + 1
+            if not self._queued:
+                self._idle.notify_all()
+        self._slots.release()
+
+        if result['ok']:
+            for listener in list(_listeners):
+                try:
+                    listener(key, sha256)
+                except Exception as e:
+                    print(f"⚠️  Extraction listener failed for {key}: {e}")
+
+    # ---------- Lifecycle ----------
+
+    def drain(self, timeout: float = None) -> bool:
+        """Block until nothing is queued or running; False on timeout"""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._queued, timeout)
+
+    def stop(self, timeout: float = 5):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def stats(self) -> dict:
+        with self._lock:
+            horizon = time.monotonic() - THROUGHPUT_WINDOW
+            while self._recent and self._recent[0][0] < horizon:
+                self._recent.popleft()
+            recent_pages = sum(pages for _, pages in self._recent)
+            return {
+                'queued': self._queue.qsize(),
+                'running': len(self._running),
+                'extracted': self.extracted,
+                'skipped': self.skipped,
+                'dropped': self.dropped,
+                'failed': dict(self.failures),
+                'pages': self.pages,
+                'worker_seconds': round(self.worker_seconds, 3),
+                'pages_per_second': round(recent_pages / THROUGHPUT_WINDOW, 3),
+            }
+
+
+_pipeline = None
+_pipeline_lock = threading.Lock()
+_registered = False
+
+
+def _reset_after_fork():
+    # Pool workers are forked from the app process - they must not inherit
+    # (and later shut down) the parent's pipeline
+    global _pipeline, _pipeline_lock
+    _pipeline = None
+    _pipeline_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_extraction_pipeline() -> PdfExtractionPipeline:
+    """Process-wide pipeline built from the current config"""
+    global _pipeline
+    if _pipeline is None:
+        with _pipeline_lock:
+            if _pipeline is None:
+                from config import get_config
+                current_config = get_config()
+                _pipeline = PdfExtractionPipeline(
+                    storage=get_file_storage(),
+                    store=get_text_store(),
+                    workers=current_config.EXTRACT_WORKERS,
+                    queue_size=current_config.EXTRACT_QUEUE_SIZE,
+                    timeout=current_config.EXTRACT_TIMEOUT,
+                    memory_mb=current_config.EXTRACT_MEMORY_MB,
+                    max_pages=current_config.EXTRACT_MAX_PAGES,
+                )
+    return _pipeline
+
+
+# ---------- New / replaced PDFs follow the session's transaction ----------
+
+def _queue_paper_files(paper, columns):
+    session = object_session(paper)
+    if session is None:
+        return
+    pending = session.info.setdefault(PENDING_KEY, set())
+    for column in columns:
+        key = getattr(paper, column)
+        if key:
+            pending.add(key)
+
+
+def _after_insert(mapper, connection, paper):
+    _queue_paper_files(paper, PDF_COLUMNS)
+
+
+def _after_update(mapper, connection, paper):
+    state = sa_inspect(paper)
+    changed = [column for column in PDF_COLUMNS if state.attrs[column].history.has_changes()]
+    if changed:
+        _queue_paper_files(paper, changed)
+
+
+@event.listens_for(SessionLocal, 'after_commit')
+def _queue_after_commit(session):
+    keys = session.info.pop(PENDING_KEY, None)
+    if keys:
+        pipeline = get_extraction_pipeline()
+        for key in keys:
+            pipeline.submit(key)
+
+
+@event.listens_for(SessionLocal, 'after_rollback')
+def _forget_pending_extractions(session):
+    session.info.pop(PENDING_KEY, None)
+
+
+def register_text_extraction(backfill: bool = True):
+    """Attach the Paper mapper events (idempotent) and queue missing texts in the background"""
+    global _registered
+    if _registered:
+        return
+    from infrastructure.models import Paper
+    event.listen(Paper, 'after_insert', _after_insert)
+    event.listen(Paper, 'after_update', _after_update)
+    _registered = True
+
+    if backfill:
+        def _backfill():
+            try:
+                pipeline = get_extraction_pipeline()
+                # Every prefork worker gets here: the first one takes the lock and
+                # keeps it until its queue is empty, the others skip the backfill
+                with file_lock(os.path.join(pipeline.store.root, BACKFILL_LOCK), blocking=False) as acquired:
+                    if not acquired:
+                        return
+                    queued = pipeline.backfill()
+                    if queued:
+                        print(f"📑 Queued {queued} PDFs for text extraction")
+                        pipeline.drain()
+            except Exception as e:
+                print(f"⚠️  PDF extraction backfill failed: {e}")
+
+        threading.Thread(target=_backfill, name='pdf-extraction-backfill', daemon=True).start()
@@ -0,0 +1,225 @@
+# ============================================
+# File: Backend/src/infrastructure/services/rate_limiter.py
+# ============================================
+"""
+Token-bucket rate limiting for login attempts
+
+A credential-stuffing burst must be rejected BEFORE the database lookup and
+the bcrypt verification, otherwise every bad guess still costs a full hash.
+Every attempt takes a token up front (so concurrent guesses cannot all slip
+through) and a successful login gives it back: only failed attempts count
+against the limit, and a throttled attempt is always a saved bcrypt.
+
+Buckets live in an in-process, lock-striped table: keys are spread over
+LOGIN_THROTTLE_SHARDS independent locks so concurrent logins for different
+users do not contend. Other stores (Redis, ...) can implement
+RateLimitBackend and be plugged into LoginThrottle unchanged.
+"""
+
+import hashlib
+import itertools
+import math
+import threading
+import time
+from collections import OrderedDict
+
+
+class LoginThrottledError(Exception):
+    """Raised when a login attempt is over the limit - caller should answer 429"""
+
+    def __init__(self, scope: str, retry_after: float):
+        self.scope = scope
+        self.retry_after = retry_after
+        super().__init__("Too many login attempts, please retry later")
+
+
+class RateLimitBackend:
+    """
+    Interface for bucket stores
+
+    consume() takes `cost` tokens from the bucket `key` (capacity tokens,
+    refilled at refill_per_second) and returns (allowed, retry_after_seconds).
+    refund() puts `cost` tokens back, up to the bucket's capacity.
+    """
+
+    def consume(self, key: str, capacity: float, refill_per_second: float, cost: float = 1):
+        raise NotImplementedError
+
+    def refund(self, key: str, cost: float = 1):
+        raise NotImplementedError
+
+    def reset(self, key: str):
+        raise NotImplementedError
+
+
+class InMemoryTokenBucketBackend(RateLimitBackend):
+    """
+    Lock-striped token buckets in process memory
+
+    Each bucket keeps its own capacity / refill rate (ip and username buckets
+    share shards). A shard holds at most max_keys_per_shard buckets in LRU
+    order; a new key evicts the least recently used one - preferring, among
+    the EVICTION_SCAN oldest, one that has refilled completely (same as no
+    bucket). Attackers hammering a key keep it recent, so flooding new keys
+    only evicts idle buckets.
+    """
+
+    EVICTION_SCAN = 8
+
+    def __init__(self, shards: int = 64, max_keys_per_shard: int = 10000):
+        self.shards = shards
+        self.max_keys_per_shard = max_keys_per_shard
+        self._locks = [threading.Lock() for _ in range(shards)]
+        # key -> [tokens, updated_at, capacity, refill_per_second], LRU first
+        self._buckets = [OrderedDict() for _ in range(shards)]
+        self.evicted = 0
+
+    def _shard(self, key: str) -> int:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'big') % self.shards
+
+    def consume(self, key, capacity, refill_per_second, cost=1):
+        index = self._shard(key)
+        now = time.monotonic()
+        with self._locks[index]:
+            buckets = self._buckets[index]
+            bucket = buckets.get(key)
+            if bucket is None:
+                if len(buckets) >= self.max_keys_per_shard:
+                    self._evict(buckets, now)
+                bucket = buckets[key] = [capacity, now, capacity, refill_per_second]
+            else:
+                buckets.move_to_end(key)
+                elapsed = now - bucket[1]
+                bucket[0] = min(capacity, bucket[0] + elapsed * refill_per_second)
+                bucket[1] = now
+                bucket[2], bucket[3] = capacity, refill_per_second
+
+            if bucket[0] >= cost:
+                bucket[0] -= cost
+                return True, 0.0
+
+            missing = cost - bucket[0]
+            retry_after = missing / refill_per_second if refill_per_second > 0 else math.inf
+            return False, retry_after
+
+    def refund(self, key, cost=1):
+        index = self._shard(key)
+        with self._locks[index]:
+            bucket = self._buckets[index].get(key)
+            if bucket is not None:
+                # Evicted meanwhile: a new bucket starts full anyway
+                bucket[0] = min(bucket[2], bucket[0] + cost)
+
+    def _evict(self, buckets, now):
+        """Drop one bucket: an old one that refilled completely, else the least recently used"""
+        victim = None
+        for key, (tokens, updated_at, capacity, refill) in itertools.islice(buckets.items(), self.EVICTION_SCAN):
+            if tokens + (now - updated_at) * refill >= capacity:
+                victim = key
+                break
+        if victim is None:
+            buckets.popitem(last=False)
+            self.evicted += 1
+        else:
+            del buckets[victim]
+
+    def reset(self, key):
+        index = self._shard(key)
+        with self._locks[index]:
+            self._buckets[index].pop(key, None)
+
+
+class LoginThrottle:
+    """
+    Per-username and per-client-IP limits for AuthService.login_user
+
+    Usage:
+        get_login_throttle().check(username, client_ip)   # raises LoginThrottledError
+        ...verify the password...
+        get_login_throttle().succeeded(username, client_ip)   # the attempt did not count
+    """
+
+    def __init__(self, backend: RateLimitBackend,
+                 user_burst: int, user_per_minute: float,
+                 ip_burst: int, ip_per_minute: float):
+        self.backend = backend
+        self.limits = {
+            'ip': (ip_burst, ip_per_minute / 60.0),
+            'username': (user_burst, user_per_minute / 60.0),
+        }
+
+        self._metrics_lock = threading.Lock()
+        self.allowed = 0
+        self.refunded = 0
+        self.throttled = {'ip': 0, 'username': 0}
+
+    @staticmethod
+    def _keys(username: str, client_ip: str = None):
+        for scope, value in (('ip', client_ip), ('username', (username or '').lower())):
+            if value:
+                yield scope, f"login:{scope}:{value}"
+
+    def check(self, username: str, client_ip: str = None):
+        for scope, key in self._keys(username, client_ip):
+            capacity, refill = self.limits[scope]
+            allowed, retry_after = self.backend.consume(key, capacity, refill)
+            if not allowed:
+                with self._metrics_lock:
+                    self.throttled[scope] += 1
+                raise LoginThrottledError(scope, retry_after)
+
+        with self._metrics_lock:
+            self.allowed += 1
+
+    def succeeded(self, username: str, client_ip: str = None):
+        """Give back the tokens check() took - successful logins never count against the limit"""
+        for _, key in self._keys(username, client_ip):
+            self.backend.refund(key)
+        with self._metrics_lock:
+            self.refunded += 1
+
+    @property
+    def bcrypt_avoided(self) -> int:
+        """Each throttled attempt is one bcrypt verification that never ran"""
+        return sum(self.throttled.values())
+
+    def stats(self) -> dict:
+        with self._metrics_lock:
+            return {
+                'allowed': self.allowed,
+                'refunded': self.refunded,
+                'throttled': dict(self.throttled),
+                'bcrypt_avoided': sum(self.throttled.values()),
+                'evicted_buckets': getattr(self.backend, 'evicted', 0),
+            }
+
+
+_throttle = None
+_throttle_lock = threading.Lock()
+
+# Extra backends register here, e.g. BACKENDS['redis'] = lambda config: RedisBackend(...)
+BACKENDS = {
+    'memory': lambda config: InMemoryTokenBucketBackend(shards=config.LOGIN_THROTTLE_SHARDS),
+}
+
+
+def get_login_throttle() -> LoginThrottle:
+    """Process-wide login throttle built from the current config"""
+    global _throttle
+    if _throttle is None:
+        with _throttle_lock:
+            if _throttle is None:
+                from config import get_config
+                current_config = get_config()
+                backend_name = current_config.LOGIN_THROTTLE_BACKEND
+                if backend_name not in BACKENDS:
+                    raise ValueError(f"Unsupported LOGIN_THROTTLE_BACKEND: {backend_name}. Use: {', '.join(BACKENDS)}")
+                _throttle = LoginThrottle(
+                    backend=BACKENDS[backend_name](current_config),
+                    user_burst=current_config.LOGIN_USER_BURST,
+                    user_per_minute=current_config.LOGIN_USER_PER_MINUTE,
+                    ip_burst=current_config.LOGIN_IP_BURST,
+                    ip_per_minute=current_config.LOGIN_IP_PER_MINUTE,
+                )
+    return _throttle
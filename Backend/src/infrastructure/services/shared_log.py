@@ -0,0 +1,219 @@
+# ============================================
+# File: Backend/src/infrastructure/services/shared_log.py
+# ============================================
+"""
+Shared append-only log - one set of files written by several worker processes
+
+Files live in one directory:
+    <name>.<generation>.<suffix>   the log, one file per generation
+    <name>.lock                    flock'd by writers
+
+Writers append whole records while holding an exclusive flock on the lock
+file, so records from different processes never interleave. Readers never
+lock: they remember a position (generation, offset), read up to the last
+complete record and pick the rest up on the next call - a half-written
+record at the end is another writer's, not garbage to cut off. Only a writer
+holding the lock repairs a torn tail (a writer that crashed mid-record).
+
+Compaction never rewrites a file another process may have open: it starts
+the next generation (a new file, moved into place whole) and deletes the old
+ones - an unlinked file stays readable through the handles still open on it.
+A reader whose next generation is already gone raises LogGapError and
+reloads from the owner's snapshot.
+
+Usage:
+    log = SharedLog(path, 'journal', 'jsonl')
+    log.seek(*saved_position)
+    with log.locked():
+        records = log.read_records()     # catch up first
+        log.append(b'...\\n')
+"""
+
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locks
+    fcntl = None
+
+
+class LogGapError(Exception):
+    """The generation after the reader's position was deleted - reload from a snapshot"""
+
+
+@contextmanager
+def file_lock(path: str, blocking: bool = True):
+    """Exclusive flock on `path`; yields False when non-blocking and already held"""
+    if fcntl is None:
+        yield True
+        return
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        yield True
+    finally:
+        os.close(fd)  # releases the lock
+
+
+class SharedLog:
+
+    def __init__(self, directory: str, name: str, suffix: str, record_size: int = None):
+        """record_size: fixed record width in bytes, None for newline-terminated records"""
+        self.directory = directory
+        self.name = name
+        self.suffix = suffix
+        self.record_size = record_size
+        self.generation = None
+        self.offset = 0
+        self._reader = None       # fd of the current generation, opened lazily
+        self._writer = None       # (generation, fd) opened O_APPEND
+        self._thread_lock = threading.RLock()  # flock does not exclude threads sharing a process
+        self._lock_depth = 0
+
+    # ---------- Files ----------
+
+    def path(self, generation: int) -> str:
+        return os.path.join(self.directory, f"{self.name}.{generation:08d}.{self.suffix}")
+
+    def generations(self) -> list:
+        prefix, suffix = self.name + '.', '.' + self.suffix
+        found = []
+        for entry in os.listdir(self.directory):
+            if entry.startswith(prefix) and entry.endswith(suffix):
+                middle = entry[len(prefix):-len(suffix)]
+                if middle.isdigit():
+                    found.append(int(middle))
+        return sorted(found)
+
+    def newer_generations(self) -> list:
+        current = -1 if self.generation is None else self.generation
+        return [generation for generation in self.generations() if generation > current]
+
+    # ---------- Reading ----------
+
+    @property
+    def position(self):
+        return self.generation, self.offset
+
+    def seek(self, generation, offset: int = 0):
+        self._close_reader()
+        self.generation = generation
+        self.offset = offset
+
+    def changed(self) -> bool:
+        """Cheap check (one or two stat calls) whether read_records() / a newer generation has news"""
+        if self.generation is None:
+            return bool(self.generations())
+        if self._reader is None:
+            return True
+        st = os.fstat(self._reader)
+        if st.st_size > self.offset or st.st_nlink == 0:
+            return True
+        return os.path.exists(self.path(self.generation + 1))
+
+    def read_records(self) -> list:
+        """Complete records of the current generation past the position (bytes each)"""
+        if self.generation is None:
+            return []
+        if self._reader is None:
+            try:
+                self._reader = os.open(self.path(self.generation), os.O_RDONLY)
+            except FileNotFoundError:
+                if self.newer_generations():
+                    raise LogGapError(f"{self.name} generation {self.generation} is gone")
+                return []  # not created yet
+        size = os.fstat(self._reader).st_size
+        if size <= self.offset:
+            return []
+        data = os.pread(self._reader, size - self.offset, self.offset)
+
+        if self.record_size:
+            usable = len(data) - len(data) % self.record_size
+            records = [data[i:i + self.record_size] for i in range(0, usable, self.record_size)]
+        else:
+            usable = data.rfind(b'\n') + 1
+            records = data[:usable].splitlines(keepends=True)
+        self.offset += usable
+        return records
+
+    # ---------- Writing (caller holds locked() and has read up to the end) ----------
+
+    @contextmanager
+    def locked(self):
+        """Exclusive across processes and threads; re-entrant within a thread"""
+        with self._thread_lock:
+            if self._lock_depth:
+                # A second flock on a new descriptor would wait for this one
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+            with file_lock(os.path.join(self.directory, self.name + '.lock')):
+                self._lock_depth = 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth = 0
+
+    def append(self, data: bytes):
+        if self.generation is None:
+            self.generation, self.offset = 0, 0
+        if self._writer is None or self._writer[0] != self.generation:
+            self._close_writer()
+            fd = os.open(self.path(self.generation), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            self._writer = (self.generation, fd)
+        fd = self._writer[1]
+        if os.fstat(fd).st_size > self.offset:
+            # Everything complete was read under this lock - the rest is a
+            # record a crashed writer never finished
+            os.ftruncate(fd, self.offset)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        self.offset += len(data)
+
+    def next_generation(self) -> int:
+        existing = self.generations()
+        current = -1 if self.generation is None else self.generation
+        return max(existing[-1] if existing else -1, current) + 1
+
+    def start_generation(self, source_path: str = None) -> int:
+        """Begin the next generation, optionally with the contents of `source_path` (moved in whole)"""
+        generation = self.next_generation()
+        if source_path is None:
+            fd, source_path = tempfile.mkstemp(prefix=f".{self.name}-", dir=self.directory)
+            os.close(fd)
+        os.replace(source_path, self.path(generation))
+        self.seek(generation, os.path.getsize(self.path(generation)))
+        return generation
+
+    def discard_before(self, generation: int):
+        for old in self.generations():
+            if old < generation:
+                try:
+                    os.remove(self.path(old))
+                except FileNotFoundError:
+                    pass
+
+    def close(self):
+        self._close_reader()
+        self._close_writer()
+
+    def _close_reader(self):
+        if self._reader is not None:
+            os.close(self._reader)
+            self._reader = None
+
+    def _close_writer(self):
+        if self._writer is not None:
+            os.close(self._writer[1])
+            self._writer = None
@@ -0,0 +1,399 @@
+# ============================================
+# File: Backend/src/infrastructure/services/upload_session_store.py
+# ============================================
+"""
+Upload Session Store - resumable, chunked uploads on local disk
+
+A session is a directory under UPLOAD_ROOT/sessions/<upload_id>/:
+    meta.json    owner, expected size, purpose, expiry, caller metadata
+    data.part    bytes received so far (its length IS the upload offset)
+
+Chunks are append-only: a PUT must start at the current offset. A client
+that lost the response to a chunk asks for the offset and continues from
+there, so a dropped connection costs one chunk, not the whole file.
+Re-sending a chunk that was already stored completely is acknowledged
+without writing anything.
+
+Finished uploads are hard-linked into the blob store through
+FileStorageService.commit_temp_file (same filesystem, atomic rename), and the
+session is dropped once the database row pointing at the blob commits. Sessions past their expiry are removed by
+collect_garbage(), which also runs opportunistically every
+UPLOAD_GC_INTERVAL seconds when a new session is created.
+
+Every mutation holds a per-session lock (flock where available), so two
+workers receiving the same chunk cannot interleave writes.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+
+from sqlalchemy import event
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locks
+    fcntl = None
+
+from infrastructure.services.file_storage_service import (
+    FileStorageService,
+    StoredFile,
+    StorageError,
+    FileTooLargeError,
+    InvalidFileError,
+    PDF_MAGIC,
+    get_file_storage,
+)
+from infrastructure.databases.base import SessionLocal
+
+
+META_FILE = 'meta.json'
+DATA_FILE = 'data.part'
+LOCK_FILE = '.lock'
+PENDING_DISCARD_KEY = 'discard_upload_sessions'
+
+
+class UploadSessionNotFoundError(StorageError):
+    """Unknown, expired or foreign upload session (caller should answer 404)"""
+
+
+class UploadOffsetMismatchError(StorageError):
+    """Chunk does not start at the current offset (caller should answer 409)"""
+
+    def __init__(self, expected: int):
+        self.expected = expected
+        super().__init__(f"Upload offset mismatch, expected {expected}")
+
+
+class UploadIncompleteError(StorageError):
+    """Finalize called before every byte arrived (caller should answer 409)"""
+
+
+class UploadChecksumMismatchError(InvalidFileError):
+    """The bytes received do not hash to the SHA-256 the client sent (caller should answer 400)"""
+
+
+@dataclass
+class UploadSession:
+    upload_id: str
+    user_id: int
+    purpose: str
+    total_size: int
+    created_at: float
+    expires_at: float
+    metadata: dict = field(default_factory=dict)
+    offset: int = 0
+
+    @property
+    def complete(self) -> bool:
+        return self.offset >= self.total_size
+
+    def to_dict(self) -> dict:
+        return {
+            'upload_id': self.upload_id,
+            'purpose': self.purpose,
+            'offset': self.offset,
+            'total_size': self.total_size,
+            'complete': self.complete,
+            'expires_at': self.expires_at,
+        }
+
+
+class UploadSessionStore:
+    """
+    Usage:
+        store = get_upload_session_store()
+        session = store.create(user_id, 'submission', total_size, metadata)
+        store.append(session.upload_id, user_id, offset, request.stream, length)
+        stored = store.finalize(session.upload_id, user_id)   # -> StoredFile
+    """
+
+    def __init__(self, storage: FileStorageService, ttl_seconds: int = 24 * 3600,
+                 gc_interval: int = 600):
+        self.storage = storage
+        self.root = os.path.join(storage.root, 'sessions')
+        self.ttl_seconds = ttl_seconds
+        self.gc_interval = gc_interval
+        self._last_gc = 0.0
+        self._gc_lock = threading.Lock()
+        self._thread_locks = {}
+        self._thread_locks_guard = threading.Lock()
+        os.makedirs(self.root, exist_ok=True)
+
+    # ---------- Paths / locking ----------
+
+    def _dir(self, upload_id: str) -> str:
+        # upload ids are uuid4 hex - anything else never touches the disk
+        if not upload_id or len(upload_id) != 32 or not all(c in '0123456789abcdef' for c in upload_id):
+            raise UploadSessionNotFoundError("Upload session not found")
+        return os.path.join(self.root, upload_id)
+
+    @contextmanager
+    def _locked(self, upload_id: str):
+        directory = self._dir(upload_id)
+        if not os.path.isdir(directory):
+            raise UploadSessionNotFoundError("Upload session not found")
+
+        with self._thread_locks_guard:
+            thread_lock = self._thread_locks.setdefault(upload_id, threading.Lock())
+
+        with thread_lock:
+            if fcntl is None:
+                yield directory
+                return
+            try:
+                fd = os.open(os.path.join(directory, LOCK_FILE), os.O_RDWR | os.O_CREAT, 0o600)
+            except FileNotFoundError:
+                raise UploadSessionNotFoundError("Upload session not found")
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield directory
+            finally:
+                os.close(fd)
+
+    def _forget_lock(self, upload_id: str):
+        with self._thread_locks_guard:
+            self._thread_locks.pop(upload_id, None)
+
+    def _read_meta(self, directory: str) -> UploadSession:
+        try:
+            with open(os.path.join(directory, META_FILE), encoding='utf-8') as f:
+                meta = json.load(f)
+        except (FileNotFoundError, ValueError):
+            raise UploadSessionNotFoundError("Upload session not found")
+        session = UploadSession(**meta)
+        try:
+            session.offset = os.path.getsize(os.path.join(directory, DATA_FILE))
+        except FileNotFoundError:
+            session.offset = 0
+        return session
+
+    def _load(self, directory: str, user_id: int) -> UploadSession:
+        session = self._read_meta(directory)
+        if session.user_id != user_id or session.expires_at < time.time():
+            raise UploadSessionNotFoundError("Upload session not found")
+        return session
+
+    # ---------- Protocol ----------
+
+    def create(self, user_id: int, purpose: str, total_size: int, metadata: dict = None) -> UploadSession:
+        if total_size <= 0:
+            raise InvalidFileError("Empty file")
+        if self.storage.max_size and total_size > self.storage.max_size:
+            raise FileTooLargeError(f"File exceeds {self.storage.max_size // (1024 * 1024)} MB limit")
+
+        self.maybe_collect_garbage()
+
+        now = time.time()
+        session = UploadSession(
+            upload_id=uuid.uuid4().hex,
+            user_id=user_id,
+            purpose=purpose,
+            total_size=total_size,
+            created_at=now,
+            expires_at=now + self.ttl_seconds,
+            metadata=metadata or {},
+        )
+        directory = self._dir(session.upload_id)
+        os.makedirs(directory)
+        meta = asdict(session)
+        meta.pop('offset')
+        with open(os.path.join(directory, META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        open(os.path.join(directory, DATA_FILE), 'wb').close()
+        return session
+
+    def get(self, upload_id: str, user_id: int) -> UploadSession:
+        return self._load(self._dir(upload_id), user_id)
+
+    def append(self, upload_id: str, user_id: int, offset: int, stream, length: int = None) -> UploadSession:
+        """
+        Write one chunk starting at `offset`; reads the stream in
+        storage.chunk_size pieces. Returns the session with the new offset.
+        """
+        with self._locked(upload_id) as directory:
+            session = self._load(directory, user_id)
+            data_path = os.path.join(directory, DATA_FILE)
+
+            if length is not None and offset < session.offset and offset + length <= session.offset:
+                # Retry of a chunk we already have
+                return session
+            if offset != session.offset:
+                raise UploadOffsetMismatchError(session.offset)
+
+            remaining = session.total_size - session.offset
+            if length is not None and length > remaining:
+                raise FileTooLargeError("Chunk goes past the declared upload size")
+
+            written = 0
+            try:
+                with open(data_path, 'ab') as out:
+                    while True:
+                        to_read = self.storage.chunk_size
+                        if length is not None:
+                            to_read = min(to_read, length - written)
+                            if to_read <= 0:
+                                break
+                        chunk = stream.read(to_read)
+                        if not chunk:
+                            break
+                        if written + len(chunk) > remaining:
+                            raise FileTooLargeError("Chunk goes past the declared upload size")
+                        out.write(chunk)
+                        written += len(chunk)
+                    out.flush()
+                    os.fsync(out.fileno())
+            except BaseException:
+                # Drop a partial chunk so the offset stays on a chunk boundary
+                with open(data_path, 'ab') as out:
+                    out.truncate(session.offset)
+                raise
+
+            session.offset += written
+            return session
+
+    def finalize(self, upload_id: str, user_id: int, require_pdf: bool = True,
+                 db_session=None, sha256: str = None) -> StoredFile:
+        """
+        Verify the finished upload (against `sha256` when the client sent
+        one) and add it to the blob store
+
+        The blob is created from a hard link, so the session survives until
+        it is discarded: with db_session that happens only after the session
+        commits, and a failed database write can simply call finalize again.
+        """
+        with self._locked(upload_id) as directory:
+            session = self._load(directory, user_id)
+            if not session.complete:
+                raise UploadIncompleteError(
+                    f"Upload incomplete: {session.offset} of {session.total_size} bytes received"
+                )
+
+            data_path = os.path.join(directory, DATA_FILE)
+            digest = hashlib.sha256()
+            with open(data_path, 'rb') as f:
+                head = f.read(len(PDF_MAGIC))
+                if require_pdf and head != PDF_MAGIC:
+                    raise InvalidFileError("File is not a PDF")
+                digest.update(head)
+                for chunk in iter(lambda: f.read(self.storage.chunk_size), b''):
+                    digest.update(chunk)
+            if sha256 is not None and digest.hexdigest() != sha256.lower():
+                # The session stays: the client may cancel it or find the bad chunk itself
+                raise UploadChecksumMismatchError(
+                    f"Upload checksum mismatch: received bytes hash to {digest.hexdigest()}"
+                )
+
+            fd, tmp_path = self.storage.new_temp_file(prefix='finalize-')
+            os.close(fd)
+            try:
+                os.remove(tmp_path)
+                os.link(data_path, tmp_path)
+            except OSError:
+                # No hard links on this filesystem - fall back to a copy
+                shutil.copyfile(data_path, tmp_path)
+            stored = self.storage.commit_temp_file(tmp_path, digest.hexdigest(), session.offset)
+
+        if db_session is None:
+            self.discard(upload_id)
+        else:
+            db_session.info.setdefault(PENDING_DISCARD_KEY, set()).add(upload_id)
+        return stored
+
+    def discard(self, upload_id: str, user_id: int = None) -> bool:
+        """Delete a session (user_id=None skips the ownership check)"""
+        directory = self._dir(upload_id)
+        if user_id is not None:
+            self._load(directory, user_id)
+        self._forget_lock(upload_id)
+        if not os.path.isdir(directory):
+            return False
+        shutil.rmtree(directory, ignore_errors=True)
+        return True
+
+    # ---------- Garbage collection ----------
+
+    def maybe_collect_garbage(self):
+        now = time.monotonic()
+        if now - self._last_gc < self.gc_interval:
+            return
+        if not self._gc_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_gc = now
+            self.collect_garbage()
+        finally:
+            self._gc_lock.release()
+
+    def collect_garbage(self) -> int:
+        """Remove expired sessions and stale temp files; returns how many were removed"""
+        removed = 0
+        now = time.time()
+
+        for name in os.listdir(self.root):
+            directory = os.path.join(self.root, name)
+            if not os.path.isdir(directory):
+                continue
+            try:
+                expired = self._read_meta(directory).expires_at < now
+            except (UploadSessionNotFoundError, TypeError):
+                # Half-created or unreadable session: judge by age
+                expired = os.path.getmtime(directory) + self.ttl_seconds < now
+            if expired:
+                self._forget_lock(name)
+                shutil.rmtree(directory, ignore_errors=True)
+                removed += 1
+
+        # Temp files left behind by crashed save_stream calls
+        for name in os.listdir(self.storage.tmp_dir):
+            path = os.path.join(self.storage.tmp_dir, name)
+            try:
+                if os.path.getmtime(path) + self.ttl_seconds < now:
+                    os.remove(path)
+                    removed += 1
+            except FileNotFoundError:
+                pass
+
+        if removed:
+            print(f"🧹 Upload GC removed {removed} expired session(s)/temp file(s)")
+        return removed
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_upload_session_store() -> UploadSessionStore:
+    """Process-wide session store on top of get_file_storage()"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                from config import get_config
+                current_config = get_config()
+                _store = UploadSessionStore(
+                    storage=get_file_storage(),
+                    ttl_seconds=current_config.UPLOAD_SESSION_TTL_HOURS * 3600,
+                    gc_interval=current_config.UPLOAD_GC_INTERVAL,
+                )
+    return _store
+
+
+@event.listens_for(SessionLocal, 'after_commit')
+def _discard_finalized_sessions(session):
+    upload_ids = session.info.pop(PENDING_DISCARD_KEY, None)
+    if upload_ids:
+        store = get_upload_session_store()
+        for upload_id in upload_ids:
+            store.discard(upload_id)
+
+
+@event.listens_for(SessionLocal, 'after_rollback')
+def _keep_sessions_for_retry(session):
+    session.info.pop(PENDING_DISCARD_KEY, None)
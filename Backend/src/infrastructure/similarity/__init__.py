@@ -0,0 +1,22 @@
+# File: src/infrastructure/similarity/__init__.py
+"""
+Near-duplicate detection, reviewer affinity and co-authorship exports
+(signature maintenance and lookups live in similarity.duplicates,
+per-conference affinity matrices in similarity.affinity, the
+conflict-of-interest graph in similarity.coauthor_graph)
+"""
+
+from .minhash import MinHasher, jaccard_estimate, optimal_bands, shingle_hashes
+from .lsh_index import MinHashLSHIndex
+from .tfidf import TfidfSpace
+from .coauthor_graph import CoauthorGraph
+
+__all__ = [
+    'CoauthorGraph',
+    'MinHasher',
+    'MinHashLSHIndex',
+    'TfidfSpace',
+    'jaccard_estimate',
+    'optimal_bands',
+    'shingle_hashes',
+]
@@ -0,0 +1,374 @@
+# ============================================
+# File: Backend/src/infrastructure/similarity/affinity.py
+# ============================================
+"""
+Reviewer <-> paper affinity - TF-IDF cosine of a paper and a reviewer profile
+
+Per conference two sparse matrices in one TF-IDF space (tfidf.py):
+    papers      one row per paper of the conference: title, keywords,
+                abstract (weighted as in search, FIELD_WEIGHTS)
+    reviewers   one row per reviewer of the pool: the same fields of every
+                paper they wrote (PaperAuthor or submitter) in OTHER
+                conferences, summed
+affinity(paper, reviewer) = papers[paper] . reviewers[reviewer]
+
+sync() brings the matrices up to date incrementally: a paper is re-read only
+when its updated_at moved, a reviewer only when the set of their papers (or
+one of them) changed, and rows of papers / reviewers that left are dropped.
+Rows are weighted with the idf of the moment; once the corpus has grown or
+shrunk by REWEIGHT_DRIFT since the last full pass every row is re-weighted.
+The transposed matrices used by lookups keep the heaviest PAPER_INDEX_TERMS /
+REVIEWER_INDEX_TERMS terms of each row (tfidf.py); single lookups rescore
+their shortlist with the exact cosine.
+
+Cache: <AFFINITY_CACHE_PATH>/conference_<id>.pickle holds the counts, rows
+and fingerprints, rewritten after each sync that changed something - a new
+process starts from it and only reads what changed meanwhile.
+"""
+
+import os
+import pickle
+import threading
+import time
+from array import array
+from collections import OrderedDict
+
+from infrastructure.search.base import FIELD_WEIGHTS
+from infrastructure.similarity.tfidf import (
+    TERM_TYPECODE,
+    WEIGHT_TYPECODE,
+    TfidfSpace,
+    dot,
+    merge_counts,
+    top_k,
+    transpose,
+)
+
+
+CACHE_VERSION = 1
+PAPER_INDEX_TERMS = 64      # heaviest terms of a paper in the transposed (lookup) matrix
+REVIEWER_INDEX_TERMS = 200  # ... of a reviewer profile (many papers)
+REWEIGHT_DRIFT = 0.1
+ID_CHUNK_SIZE = 900
+MAX_LOADED_CONFERENCES = 8
+
+_loaded = OrderedDict()
+_loaded_lock = threading.Lock()
+
+
+def _reset_after_fork():
+    global _loaded_lock
+    _loaded.clear()
+    _loaded_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _chunks(ids):
+    ids = list(ids)
+    for start in range(0, len(ids), ID_CHUNK_SIZE):
+        yield ids[start:start + ID_CHUNK_SIZE]
+
+
+def _stamp(row) -> str:
+    changed = row.updated_at or row.created_at
+    return changed.isoformat() if changed else ''
+
+
+def _packed(counts: dict) -> tuple:
+    term_ids = sorted(counts)
+    return array(TERM_TYPECODE, term_ids), array(WEIGHT_TYPECODE, [counts[t] for t in term_ids])
+
+
+def _unpacked(packed: tuple) -> dict:
+    return dict(zip(*packed))
+
+
+class ConferenceAffinity:
+    """
+    Usage:
+        affinity = get_conference_affinity(conference_id)
+        affinity.sync(db, reviewer_ids)
+        affinity.top_reviewers(paper_id, k=10)      # [(reviewer_id, cosine), ...]
+        affinity.top_papers(reviewer_id, k=10)      # [(paper_id, cosine), ...]
+    """
+
+    def __init__(self, conference_id: int, path: str = None):
+        self.conference_id = conference_id
+        self.path = path
+        self._lock = threading.RLock()
+        self.space = TfidfSpace()
+        self.papers = {}            # paper_id -> (updated_at stamp, packed counts)
+        self.reviewers = {}         # reviewer_id -> (((paper_id, stamp), ...), packed counts)
+        self.paper_rows = {}        # paper_id -> CSR row
+        self.reviewer_rows = {}     # reviewer_id -> CSR row
+        self.weighted_documents = 0  # corpus size at the last full weighting
+        self._paper_columns = None
+        self._reviewer_columns = None
+        self.loaded_from_disk = False
+        if path:
+            self._load()
+
+    # ---------- Sync ----------
+
+    def sync(self, db, reviewer_ids) -> dict:
+        """Catch up with the database; reviewer_ids is the conference's reviewer pool"""
+        from infrastructure.models import Paper
+
+        started = time.perf_counter()
+        reviewer_ids = set(reviewer_ids)
+        with self._lock:
+            current_papers = {
+                row.id: _stamp(row) for row in db.query(Paper.id, Paper.updated_at, Paper.created_at).filter(
+                    Paper.conference_id == self.conference_id,
+                    Paper.is_withdrawn.isnot(True)
+                )
+            }
+            stale_papers = [
+                paper_id for paper_id, stamp in current_papers.items()
+                if paper_id not in self.papers or self.papers[paper_id][0] != stamp
+            ]
+            gone_papers = [paper_id for paper_id in self.papers if paper_id not in current_papers]
+
+            profiles = self._profiles(db, reviewer_ids)
+            stale_reviewers = [
+                reviewer_id for reviewer_id in reviewer_ids
+                if reviewer_id not in self.reviewers or self.reviewers[reviewer_id][0] != profiles.get(reviewer_id, ())
+            ]
+            gone_reviewers = [reviewer_id for reviewer_id in self.reviewers if reviewer_id not in reviewer_ids]
+
+            stats = {
+                'papers_updated': len(stale_papers),
+                'reviewers_updated': len(stale_reviewers),
+                'removed': len(gone_papers) + len(gone_reviewers),
+                'reweighted': False,
+            }
+            if not (stale_papers or gone_papers or stale_reviewers or gone_reviewers):
+                stats['seconds'] = round(time.perf_counter() - started, 3)
+                return stats
+
+            needed = set(stale_papers)
+            for reviewer_id in stale_reviewers:
+                needed.update(paper_id for paper_id, _ in profiles.get(reviewer_id, ()))
+            counts = self._count_papers(db, needed)
+
+            for paper_id in gone_papers:
+                self.space.remove_document(self.papers.pop(paper_id)[1][0])
+                self.paper_rows.pop(paper_id, None)
+            for reviewer_id in gone_reviewers:
+                self.space.remove_document(self.reviewers.pop(reviewer_id)[1][0])
+                self.reviewer_rows.pop(reviewer_id, None)
+
+            for paper_id in stale_papers:
+                self._replace(self.papers, paper_id, current_papers[paper_id], counts.get(paper_id, {}))
+            for reviewer_id in stale_reviewers:
+                profile = profiles.get(reviewer_id, ())
+                merged = merge_counts(counts[paper_id] for paper_id, _ in profile if paper_id in counts)
+                self._replace(self.reviewers, reviewer_id, profile, merged)
+
+            documents = self.space.documents
+            if abs(documents - self.weighted_documents) > REWEIGHT_DRIFT * self.weighted_documents:
+                self._reweigh_all()
+                stats['reweighted'] = True
+            else:
+                for paper_id in stale_papers:
+                    self.paper_rows[paper_id] = self.space.weigh(_unpacked(self.papers[paper_id][1]))
+                for reviewer_id in stale_reviewers:
+                    self.reviewer_rows[reviewer_id] = self.space.weigh(_unpacked(self.reviewers[reviewer_id][1]))
+            self._paper_columns = None
+            self._reviewer_columns = None
+
+            if self.path:
+                self.save()
+        stats['seconds'] = round(time.perf_counter() - started, 3)
+        return stats
+
+    def _profiles(self, db, reviewer_ids) -> dict:
+        """reviewer_id -> sorted ((paper_id, stamp), ...) of their papers outside this conference"""
+        from infrastructure.models import Paper, PaperAuthor
+
+        authored = {}
+        for chunk in _chunks(reviewer_ids):
+            rows = db.query(
+                PaperAuthor.user_id, Paper.id, Paper.updated_at, Paper.created_at
+            ).join(
+                Paper, Paper.id == PaperAuthor.paper_id
+            ).filter(
+                PaperAuthor.user_id.in_(chunk),
+                Paper.conference_id != self.conference_id
+            ).all()
+            rows += db.query(
+                Paper.submitter_id.label('user_id'), Paper.id, Paper.updated_at, Paper.created_at
+            ).filter(
+                Paper.submitter_id.in_(chunk),
+                Paper.conference_id != self.conference_id
+            ).all()
+            for row in rows:
+                authored.setdefault(row.user_id, {})[row.id] = _stamp(row)
+        return {reviewer_id: tuple(sorted(papers.items())) for reviewer_id, papers in authored.items()}
+
+    def _count_papers(self, db, paper_ids) -> dict:
+        from infrastructure.models import Paper
+
+        counts = {}
+        for chunk in _chunks(paper_ids):
+            for row in db.query(Paper.id, Paper.title, Paper.keywords, Paper.abstract).filter(Paper.id.in_(chunk)):
+                counts[row.id] = self.space.count({
+                    field: (getattr(row, field) or '', weight) for field, weight in FIELD_WEIGHTS.items()
+                })
+        return counts
+
+    def _replace(self, documents: dict, key, fingerprint, counts: dict):
+        previous = documents.get(key)
+        if previous is not None:
+            self.space.remove_document(previous[1][0])
+        documents[key] = (fingerprint, _packed(counts))
+        self.space.add_document(counts)
+
+    def _reweigh_all(self):
+        idf = self.space.idf_table()
+        weigh = self.space.weigh
+        self.paper_rows = {
+            paper_id: weigh(_unpacked(packed), idf=idf)
+            for paper_id, (_, packed) in self.papers.items()
+        }
+        self.reviewer_rows = {
+            reviewer_id: weigh(_unpacked(packed), idf=idf)
+            for reviewer_id, (_, packed) in self.reviewers.items()
+        }
+        self.weighted_documents = self.space.documents
+
+    # ---------- Queries ----------
+
+    def _reviewer_index(self):
+        if self._reviewer_columns is None:
+            self._reviewer_columns = transpose(self.reviewer_rows, REVIEWER_INDEX_TERMS)
+        return self._reviewer_columns
+
+    def _paper_index(self):
+        if self._paper_columns is None:
+            self._paper_columns = transpose(self.paper_rows, PAPER_INDEX_TERMS)
+        return self._paper_columns
+
+    def affinity(self, paper_id: int, reviewer_id: int) -> float:
+        with self._lock:
+            paper = self.paper_rows.get(paper_id)
+            reviewer = self.reviewer_rows.get(reviewer_id)
+            if paper is None or reviewer is None:
+                return 0.0
+            return round(dot(paper, reviewer), 6)
+
+    def top_reviewers(self, paper_id: int, k: int = 10, exclude=()) -> list:
+        """[(reviewer_id, affinity)] best first; reviewers sharing no term are left out"""
+        with self._lock:
+            row = self.paper_rows.get(paper_id)
+            if row is None:
+                return []
+            return top_k(row, self._reviewer_index(), k, exclude, self.reviewer_rows)
+
+    def top_papers(self, reviewer_id: int, k: int = 10, exclude=()) -> list:
+        """[(paper_id, affinity)] best first"""
+        with self._lock:
+            row = self.reviewer_rows.get(reviewer_id)
+            if row is None:
+                return []
+            return top_k(row, self._paper_index(), k, exclude, self.paper_rows)
+
+    def candidates(self, paper_ids, k: int, exclude: set = frozenset()) -> dict:
+        """paper_id -> its k best [(reviewer_id, affinity)], skipping (paper_id, reviewer_id) in exclude"""
+        excluded = {}
+        for paper_id, reviewer_id in exclude:
+            excluded.setdefault(paper_id, []).append(reviewer_id)
+        with self._lock:
+            columns = self._reviewer_index()
+            return {
+                paper_id: top_k(self.paper_rows[paper_id], columns, k, excluded.get(paper_id, ()))
+                if paper_id in self.paper_rows else []
+                for paper_id in paper_ids
+            }
+
+    def paper_candidates(self, reviewer_ids, k: int) -> dict:
+        """reviewer_id -> their k best [(paper_id, affinity)]"""
+        with self._lock:
+            columns = self._paper_index()
+            return {
+                reviewer_id: top_k(self.reviewer_rows[reviewer_id], columns, k)
+                if reviewer_id in self.reviewer_rows else []
+                for reviewer_id in reviewer_ids
+            }
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'conference_id': self.conference_id,
+                'papers': len(self.paper_rows),
+                'reviewers': len(self.reviewer_rows),
+                'terms': len(self.space.terms),
+                'paper_nonzeros': sum(len(row[0]) for row in self.paper_rows.values()),
+                'reviewer_nonzeros': sum(len(row[0]) for row in self.reviewer_rows.values()),
+                'loaded_from_disk': self.loaded_from_disk,
+            }
+
+    # ---------- Persistence ----------
+
+    @property
+    def _cache_path(self):
+        return os.path.join(self.path, f"conference_{self.conference_id}.pickle")
+
+    def save(self):
+        with self._lock:
+            state = {
+                'version': CACHE_VERSION,
+                'field_weights': FIELD_WEIGHTS,
+                'space': self.space,
+                'papers': self.papers,
+                'reviewers': self.reviewers,
+                'paper_rows': self.paper_rows,
+                'reviewer_rows': self.reviewer_rows,
+                'weighted_documents': self.weighted_documents,
+            }
+            os.makedirs(self.path, exist_ok=True)
+            tmp_path = f"{self._cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._cache_path)
+
+    def _load(self):
+        try:
+            with open(self._cache_path, 'rb') as f:
+                state = pickle.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"⚠️  Affinity cache of conference {self.conference_id} unreadable, rebuilding: {e}")
+            return
+        if (state.get('version') != CACHE_VERSION
+                or state.get('field_weights') != FIELD_WEIGHTS):
+            return
+        self.space = state['space']
+        self.papers = state['papers']
+        self.reviewers = state['reviewers']
+        self.paper_rows = state['paper_rows']
+        self.reviewer_rows = state['reviewer_rows']
+        self.weighted_documents = state['weighted_documents']
+        self.loaded_from_disk = True
+
+
+def get_conference_affinity(conference_id: int) -> ConferenceAffinity:
+    """The conference's matrices (kept for the MAX_LOADED_CONFERENCES used last); call sync() before reading"""
+    with _loaded_lock:
+        affinity = _loaded.get(conference_id)
+        if affinity is not None:
+            _loaded.move_to_end(conference_id)
+            return affinity
+
+    from config import get_config
+    affinity = ConferenceAffinity(conference_id, path=get_config().AFFINITY_CACHE_PATH or None)
+    with _loaded_lock:
+        affinity = _loaded.setdefault(conference_id, affinity)
+        _loaded.move_to_end(conference_id)
+        while len(_loaded) > MAX_LOADED_CONFERENCES:
+            _loaded.popitem(last=False)
+    return affinity
@@ -0,0 +1,446 @@
+# ============================================
+# File: Backend/src/infrastructure/similarity/coauthor_graph.py
+# ============================================
+"""
+Co-authorship graph - conflict-of-interest lookups
+
+Nodes are users; an edge joins two users who wrote a paper together (as
+PaperAuthor or submitter) and remembers the day of their latest joint paper
+(Paper.created_at). Affiliations come from PaperAuthor.affiliation,
+normalised (case, accents, punctuation), and are remembered per user with
+the day they last used them.
+
+A reviewer is conflicted with a paper when
+    'author'        they are one of its authors
+    'coauthor'      an author is at most `hops` co-authorship steps away,
+                    every step a joint paper inside the time window
+    'affiliation'   they and an author used the same affiliation inside the
+                    window
+Neighbourhoods are computed once per (user, hops, window) and cached, so a
+check costs a few hash lookups per author (MAX_AUTHORS at most).
+
+catch_up() only reads PaperAuthor / Paper rows past the last ids seen (with
+an overlap for transactions that committed out of id order) - edges only
+ever move forward, so reading a row twice is harmless. Every
+COI_GRAPH_REBUILD_MINUTES the graph is rebuilt, which drops edges of deleted
+papers and authors.
+
+register_coauthor_tracking() catches the graph up on a background thread
+after every commit that inserted a Paper or PaperAuthor, then hands the
+touched users to the listeners (add_coauthor_listener) - that is how
+generated conflicts of interest follow new authors.
+"""
+
+import os
+import queue
+import re
+import threading
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.orm import object_session
+
+from infrastructure.databases.base import SessionLocal
+from infrastructure.search.tokenizer import fold
+
+
+REASON_AUTHOR = 'author'
+REASON_COAUTHOR = 'coauthor'
+REASON_AFFILIATION = 'affiliation'
+
+PENDING_KEY = 'pending_coauthor_updates'
+CATCH_UP_OVERLAP = 1000   # ids re-read below the last one seen
+BUILD_BATCH = 5000
+GENERIC_AFFILIATIONS = frozenset({
+    'na', 'n a', 'none', 'unknown', 'independent', 'independent researcher', 'self', 'self employed', 'student',
+})
+
+ABBREVIATIONS = {'univ': 'university', 'uni': 'university', 'inst': 'institute', 'dept': 'department'}
+
+_NON_WORD = re.compile(r'\W+', re.UNICODE)
+
+_graph = None
+_graph_lock = threading.Lock()
+_worker = None
+_worker_lock = threading.Lock()
+_listeners = []
+_registered = False
+
+
+def _reset_after_fork():
+    global _graph, _graph_lock, _worker, _worker_lock
+    _graph = None
+    _graph_lock = threading.Lock()
+    _worker = None
+    _worker_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def normalize_affiliation(name: str):
+    """Comparable form of an affiliation, None when it says nothing"""
+    if not name:
+        return None
+    normalized = ' '.join(ABBREVIATIONS.get(word, word) for word in _NON_WORD.sub(' ', fold(name)).split())
+    if len(normalized) < 3 or normalized in GENERIC_AFFILIATIONS:
+        return None
+    return normalized
+
+
+def _day(value) -> int:
+    if value is None:
+        return date.today().toordinal()
+    return value.toordinal()
+
+
+def window_start(window_years: float) -> int:
+    """First day (ordinal) inside a window of `window_years` back from today; 0 = no window"""
+    if not window_years:
+        return 0
+    return (date.today() - timedelta(days=int(window_years * 365.25))).toordinal()
+
+
+class CoauthorGraph:
+    """
+    Usage:
+        graph = get_coauthor_graph()
+        graph.catch_up(db)
+        graph.conflict(reviewer_id, paper_id, hops=1, since=window_start(5))
+        # -> None or (reason, author_id, detail)
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self.edges = {}                 # user -> {co-author: day of latest joint paper}
+        self.paper_authors = {}         # paper_id -> (user_id, ...)
+        self.affiliations = []          # affiliation id -> normalized name
+        self._affiliation_ids = {}
+        self.user_affiliations = {}     # user -> {affiliation id: day last used}
+        self.affiliation_users = {}     # affiliation id -> {user}
+        self.last_author_row = 0
+        self.last_paper = 0
+        self.built_at = None
+        self.updates = 0
+        self._touched = set()           # users whose edges / affiliations changed since take_touched
+        self._rebuilt = False
+        self._hoods = {}                # (hops, since) -> {user: {other: steps}}
+
+    # ---------- Updates ----------
+
+    def add_authorship(self, paper_id: int, user_id: int, day: int, affiliation: str = None) -> bool:
+        """Record one author of a paper; False when nothing new was learnt"""
+        with self._lock:
+            changed = False
+            authors = self.paper_authors.get(paper_id, ())
+            if user_id not in authors:
+                for other in authors:
+                    self._link(user_id, other, day)
+                self.paper_authors[paper_id] = authors + (user_id,)
+                changed = True
+            else:
+                known = self.edges.get(user_id, {})
+                for other in authors:
+                    if other != user_id and known.get(other, 0) < day:
+                        self._link(user_id, other, day)
+                        changed = True
+
+            normalized = normalize_affiliation(affiliation)
+            if normalized is not None:
+                affiliation_id = self._affiliation_ids.get(normalized)
+                if affiliation_id is None:
+                    affiliation_id = self._affiliation_ids[normalized] = len(self.affiliations)
+                    self.affiliations.append(normalized)
+                used = self.user_affiliations.setdefault(user_id, {})
+                if used.get(affiliation_id, 0) < day:
+                    used[affiliation_id] = day
+                    self.affiliation_users.setdefault(affiliation_id, set()).add(user_id)
+                    changed = True
+
+            if changed:
+                self.updates += 1
+                self._touched.update(authors)
+                self._touched.add(user_id)
+                self._hoods.clear()
+            return changed
+
+    def _link(self, first: int, second: int, day: int):
+        for a, b in ((first, second), (second, first)):
+            neighbours = self.edges.setdefault(a, {})
+            if neighbours.get(b, 0) < day:
+                neighbours[b] = day
+
+    def build(self, db):
+        """Rebuild from every PaperAuthor row and paper submitter"""
+        with self._lock:
+            self._reset()
+            self._read(db, 0, 0)
+            self._touched = set()
+            self.built_at = time.monotonic()
+
+    def catch_up(self, db, max_age_minutes: float = None):
+        """Read authorships added since the last call (a full build the first time / when too old)"""
+        with self._lock:
+            if self.built_at is None or (
+                max_age_minutes and time.monotonic() - self.built_at > max_age_minutes * 60
+            ):
+                self.build(db)
+                self._rebuilt = True
+                return
+            self._read(
+                db,
+                max(0, self.last_author_row - CATCH_UP_OVERLAP),
+                max(0, self.last_paper - CATCH_UP_OVERLAP)
+            )
+
+    def take_touched(self):
+        """
+        Users whose co-authors or affiliations changed since the last call,
+        None when the graph was rebuilt meanwhile (anything may have changed)
+        """
+        with self._lock:
+            touched, self._touched = self._touched, set()
+            rebuilt, self._rebuilt = self._rebuilt, False
+            return None if rebuilt else touched
+
+    def affected_by(self, touched, hops: int, since: int = 0) -> set:
+        """Users whose conflicts can differ after `touched` changed: those within `hops` of one"""
+        with self._lock:
+            affected = set(touched)
+            for user_id in touched:
+                affected.update(self.neighbourhood(user_id, hops, since))
+            return affected
+
+    def _read(self, db, after_author_row: int, after_paper: int) -> int:
+        from infrastructure.models import Paper, PaperAuthor
+
+        rows = 0
+        for row in db.query(
+            PaperAuthor.id, PaperAuthor.paper_id, PaperAuthor.user_id, PaperAuthor.affiliation, Paper.created_at
+        ).join(
+            Paper, Paper.id == PaperAuthor.paper_id
+        ).filter(PaperAuthor.id > after_author_row).order_by(PaperAuthor.id).yield_per(BUILD_BATCH):
+            self.add_authorship(row.paper_id, row.user_id, _day(row.created_at), row.affiliation)
+            self.last_author_row = max(self.last_author_row, row.id)
+            rows += 1
+        for row in db.query(Paper.id, Paper.submitter_id, Paper.created_at).filter(
+            Paper.id > after_paper
+        ).order_by(Paper.id).yield_per(BUILD_BATCH):
+            self.add_authorship(row.id, row.submitter_id, _day(row.created_at))
+            self.last_paper = max(self.last_paper, row.id)
+            rows += 1
+        return rows
+
+    # ---------- Lookups ----------
+
+    def neighbourhood(self, user_id: int, hops: int, since: int = 0) -> dict:
+        """{user: co-authorship steps} within `hops` steps, every joint paper on or after `since`"""
+        with self._lock:
+            cache = self._hoods.setdefault((hops, since), {})
+            hood = cache.get(user_id)
+            if hood is not None:
+                return hood
+            hood = {}
+            frontier = [user_id]
+            for step in range(1, hops + 1):
+                reached = []
+                for current in frontier:
+                    for other, day in self.edges.get(current, {}).items():
+                        if day >= since and other != user_id and other not in hood:
+                            hood[other] = step
+                            reached.append(other)
+                frontier = reached
+                if not frontier:
+                    break
+            cache[user_id] = hood
+            return hood
+
+    def _affiliations_of(self, user_id: int, since: int) -> set:
+        return {
+            affiliation_id for affiliation_id, day in self.user_affiliations.get(user_id, {}).items()
+            if day >= since
+        }
+
+    def authors_of(self, paper_id: int) -> tuple:
+        return self.paper_authors.get(paper_id, ())
+
+    def conflict(self, reviewer_id: int, paper_id: int, hops: int = 1, since: int = 0,
+                 affiliation: bool = True):
+        """None, or (reason, author_id, detail) for the closest tie to the paper's authors"""
+        with self._lock:
+            authors = self.paper_authors.get(paper_id, ())
+            if reviewer_id in authors:
+                return REASON_AUTHOR, reviewer_id, None
+            if hops > 0:
+                hood = self.neighbourhood(reviewer_id, hops, since)
+                tied = [(hood[author], author) for author in authors if author in hood]
+                if tied:
+                    steps, author = min(tied)
+                    return REASON_COAUTHOR, author, steps
+            if affiliation:
+                mine = self._affiliations_of(reviewer_id, since)
+                if mine:
+                    for author in authors:
+                        shared = mine & self._affiliations_of(author, since)
+                        if shared:
+                            return REASON_AFFILIATION, author, self.affiliations[min(shared)]
+            return None
+
+    def conflicts_among(self, paper_ids, reviewer_ids, hops: int = 1, since: int = 0,
+                        affiliation: bool = True) -> dict:
+        """
+        {(paper_id, reviewer_id): (reason, author_id, detail)} for every
+        conflicted pair - walks each author's neighbourhood instead of every
+        paper x reviewer pair
+        """
+        pool = set(reviewer_ids)
+        found = {}
+        with self._lock:
+            for paper_id in paper_ids:
+                authors = self.paper_authors.get(paper_id, ())
+                for author in authors:
+                    if author in pool:
+                        found[(paper_id, author)] = (REASON_AUTHOR, author, None)
+                for author in authors:
+                    if hops > 0:
+                        for other, steps in self.neighbourhood(author, hops, since).items():
+                            if other not in pool:
+                                continue
+                            known = found.get((paper_id, other))
+                            if known is None or (known[0] == REASON_COAUTHOR and known[2] > steps):
+                                found[(paper_id, other)] = (REASON_COAUTHOR, author, steps)
+                    if affiliation:
+                        for affiliation_id in self._affiliations_of(author, since):
+                            for other in self.affiliation_users.get(affiliation_id, ()):
+                                if (other in pool and (paper_id, other) not in found
+                                        and self.user_affiliations[other][affiliation_id] >= since):
+                                    found[(paper_id, other)] = (
+                                        REASON_AFFILIATION, author, self.affiliations[affiliation_id]
+                                    )
+        return found
+
+    def joint_paper_day(self, first: int, second: int):
+        """Date of the latest paper two users wrote together, or None"""
+        day = self.edges.get(first, {}).get(second)
+        return date.fromordinal(day) if day else None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'users': len(self.edges),
+                'edges': sum(len(neighbours) for neighbours in self.edges.values()) // 2,
+                'papers': len(self.paper_authors),
+                'affiliations': len(self.affiliations),
+                'updates': self.updates,
+                'built': self.built_at is not None,
+            }
+
+
+def get_coauthor_graph() -> CoauthorGraph:
+    """Process-wide graph (built on the first catch_up)"""
+    global _graph
+    if _graph is None:
+        with _graph_lock:
+            if _graph is None:
+                _graph = CoauthorGraph()
+    return _graph
+
+
+def synced_coauthor_graph(db) -> CoauthorGraph:
+    """The process-wide graph, caught up with db"""
+    from config import get_config
+    graph = get_coauthor_graph()
+    graph.catch_up(db, max_age_minutes=get_config().COI_GRAPH_REBUILD_MINUTES)
+    return graph
+
+
+def add_coauthor_listener(listener):
+    """listener(graph, touched) runs on the tracking thread after committed authorships were read"""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+class _CoauthorWorker:
+    """One daemon thread catching the graph up after commits that added authors"""
+
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.failed = 0
+        self._thread = threading.Thread(target=self._run, name='coauthor-graph', daemon=True)
+        self._thread.start()
+
+    def submit(self):
+        self.queue.put(None)
+
+    def _run(self):
+        while True:
+            self.queue.get()
+            # One catch-up covers every commit queued meanwhile
+            while True:
+                try:
+                    self.queue.get_nowait()
+                    self.queue.task_done()
+                except queue.Empty:
+                    break
+            try:
+                db = SessionLocal()
+                try:
+                    graph = synced_coauthor_graph(db)
+                finally:
+                    db.close()
+                touched = graph.take_touched()
+                if touched is None or touched:
+                    for listener in list(_listeners):
+                        try:
+                            listener(graph, touched)
+                        except Exception as e:
+                            print(f"⚠️  Co-author listener failed: {e}")
+            except Exception as e:
+                self.failed += 1
+                print(f"⚠️  Co-author graph update failed: {e}")
+            finally:
+                self.queue.task_done()
+
+
+def _get_worker() -> _CoauthorWorker:
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = _CoauthorWorker()
+    return _worker
+
+
+# ---------- Mapper / session events ----------
+
+def _after_insert(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info[PENDING_KEY] = True
+
+
+@event.listens_for(SessionLocal, 'after_commit')
+def _catch_up_after_commit(session):
+    if session.info.pop(PENDING_KEY, None) and _registered:
+        _get_worker().submit()
+
+
+@event.listens_for(SessionLocal, 'after_rollback')
+def _forget_pending_authors(session):
+    session.info.pop(PENDING_KEY, None)
+
+
+def register_coauthor_tracking():
+    """Catch the graph up (and notify listeners) after commits inserting papers / authors (idempotent)"""
+    global _registered
+    if _registered:
+        return
+    from infrastructure.models import Paper, PaperAuthor
+    event.listen(Paper, 'after_insert', _after_insert)
+    event.listen(PaperAuthor, 'after_insert', _after_insert)
+    _registered = True
@@ -0,0 +1,319 @@
+# ============================================
+# File: Backend/src/infrastructure/similarity/duplicates.py
+# ============================================
+"""
+Near-duplicate detection - signature maintenance and lookups
+
+Every paper gets a MinHash signature of its title, abstract and, once the
+extraction pipeline has stored it, the text of its submitted PDF. Signatures
+live in a MinHashLSHIndex persisted under DEDUP_INDEX_PATH.
+
+Signatures are computed by one background thread, never on the request:
+    - Paper inserts, deletes and updates touching title / abstract /
+      pdf_path / conference_id are collected on the session and queued after
+      it commits (a rolled-back submission is never indexed)
+    - when the extraction pipeline stores a PDF's text, papers using that
+      blob are re-signed with the full text
+    - register_duplicate_detection(backfill=True) signs every paper that is
+      missing, stale (text arrived while the app was down) or gone
+Bulk query.update() / Core statements bypass mapper events - call
+refresh_signatures() after those.
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import object_session
+
+from infrastructure.databases.base import SessionLocal
+from infrastructure.similarity.lsh_index import MinHashLSHIndex, FLAG_FULL_TEXT
+from infrastructure.similarity.minhash import MinHasher, optimal_bands, shingle_hashes
+
+
+PENDING_KEY = 'pending_signature_updates'
+SIGNED_COLUMNS = ('title', 'abstract', 'pdf_path', 'conference_id')
+BACKFILL_BATCH = 5000   # papers signed per index merge
+MIN_SHINGLES = 8   # fewer word 3-grams than this: too little text to call anything a duplicate
+
+_index = None
+_hasher = None
+_index_lock = threading.Lock()
+_worker = None
+_worker_lock = threading.Lock()
+_registered = False
+
+
+def _reset_after_fork():
+    global _index, _index_lock, _worker, _worker_lock
+    _index = None
+    _index_lock = threading.Lock()
+    _worker = None
+    _worker_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _threshold() -> float:
+    from config import get_config
+    return get_config().DEDUP_THRESHOLD
+
+
+def get_duplicate_index() -> MinHashLSHIndex:
+    """Process-wide LSH index, loaded from DEDUP_INDEX_PATH on first use"""
+    global _index, _hasher
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                from config import get_config
+                current_config = get_config()
+                num_perm = current_config.DEDUP_NUM_PERM
+                bands, rows = optimal_bands(current_config.DEDUP_THRESHOLD, num_perm)
+                _hasher = MinHasher(num_perm=num_perm)
+                index = MinHashLSHIndex(
+                    num_perm=num_perm, bands=bands, rows=rows,
+                    path=current_config.DEDUP_INDEX_PATH or None
+                )
+                atexit.register(index.close)
+                _index = index
+    return _index
+
+
+def loaded_duplicate_index():
+    """The index if it has been loaded already, else None"""
+    return _index
+
+
+def get_hasher() -> MinHasher:
+    get_duplicate_index()
+    return _hasher
+
+
+def find_similar_papers(paper_id: int, threshold: float = None, limit: int = None) -> list:
+    """[(other_paper_id, similarity)] in any conference, most similar first"""
+    threshold = _threshold() if threshold is None else threshold
+    return get_duplicate_index().similar_to(paper_id, threshold, limit=limit)
+
+
+def find_conference_duplicates(conference_id: int, threshold: float = None) -> list:
+    """[(paper_id, other_paper_id, similarity)] - paper_id in the conference, each pair once"""
+    threshold = _threshold() if threshold is None else threshold
+    return get_duplicate_index().duplicates_in(conference_id, threshold)
+
+
+# ---------- Signing ----------
+
+def paper_document(title: str, abstract: str, text: str = None) -> str:
+    return '\n'.join(part for part in (title, abstract, text) if part)
+
+
+def _stored_text(pdf_path: str):
+    from infrastructure.services.extracted_text_store import get_text_store
+    from infrastructure.services.file_storage_service import FileStorageService
+    if not pdf_path:
+        return None
+    try:
+        return get_text_store().read(FileStorageService.hash_from_key(pdf_path))
+    except ValueError:
+        return None  # not a content-addressed key (legacy path)
+
+
+def _has_stored_text(pdf_path: str) -> bool:
+    from infrastructure.services.extracted_text_store import get_text_store
+    from infrastructure.services.file_storage_service import FileStorageService
+    if not pdf_path:
+        return False
+    try:
+        return get_text_store().has(FileStorageService.hash_from_key(pdf_path))
+    except ValueError:
+        return False
+
+
+def _sign(row):
+    """(paper_id, conference_id, signature, flags) or None when there is too little text"""
+    hasher = get_hasher()
+    text = _stored_text(row.pdf_path)
+    hashes = shingle_hashes(paper_document(row.title, row.abstract, text), hasher.shingle_size)
+    if len(hashes) < MIN_SHINGLES:
+        return None
+    return (row.id, row.conference_id, hasher.signature_from_hashes(hashes),
+            FLAG_FULL_TEXT if text else 0)
+
+
+def _load_rows(db, paper_ids=None, pdf_path: str = None):
+    from infrastructure.models import Paper
+    query = db.query(Paper.id, Paper.conference_id, Paper.title, Paper.abstract, Paper.pdf_path)
+    if paper_ids is not None:
+        query = query.filter(Paper.id.in_(paper_ids))
+    if pdf_path is not None:
+        query = query.filter(Paper.pdf_path == pdf_path)
+    return query.all()
+
+
+def refresh_signatures(paper_ids=None, pdf_path: str = None) -> int:
+    """Re-sign papers from the database (every paper when neither argument is given)"""
+    index = get_duplicate_index()
+    db = SessionLocal()
+    try:
+        rows = _load_rows(db, paper_ids=paper_ids, pdf_path=pdf_path)
+    finally:
+        db.close()
+
+    signed = []
+    for row in rows:
+        result = _sign(row)
+        if result is None:
+            index.remove(row.id)
+        else:
+            signed.append(result)
+    index.add_many(signed)
+
+    if paper_ids is not None:
+        for missing in set(paper_ids) - {row.id for row in rows}:
+            index.remove(missing)
+    return len(signed)
+
+
+def backfill_signatures() -> int:
+    """Sign missing / stale papers and drop deleted ones; returns the number signed"""
+    from infrastructure.models import Paper
+    index = get_duplicate_index()
+
+    db = SessionLocal()
+    try:
+        stale, seen = [], set()
+        for row in db.query(Paper.id, Paper.pdf_path).yield_per(2000):
+            seen.add(row.id)
+            flags = index.flags(row.id)
+            if flags is None or (not flags & FLAG_FULL_TEXT and _has_stored_text(row.pdf_path)):
+                stale.append(row.id)
+    finally:
+        db.close()
+
+    for paper_id in set(index.paper_ids()) - seen:
+        index.remove(paper_id)
+
+    signed = 0
+    for start in range(0, len(stale), BACKFILL_BATCH):
+        signed += refresh_signatures(paper_ids=stale[start:start + BACKFILL_BATCH])
+    return signed
+
+
+class _SignatureWorker:
+    """One daemon thread draining ('paper', id) / ('remove', id) / ('pdf', key) jobs"""
+
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.signed = 0
+        self.failed = 0
+        self.backfill_done = False
+        self._thread = threading.Thread(target=self._run, name='dedup-signatures', daemon=True)
+        self._thread.start()
+
+    def submit(self, kind: str, value):
+        self.queue.put((kind, value))
+
+    def _run(self):
+        while True:
+            kind, value = self.queue.get()
+            try:
+                if kind == 'remove':
+                    get_duplicate_index().remove(value)
+                elif kind == 'paper':
+                    self.signed += refresh_signatures(paper_ids=[value])
+                elif kind == 'pdf':
+                    self.signed += refresh_signatures(pdf_path=value)
+                elif kind == 'backfill':
+                    started = time.perf_counter()
+                    signed = backfill_signatures()
+                    self.signed += signed
+                    self.backfill_done = True
+                    if signed:
+                        print(f"🧬 Signed {signed} papers for duplicate detection "
+                              f"in {time.perf_counter() - started:.1f}s")
+            except Exception as e:
+                self.failed += 1
+                print(f"⚠️  Duplicate signature update failed ({kind} {value}): {e}")
+            finally:
+                self.queue.task_done()
+
+
+def _get_worker() -> _SignatureWorker:
+    global _worker
+    if _worker is None:
+        with _worker_lock:
+            if _worker is None:
+                _worker = _SignatureWorker()
+    return _worker
+
+
+def duplicate_detection_stats() -> dict:
+    stats = _index.stats() if _index is not None else {'papers': 0}
+    worker = _worker
+    stats['queued'] = worker.queue.qsize() if worker else 0
+    stats['signed'] = worker.signed if worker else 0
+    stats['failed'] = worker.failed if worker else 0
+    stats['complete'] = bool(worker and worker.backfill_done and not worker.queue.unfinished_tasks)
+    return stats
+
+
+# ---------- Mapper / session events ----------
+
+def _queue(paper, kind):
+    session = object_session(paper)
+    if session is not None:
+        session.info.setdefault(PENDING_KEY, {})[paper.id] = kind
+
+
+def _after_insert(mapper, connection, paper):
+    _queue(paper, 'paper')
+
+
+def _after_update(mapper, connection, paper):
+    state = sa_inspect(paper)
+    if any(state.attrs[column].history.has_changes() for column in SIGNED_COLUMNS):
+        _queue(paper, 'paper')
+
+
+def _after_delete(mapper, connection, paper):
+    _queue(paper, 'remove')
+
+
+@event.listens_for(SessionLocal, 'after_commit')
+def _signatures_after_commit(session):
+    changes = session.info.pop(PENDING_KEY, None)
+    if changes:
+        worker = _get_worker()
+        for paper_id, kind in changes.items():
+            worker.submit(kind, paper_id)
+
+
+@event.listens_for(SessionLocal, 'after_rollback')
+def _forget_pending_signatures(session):
+    session.info.pop(PENDING_KEY, None)
+
+
+def _on_text_extracted(key, sha256):
+    _get_worker().submit('pdf', key)
+
+
+def register_duplicate_detection(backfill: bool = True):
+    """Attach the Paper mapper events and the extraction listener (idempotent)"""
+    global _registered
+    if _registered:
+        return
+    from infrastructure.models import Paper
+    from infrastructure.services.pdf_extraction_service import add_extraction_listener
+    event.listen(Paper, 'after_insert', _after_insert)
+    event.listen(Paper, 'after_update', _after_update)
+    event.listen(Paper, 'after_delete', _after_delete)
+    add_extraction_listener(_on_text_extracted)
+    _registered = True
+
+    if backfill:
+        _get_worker().submit('backfill', None)
@@ -0,0 +1,459 @@
+# ============================================
+# File: Backend/src/infrastructure/similarity/lsh_index.py
+# ============================================
+"""
+MinHash LSH index - candidate near-duplicates without comparing every pair
+
+Each signature is cut into `bands` slices of `rows` positions. Two papers
+become candidates when any slice matches exactly, which happens with
+probability 1 - (1 - J^rows)^bands for Jaccard similarity J - an S-curve
+around the configured threshold (minhash.optimal_bands). Candidates are then
+checked against the full signatures, so a query touches a handful of papers
+instead of all of them.
+
+Memory layout (50k papers, 128 positions, 30 bands: ~40 MB):
+    _signatures      one array('I'), paper slot i at [i*num_perm, (i+1)*num_perm)
+    _band_keys[b]    sorted array('q') of slice hashes for band b
+    _band_slots[b]   array('I') of the slot owning each key (same order)
+Sorted arrays instead of dicts: a dict entry per (paper, band) costs ~90 bytes,
+a sorted key + slot costs 12.
+
+Persistence (path set): signatures.<gen>.bin is a log of fixed-width uint32
+records
+    [paper_id, conference_id, flags, sig[0] .. sig[num_perm-1]]
+appended on every change (REMOVED in flags marks a deletion; the last record
+per paper wins). meta.json pins num_perm / bands / rows - a mismatch starts
+from empty.
+Worker processes share the directory through shared_log.SharedLog: a write
+happens under the log's flock after replaying what the others appended, and
+reads first replay records past their own position (a stat call when
+nothing changed). Once dead records dominate, the log is compacted into the
+next generation - a file starting with every live record - and the old
+generations are deleted; a worker that finds a newer generation loads it
+whole instead of replaying.
+"""
+
+import bisect
+import json
+import os
+import tempfile
+import threading
+from array import array
+from contextlib import nullcontext
+
+from infrastructure.services.shared_log import SharedLog, LogGapError
+from infrastructure.similarity.minhash import (
+    SIGNATURE_TYPECODE,
+    jaccard_estimate,
+)
+
+
+FLAG_FULL_TEXT = 1          # signature covers the extracted PDF text, not only title + abstract
+FLAG_REMOVED = 1 << 31      # log record deleting the paper
+RECORD_HEADER = 3
+COMPACT_MIN_RECORDS = 1000
+LOG_NAME = 'signatures'
+LEGACY_LOG_FILE = 'signatures.bin'   # single-file log of older versions, same records
+
+
+class MinHashLSHIndex:
+    """
+    Usage:
+        index = MinHashLSHIndex(num_perm=128, bands=30, rows=4, path='var/minhash')
+        index.add(paper_id, conference_id, signature)
+        index.similar_to(paper_id, threshold=0.5)     # [(other_id, similarity), ...]
+    """
+
+    def __init__(self, num_perm: int, bands: int, rows: int, path: str = None,
+                 compact_ratio: float = 2.0):
+        if bands * rows > num_perm:
+            raise ValueError("bands * rows must not exceed num_perm")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = rows
+        self.path = path
+        self.compact_ratio = compact_ratio
+        self._lock = threading.RLock()
+        self._log = None
+        self.loaded_from_disk = False
+        self.log_records = 0
+        self.queries = 0
+        self.candidates_checked = 0
+        self._reset()
+
+        if path:
+            os.makedirs(path, exist_ok=True)
+            self._log = SharedLog(path, LOG_NAME, 'bin',
+                                  record_size=self._record_width * array(SIGNATURE_TYPECODE).itemsize)
+            self._load()
+
+    def _reset(self):
+        self._signatures = array(SIGNATURE_TYPECODE)
+        self._slot_paper = array('I')
+        self._slot_conference = array('I')
+        self._slot_flags = array('I')
+        self._slot_of = {}
+        self._free_slots = []
+        self._by_conference = {}
+        self._band_keys = [array('q') for _ in range(self.bands)]
+        self._band_slots = [array('I') for _ in range(self.bands)]
+
+    # ---------- Reads ----------
+
+    def __len__(self):
+        return len(self._slot_of)
+
+    def __contains__(self, paper_id: int):
+        return paper_id in self._slot_of
+
+    def get(self, paper_id: int):
+        """(conference_id, signature, flags) or None"""
+        with self._lock:
+            self._catch_up()
+            slot = self._slot_of.get(paper_id)
+            if slot is None:
+                return None
+            return self._slot_conference[slot], self._signature_at(slot), self._slot_flags[slot]
+
+    def flags(self, paper_id: int):
+        slot = self._slot_of.get(paper_id)
+        return None if slot is None else self._slot_flags[slot]
+
+    def paper_ids(self, conference_id: int = None) -> list:
+        with self._lock:
+            self._catch_up()
+            if conference_id is None:
+                return list(self._slot_of)
+            return list(self._by_conference.get(conference_id, ()))
+
+    def query(self, signature: array, threshold: float, exclude: int = None, limit: int = None) -> list:
+        """[(paper_id, estimated_similarity)] at or above threshold, most similar first"""
+        with self._lock:
+            self._catch_up()
+            self.queries += 1
+            results = []
+            for slot in self._candidate_slots(signature):
+                paper_id = self._slot_paper[slot]
+                if paper_id == exclude:
+                    continue
+                self.candidates_checked += 1
+                similarity = jaccard_estimate(signature, self._signature_at(slot))
+                if similarity >= threshold:
+                    results.append((paper_id, similarity))
+        results.sort(key=lambda item: (-item[1], item[0]))
+        return results[:limit] if limit else results
+
+    def similar_to(self, paper_id: int, threshold: float, limit: int = None) -> list:
+        with self._lock:
+            self._catch_up()
+            slot = self._slot_of.get(paper_id)
+            if slot is None:
+                return []
+            return self.query(self._signature_at(slot), threshold, exclude=paper_id, limit=limit)
+
+    def duplicates_in(self, conference_id: int, threshold: float) -> list:
+        """
+        Likely duplicate pairs involving the conference's papers
+        [(paper_id, other_id, similarity)] - paper_id is in the conference,
+        other_id may be in any conference; each pair is listed once.
+        """
+        pairs = {}
+        with self._lock:
+            self._catch_up()
+            for paper_id in sorted(self._by_conference.get(conference_id, ())):
+                for other_id, similarity in self.similar_to(paper_id, threshold):
+                    key = (min(paper_id, other_id), max(paper_id, other_id))
+                    if key not in pairs:
+                        pairs[key] = (paper_id, other_id, similarity)
+        return sorted(pairs.values(), key=lambda pair: (-pair[2], pair[0], pair[1]))
+
+    def _signature_at(self, slot: int) -> array:
+        start = slot * self.num_perm
+        return self._signatures[start:start + self.num_perm]
+
+    def _band_key(self, signature, band: int) -> int:
+        start = band * self.rows
+        return hash(signature[start:start + self.rows].tobytes())
+
+    def _candidate_slots(self, signature: array) -> set:
+        slots = set()
+        for band in range(self.bands):
+            keys = self._band_keys[band]
+            key = self._band_key(signature, band)
+            position = bisect.bisect_left(keys, key)
+            band_slots = self._band_slots[band]
+            while position < len(keys) and keys[position] == key:
+                slots.add(band_slots[position])
+                position += 1
+        return slots
+
+    # ---------- Writes ----------
+
+    def add(self, paper_id: int, conference_id: int, signature: array, flags: int = 0):
+        if len(signature) != self.num_perm:
+            raise ValueError(f"Signature has {len(signature)} positions, expected {self.num_perm}")
+        with self._lock, self._log_locked():
+            self._catch_up()
+            self._add(paper_id, conference_id, signature, flags)
+            self._append(paper_id, conference_id, flags, signature)
+
+    def remove(self, paper_id: int) -> bool:
+        with self._lock, self._log_locked():
+            self._catch_up()
+            if not self._remove(paper_id):
+                return False
+            self._append(paper_id, 0, FLAG_REMOVED, None)
+            return True
+
+    def add_many(self, rows):
+        """Add rows of (paper_id, conference_id, signature, flags) with one sort per band"""
+        rows = list(rows)
+        if not rows:
+            return
+        with self._lock, self._log_locked():
+            if len(rows) < COMPACT_MIN_RECORDS:
+                # A few inserts into the sorted bands beat re-sorting all of them
+                for paper_id, conference_id, signature, flags in rows:
+                    self.add(paper_id, conference_id, signature, flags)
+                return
+            self._catch_up()
+            self._bulk_load(rows)
+            self._rewrite_log()
+
+    def rebuild(self, rows):
+        """Replace the whole index with rows of (paper_id, conference_id, signature, flags)"""
+        with self._lock, self._log_locked():
+            self._reset()
+            self._bulk_load(rows)
+            self._rewrite_log()
+
+    def _add(self, paper_id, conference_id, signature, flags):
+        self._remove(paper_id)
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            start = slot * self.num_perm
+            self._signatures[start:start + self.num_perm] = signature
+            self._slot_paper[slot] = paper_id
+            self._slot_conference[slot] = conference_id
+            self._slot_flags[slot] = flags
+        else:
+            slot = len(self._slot_paper)
+            self._signatures.extend(signature)
+            self._slot_paper.append(paper_id)
+            self._slot_conference.append(conference_id)
+            self._slot_flags.append(flags)
+        self._slot_of[paper_id] = slot
+        self._by_conference.setdefault(conference_id, set()).add(paper_id)
+
+        for band in range(self.bands):
+            keys = self._band_keys[band]
+            key = self._band_key(signature, band)
+            position = bisect.bisect_right(keys, key)
+            keys.insert(position, key)
+            self._band_slots[band].insert(position, slot)
+
+    def _remove(self, paper_id) -> bool:
+        slot = self._slot_of.pop(paper_id, None)
+        if slot is None:
+            return False
+        signature = self._signature_at(slot)
+        for band in range(self.bands):
+            keys = self._band_keys[band]
+            band_slots = self._band_slots[band]
+            key = self._band_key(signature, band)
+            position = bisect.bisect_left(keys, key)
+            while position < len(keys) and keys[position] == key:
+                if band_slots[position] == slot:
+                    del keys[position]
+                    del band_slots[position]
+                    break
+                position += 1
+
+        conference_id = self._slot_conference[slot]
+        members = self._by_conference.get(conference_id)
+        if members is not None:
+            members.discard(paper_id)
+            if not members:
+                del self._by_conference[conference_id]
+        self._free_slots.append(slot)
+        return True
+
+    def _bulk_load(self, rows):
+        """Append many signatures, then sort each band once (not insert-by-insert)"""
+        latest = {row[0]: row for row in rows}  # last row per paper wins
+        for paper_id in latest:
+            self._remove(paper_id)
+
+        keys = [list(band_keys) for band_keys in self._band_keys]
+        slots = [list(band_slots) for band_slots in self._band_slots]
+        width = self.rows * self._signatures.itemsize
+        for paper_id, conference_id, signature, flags in latest.values():
+            slot = len(self._slot_paper)
+            self._signatures.extend(signature)
+            self._slot_paper.append(paper_id)
+            self._slot_conference.append(conference_id)
+            self._slot_flags.append(flags)
+            self._slot_of[paper_id] = slot
+            self._by_conference.setdefault(conference_id, set()).add(paper_id)
+            # Same key as _band_key(), from one bytes copy instead of a slice per band
+            raw = signature.tobytes()
+            for band in range(self.bands):
+                keys[band].append(hash(raw[band * width:(band + 1) * width]))
+                slots[band].append(slot)
+
+        for band in range(self.bands):
+            band_keys, band_slots = keys[band], slots[band]
+            order = sorted(range(len(band_keys)), key=band_keys.__getitem__)
+            self._band_keys[band] = array('q', [band_keys[i] for i in order])
+            self._band_slots[band] = array('I', [band_slots[i] for i in order])
+
+    # ---------- Persistence ----------
+
+    @property
+    def _record_width(self) -> int:
+        return RECORD_HEADER + self.num_perm
+
+    def _meta(self) -> dict:
+        return {'version': 1, 'num_perm': self.num_perm, 'bands': self.bands, 'rows': self.rows}
+
+    def _meta_path(self) -> str:
+        return os.path.join(self.path, 'meta.json')
+
+    def _log_locked(self):
+        return self._log.locked() if self._log is not None else nullcontext()
+
+    def _load(self):
+        try:
+            with open(self._meta_path(), encoding='utf-8') as f:
+                meta = json.load(f)
+        except (FileNotFoundError, ValueError):
+            meta = None
+
+        with self._lock, self._log_locked():
+            legacy = os.path.join(self.path, LEGACY_LOG_FILE)
+            if os.path.exists(legacy) and not self._log.generations():
+                self._log.seek(self._log.start_generation(legacy))  # read it from the start
+            if meta == self._meta():
+                self._catch_up()
+            self.loaded_from_disk = bool(self._slot_of)
+            if meta != self._meta() or self._log.generation is None or self._should_compact():
+                self._rewrite_log()
+
+    def _catch_up(self):
+        """Apply what other workers appended since our position (caller holds the lock)"""
+        log = self._log
+        if log is None or not log.changed():
+            return
+        try:
+            newer = log.newer_generations()
+            if newer:
+                raise LogGapError("log compacted")
+            self._apply_records(log.read_records())
+        except LogGapError:
+            # A compaction wrote every live record into a new generation:
+            # load that instead of replaying the old one
+            newest = log.generations()[-1]
+            self._reset()
+            log.seek(newest)
+            self.log_records = 0
+            self._apply_records(log.read_records())
+
+    def _apply_records(self, records: list):
+        latest = {}
+        for record in records:
+            data = array(SIGNATURE_TYPECODE)
+            data.frombytes(record)
+            latest[data[0]] = data  # the last record per paper wins
+        self.log_records += len(records)
+
+        rows = []
+        for paper_id, data in latest.items():
+            flags = data[2]
+            if flags & FLAG_REMOVED:
+                self._remove(paper_id)
+            else:
+                rows.append((paper_id, data[1], data[RECORD_HEADER:], flags))
+        if len(rows) < COMPACT_MIN_RECORDS:
+            for row in rows:
+                self._add(*row)
+        else:
+            self._bulk_load(rows)
+
+    def _append(self, paper_id, conference_id, flags, signature):
+        """Log one change (caller holds the lock and the log lock, caught up)"""
+        if not self.path:
+            return
+        record = array(SIGNATURE_TYPECODE, (paper_id, conference_id, flags))
+        if signature is None:
+            record.extend([0] * self.num_perm)
+        else:
+            record.extend(signature)
+        self._log.append(record.tobytes())
+        self.log_records += 1
+        if self._should_compact():
+            self._rewrite_log()
+
+    def _should_compact(self) -> bool:
+        return (self.log_records > COMPACT_MIN_RECORDS
+                and self.log_records > self.compact_ratio * max(1, len(self._slot_of)))
+
+    def _rewrite_log(self):
+        """Write only live records into the next log generation (caller holds the log lock)"""
+        if not self.path:
+            return
+        fd, tmp_path = tempfile.mkstemp(prefix='.signatures-', dir=self.path)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for paper_id, slot in self._slot_of.items():
+                    record = array(SIGNATURE_TYPECODE, (
+                        paper_id, self._slot_conference[slot], self._slot_flags[slot]
+                    ))
+                    record.extend(self._signature_at(slot))
+                    f.write(record.tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            generation = self._log.start_generation(tmp_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._log.discard_before(generation)
+
+        fd, tmp_path = tempfile.mkstemp(prefix='.meta-', dir=self.path)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self._meta(), f)
+        os.replace(tmp_path, self._meta_path())
+        self.log_records = len(self._slot_of)
+
+    def close(self):
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+
+    def _log_bytes(self) -> int:
+        total = 0
+        for generation in self._log.generations():
+            try:
+                total += os.path.getsize(self._log.path(generation))
+            except FileNotFoundError:
+                pass  # compacted away since the listing
+        return total
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'papers': len(self._slot_of),
+                'conferences': len(self._by_conference),
+                'bands': self.bands,
+                'rows': self.rows,
+                'num_perm': self.num_perm,
+                'log_records': self.log_records,
+                'log_bytes': self._log_bytes(),
+                'queries': self.queries,
+                'candidates_checked': self.candidates_checked,
+                'memory_bytes': (
+                    self._signatures.buffer_info()[1] * self._signatures.itemsize
+                    + sum(keys.buffer_info()[1] * keys.itemsize + slots.buffer_info()[1] * slots.itemsize
+                          for keys, slots in zip(self._band_keys, self._band_slots))
+                ),
+            }
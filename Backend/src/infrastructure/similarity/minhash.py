@@ -0,0 +1,145 @@
+# ============================================
+# File: Backend/src/infrastructure/similarity/minhash.py
+# ============================================
+"""
+MinHash signatures for near-duplicate detection
+
+A document is reduced to the set of its word n-grams ("shingles") after the
+search tokenizer, so re-casing, dropped accents and stop-word edits do not
+change it. Two documents' Jaccard similarity |A ∩ B| / |A ∪ B| is then
+estimated from fixed-width signatures: the fraction of positions where the
+two signatures agree.
+
+Signatures use one-permutation hashing (Li, Owen & Zhang 2012): each
+shingle is hashed once, the hash picks one of num_perm bins and every bin
+keeps its minimum. That is one hash per shingle instead of num_perm, which
+is what makes full paper texts affordable in pure Python. Bins that no
+shingle fell into copy the value of another bin chosen by a fixed probe
+sequence ("optimal densification", Shrivastava 2017), which keeps the
+agreement rate an unbiased Jaccard estimate for short texts too.
+"""
+
+import hashlib
+import operator
+import random
+from array import array
+
+from infrastructure.search.tokenizer import tokenize
+
+
+SIGNATURE_TYPECODE = 'I'  # uint32 per position
+EMPTY_BIN = 0xFFFFFFFF
+DEFAULT_NUM_PERM = 128
+DEFAULT_SHINGLE_SIZE = 3
+MAX_PROBES = 64
+
+
+def shingle_hashes(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> set:
+    """64-bit hashes of the word n-grams of text (stable across processes)"""
+    tokens = tokenize(text)
+    if len(tokens) < size:
+        return {_hash64(' '.join(tokens))} if tokens else set()
+    return {
+        _hash64(' '.join(tokens[i:i + size]))
+        for i in range(len(tokens) - size + 1)
+    }
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+class MinHasher:
+    """
+    Usage:
+        hasher = MinHasher(num_perm=128)
+        signature = hasher.signature(title + '\\n' + abstract)   # array('I'), len 128
+        jaccard_estimate(signature, other_signature)             # 0.0 .. 1.0
+    """
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, shingle_size: int = DEFAULT_SHINGLE_SIZE,
+                 seed: int = 1):
+        if num_perm < 2:
+            raise ValueError("num_perm must be at least 2")
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        # The probe order must be identical everywhere signatures are compared
+        rng = random.Random(seed)
+        self._probes = [
+            [rng.randrange(num_perm) for _ in range(MAX_PROBES)]
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, text: str) -> array:
+        return self.signature_from_hashes(shingle_hashes(text, self.shingle_size))
+
+    def signature_from_hashes(self, hashes) -> array:
+        num_perm = self.num_perm
+        mins = [EMPTY_BIN] * num_perm
+        for h in hashes:
+            slot = h % num_perm
+            value = h >> 32
+            if value < mins[slot]:
+                mins[slot] = value
+
+        empty = [slot for slot, value in enumerate(mins) if value == EMPTY_BIN]
+        if empty and len(empty) < num_perm:
+            filled = list(mins)
+            for slot in empty:
+                filled[slot] = self._borrow(mins, slot)
+            mins = filled
+        return array(SIGNATURE_TYPECODE, mins)
+
+    def _borrow(self, mins: list, slot: int) -> int:
+        for donor in self._probes[slot]:
+            if mins[donor] != EMPTY_BIN:
+                return mins[donor]
+        # Very short texts: fall back to the next non-empty bin to the right
+        num_perm = self.num_perm
+        for step in range(1, num_perm):
+            value = mins[(slot + step) % num_perm]
+            if value != EMPTY_BIN:
+                return value
+        return EMPTY_BIN
+
+
+def jaccard_estimate(first: array, second: array) -> float:
+    """Fraction of agreeing positions - an estimate of the shingle-set Jaccard similarity"""
+    if len(first) != len(second):
+        raise ValueError("Signatures have different lengths")
+    return sum(map(operator.eq, first, second)) / len(first)
+
+
+def _candidate_probability(similarity: float, bands: int, rows: int) -> float:
+    return 1.0 - (1.0 - similarity ** rows) ** bands
+
+
+def _integrate(fn, low: float, high: float, steps: int = 100) -> float:
+    if high <= low:
+        return 0.0
+    width = (high - low) / steps
+    total = (fn(low) + fn(high)) / 2 + sum(fn(low + i * width) for i in range(1, steps))
+    return total * width
+
+
+def optimal_bands(threshold: float, num_perm: int, false_positive_weight: float = 0.2,
+                  false_negative_weight: float = 0.8):
+    """
+    (bands, rows) with bands * rows <= num_perm whose S-curve best separates
+    pairs above / below threshold. False negatives weigh more by default: a
+    missed duplicate is never looked at again, while a false candidate only
+    costs one signature comparison.
+    """
+    if not 0.0 < threshold < 1.0:
+        raise ValueError("threshold must be between 0 and 1")
+    best, best_error = None, None
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            false_positive = _integrate(
+                lambda s: _candidate_probability(s, bands, rows), 0.0, threshold)
+            false_negative = _integrate(
+                lambda s: 1.0 - _candidate_probability(s, bands, rows), threshold, 1.0)
+            error = false_positive_weight * false_positive + false_negative_weight * false_negative
+            if best_error is None or error < best_error:
+                best, best_error = (bands, rows), error
+    return best
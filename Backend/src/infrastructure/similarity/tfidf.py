@@ -0,0 +1,197 @@
+# ============================================
+# File: Backend/src/infrastructure/similarity/tfidf.py
+# ============================================
+"""
+TF-IDF vectors and sparse matrix products (pure Python, no NumPy needed)
+
+A document is a row of a sparse matrix kept CSR-style: parallel arrays of
+term ids (ascending) and float32 weights, L2-normalised so a dot product is
+a cosine similarity. Weights are sublinear tf times smoothed idf:
+    w(t, d) = (1 + log tf) * (log((1 + N) / (1 + df)) + 1)
+
+A product A . B^T never loops over every pair: B is transposed once into
+per-term columns (CSC), and each row of A only visits the columns of its
+own terms, accumulating scores for the rows of B that share one. Columns
+only hold each B row's `max_terms` heaviest terms - the words that occur
+everywhere weigh little but have the longest columns. At 64 / 200 terms per
+paper / reviewer profile that keeps >99.8% of the affinity of the best 50
+reviewers at a tenth of the exhaustive cost (scripts/benchmark_affinity.py);
+single lookups can rescore their shortlist exactly (top_k with `rows`).
+
+Usage:
+    space = TfidfSpace()
+    counts = space.count({'title': (text, 3.0), 'abstract': (text, 1.0)})
+    space.add_document(counts)
+    row = space.weigh(counts)
+    columns = transpose({reviewer_id: reviewer_row, ...}, max_terms=200)
+    top_k(row, columns, k=10)        # [(reviewer_id, cosine), ...]
+"""
+
+import heapq
+import math
+from array import array
+from operator import itemgetter
+
+from infrastructure.search.tokenizer import tokenize
+
+
+TERM_TYPECODE = 'I'
+WEIGHT_TYPECODE = 'f'
+EMPTY_ROW = (array(TERM_TYPECODE), array(WEIGHT_TYPECODE))
+RESCORE_FACTOR = 4
+
+
+class TfidfSpace:
+    """Vocabulary and document frequencies shared by every row of one corpus"""
+
+    def __init__(self):
+        self.terms = []         # term id -> term
+        self._ids = {}          # term -> term id
+        self.df = array('I')    # term id -> documents containing it
+        self.documents = 0
+
+    def __getstate__(self):
+        return {'terms': self.terms, 'df': self.df, 'documents': self.documents}
+
+    def __setstate__(self, state):
+        self.terms = state['terms']
+        self.df = state['df']
+        self.documents = state['documents']
+        self._ids = {term: term_id for term_id, term in enumerate(self.terms)}
+
+    def term_id(self, term: str) -> int:
+        term_id = self._ids.get(term)
+        if term_id is None:
+            term_id = self._ids[term] = len(self.terms)
+            self.terms.append(term)
+            self.df.append(0)
+        return term_id
+
+    def count(self, fields) -> dict:
+        """{term id: weighted count} of {field: (text, weight)} - weights >= 1"""
+        counts = {}
+        for text, weight in fields.values():
+            for token in tokenize(text):
+                term_id = self.term_id(token)
+                counts[term_id] = counts.get(term_id, 0.0) + weight
+        return counts
+
+    def add_document(self, counts: dict):
+        for term_id in counts:
+            self.df[term_id] += 1
+        self.documents += 1
+
+    def remove_document(self, counts: dict):
+        for term_id in counts:
+            self.df[term_id] -= 1
+        self.documents -= 1
+
+    def idf(self, term_id: int) -> float:
+        return math.log((1 + self.documents) / (1 + self.df[term_id])) + 1.0
+
+    def idf_table(self) -> list:
+        """idf of every term - pass to weigh() when weighing many rows at once"""
+        log_documents = math.log(1 + self.documents)
+        return [log_documents - math.log(1 + df) + 1.0 for df in self.df]
+
+    def weigh(self, counts: dict, max_terms: int = None, idf: list = None) -> tuple:
+        """CSR row (term ids, weights) of a document, L2-normalised"""
+        if not counts:
+            return EMPTY_ROW
+        log = math.log
+        if idf is None:
+            idf_of = self.idf
+            weighted = [(term_id, (1.0 + log(count)) * idf_of(term_id)) for term_id, count in counts.items()]
+        else:
+            weighted = [(term_id, (1.0 + log(count)) * idf[term_id]) for term_id, count in counts.items()]
+        norm = math.sqrt(sum(weight * weight for _, weight in weighted))
+        if not norm:
+            return EMPTY_ROW
+        if max_terms and len(weighted) > max_terms:
+            weighted = heapq.nlargest(max_terms, weighted, key=itemgetter(1))  # norm stays the full row's
+        weighted.sort()
+        return (
+            array(TERM_TYPECODE, [term_id for term_id, _ in weighted]),
+            array(WEIGHT_TYPECODE, [weight / norm for _, weight in weighted]),
+        )
+
+
+def merge_counts(parts) -> dict:
+    """Sum of several {term id: count} (e.g. a reviewer's papers)"""
+    merged = {}
+    for counts in parts:
+        for term_id, count in counts.items():
+            merged[term_id] = merged.get(term_id, 0.0) + count
+    return merged
+
+
+def head(row: tuple, max_terms: int) -> tuple:
+    """The row restricted to its max_terms heaviest terms (still sorted by term id)"""
+    term_ids, weights = row
+    if not max_terms or len(term_ids) <= max_terms:
+        return row
+    kept = sorted(heapq.nlargest(max_terms, range(len(weights)), key=weights.__getitem__))
+    return (
+        array(TERM_TYPECODE, [term_ids[i] for i in kept]),
+        array(WEIGHT_TYPECODE, [weights[i] for i in kept]),
+    )
+
+
+def transpose(rows: dict, max_terms: int = None) -> dict:
+    """CSR rows {key: (term ids, weights)} -> CSC columns {term id: (keys, weights)}"""
+    keys_of, weights_of = {}, {}
+    for key, row in rows.items():
+        for term_id, weight in zip(*head(row, max_terms)):
+            column = keys_of.get(term_id)
+            if column is None:
+                keys_of[term_id] = [key]
+                weights_of[term_id] = array(WEIGHT_TYPECODE, (weight,))
+            else:
+                column.append(key)
+                weights_of[term_id].append(weight)
+    return {term_id: (keys, weights_of[term_id]) for term_id, keys in keys_of.items()}
+
+
+def dot(first: tuple, second: tuple) -> float:
+    """Dot product of two CSR rows"""
+    if len(first[0]) > len(second[0]):
+        first, second = second, first
+    weights = dict(zip(*second))
+    get = weights.get
+    return sum(weight * get(term_id, 0.0) for term_id, weight in zip(*first))
+
+
+def scores(row: tuple, columns: dict) -> dict:
+    """{key: row . column-side row} for every key sharing a term with `row`"""
+    accumulated = {}
+    get = accumulated.get
+    for term_id, weight in zip(*row):
+        column = columns.get(term_id)
+        if column is None:
+            continue
+        for key, other in zip(*column):
+            accumulated[key] = get(key, 0.0) + weight * other
+    return accumulated
+
+
+def top_k(row: tuple, columns: dict, k: int, exclude=(), rows: dict = None) -> list:
+    """
+    The k best [(key, score)] of one row against transposed rows, best first
+
+    With `rows` (the untransposed side, full rows) the best k * RESCORE_FACTOR
+    are rescored exactly - what pruned columns missed can reorder them.
+    """
+    accumulated = scores(row, columns)
+    for key in exclude:
+        accumulated.pop(key, None)
+    if rows is None:
+        best = heapq.nlargest(k, accumulated.items(), key=itemgetter(1))
+    else:
+        query = dict(zip(*row))
+        get = query.get
+        shortlist = heapq.nlargest(k * RESCORE_FACTOR, accumulated, key=accumulated.__getitem__)
+        best = heapq.nlargest(k, (
+            (key, sum(weight * get(term_id, 0.0) for term_id, weight in zip(*rows[key])))
+            for key in shortlist
+        ), key=itemgetter(1))
+    return [(key, round(score, 6)) for key, score in best]
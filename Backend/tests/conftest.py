@@ -0,0 +1,37 @@
+"""
+Backend/tests/conftest.py
+Test settings: a throw-away SQLite database and storage directories, set
+before any application module reads the config.
+
+Run from Backend/:
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, SRC_DIR)
+
+_ROOT = tempfile.mkdtemp(prefix='uth_tests_')
+os.environ.update(
+    APP_ENV='testing',
+    DB_TYPE='sqlite',
+    DB_ECHO='False',
+    DATABASE_URL=f"sqlite:///{os.path.join(_ROOT, 'app.db')}",
+    UPLOAD_ROOT=os.path.join(_ROOT, 'uploads'),
+    TEXT_ROOT=os.path.join(_ROOT, 'texts'),
+    SEARCH_INDEX_PATH=os.path.join(_ROOT, 'search'),
+    DEDUP_INDEX_PATH=os.path.join(_ROOT, 'minhash'),
+    EXTRACT_WORKERS='0',
+    HASH_WORKERS='0',
+)
+
+
+@pytest.fixture(scope='session')
+def database():
+    from infrastructure.databases import init_db
+    assert init_db()
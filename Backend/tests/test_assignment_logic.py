@@ -0,0 +1,106 @@
+"""
+Backend/tests/test_assignment_logic.py
+The solver respects every hard constraint - quotas (fixed assignments
+included), conflicts, distinct reviewers per paper, kept assignments never
+moved - reports what it could not fill, and stays within its own bound of
+the optimum.
+"""
+
+import itertools
+import random
+
+import pytest
+
+from domain.services.assignment_logic import AssignmentProblem, residual_quotas, solve_assignment
+
+
+def random_problem(seed: int) -> AssignmentProblem:
+    rng = random.Random(seed)
+    papers = list(range(1, 31))
+    reviewers = list(range(100, 112))
+    conflicts = {(p, r) for p in papers for r in reviewers if rng.random() < 0.1}
+    fixed = {}
+    for paper_id in rng.sample(papers, 8):
+        fixed[paper_id] = {r for r in rng.sample(reviewers, rng.randint(1, 2)) if (paper_id, r) not in conflicts}
+    return AssignmentProblem(
+        paper_ids=papers,
+        reviewer_ids=reviewers,
+        candidates={p: [(r, round(rng.random(), 3)) for r in rng.sample(reviewers, 8)] for p in papers},
+        quotas={r: rng.randint(8, 10) for r in reviewers},  # >= any kept load
+        reviewers_per_paper=3,
+        conflicts=conflicts,
+        fixed=fixed,
+    )
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_hard_constraints_hold(seed):
+    problem = random_problem(seed)
+    result = solve_assignment(problem)
+
+    load = {r: 0 for r in problem.reviewer_ids}
+    per_paper = {p: set(problem.fixed.get(p, ())) for p in problem.paper_ids}
+    for reviewer_ids in problem.fixed.values():
+        for reviewer_id in reviewer_ids:
+            load[reviewer_id] += 1
+    for paper_id, reviewer_id, _ in result.pairs:
+        assert (paper_id, reviewer_id) not in problem.conflicts
+        assert reviewer_id not in per_paper[paper_id], "a reviewer twice on a paper, or a kept one re-added"
+        per_paper[paper_id].add(reviewer_id)
+        load[reviewer_id] += 1
+
+    for reviewer_id, count in load.items():
+        assert count <= problem.quotas[reviewer_id]
+    for paper_id, reviewer_ids in per_paper.items():
+        assert len(reviewer_ids) + result.unfilled.get(paper_id, 0) == problem.reviewers_per_paper
+    assert result.total_affinity <= result.upper_bound + 1e-9
+
+
+def test_close_to_the_brute_force_optimum():
+    rng = random.Random(7)
+    papers, reviewers = [1, 2, 3, 4], [10, 11, 12, 13, 14]
+    affinity = {(p, r): round(rng.random(), 3) for p in papers for r in reviewers}
+    problem = AssignmentProblem(
+        paper_ids=papers, reviewer_ids=reviewers,
+        candidates={p: [(r, affinity[p, r]) for r in reviewers] for p in papers},
+        quotas={r: 1 for r in reviewers}, reviewers_per_paper=1,
+    )
+    best = max(sum(affinity[p, r] for p, r in zip(papers, chosen))
+               for chosen in itertools.permutations(reviewers, len(papers)))
+
+    result = solve_assignment(problem)
+    assert not result.unfilled
+    assert result.upper_bound >= best - 1e-9
+    # The auction is optimal up to eps per paper
+    assert result.total_affinity >= best - len(papers) * 0.02 * max(affinity.values())
+
+
+def test_kept_assignments_count_against_quota_and_demand():
+    problem = AssignmentProblem(
+        paper_ids=[1, 2], reviewer_ids=[10, 11],
+        candidates={1: [(10, 0.9), (11, 0.1)], 2: [(10, 0.9), (11, 0.5)]},
+        quotas={10: 1, 11: 5}, reviewers_per_paper=2,
+        fixed={1: {10}},
+    )
+    result = solve_assignment(problem)
+    pairs = {(p, r) for p, r, _ in result.pairs}
+    # Reviewer 10 is full with the kept paper 1: paper 2 cannot get it
+    assert pairs == {(1, 11), (2, 11)}
+    assert result.unfilled == {2: 1}
+
+
+def test_conflicts_are_never_filled_in():
+    problem = AssignmentProblem(
+        paper_ids=[1], reviewer_ids=[10, 11],
+        candidates={1: [(10, 0.9)]},
+        quotas={10: 5, 11: 5}, reviewers_per_paper=2,
+        conflicts={(1, 11)},
+    )
+    result = solve_assignment(problem)
+    assert [(p, r) for p, r, _ in result.pairs] == [(1, 10)]
+    assert result.unfilled == {1: 1}
+
+
+def test_residual_quotas():
+    # Reviewer 10: quota 5, 4 active assignments of which 1 is in the problem
+    assert residual_quotas({10: 5, 11: 2}, {10: 4, 11: 3}, {1: {10}}) == {10: 2, 11: 0}
@@ -0,0 +1,86 @@
+"""
+Backend/tests/test_audit_sink.py
+Spill replays are idempotent: a crash between the insert and removing the
+file, or a `.replay` file left behind, never duplicates audit rows.
+"""
+
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime
+
+import pytest
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.models import AuditLogAI
+from infrastructure.services.audit_sink import AuditSink
+
+
+@pytest.fixture
+def sink(database, tmp_path):
+    return AuditSink(batch_size=2, spill_path=str(tmp_path / 'audit_spill.jsonl'))
+
+
+def rows(action_type: str, count: int = 3):
+    return [{
+        'action_user_id': None,
+        'action_type': action_type,
+        'table_name': 'papers',
+        'record_id': record_id,
+        'data': None,
+        'timestamp': datetime.utcnow(),
+    } for record_id in range(count)]
+
+
+def written(action_type: str) -> int:
+    with session_scope(read_only=True) as db:
+        return db.query(AuditLogAI).filter(AuditLogAI.action_type == action_type).count()
+
+
+def test_crash_before_the_replay_file_is_removed(sink):
+    action_type = f"test_{uuid.uuid4().hex[:8]}"
+    sink._spill(rows(action_type))
+    spilled = f"{sink.spill_path}.copy"
+    shutil.copy(sink.spill_path, spilled)
+
+    sink._replay_spill()
+    assert written(action_type) == 3
+    assert not os.path.exists(sink.replay_path)
+
+    # The rows were committed, then the process died before os.remove()
+    os.replace(spilled, sink.replay_path)
+    AuditSink(batch_size=2, spill_path=sink.spill_path)._replay_spill()
+    assert written(action_type) == 3
+    assert not os.path.exists(sink.replay_path)
+
+
+def test_leftover_replay_file_is_picked_up_first(sink):
+    leftover, fresh = f"test_{uuid.uuid4().hex[:8]}", f"test_{uuid.uuid4().hex[:8]}"
+    sink._spill(rows(leftover))
+    os.replace(sink.spill_path, sink.replay_path)
+    sink._spill(rows(fresh, 2))
+
+    sink._replay_spill()
+    assert written(leftover) == 3
+    assert written(fresh) == 2
+    assert not os.path.exists(sink.replay_path)
+    assert not os.path.exists(sink.spill_path)
+
+
+def test_lines_spilled_without_an_id_replay_once(sink):
+    action_type = f"test_{uuid.uuid4().hex[:8]}"
+    legacy = ''.join(json.dumps(dict(row, timestamp=row['timestamp'].isoformat())) + '\n'
+                     for row in rows(action_type))
+    for _ in range(2):
+        with open(sink.replay_path, 'w', encoding='utf-8') as f:
+            f.write(legacy)
+        sink._replay_spill()
+    assert written(action_type) == 3
+
+
+def test_rows_written_directly_have_no_spill_id(sink):
+    action_type = f"test_{uuid.uuid4().hex[:8]}"
+    sink._write(rows(action_type))
+    sink._write(rows(action_type))
+    assert written(action_type) == 6
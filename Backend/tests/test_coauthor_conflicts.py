@@ -0,0 +1,107 @@
+"""
+Backend/tests/test_coauthor_conflicts.py
+Conflict-of-interest lookups on the co-authorship graph: authors, co-authors
+up to `hops` steps away (every step a joint paper inside the window) and
+shared affiliations inside the window; conflicts_among agrees with conflict.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from infrastructure.similarity.coauthor_graph import (
+    REASON_AFFILIATION,
+    REASON_AUTHOR,
+    REASON_COAUTHOR,
+    CoauthorGraph,
+    normalize_affiliation,
+    window_start,
+)
+
+TODAY = date.today().toordinal()
+OLD = (date.today() - timedelta(days=10 * 365)).toordinal()
+
+PAPER = 1   # under review, written by author 1 and 2
+
+
+@pytest.fixture
+def graph():
+    """
+    Chain 3 - 1 - 4 - 5 (recent papers), 1 - 6 only on an old paper, 4 - 7 on an
+    old paper; 8 shares author 2's affiliation, 9 used it only long ago
+    """
+    graph = CoauthorGraph()
+    graph.add_authorship(PAPER, 1, TODAY)
+    graph.add_authorship(PAPER, 2, TODAY, 'Univ. of Somewhere')
+    for paper_id, authors, day in (
+        (10, (1, 3), TODAY),
+        (11, (1, 4), TODAY),
+        (12, (4, 5), TODAY),
+        (13, (1, 6), OLD),
+        (14, (4, 7), OLD),
+    ):
+        for user_id in authors:
+            graph.add_authorship(paper_id, user_id, day)
+    graph.add_authorship(20, 8, TODAY, 'University of  SOMEWHERE')
+    graph.add_authorship(21, 9, OLD, 'University of Somewhere')
+    return graph
+
+
+def test_window_start():
+    assert window_start(0) == 0
+    assert window_start(None) == 0
+    assert window_start(1) == (date.today() - timedelta(days=365)).toordinal()
+    assert OLD < window_start(5) < TODAY
+
+
+def test_authors_are_conflicted(graph):
+    assert graph.conflict(1, PAPER, hops=0, affiliation=False) == (REASON_AUTHOR, 1, None)
+
+
+def test_hops(graph):
+    assert graph.conflict(3, PAPER, hops=1) == (REASON_COAUTHOR, 1, 1)
+    assert graph.conflict(5, PAPER, hops=1) is None
+    assert graph.conflict(5, PAPER, hops=2) == (REASON_COAUTHOR, 1, 2)
+    assert graph.conflict(3, PAPER, hops=0, affiliation=False) is None
+    assert graph.neighbourhood(1, 2) == {2: 1, 3: 1, 4: 1, 6: 1, 5: 2, 7: 2}
+
+
+def test_window_drops_old_joint_papers(graph):
+    since = window_start(5)
+    assert graph.conflict(6, PAPER, hops=1) == (REASON_COAUTHOR, 1, 1)
+    assert graph.conflict(6, PAPER, hops=1, since=since) is None
+    # Every step has to be inside the window, not just the first
+    assert graph.conflict(7, PAPER, hops=2) == (REASON_COAUTHOR, 1, 2)
+    assert graph.conflict(7, PAPER, hops=2, since=since) is None
+    assert graph.neighbourhood(1, 2, since) == {2: 1, 3: 1, 4: 1, 5: 2}
+
+
+def test_a_newer_joint_paper_brings_the_edge_back(graph):
+    since = window_start(5)
+    assert graph.conflict(6, PAPER, hops=1, since=since) is None
+    assert graph.add_authorship(30, 1, TODAY)
+    assert graph.add_authorship(30, 6, TODAY)
+    assert not graph.add_authorship(30, 6, TODAY)   # nothing new
+    assert graph.conflict(6, PAPER, hops=1, since=since) == (REASON_COAUTHOR, 1, 1)
+
+
+def test_affiliation(graph):
+    since = window_start(5)
+    assert normalize_affiliation('Univ. of Somewhere') == normalize_affiliation('University of  SOMEWHERE')
+    assert normalize_affiliation('Independent') is None
+    assert graph.conflict(8, PAPER, hops=1, since=since) == (REASON_AFFILIATION, 2, 'university of somewhere')
+    assert graph.conflict(8, PAPER, hops=1, since=since, affiliation=False) is None
+    assert graph.conflict(9, PAPER, hops=1) == (REASON_AFFILIATION, 2, 'university of somewhere')
+    assert graph.conflict(9, PAPER, hops=1, since=since) is None
+
+
+@pytest.mark.parametrize('hops, years', [(0, 0), (1, 0), (2, 0), (1, 5), (2, 5)])
+def test_conflicts_among_matches_conflict(graph, hops, years):
+    since = window_start(years)
+    reviewers = range(1, 10)
+    found = graph.conflicts_among([PAPER], reviewers, hops, since)
+    expected = {
+        (PAPER, reviewer_id): conflict for reviewer_id in reviewers
+        if (conflict := graph.conflict(reviewer_id, PAPER, hops, since)) is not None
+    }
+    assert found == expected
@@ -0,0 +1,63 @@
+"""
+Backend/tests/test_download_access.py
+A reviewer who declines an assignment loses the PDF at once, not when the
+cached download decision expires; other reviewers keep theirs.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.models import User, Conference, Paper, Assignment
+from domain.services.assignment_service import AssignmentService
+from domain.services.paper_file_service import VARIANT_SUBMISSION, get_download_access_cache
+
+
+def user(db, label: str) -> User:
+    name = f"{label}_{uuid.uuid4().hex[:10]}"
+    row = User(username=name, password_hash='x', full_name=label, email=f'{name}@example.org')
+    db.add(row)
+    db.flush()
+    return row
+
+
+@pytest.fixture
+def assigned_paper(database):
+    """{'conference_id', 'paper_id', 'reviewers': [(reviewer_id, assignment_id)]} - two reviewers"""
+    now = datetime.utcnow()
+    with session_scope() as db:
+        chair = user(db, 'chair')
+        conf = Conference(chair_id=chair.id, name=f'Conf {uuid.uuid4().hex[:8]}',
+                          submission_deadline=now - timedelta(days=1), review_deadline=now + timedelta(days=30))
+        db.add(conf)
+        db.flush()
+        paper = Paper(title='A paper', abstract='About things', pdf_path='legacy.pdf',
+                      submitter_id=chair.id, conference_id=conf.id)
+        db.add(paper)
+        db.flush()
+        reviewers = []
+        for _ in range(2):
+            reviewer = user(db, 'reviewer')
+            assignment = Assignment(conference_id=conf.id, paper_id=paper.id, reviewer_id=reviewer.id)
+            db.add(assignment)
+            db.flush()
+            reviewers.append((reviewer.id, assignment.id))
+        return {'conference_id': conf.id, 'paper_id': paper.id, 'reviewers': reviewers}
+
+
+def test_decline_drops_the_cached_download_decision(assigned_paper):
+    cache = get_download_access_cache()
+    paper_id = assigned_paper['paper_id']
+    (declining, assignment_id), (staying, _) = assigned_paper['reviewers']
+    for reviewer_id in (declining, staying):
+        cache.set((reviewer_id, paper_id, VARIANT_SUBMISSION), f'target-{reviewer_id}')
+
+    result, error = AssignmentService.decline_assignment(
+        assigned_paper['conference_id'], assignment_id, {'user_id': declining, 'roles': []}, repair=False
+    )
+    assert error is None
+    assert result['status'] == 'Declined'
+    assert cache.get((declining, paper_id, VARIANT_SUBMISSION)) is None
+    assert cache.get((staying, paper_id, VARIANT_SUBMISSION)) == f'target-{staying}'
@@ -0,0 +1,93 @@
+"""
+Backend/tests/test_jwt_key_ring.py
+Key rotation keeps tokens signed with a previous key valid until that key
+leaves the ring - cached verifications included - and the verified-token
+cache spares the HMAC on repeat requests.
+"""
+
+from types import SimpleNamespace
+
+import jwt
+import pytest
+
+from domain.utils import auth_utils
+from domain.utils.auth_utils import decode_token, generate_token
+from domain.utils.key_ring import KeyRing
+from infrastructure.cache import TTLCache
+
+
+OLD_SECRET = 'old-secret-' + 'o' * 32
+NEW_SECRET = 'new-secret-' + 'n' * 32
+
+
+@pytest.fixture
+def use_ring(monkeypatch):
+    """use_ring(KeyRing) - swap the process key ring; every test starts with an empty token cache"""
+    monkeypatch.setattr(auth_utils, '_token_cache', TTLCache(max_size=100, ttl=300, name='test_tokens'))
+
+    def use(ring: KeyRing):
+        monkeypatch.setattr(auth_utils, '_key_ring', ring)
+    use(KeyRing('k1', OLD_SECRET))
+    return use
+
+
+@pytest.fixture
+def verifications(monkeypatch):
+    calls = []
+    original = auth_utils.verify_token
+
+    def counting(token):
+        calls.append(token)
+        return original(token)
+
+    monkeypatch.setattr(auth_utils, 'verify_token', counting)
+    return calls
+
+
+def test_rotation_keeps_old_tokens_until_the_key_is_dropped(use_ring, verifications):
+    token = generate_token(7, ['Author'])
+    assert jwt.get_unverified_header(token)['kid'] == 'k1'
+    assert decode_token(token)['user_id'] == 7
+
+    use_ring(KeyRing('k2', NEW_SECRET, previous={'k1': OLD_SECRET}))
+    assert decode_token(token)['user_id'] == 7
+    assert jwt.get_unverified_header(generate_token(8, ['Author']))['kid'] == 'k2'
+
+    # Dropped from the ring: the cached verification is not trusted either
+    use_ring(KeyRing('k2', NEW_SECRET))
+    with pytest.raises(ValueError, match='Invalid token'):
+        decode_token(token)
+
+
+def test_verified_tokens_are_cached(use_ring, verifications):
+    token = generate_token(7, ['Author'])
+    first = decode_token(token)
+    first['user_id'] = 99  # callers get a copy, not the cached payload
+    assert decode_token(token)['user_id'] == 7
+    assert len(verifications) == 1
+
+    forged = jwt.encode({'user_id': 1, 'role': ['Admin'], 'exp': 4102444800}, 'x' * 40,
+                        algorithm='HS256', headers={'kid': 'k1'})
+    with pytest.raises(ValueError, match='Invalid token'):
+        decode_token(forged)
+
+
+def test_legacy_token_without_kid_is_tried_against_every_key(use_ring):
+    legacy = jwt.encode({'user_id': 5, 'role': ['Author'], 'exp': 4102444800}, OLD_SECRET, algorithm='HS256')
+    use_ring(KeyRing('k2', NEW_SECRET, previous={'k1': OLD_SECRET}))
+    assert decode_token(legacy)['user_id'] == 5
+
+
+def test_expired_token_is_rejected(use_ring):
+    with pytest.raises(ValueError, match='expired'):
+        decode_token(generate_token(7, ['Author'], expires_in_hours=-1))
+
+
+def test_previous_keys_come_from_config():
+    ring = KeyRing.from_config(SimpleNamespace(
+        JWT_KEY_ID='k2', JWT_SECRET_KEY=NEW_SECRET, JWT_PREVIOUS_KEYS=f' k1:{OLD_SECRET} ,'
+    ))
+    assert ring.current_kid == 'k2'
+    assert ring.get('k1') == OLD_SECRET
+    with pytest.raises(ValueError):
+        KeyRing.from_config(SimpleNamespace(JWT_KEY_ID='k2', JWT_SECRET_KEY=NEW_SECRET, JWT_PREVIOUS_KEYS='k1'))
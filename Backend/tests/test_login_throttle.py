@@ -0,0 +1,75 @@
+"""
+Backend/tests/test_login_throttle.py
+Only failed logins count against the limit: a user who keeps logging in is
+never throttled, a guesser is stopped before bcrypt after the burst.
+"""
+
+import uuid
+
+import pytest
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.models import User
+from infrastructure.services.hashing_service import get_password_hasher
+from infrastructure.services.rate_limiter import (
+    InMemoryTokenBucketBackend,
+    LoginThrottle,
+    LoginThrottledError,
+)
+from domain.services import auth_service
+from domain.services.auth_service import AuthService
+
+
+PASSWORD = 'SecurePass123'
+
+
+@pytest.fixture
+def throttle(monkeypatch):
+    throttle = LoginThrottle(InMemoryTokenBucketBackend(shards=4),
+                             user_burst=3, user_per_minute=0.001, ip_burst=5, ip_per_minute=0.001)
+    monkeypatch.setattr(auth_service, 'get_login_throttle', lambda: throttle)
+    return throttle
+
+
+@pytest.fixture
+def username(database):
+    name = f"author_{uuid.uuid4().hex[:10]}"
+    with session_scope() as db:
+        db.add(User(username=name, password_hash=get_password_hasher().hash(PASSWORD),
+                    full_name='Author', email=f'{name}@example.org'))
+    return name
+
+
+def test_successful_logins_are_never_throttled(throttle, username):
+    for _ in range(10):
+        user, token = AuthService.login_user(username, PASSWORD, client_ip='10.0.0.1')
+        assert user is not None and token
+    stats = throttle.stats()
+    assert stats['allowed'] == stats['refunded'] == 10
+    assert stats['bcrypt_avoided'] == 0
+
+
+def test_failed_attempts_are_throttled_before_bcrypt(throttle, username, monkeypatch):
+    for _ in range(3):
+        user, error = AuthService.login_user(username, 'wrong', client_ip='10.0.0.2')
+        assert user is None and error == 'Invalid credentials'
+
+    def no_bcrypt():
+        raise AssertionError('a throttled attempt must not reach bcrypt')
+
+    monkeypatch.setattr(auth_service, 'get_password_hasher', no_bcrypt)
+    with pytest.raises(LoginThrottledError) as throttled:
+        AuthService.login_user(username, PASSWORD, client_ip='10.0.0.3')
+    assert throttled.value.scope == 'username'
+    assert throttled.value.retry_after > 0
+    assert throttle.stats()['bcrypt_avoided'] == 1
+
+
+def test_refund_never_exceeds_the_burst():
+    backend = InMemoryTokenBucketBackend(shards=1)
+    backend.consume('k', capacity=2, refill_per_second=0)
+    for _ in range(5):
+        backend.refund('k')
+    assert backend.consume('k', 2, 0)[0]
+    assert backend.consume('k', 2, 0)[0]
+    assert not backend.consume('k', 2, 0)[0]
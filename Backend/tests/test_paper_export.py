@@ -0,0 +1,94 @@
+"""
+Backend/tests/test_paper_export.py
+The streamed conference export is a ZIP that zipfile opens and verifies:
+manifest and authors CSVs, one PDF per exported paper (bytes and SHA-256 as
+listed in the manifest), withdrawn papers left out.
+"""
+
+import csv
+import hashlib
+import io
+import os
+import uuid
+import zipfile
+from datetime import datetime, timedelta
+
+import pytest
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.models import User, Conference, Paper, PaperAuthor
+from infrastructure.services.file_storage_service import get_file_storage
+from domain.services.paper_export_service import ACCESS_DENIED, PaperExportService
+
+
+def user(db, label: str) -> User:
+    name = f"{label}_{uuid.uuid4().hex[:10]}"
+    row = User(username=name, password_hash='x', full_name=label.title(), email=f'{name}@example.org')
+    db.add(row)
+    db.flush()
+    return row
+
+
+def pdf(size: int) -> bytes:
+    body = os.urandom(size)
+    return b'%PDF-1.4\n' + body + b'\n%%EOF\n'
+
+
+@pytest.fixture
+def conference(database):
+    """{'chair', 'author', 'conference_id', 'pdfs': {paper_id: bytes}} - plus one withdrawn paper"""
+    storage = get_file_storage()
+    now = datetime.utcnow()
+    with session_scope() as db:
+        chair = user(db, 'chair')
+        author = user(db, 'author')
+        conf = Conference(chair_id=chair.id, name=f'Export {uuid.uuid4().hex[:8]}',
+                          submission_deadline=now - timedelta(days=1), review_deadline=now + timedelta(days=30))
+        db.add(conf)
+        db.flush()
+        pdfs = {}
+        # Bigger than the stream chunk so an entry spans several chunks
+        for title, size in (('Small paper', 2_000), ('Large paper', 300_000)):
+            data = pdf(size)
+            stored = storage.save_stream(io.BytesIO(data), require_pdf=True)
+            paper = Paper(title=title, abstract='About things', pdf_path=stored.key,
+                          submitter_id=author.id, conference_id=conf.id)
+            db.add(paper)
+            db.flush()
+            db.add(PaperAuthor(paper_id=paper.id, user_id=author.id, author_order=1))
+            pdfs[paper.id] = data
+        db.add(Paper(title='Withdrawn paper', abstract='Gone', pdf_path='legacy.pdf',
+                     submitter_id=author.id, conference_id=conf.id, is_withdrawn=True))
+        return {'chair': {'user_id': chair.id, 'roles': []}, 'author': {'user_id': author.id, 'roles': []},
+                'conference_id': conf.id, 'pdfs': pdfs}
+
+
+def test_export_is_a_valid_zip(conference):
+    plan, error = PaperExportService.prepare_conference_export(conference['conference_id'], conference['chair'])
+    assert error is None
+    assert plan.paper_count == 2
+
+    archive = b''.join(PaperExportService.stream_archive(plan, chunk_size=64 * 1024))
+    with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+        assert zf.testzip() is None
+        names = zf.namelist()
+        assert f"{plan.folder}/manifest.csv" in names
+        assert f"{plan.folder}/authors.csv" in names
+
+        manifest = list(csv.DictReader(io.StringIO(zf.read(f"{plan.folder}/manifest.csv").decode('utf-8-sig'))))
+        assert {int(row['paper_id']) for row in manifest} == set(conference['pdfs'])
+        for row in manifest:
+            data = zf.read(row['pdf_file'])
+            assert data == conference['pdfs'][int(row['paper_id'])]
+            assert row['pdf_sha256'] == hashlib.sha256(data).hexdigest()
+            assert int(row['pdf_size']) == len(data)
+
+        authors = list(csv.DictReader(io.StringIO(zf.read(f"{plan.folder}/authors.csv").decode('utf-8-sig'))))
+        assert len(authors) == 2
+        assert sorted(name for name in names if name.endswith('.pdf')) == sorted(row['pdf_file'] for row in manifest)
+
+
+def test_only_chair_or_admin_exports(conference):
+    plan, error = PaperExportService.prepare_conference_export(conference['conference_id'], conference['author'])
+    assert plan is None
+    assert error == ACCESS_DENIED
@@ -0,0 +1,120 @@
+"""
+Backend/tests/test_paper_status.py
+Bulk status changes follow the state machine: forbidden transitions and a
+camera-ready without a file are reported per paper and leave those papers
+(and their decisions) untouched, while the rest of the batch moves.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.models import User, Conference, Paper, PaperStatus, Decision
+from domain.services.paper_status_service import (
+    ACCESS_DENIED,
+    RESULT_INVALID,
+    RESULT_MISSING_FILE,
+    RESULT_NOT_FOUND,
+    RESULT_UNCHANGED,
+    RESULT_UPDATED,
+    PaperStatusService,
+    can_transition,
+)
+
+
+def user(db, label: str) -> User:
+    name = f"{label}_{uuid.uuid4().hex[:10]}"
+    row = User(username=name, password_hash='x', full_name=label, email=f'{name}@example.org')
+    db.add(row)
+    db.flush()
+    return row
+
+
+@pytest.fixture
+def papers(database):
+    """{'chair', 'author', 'conference_id', status value: paper_id} - one paper per status"""
+    now = datetime.utcnow()
+    with session_scope() as db:
+        chair = user(db, 'chair')
+        author = user(db, 'author')
+        conf = Conference(chair_id=chair.id, name=f'Conf {uuid.uuid4().hex[:8]}',
+                          submission_deadline=now - timedelta(days=1), review_deadline=now + timedelta(days=30))
+        db.add(conf)
+        db.flush()
+        ids = {'chair': {'user_id': chair.id, 'roles': []}, 'author': {'user_id': author.id, 'roles': []},
+               'conference_id': conf.id}
+        for status in PaperStatus:
+            paper = Paper(title=f'A {status.value} paper', abstract='About things', pdf_path='legacy.pdf',
+                          submitter_id=author.id, conference_id=conf.id, status=status,
+                          is_withdrawn=status == PaperStatus.WITHDRAWN)
+            db.add(paper)
+            db.flush()
+            ids[status.value] = paper.id
+        return ids
+
+
+def statuses(paper_ids) -> dict:
+    with session_scope(read_only=True) as db:
+        return {row.id: row.status for row in db.query(Paper.id, Paper.status).filter(Paper.id.in_(paper_ids))}
+
+
+def results(response) -> dict:
+    return {entry['paper_id']: entry['result'] for entry in response['results']}
+
+
+def test_state_machine():
+    assert can_transition(PaperStatus.SUBMITTED, PaperStatus.UNDER_REVIEW)
+    assert can_transition(PaperStatus.REJECTED, PaperStatus.ACCEPTED)
+    assert not can_transition(PaperStatus.SUBMITTED, PaperStatus.ACCEPTED)
+    assert not can_transition(PaperStatus.WITHDRAWN, PaperStatus.UNDER_REVIEW)
+    assert not can_transition(PaperStatus.CAMERA_READY, PaperStatus.REJECTED)
+
+
+def test_invalid_transitions_leave_papers_untouched(papers):
+    ids = [papers[status.value] for status in PaperStatus] + [10**9]
+    before = statuses(ids)
+
+    response, error = PaperStatusService.bulk_transition(papers['conference_id'], ids, 'accepted', papers['chair'])
+    assert error is None
+    assert results(response) == {
+        papers['submitted']: RESULT_INVALID,
+        papers['under_review']: RESULT_UPDATED,
+        papers['accepted']: RESULT_UNCHANGED,
+        papers['rejected']: RESULT_UPDATED,
+        papers['withdrawn']: RESULT_INVALID,
+        papers['camera_ready']: RESULT_INVALID,
+        10**9: RESULT_NOT_FOUND,
+    }
+
+    after = statuses(ids)
+    for status in ('submitted', 'withdrawn', 'camera_ready', 'accepted'):
+        assert after[papers[status]] == before[papers[status]]
+    assert after[papers['under_review']] == PaperStatus.ACCEPTED
+
+    with session_scope(read_only=True) as db:
+        decided = {row.paper_id for row in db.query(Decision.paper_id).filter(
+            Decision.paper_id.in_(ids), Decision.is_deleted == False
+        )}
+    assert decided == {papers['under_review'], papers['rejected']}
+
+
+def test_camera_ready_needs_a_file(papers):
+    response, error = PaperStatusService.bulk_transition(
+        papers['conference_id'], [papers['accepted']], 'camera_ready', papers['chair']
+    )
+    assert error is None
+    assert results(response) == {papers['accepted']: RESULT_MISSING_FILE}
+    assert statuses([papers['accepted']])[papers['accepted']] == PaperStatus.ACCEPTED
+
+
+def test_bad_requests_are_refused(papers):
+    assert PaperStatusService.bulk_transition(
+        papers['conference_id'], [papers['submitted']], 'under_review', papers['author']
+    ) == (None, ACCESS_DENIED)
+    response, error = PaperStatusService.bulk_transition(
+        papers['conference_id'], [papers['submitted']], 'published', papers['chair']
+    )
+    assert response is None and error.startswith('Invalid status')
+    assert statuses([papers['submitted']])[papers['submitted']] == PaperStatus.SUBMITTED
@@ -0,0 +1,83 @@
+"""
+Backend/tests/test_password_hashing.py
+An overloaded bcrypt pool is a 503 with Retry-After, never a failed login,
+and hash latency is exported as a real histogram.
+"""
+
+import time
+import uuid
+
+import pytest
+from flask import Flask
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.models import User
+from infrastructure.monitoring.metrics import registry
+from infrastructure.services.hashing_service import (
+    HashingQueueFullError,
+    HashingTimeoutError,
+    PasswordHasher,
+)
+from domain.services import auth_service
+from api.v1.auth import auth_bp
+
+
+class OverloadedHasher:
+    def __init__(self, error):
+        self.error = error
+
+    def verify(self, password, hashed):
+        raise self.error
+
+    def hash(self, password, rounds=None):
+        raise self.error
+
+
+@pytest.fixture
+def client(database):
+    app = Flask(__name__)
+    app.register_blueprint(auth_bp)
+    return app.test_client()
+
+
+@pytest.fixture
+def username(database):
+    name = f"author_{uuid.uuid4().hex[:10]}"
+    with session_scope() as db:
+        db.add(User(username=name, password_hash='x', full_name='Author', email=f'{name}@example.org'))
+    return name
+
+
+def test_slow_job_times_out_and_keeps_its_slot():
+    hasher = PasswordHasher(workers=1, queue_size=1, rounds=4, timeout=0.2)
+    try:
+        with pytest.raises(HashingTimeoutError) as timed_out:
+            hasher._run('verify', time.sleep, 2)
+        assert timed_out.value.retry_after == 1
+        # The worker is still busy with the timed-out job
+        with pytest.raises(HashingQueueFullError):
+            hasher.verify('secret', 'x')
+    finally:
+        hasher.shutdown()
+
+
+@pytest.mark.parametrize('error', [
+    HashingQueueFullError("Password hashing queue is full, please retry"),
+    HashingTimeoutError("Password hashing took longer than 10s, please retry", retry_after=10),
+])
+def test_overloaded_pool_is_503_not_401(client, username, monkeypatch, error):
+    monkeypatch.setattr(auth_service, 'get_password_hasher', lambda: OverloadedHasher(error))
+
+    response = client.post('/auth/login', json={'username': username, 'password': 'SecurePass123'})
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == str(error.retry_after)
+
+
+def test_hash_latency_is_a_histogram():
+    hasher = PasswordHasher(workers=0, queue_size=1, rounds=4)
+    hasher.verify('secret', hasher.hash('secret'))
+
+    text = registry.render()
+    assert '# TYPE uth_password_hash_seconds histogram' in text
+    assert 'uth_password_hash_seconds_bucket{operation="hash",le="+Inf"}' in text
+    assert 'uth_password_hash_seconds_count{operation="verify"}' in text
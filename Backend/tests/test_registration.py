@@ -0,0 +1,73 @@
+"""
+Backend/tests/test_registration.py
+Two registrations racing for the same email: the loser gets a clean 409 and
+no token, the unit of work rolls its rows back.
+"""
+
+import uuid
+
+import pytest
+from flask import Flask
+
+from infrastructure.databases import unit_of_work
+from infrastructure.databases.unit_of_work import separate_transaction, session_scope
+from infrastructure.models import User
+from domain.services import auth_service
+from domain.services.auth_service import AuthService, EMAIL_TAKEN
+from api.v1.auth import auth_bp
+
+
+class RacingHasher:
+    """Commits a competing account for `email` while 'bcrypt' runs - after the existence check"""
+
+    def __init__(self, email: str):
+        self.email = email
+
+    def hash(self, password, rounds=None):
+        name = f"racer_{uuid.uuid4().hex[:10]}"
+        with separate_transaction() as db:
+            db.add(User(username=name, password_hash='x', full_name='Racer', email=self.email))
+        return 'x'
+
+
+@pytest.fixture
+def client(database):
+    app = Flask(__name__)
+    unit_of_work.init_app(app)
+    app.register_blueprint(auth_bp)
+    return app.test_client()
+
+
+def accounts(username: str) -> int:
+    with session_scope(read_only=True) as db:
+        return db.query(User).filter(User.username == username).count()
+
+
+def test_lost_race_is_a_conflict_without_token(database, monkeypatch):
+    name = f"author_{uuid.uuid4().hex[:10]}"
+    email = f'{name}@example.org'
+    monkeypatch.setattr(auth_service, 'get_password_hasher', lambda: RacingHasher(email))
+
+    user, error = AuthService.register_user(name, 'SecurePass123', email, 'Author')
+    assert user is None
+    assert error == EMAIL_TAKEN
+    assert accounts(name) == 0
+
+
+def test_register_api_answers_409(client, monkeypatch):
+    name = f"author_{uuid.uuid4().hex[:10]}"
+    email = f'{name}@example.org'
+    monkeypatch.setattr(auth_service, 'get_password_hasher', lambda: RacingHasher(email))
+
+    response = client.post('/auth/register', json={
+        'username': name, 'password': 'SecurePass123', 'email': email, 'full_name': 'Author'
+    })
+    assert response.status_code == 409
+    assert 'token' not in response.get_json().get('data', {})
+    assert accounts(name) == 0
+
+    # The plain duplicate (no race) is the same conflict
+    response = client.post('/auth/register', json={
+        'username': f"other_{name}", 'password': 'SecurePass123', 'email': email, 'full_name': 'Author'
+    })
+    assert response.status_code == 409
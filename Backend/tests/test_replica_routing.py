@@ -0,0 +1,116 @@
+"""
+Backend/tests/test_replica_routing.py
+Reads in read-only scopes go to a replica, writes and everything after them
+to the primary; a client that just wrote keeps reading the primary (its pin
+travels in the response), other clients may still see the lagging replica.
+"""
+
+import time
+import uuid
+
+import pytest
+from flask import Flask, jsonify
+from sqlalchemy import create_engine
+
+from infrastructure.cache.memory_cache import TTLCache
+from infrastructure.databases import base, routing, unit_of_work
+from infrastructure.databases.base import Base, SessionLocal, get_engine
+from infrastructure.databases.routing import PRIMARY_HEADER, is_sticky, stick_to_primary
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.models import User
+
+
+@pytest.fixture
+def replicas(database, tmp_path, monkeypatch):
+    """Two replicas that never catch up: empty copies of the schema"""
+    engines = []
+    for index in range(2):
+        engine = create_engine(f"sqlite:///{tmp_path / f'replica{index}.db'}")
+        Base.metadata.create_all(bind=engine)
+        engines.append(engine)
+    monkeypatch.setattr(base, 'get_replica_engines', lambda: engines)
+    monkeypatch.setattr(routing, '_sticky', TTLCache(max_size=100, ttl=5, name='test_sticky'))
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+@pytest.fixture
+def client(replicas):
+    app = Flask(__name__)
+    unit_of_work.init_app(app)
+
+    @app.route('/users/<name>', methods=['POST'])
+    def create(name):
+        with session_scope() as db:
+            db.add(User(username=name, password_hash='x', full_name='Author', email=f'{name}@example.org'))
+        return jsonify({}), 201
+
+    @app.route('/users/<name>')
+    def read(name):
+        with session_scope(read_only=True) as db:
+            found = db.query(User.id).filter(User.username == name).first() is not None
+        return jsonify({'found': found})
+
+    return app
+
+
+def test_reads_use_one_replica_until_the_session_writes(replicas):
+    session = SessionLocal()
+    try:
+        session.info[routing.USE_REPLICA_KEY] = True
+        replica = session.get_bind()
+        assert replica in replicas
+        assert session.get_bind() is replica
+
+        session.add(User(username=f"rt_{uuid.uuid4().hex[:10]}", password_hash='x',
+                         full_name='Author', email=f'{uuid.uuid4().hex[:10]}@example.org'))
+        session.flush()
+        assert session.get_bind() is get_engine()
+    finally:
+        session.rollback()
+        session.close()
+
+    # Round-robin across sessions
+    picked = set()
+    for _ in range(2):
+        with session_scope(read_only=True) as db:
+            picked.add(db.get_bind())
+    assert picked == set(replicas)
+
+
+def test_sticky_key_pins_its_reads_after_commit(replicas):
+    key = f"user-{uuid.uuid4().hex}"
+    with session_scope() as db:
+        stick_to_primary(key, session=db)
+        assert not is_sticky(key)  # not before the commit
+        db.add(User(username=key[:40], password_hash='x', full_name='Author', email=f'{key[:40]}@example.org'))
+    assert is_sticky(key)
+
+    with session_scope(read_only=True, read_key=key) as db:
+        assert db.get_bind() is get_engine()
+    with session_scope(read_only=True, read_key='someone-else') as db:
+        assert db.get_bind() in replicas
+
+
+def test_writer_reads_its_own_write(client):
+    name = f"rt_{uuid.uuid4().hex[:10]}"
+    writer = client.test_client()
+    response = writer.post(f'/users/{name}')
+    assert response.status_code == 201
+    pinned_until = response.headers[PRIMARY_HEADER]
+    assert float(pinned_until) > time.time()
+
+    # Cookie sent back by the same client
+    assert writer.get(f'/users/{name}').get_json()['found']
+    # Header only (clients without cookies)
+    assert client.test_client().get(f'/users/{name}', headers={PRIMARY_HEADER: pinned_until}).get_json()['found']
+    # Another client reads the (lagging) replica
+    assert not client.test_client().get(f'/users/{name}').get_json()['found']
+
+
+def test_forged_far_future_pin_is_ignored(client):
+    name = f"rt_{uuid.uuid4().hex[:10]}"
+    client.test_client().post(f'/users/{name}')
+    far = f"{time.time() + 3600:.3f}"
+    assert not client.test_client().get(f'/users/{name}', headers={PRIMARY_HEADER: far}).get_json()['found']
@@ -0,0 +1,174 @@
+"""
+Backend/tests/test_resumable_upload.py
+Resumable uploads: chunks only land at the current offset, finalize checks
+size and checksum, expired sessions are gone, and a session opened before
+the deadline cannot keep taking bytes long after it.
+"""
+
+import hashlib
+import io
+import json
+import os
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.models import User, Conference, Paper
+from infrastructure.services.file_storage_service import FileTooLargeError
+from infrastructure.services.upload_session_store import (
+    META_FILE,
+    UploadChecksumMismatchError,
+    UploadIncompleteError,
+    UploadOffsetMismatchError,
+    UploadSessionNotFoundError,
+    get_upload_session_store,
+)
+from domain.services.submission_upload_service import (
+    DEADLINE_PASSED,
+    UPLOAD_WINDOW_CLOSED,
+    SubmissionUploadService,
+)
+
+
+PDF = b'%PDF-1.4\n' + b'resumable upload body\n' * 40 + b'%%EOF\n'
+
+
+@pytest.fixture
+def author(database):
+    """(user_id, conference_id) - submissions open for another day"""
+    name = uuid.uuid4().hex[:12]
+    with session_scope() as db:
+        user = User(username=name, password_hash='x', full_name='Author', email=f'{name}@example.org')
+        db.add(user)
+        db.flush()
+        deadline = datetime.utcnow() + timedelta(days=1)
+        conf = Conference(chair_id=user.id, name=f'Conf {name}',
+                          submission_deadline=deadline, review_deadline=deadline + timedelta(days=30))
+        db.add(conf)
+        db.flush()
+        return user.id, conf.id
+
+
+def start(author, total_size=len(PDF)) -> str:
+    user_id, conference_id = author
+    session, error = SubmissionUploadService.start_upload(user_id, 'submission', total_size, {
+        'conference_id': conference_id, 'title': 'A resumable paper', 'abstract': 'Sent in pieces'
+    })
+    assert error is None
+    return session['upload_id']
+
+
+def send(author, upload_id, offset, data):
+    return SubmissionUploadService.append_chunk(upload_id, author[0], offset, io.BytesIO(data), len(data))
+
+
+def edit_session(upload_id, **fields):
+    path = os.path.join(get_upload_session_store().root, upload_id, META_FILE)
+    with open(path, encoding='utf-8') as f:
+        meta = json.load(f)
+    meta.update(fields)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+
+
+def move_deadline(author, deadline):
+    with session_scope() as db:
+        db.query(Conference).filter(Conference.id == author[1]).update({'submission_deadline': deadline})
+
+
+def papers_in(author) -> int:
+    with session_scope(read_only=True) as db:
+        return db.query(Paper).filter(Paper.conference_id == author[1]).count()
+
+
+def test_chunks_only_land_at_the_current_offset(author):
+    upload_id = start(author)
+    half = len(PDF) // 2
+
+    with pytest.raises(UploadOffsetMismatchError) as skipped_ahead:
+        send(author, upload_id, half, PDF[half:])
+    assert skipped_ahead.value.expected == 0
+
+    progress, _ = send(author, upload_id, 0, PDF[:half])
+    assert progress['offset'] == half
+    # A retry of a chunk the server already has is acknowledged, not written twice
+    progress, _ = send(author, upload_id, 0, PDF[:half])
+    assert progress['offset'] == half
+
+    progress, _ = send(author, upload_id, half, PDF[half:])
+    assert progress['complete']
+    paper, error = SubmissionUploadService.finalize(upload_id, author[0])
+    assert error is None
+    assert paper['title'] == 'A resumable paper'
+
+
+def test_finalize_checks_size_and_checksum(author):
+    upload_id = start(author, total_size=len(PDF) + 10)
+    send(author, upload_id, 0, PDF)
+    with pytest.raises(UploadIncompleteError):
+        SubmissionUploadService.finalize(upload_id, author[0])
+    with pytest.raises(FileTooLargeError):
+        send(author, upload_id, len(PDF), b'x' * 11)
+
+    upload_id = start(author)
+    send(author, upload_id, 0, PDF)
+    with pytest.raises(UploadChecksumMismatchError):
+        SubmissionUploadService.finalize(upload_id, author[0], sha256=hashlib.sha256(b'other').hexdigest())
+    assert papers_in(author) == 0
+
+    paper, error = SubmissionUploadService.finalize(upload_id, author[0], sha256=hashlib.sha256(PDF).hexdigest())
+    assert error is None
+    assert papers_in(author) == 1
+
+
+def test_expired_session_is_gone(author):
+    upload_id = start(author)
+    send(author, upload_id, 0, PDF[:100])
+    edit_session(upload_id, expires_at=datetime.utcnow().timestamp() - 1)
+
+    with pytest.raises(UploadSessionNotFoundError):
+        SubmissionUploadService.get_progress(upload_id, author[0])
+    with pytest.raises(UploadSessionNotFoundError):
+        send(author, upload_id, 100, PDF[100:])
+    store = get_upload_session_store()
+    assert store.collect_garbage() >= 1
+    assert not os.path.exists(os.path.join(store.root, upload_id))
+
+
+def test_upload_window_closes_after_the_grace_period(author):
+    upload_id = start(author)
+    send(author, upload_id, 0, PDF[:100])
+    # Opened a minute before a deadline that passed an hour ago
+    deadline = datetime.utcnow() - timedelta(hours=1)
+    edit_session(upload_id, created_at=(deadline - timedelta(minutes=1) - datetime(1970, 1, 1)).total_seconds())
+    move_deadline(author, deadline)
+
+    progress, error = send(author, upload_id, 100, PDF[100:])
+    assert progress is None
+    assert error == UPLOAD_WINDOW_CLOSED
+    paper, error = SubmissionUploadService.finalize(upload_id, author[0])
+    assert paper is None
+    assert error == UPLOAD_WINDOW_CLOSED
+    assert papers_in(author) == 0
+
+
+def test_upload_started_in_time_finishes_within_the_grace_period(author):
+    upload_id = start(author)
+    deadline = datetime.utcnow() - timedelta(minutes=5)
+    edit_session(upload_id, created_at=(deadline - timedelta(minutes=1) - datetime(1970, 1, 1)).total_seconds())
+    move_deadline(author, deadline)
+
+    progress, error = send(author, upload_id, 0, PDF)
+    assert error is None and progress['complete']
+    paper, error = SubmissionUploadService.finalize(upload_id, author[0])
+    assert error is None
+
+    # Started after the deadline: refused whatever the grace
+    user_id, conference_id = author
+    session, error = SubmissionUploadService.start_upload(user_id, 'submission', len(PDF), {
+        'conference_id': conference_id, 'title': 'Too late', 'abstract': 'Sent in pieces'
+    })
+    assert session is None
+    assert error == DEADLINE_PASSED
@@ -0,0 +1,167 @@
+"""
+Backend/tests/test_score_tracking.py
+Score summaries follow the assignments behind them: a declined assignment's
+review stops counting, and a conference mean that moves re-bases every
+summary, not only the papers that were reviewed.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.models import User, Conference, Paper, Assignment, Review, PaperScoreSummary
+from domain.services import scoring_service
+from domain.services.assignment_service import AssignmentService
+from domain.services.scoring_logic import score_conference
+from domain.services.scoring_service import register_score_tracking, _prior
+
+
+def user(db, label: str) -> User:
+    name = f"{label}_{uuid.uuid4().hex[:10]}"
+    row = User(username=name, password_hash='x', full_name=label, email=f'{name}@example.org')
+    db.add(row)
+    db.flush()
+    return row
+
+
+@pytest.fixture
+def reviewed_paper(database):
+    """{'chair', 'paper_id', 'assignments': {score: assignment_id}} - one paper reviewed 8 and 2"""
+    register_score_tracking()
+    now = datetime.utcnow()
+    with session_scope() as db:
+        chair = user(db, 'chair')
+        conf = Conference(chair_id=chair.id, name=f'Conf {uuid.uuid4().hex[:8]}',
+                          submission_deadline=now - timedelta(days=1), review_deadline=now + timedelta(days=30))
+        db.add(conf)
+        db.flush()
+        paper = Paper(title='A paper', abstract='About things', pdf_path='legacy.pdf',
+                      submitter_id=chair.id, conference_id=conf.id)
+        db.add(paper)
+        db.flush()
+        assignments = {}
+        for score in (8, 2):
+            reviewer = user(db, 'reviewer')
+            assignment = Assignment(conference_id=conf.id, paper_id=paper.id, reviewer_id=reviewer.id)
+            db.add(assignment)
+            db.flush()
+            db.add(Review(assignment_id=assignment.id, paper_id=paper.id, score=score))
+            assignments[score] = assignment.id
+        return {'chair': {'user_id': chair.id, 'roles': []}, 'conference_id': conf.id,
+                'paper_id': paper.id, 'assignments': assignments}
+
+
+def summaries(conference_id: int) -> dict:
+    with session_scope(read_only=True) as db:
+        return {row.paper_id: row for row in db.query(
+            PaperScoreSummary.paper_id, PaperScoreSummary.review_count, PaperScoreSummary.mean_score,
+            PaperScoreSummary.calibrated_score, PaperScoreSummary.prior_mean
+        ).filter(PaperScoreSummary.conference_id == conference_id)}
+
+
+def test_decline_refreshes_the_paper_scores(reviewed_paper, monkeypatch):
+    refreshed = []
+    original = scoring_service.refresh_paper_scores
+
+    def spy(paper_ids=(), reviewer_ids=(), db=None):
+        refreshed.append(set(paper_ids))
+        return original(paper_ids, reviewer_ids, db=db)
+
+    monkeypatch.setattr(scoring_service, 'refresh_paper_scores', spy)
+
+    result, error = AssignmentService.decline_assignment(
+        reviewed_paper['conference_id'], reviewed_paper['assignments'][2], reviewed_paper['chair'], repair=False
+    )
+    assert error is None
+    assert result['status'] == 'Declined'
+    assert refreshed == [{reviewed_paper['paper_id']}]
+
+    summary = summaries(reviewed_paper['conference_id'])[reviewed_paper['paper_id']]
+    assert summary.review_count == 1
+    assert summary.mean_score == 8
+
+
+def test_moved_conference_mean_rebases_every_summary(reviewed_paper):
+    conference_id = reviewed_paper['conference_id']
+    before = summaries(conference_id)[reviewed_paper['paper_id']]
+
+    with session_scope() as db:
+        paper = Paper(title='Another paper', abstract='About other things', pdf_path='legacy2.pdf',
+                      submitter_id=reviewed_paper['chair']['user_id'], conference_id=conference_id)
+        db.add(paper)
+        db.flush()
+        reviewer = user(db, 'reviewer')
+        assignment = Assignment(conference_id=conference_id, paper_id=paper.id, reviewer_id=reviewer.id)
+        db.add(assignment)
+        db.flush()
+        db.add(Review(assignment_id=assignment.id, paper_id=paper.id, score=10))
+
+    with session_scope(read_only=True) as db:
+        prior = _prior(db, conference_id)
+    after = summaries(conference_id)
+    assert len(after) == 2
+    assert before.prior_mean == 5
+    # The first paper had no new review, yet it was re-based on the new mean
+    assert {round(row.prior_mean, 6) for row in after.values()} == {round(prior.mean, 6)}
+    assert after[reviewed_paper['paper_id']].calibrated_score != before.calibrated_score
+
+
+def test_incremental_refresh_matches_a_full_recompute(database):
+    """
+    Reviewer A reviews papers 1 and 2 (3 and 7), B paper 3, C paper 4. A's two
+    scores swap - the conference mean / spread stay put, so only A's papers are
+    recomputed, and they match a from-scratch computation.
+    """
+    register_score_tracking()
+    now = datetime.utcnow()
+    with session_scope() as db:
+        chair = user(db, 'chair')
+        conf = Conference(chair_id=chair.id, name=f'Conf {uuid.uuid4().hex[:8]}',
+                          submission_deadline=now - timedelta(days=1), review_deadline=now + timedelta(days=30))
+        db.add(conf)
+        db.flush()
+        reviewers = {label: user(db, label).id for label in 'ABC'}
+        reviews = {}
+        for title, label, score in (('P1', 'A', 3), ('P2', 'A', 7), ('P3', 'B', 9), ('P4', 'C', 4)):
+            paper = Paper(title=title, abstract='About things', pdf_path='legacy.pdf',
+                          submitter_id=chair.id, conference_id=conf.id)
+            db.add(paper)
+            db.flush()
+            assignment = Assignment(conference_id=conf.id, paper_id=paper.id, reviewer_id=reviewers[label])
+            db.add(assignment)
+            db.flush()
+            review = Review(assignment_id=assignment.id, paper_id=paper.id, score=score)
+            db.add(review)
+            db.flush()
+            reviews[title] = (paper.id, review.id)
+        conference_id = conf.id
+
+    def stored():
+        with session_scope(read_only=True) as db:
+            return {row.paper_id: row for row in db.query(
+                PaperScoreSummary.paper_id, PaperScoreSummary.mean_score, PaperScoreSummary.weighted_score,
+                PaperScoreSummary.calibrated_score, PaperScoreSummary.z_score, PaperScoreSummary.updated_at
+            ).filter(PaperScoreSummary.conference_id == conference_id)}
+
+    before = stored()
+    assert len(before) == 4
+
+    with session_scope() as db:
+        for title, score in (('P1', 7), ('P2', 3)):
+            db.get(Review, reviews[title][1]).score = score
+
+    after = stored()
+    with session_scope(read_only=True) as db:
+        _, _, full = score_conference(scoring_service._scored_reviews(db, conference_id))
+    for title in ('P1', 'P2'):
+        paper_id = reviews[title][0]
+        assert after[paper_id].updated_at > before[paper_id].updated_at
+        for column, value in (('mean_score', full[paper_id].mean), ('weighted_score', full[paper_id].weighted),
+                              ('calibrated_score', full[paper_id].calibrated), ('z_score', full[paper_id].z)):
+            assert getattr(after[paper_id], column) == pytest.approx(value)
+    assert after[reviews['P1'][0]].mean_score == 7
+    # Nothing moved for the other reviewers' papers: not recomputed
+    for title in ('P3', 'P4'):
+        assert after[reviews[title][0]] == before[reviews[title][0]]
@@ -0,0 +1,90 @@
+"""
+Backend/tests/test_scoring_logic.py
+Reviewer calibration shrinks towards the conference: a reviewer with few
+reviews is barely corrected, a consistently harsh one with many almost
+fully, and the calibrated score removes the harshness the raw mean keeps.
+"""
+
+import math
+
+import pytest
+
+from domain.services.scoring_logic import (
+    MIN_STD,
+    PRIOR_REVIEWS,
+    Prior,
+    calibrate_reviewers,
+    columns,
+    conference_prior,
+    score_conference,
+)
+
+
+def test_conference_prior_from_scores_or_sql_aggregates():
+    scores = [2.0, 4.0, 6.0, 8.0]
+    prior = conference_prior(scores)
+    assert prior == Prior(4, 5.0, math.sqrt(5.0))
+    assert conference_prior(None, count=4, total=20.0, squares=120.0) == prior
+    # Nothing reviewed yet: middle of the scale; everyone agreeing: floored spread
+    assert conference_prior([]) == Prior(0, 5.5, 2.25)
+    assert conference_prior([7.0, 7.0]).std == MIN_STD
+
+
+def test_scores_are_clamped_to_the_scale():
+    _, _, scores = columns([(1, 10, 0), (1, 11, 14), (1, 12, '6.5')])
+    assert list(scores) == [1.0, 10.0, 6.5]
+
+
+@pytest.mark.parametrize('n', [1, 2, 5, 20, 100])
+def test_shrinkage_follows_the_formula(n):
+    prior = Prior(1000, 6.0, 2.0)
+    scores = [3.0 if i % 2 else 4.0 for i in range(n)]
+    reviewer = calibrate_reviewers([7] * n, scores, prior)[7]
+
+    mean = sum(scores) / n
+    variance = sum((score - mean) ** 2 for score in scores) / n
+    assert reviewer.count == n
+    assert reviewer.mean == pytest.approx(mean)
+    assert reviewer.shrunk_mean == pytest.approx((n * mean + PRIOR_REVIEWS * 6.0) / (n + PRIOR_REVIEWS))
+    assert reviewer.shrunk_std == pytest.approx(
+        max(MIN_STD, math.sqrt((n * variance + PRIOR_REVIEWS * 4.0) / (n + PRIOR_REVIEWS)))
+    )
+    # Always between the reviewer's own mean and the conference's
+    assert mean <= reviewer.shrunk_mean <= prior.mean
+
+
+def test_more_reviews_mean_more_correction():
+    prior = Prior(1000, 6.0, 2.0)
+    biases = [
+        calibrate_reviewers([7] * n, [3.0] * n, prior)[7].bias(prior)
+        for n in (1, 3, 10, 100)
+    ]
+    assert biases == sorted(biases, reverse=True)
+    assert biases[0] == pytest.approx(-3.0 / 4)
+    assert biases[-1] == pytest.approx(-3.0 * 100 / 103)
+    # No pull at all without pseudo-reviews
+    assert calibrate_reviewers([7], [3.0], prior, strength=0)[7].bias(prior) == pytest.approx(-3.0)
+
+
+def test_calibration_removes_a_harsh_reviewers_bias():
+    # Papers 1-20 of equal quality; the harsh reviewer scores 2 below the fair
+    # ones on every paper. Paper 21 got only the harsh reviewer, 22 only a fair one.
+    rows = []
+    for paper_id in range(1, 21):
+        rows.append((paper_id, 100, 5))
+        rows.append((paper_id, 101 + paper_id % 2, 7))
+    rows.append((21, 100, 5))
+    rows.append((22, 101, 7))
+    prior, calibration, papers = score_conference(rows)
+
+    assert calibration[100].bias(prior) == pytest.approx((21 * 5 + PRIOR_REVIEWS * 6) / (21 + PRIOR_REVIEWS) - 6)
+    assert papers[21].mean == 5 and papers[22].mean == 7
+    # Raw means put 22 two points above 21; calibrated, most of the gap is gone
+    assert abs(papers[21].calibrated - papers[22].calibrated) < 0.5
+
+
+def test_noisy_reviewer_weighs_less():
+    prior = Prior(1000, 6.0, 1.0)
+    calibration = calibrate_reviewers([1] * 10 + [2] * 10, [6.0] * 10 + [1.0, 10.0] * 5, prior)
+    assert calibration[1].shrunk_std < calibration[2].shrunk_std
+    assert calibration[1].weight(prior) > 1 > calibration[2].weight(prior)
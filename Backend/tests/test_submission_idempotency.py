@@ -0,0 +1,107 @@
+"""
+Backend/tests/test_submission_idempotency.py
+A retry that takes over an Idempotency-Key may only inherit the first
+attempt's receipt time (and so its place before the deadline) when that
+attempt had stored the same PDF.
+"""
+
+import io
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+
+from infrastructure.databases.unit_of_work import session_scope
+from infrastructure.models import User, Conference, Paper
+from infrastructure.services.file_storage_service import InvalidFileError
+from domain.services import submission_upload_service
+from domain.services.submission_upload_service import SubmissionUploadService
+
+
+DEADLINE_PASSED = "Submission deadline has passed"
+
+
+def pdf(marker: str) -> io.BytesIO:
+    return io.BytesIO(b'%PDF-1.4\n' + marker.encode('ascii') + b'\n%%EOF\n')
+
+
+@pytest.fixture
+def conference(database):
+    """(user_id, conference_id, deadline)"""
+    deadline = datetime.utcnow()
+    name = uuid.uuid4().hex[:12]
+    with session_scope() as db:
+        user = User(username=name, password_hash='x', full_name='Author', email=f'{name}@example.org')
+        db.add(user)
+        db.flush()
+        conf = Conference(chair_id=user.id, name=f'Conf {name}',
+                          submission_deadline=deadline, review_deadline=deadline + timedelta(days=30))
+        db.add(conf)
+        db.flush()
+        return user.id, conf.id, deadline
+
+
+def submit(conference, stream, received_at, key):
+    user_id, conference_id, _ = conference
+    metadata = {'conference_id': conference_id, 'title': 'A paper', 'abstract': 'About things'}
+    return SubmissionUploadService.submit(user_id, metadata, stream, received_at, idempotency_key=key)
+
+
+def papers_in(conference) -> int:
+    with session_scope(read_only=True) as db:
+        return db.query(Paper).filter(Paper.conference_id == conference[1]).count()
+
+
+def die_before_commit(monkeypatch, times: int = 1):
+    """The next `times` submissions store their PDF, then fail before the Paper commits"""
+    original = submission_upload_service._add_paper
+    calls = []
+
+    def failing(*args, **kwargs):
+        if len(calls) < times:
+            calls.append(1)
+            raise RuntimeError("connection lost")
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(submission_upload_service, '_add_paper', failing)
+
+
+def test_garbage_before_deadline_does_not_extend_it(conference):
+    _, _, deadline = conference
+    key = uuid.uuid4().hex
+
+    with pytest.raises(InvalidFileError):
+        submit(conference, io.BytesIO(b'not a pdf'), deadline - timedelta(minutes=5), key)
+
+    result, error = submit(conference, pdf('real'), deadline + timedelta(minutes=5), key)
+    assert result is None
+    assert error == DEADLINE_PASSED
+    assert papers_in(conference) == 0
+
+
+def test_retry_with_the_stored_pdf_keeps_the_first_receipt_time(conference, monkeypatch):
+    _, _, deadline = conference
+    key = uuid.uuid4().hex
+    die_before_commit(monkeypatch)
+
+    with pytest.raises(RuntimeError):
+        submit(conference, pdf('same'), deadline - timedelta(minutes=5), key)
+
+    result, error = submit(conference, pdf('same'), deadline + timedelta(minutes=5), key)
+    assert error is None
+    assert result['replayed'] is False
+    assert papers_in(conference) == 1
+
+
+def test_retry_with_a_different_pdf_is_held_to_its_own_receipt_time(conference, monkeypatch):
+    _, _, deadline = conference
+    key = uuid.uuid4().hex
+    die_before_commit(monkeypatch)
+
+    with pytest.raises(RuntimeError):
+        submit(conference, pdf('first'), deadline - timedelta(minutes=5), key)
+
+    result, error = submit(conference, pdf('second'), deadline + timedelta(minutes=5), key)
+    assert error == DEADLINE_PASSED
+    assert papers_in(conference) == 0
+
@@ -0,0 +1,80 @@
+"""
+Backend/tests/test_unit_of_work.py
+One session per request, committed once on a < 400 status and rolled back
+otherwise; nested scopes join the outer transaction, separate_transaction()
+commits on its own.
+"""
+
+import uuid
+
+import pytest
+from flask import Flask, jsonify
+
+from infrastructure.databases import unit_of_work
+from infrastructure.databases.unit_of_work import separate_transaction, session_scope
+from infrastructure.models import User
+
+
+def add_user(db, name: str):
+    db.add(User(username=name, password_hash='x', full_name='Author', email=f'{name}@example.org'))
+    db.flush()
+
+
+def exists(name: str) -> bool:
+    with session_scope(read_only=True) as db:
+        return db.query(User.id).filter(User.username == name).first() is not None
+
+
+@pytest.fixture
+def client(database):
+    app = Flask(__name__)
+    unit_of_work.init_app(app)
+    sessions = []
+
+    @app.route('/users/<name>/<int:status>', methods=['POST'])
+    def create(name, status):
+        # First: sqlite has one writer, and the request's flush holds it until the end
+        with separate_transaction() as db:
+            add_user(db, f"{name}_log")
+        with session_scope() as db:
+            add_user(db, name)
+            sessions.append(db)
+        with session_scope() as db:
+            sessions.append(db)  # a second service joins the same unit of work
+        if status >= 500:
+            raise RuntimeError('view failed')
+        return jsonify({'name': name}), status
+
+    client = app.test_client()
+    client.sessions = sessions
+    return client
+
+
+@pytest.mark.parametrize('status, committed', [(201, True), (400, False), (409, False), (500, False)])
+def test_request_commits_only_on_success(client, status, committed):
+    name = f"uow_{uuid.uuid4().hex[:10]}"
+    response = client.post(f'/users/{name}/{status}')
+    assert response.status_code == status
+    assert exists(name) is committed
+    # Committed on its own, whatever the request's outcome
+    assert exists(f"{name}_log")
+    first, second = client.sessions
+    assert first is second
+
+
+def test_nested_scopes_share_the_outer_transaction(database):
+    outer_name, inner_name = f"uow_{uuid.uuid4().hex[:10]}", f"uow_{uuid.uuid4().hex[:10]}"
+    with pytest.raises(RuntimeError):
+        with session_scope() as outer:
+            add_user(outer, outer_name)
+            with session_scope() as inner:
+                assert inner is outer
+                add_user(inner, inner_name)
+            raise RuntimeError('outer scope fails after the inner one exited')
+    assert not exists(outer_name)
+    assert not exists(inner_name)
+
+    with session_scope() as outer:
+        with session_scope() as inner:
+            add_user(inner, inner_name)
+    assert exists(inner_name)